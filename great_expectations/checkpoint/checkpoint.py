@@ -3,6 +3,7 @@ import datetime
 import json
 import logging
 import os
+import traceback
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 from uuid import UUID
@@ -16,7 +17,11 @@ from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import BatchRequest, RuntimeBatchRequest
 from great_expectations.core.util import get_datetime_string_from_strftime_format
 from great_expectations.data_asset import DataAsset
-from great_expectations.data_context.types.base import CheckpointConfig
+from great_expectations.data_context.types.base import (
+    CheckpointConfig,
+    ConcurrencyConfig,
+    DataContextConfig,
+)
 from great_expectations.data_context.types.resource_identifiers import GeCloudIdentifier
 from great_expectations.data_context.util import substitute_all_config_variables
 from great_expectations.validation_operators import ActionListValidationOperator
@@ -265,13 +270,27 @@ class Checkpoint:
         # Use AsyncExecutor to speed up I/O bound validations by running them in parallel with multithreading (if
         # concurrency is enabled in the data context configuration) -- please see the below arguments used to initialize
         # AsyncExecutor and the corresponding AsyncExecutor docstring for more details on when multiple threads are
-        # used.
+        # used.  Each validation loads its own batch, so that batches are also loaded in parallel.  If the concurrency
+        # configuration uses processes, validations are run in worker processes, each of which builds its own data
+        # context from the configuration of this one (and thus shares its datasources and stores).
+        concurrency: ConcurrencyConfig = self.data_context.concurrency
+        use_processes: bool = bool(concurrency.use_processes)
         with AsyncExecutor(
-            self.data_context.concurrency, max_workers=len(validations)
+            concurrency,
+            max_workers=len(validations),
+            use_processes=use_processes,
+            initializer=_initialize_checkpoint_worker if use_processes else None,
+            initargs=(
+                self.data_context.get_config(),
+                self.data_context.root_directory,
+                self.data_context.runtime_environment,
+                self.data_context.ge_cloud_mode,
+                self.data_context.ge_cloud_config,
+            )
+            if use_processes
+            else (),
         ) as async_executor:
-            async_validation_operator_results: List[
-                AsyncResult[ValidationOperatorResult]
-            ] = []
+            async_validation_run_results: List[AsyncResult[dict]] = []
             for idx, validation_dict in enumerate(validations):
                 try:
                     substituted_validation_dict: dict = get_substituted_validation_dict(
@@ -287,22 +306,6 @@ class Checkpoint:
                     expectation_suite_ge_cloud_id: str = (
                         substituted_validation_dict.get("expectation_suite_ge_cloud_id")
                     )
-                    action_list: list = substituted_validation_dict.get("action_list")
-
-                    validator: Validator = self.data_context.get_validator(
-                        batch_request=batch_request,
-                        expectation_suite_name=(
-                            expectation_suite_name
-                            if not self.data_context.ge_cloud_mode
-                            else None
-                        ),
-                        expectation_suite_ge_cloud_id=(
-                            expectation_suite_ge_cloud_id
-                            if self.data_context.ge_cloud_mode
-                            else None
-                        ),
-                    )
-
                     action_list: list = substituted_validation_dict.get("action_list")
                     runtime_configuration_validation = substituted_validation_dict.get(
                         "runtime_configuration", {}
@@ -318,14 +321,6 @@ class Checkpoint:
                     if result_format is None:
                         result_format = {"result_format": "SUMMARY"}
 
-                    action_list_validation_operator: ActionListValidationOperator = (
-                        ActionListValidationOperator(
-                            data_context=self.data_context,
-                            action_list=action_list,
-                            result_format=result_format,
-                            name=f"{self.name}-checkpoint-validation[{idx}]",
-                        )
-                    )
                     checkpoint_identifier = None
                     if self.data_context.ge_cloud_mode:
                         checkpoint_identifier = GeCloudIdentifier(
@@ -339,19 +334,35 @@ class Checkpoint:
                             "catch_exceptions"
                         ] = catch_exceptions_validation
 
-                    async_validation_operator_results.append(
-                        async_executor.submit(
-                            action_list_validation_operator.run,
-                            assets_to_validate=[validator],
-                            run_id=run_id,
-                            evaluation_parameters=substituted_validation_dict.get(
-                                "evaluation_parameters"
-                            ),
-                            result_format=result_format,
-                            checkpoint_identifier=checkpoint_identifier,
-                            **operator_run_kwargs,
+                    validation_kwargs: dict = {
+                        "batch_request": batch_request,
+                        "expectation_suite_name": expectation_suite_name,
+                        "expectation_suite_ge_cloud_id": expectation_suite_ge_cloud_id,
+                        "action_list": action_list,
+                        "result_format": result_format,
+                        "validation_operator_name": f"{self.name}-checkpoint-validation[{idx}]",
+                        "run_id": run_id,
+                        "evaluation_parameters": substituted_validation_dict.get(
+                            "evaluation_parameters"
+                        ),
+                        "checkpoint_identifier": checkpoint_identifier,
+                        "operator_run_kwargs": operator_run_kwargs,
+                    }
+                    if use_processes:
+                        async_validation_run_results.append(
+                            async_executor.submit(
+                                _run_checkpoint_validation_in_worker,
+                                **validation_kwargs,
+                            )
+                        )
+                    else:
+                        async_validation_run_results.append(
+                            async_executor.submit(
+                                _run_checkpoint_validation,
+                                data_context=self.data_context,
+                                **validation_kwargs,
+                            )
                         )
-                    )
                 except (
                     ge_exceptions.CheckpointError,
                     ge_exceptions.ExecutionEngineError,
@@ -361,11 +372,24 @@ class Checkpoint:
                         f"Exception occurred while running validation[{idx}] of Checkpoint '{self.name}': {e.message}."
                     )
 
+            # Results are collected in the order of the validations; a failed validation does not interrupt the others,
+            # which all run to completion before the exception of the first failed validation is raised.
             run_results = {}
-            for async_validation_operator_result in async_validation_operator_results:
-                run_results.update(
-                    async_validation_operator_result.result().run_results
-                )
+            first_exception: Optional[Exception] = None
+            for idx, async_validation_run_result in enumerate(
+                async_validation_run_results
+            ):
+                try:
+                    run_results.update(async_validation_run_result.result())
+                except Exception as e:
+                    logger.error(
+                        f"Exception occurred while running validation[{idx}] of Checkpoint '{self.name}': {e}"
+                    )
+                    if first_exception is None:
+                        first_exception = e
+
+            if first_exception is not None:
+                raise first_exception
 
         return CheckpointResult(
             run_id=run_id, run_results=run_results, checkpoint_config=self.config
@@ -420,6 +444,91 @@ is run), with each validation having its own defined "action_list" attribute.
         return report_object
 
 
+# The data context of a checkpoint worker process, built once per process by _initialize_checkpoint_worker.
+_checkpoint_worker_data_context = None
+
+
+def _initialize_checkpoint_worker(
+    project_config: DataContextConfig,
+    context_root_dir: Optional[str],
+    runtime_environment: Optional[dict],
+    ge_cloud_mode: bool,
+    ge_cloud_config,
+):
+    """Builds the data context of a checkpoint worker process from the configuration of the checkpoint's data context."""
+    # Imported here to avoid a circular import.
+    from great_expectations.data_context.data_context import BaseDataContext
+
+    global _checkpoint_worker_data_context
+    _checkpoint_worker_data_context = BaseDataContext(
+        project_config=project_config,
+        context_root_dir=context_root_dir,
+        runtime_environment=runtime_environment,
+        ge_cloud_mode=ge_cloud_mode,
+        ge_cloud_config=ge_cloud_config,
+    )
+
+
+def _run_checkpoint_validation_in_worker(**kwargs) -> dict:
+    try:
+        return _run_checkpoint_validation(
+            data_context=_checkpoint_worker_data_context, **kwargs
+        )
+    except Exception as e:
+        # Not every exception can be pickled back to the calling process (e.g. those whose constructors take more
+        # than a message), so the failure is reported as a CheckpointError carrying its message and traceback.
+        raise ge_exceptions.CheckpointError(
+            f"Exception occurred while running {kwargs['validation_operator_name']}: {e}\n"
+            f"{traceback.format_exc()}"
+        ) from None
+
+
+def _run_checkpoint_validation(
+    data_context,
+    batch_request: Union[BatchRequest, RuntimeBatchRequest],
+    expectation_suite_name: Optional[str],
+    expectation_suite_ge_cloud_id: Optional[str],
+    action_list: list,
+    result_format: dict,
+    validation_operator_name: str,
+    run_id: RunIdentifier,
+    evaluation_parameters: Optional[dict],
+    checkpoint_identifier: Optional[GeCloudIdentifier],
+    operator_run_kwargs: dict,
+) -> dict:
+    """Loads the batch of a validation of a checkpoint, validates it, and returns the run results of its actions."""
+    # Errors are not wrapped here: run serially, they are wrapped (once) with the index of the validation by the caller.
+    validator: Validator = data_context.get_validator(
+        batch_request=batch_request,
+        expectation_suite_name=(
+            expectation_suite_name if not data_context.ge_cloud_mode else None
+        ),
+        expectation_suite_ge_cloud_id=(
+            expectation_suite_ge_cloud_id if data_context.ge_cloud_mode else None
+        ),
+    )
+
+    action_list_validation_operator: ActionListValidationOperator = (
+        ActionListValidationOperator(
+            data_context=data_context,
+            action_list=action_list,
+            result_format=result_format,
+            name=validation_operator_name,
+        )
+    )
+    validation_operator_result: ValidationOperatorResult = (
+        action_list_validation_operator.run(
+            assets_to_validate=[validator],
+            run_id=run_id,
+            evaluation_parameters=evaluation_parameters,
+            result_format=result_format,
+            checkpoint_identifier=checkpoint_identifier,
+            **operator_run_kwargs,
+        )
+    )
+    return validation_operator_result.run_results
+
+
 class LegacyCheckpoint(Checkpoint):
     """
     --ge-feature-maturity-info--
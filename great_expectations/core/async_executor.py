@@ -5,9 +5,10 @@ for both when concurrency is enabled and disabled.
 WARNING: This module is experimental.
 """
 
-from concurrent.futures import Future, ThreadPoolExecutor
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import AbstractContextManager
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Tuple
 
 from urllib3 import connectionpool, poolmanager
 
@@ -34,7 +35,7 @@ class AsyncResult:
 
 
 class AsyncExecutor(AbstractContextManager):
-    """Wrapper around ThreadPoolExecutor to facilitate single code path
+    """Wrapper around ThreadPoolExecutor (or ProcessPoolExecutor) to facilitate single code path
     for both when concurrency is enabled and disabled.
 
     WARNING: This class is experimental.
@@ -44,6 +45,9 @@ class AsyncExecutor(AbstractContextManager):
         self,
         concurrency_config: ConcurrencyConfig,
         max_workers: int,
+        use_processes: bool = False,
+        initializer: Optional[Callable] = None,
+        initargs: Tuple = (),
     ):
         """Initializes a new AsyncExecutor instance used to organize code for multithreaded execution.
 
@@ -61,21 +65,33 @@ class AsyncExecutor(AbstractContextManager):
             max_workers: The maximum number of threads that can be used to execute concurrently. If concurrency is
                 disabled or max_workers is 1, all work will be done synchronously (e.g. on the main thread) during the
                 call to submit. Note that the maximum number of threads is also limited by
-                concurrency_config.max_database_query_concurrency.
+                concurrency_config.max_database_query_concurrency and, if set, by concurrency_config.max_workers.
+            use_processes: Whether work is executed concurrently in worker processes rather than threads (e.g. for
+                CPU bound work). Submitted callables, their arguments, and their results must then be picklable. Unless
+                concurrency_config.max_workers is set, the number of processes is also limited by the number of CPUs.
+            initializer: Optional callable run at the start of each worker process (only used with use_processes).
+            initargs: Arguments passed to the initializer.
         """
+        max_workers = min(
+            concurrency_config.max_database_query_concurrency, max_workers
+        )
+        if concurrency_config.max_workers is not None:
+            max_workers = min(concurrency_config.max_workers, max_workers)
+        elif use_processes:
+            max_workers = min(os.cpu_count() or 1, max_workers)
+
         # Only enable concurrent execution if it is enabled in the config AND there is more than 1 max worker specified.
         self._execute_concurrently = concurrency_config.enabled and max_workers > 1
 
-        self._thread_pool_executor = (
-            ThreadPoolExecutor(
-                max_workers=min(
-                    concurrency_config.max_database_query_concurrency,
-                    max_workers,
+        self._use_processes = use_processes
+        self._pool_executor: Optional[Executor] = None
+        if self._execute_concurrently:
+            if use_processes:
+                self._pool_executor = ProcessPoolExecutor(
+                    max_workers=max_workers, initializer=initializer, initargs=initargs
                 )
-            )
-            if self._execute_concurrently
-            else None
-        )
+            else:
+                self._pool_executor = ThreadPoolExecutor(max_workers=max_workers)
 
     def __exit__(self, exc_type, exc_value, traceback):
         self.shutdown()
@@ -86,13 +102,11 @@ class AsyncExecutor(AbstractContextManager):
     def submit(self, fn, *args, **kwargs) -> AsyncResult:
         """Submits a callable to be executed with the given arguments.
 
-        Execution occurs either concurrently on a different thread or synchronously (e.g. on the main thread) depending
-        on how the AsyncExecutor instance was initialized.
+        Execution occurs either concurrently on a different thread (or process) or synchronously (e.g. on the main
+        thread) depending on how the AsyncExecutor instance was initialized.
         """
         if self._execute_concurrently:
-            return AsyncResult(
-                future=self._thread_pool_executor.submit(fn, *args, **kwargs)
-            )
+            return AsyncResult(future=self._pool_executor.submit(fn, *args, **kwargs))
         else:
             return AsyncResult(value=fn(*args, **kwargs))
 
@@ -103,13 +117,17 @@ class AsyncExecutor(AbstractContextManager):
         It is preferable to not call this method explicitly, and instead use the `with` statement to ensure shutdown is
         called.
         """
-        if self._thread_pool_executor is not None:
-            self._thread_pool_executor.shutdown()
+        if self._pool_executor is not None:
+            self._pool_executor.shutdown()
 
     @property
     def execute_concurrently(self) -> bool:
         return self._execute_concurrently
 
+    @property
+    def execute_in_processes(self) -> bool:
+        return self._execute_concurrently and self._use_processes
+
 
 def patch_https_connection_pool(concurrency_config: ConcurrencyConfig):
     """Patch urllib3 to enable a higher default max pool size to reduce concurrency bottlenecks.
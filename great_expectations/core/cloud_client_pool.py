@@ -0,0 +1,158 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_POOLED_CLIENTS: int = 32
+
+
+def _make_hashable(value: Any) -> Hashable:
+    """Converts (possibly nested) client options into a hashable value, which identifies them in the pool."""
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                ((key, _make_hashable(item)) for key, item in value.items()),
+                key=lambda pair: str(pair[0]),
+            )
+        )
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(item) for item in value)
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_make_hashable(item) for item in value)
+
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return type(value), repr(value)
+
+
+def _describe_client_key(client_key: Hashable) -> str:
+    """
+    Describes a pooled client for logging by its factory and a short hash of its key; the key itself is never logged,
+    since it contains credentials (e.g., secret keys, connection strings, and service account info).
+    """
+    factory: Any = (
+        client_key[0] if isinstance(client_key, tuple) and client_key else None
+    )
+    factory_name: str = (
+        getattr(factory, "__qualname__", getattr(factory, "__name__", None))
+        if callable(factory)
+        else None
+    ) or type(factory).__name__
+    key_hash: str = hashlib.sha256(repr(client_key).encode("utf-8")).hexdigest()[:12]
+    return f"{factory_name} (key hash {key_hash})"
+
+
+def get_credentials_environment(prefix: str) -> Dict[str, str]:
+    """Returns the environment variables (e.g., "AWS_*"), from which a cloud client resolves its default credentials upon
+    creation; they are part of the key of a pooled client, so that a change of credentials yields a new client."""
+    return {
+        name: value for name, value in os.environ.items() if name.startswith(prefix)
+    }
+
+
+class CloudClientPool:
+    """
+    Shares the clients of cloud services (S3, Azure Blob Storage, and GCS) among the execution engines and store
+    backends, which use them.
+
+    A client is created upon the first request for its key -- which identifies the client factory together with the
+    credentials and options, with which it is created -- and is returned by every later request for the same key.  At
+    most "max_clients" clients are pooled; the least recently requested one is discarded to make room for a new one.
+
+    Each client is created once, outside of the lock guarding the pool, so that creating a (slow) client blocks only the
+    requests for the same key.  The clients themselves are shared across threads, as boto3, Azure, and GCS clients are
+    thread-safe, but not across processes: a forked process (e.g., a worker of a process pool) discards the clients it
+    inherited and creates its own ones.
+    """
+
+    def __init__(self, max_clients: int = DEFAULT_MAX_POOLED_CLIENTS):
+        if max_clients < 1:
+            raise ValueError(
+                f'"max_clients" of a cloud client pool must be positive (got {max_clients}).'
+            )
+
+        self._max_clients = max_clients
+        self._reset()
+
+    def _reset(self):
+        self._pid: int = os.getpid()
+        self._clients: "OrderedDict[Hashable, Any]" = OrderedDict()
+        # Serialize the creation of the client for each key (without blocking the requests for other keys).
+        self._creation_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_clients(self) -> int:
+        return self._max_clients
+
+    def get_client(self, key: Any, create_client: Callable[[], Any]) -> Any:
+        """
+        Returns the pooled client for the key, creating it with "create_client" if the pool has no client for it yet.
+
+        Args:
+            key: identifies the client -- typically, a tuple of the client factory and the options passed to it
+            create_client (Callable): creates the client (an error raised by it is propagated, and nothing is pooled)
+
+        Returns:
+            The pooled client
+        """
+        if self._pid != os.getpid():
+            # Clients (and locks, which might have been held by other threads) of the parent process are not reused.
+            self._reset()
+
+        client_key: Hashable = _make_hashable(key)
+        with self._lock:
+            if client_key in self._clients:
+                self._clients.move_to_end(client_key)
+                return self._clients[client_key]
+
+            creation_lock: threading.Lock = self._creation_locks.setdefault(
+                client_key, threading.Lock()
+            )
+
+        with creation_lock:
+            with self._lock:
+                if client_key in self._clients:
+                    self._clients.move_to_end(client_key)
+                    return self._clients[client_key]
+
+            logger.debug(
+                f"Creating pooled cloud client {_describe_client_key(client_key)}."
+            )
+            try:
+                client: Any = create_client()
+            except Exception:
+                with self._lock:
+                    self._creation_locks.pop(client_key, None)
+                raise
+
+            with self._lock:
+                self._clients[client_key] = client
+                self._creation_locks.pop(client_key, None)
+                while len(self._clients) > self._max_clients:
+                    evicted_client_key: Hashable
+                    evicted_client_key, _ = self._clients.popitem(last=False)
+                    logger.debug(
+                        f"Discarding least recently used cloud client {_describe_client_key(evicted_client_key)}."
+                    )
+
+            return client
+
+    def clear(self):
+        """Discards all pooled clients, so that they are created again upon their next request."""
+        with self._lock:
+            self._clients = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+cloud_client_pool: CloudClientPool = CloudClientPool()
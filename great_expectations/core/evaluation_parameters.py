@@ -2,8 +2,10 @@ import copy
 import logging
 import math
 import operator
+import threading
 import traceback
 from collections import namedtuple
+from functools import lru_cache
 
 from pyparsing import (
     CaselessKeyword,
@@ -26,6 +28,9 @@ from great_expectations.exceptions import EvaluationParameterError
 logger = logging.getLogger(__name__)
 _epsilon = 1e-12
 
+# Maximum number of distinct evaluation parameter expressions whose compiled form is kept in memory.
+EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE = 1024
+
 
 class EvaluationParameterParser:
     """
@@ -208,6 +213,56 @@ def build_evaluation_parameters(
 
 
 expr = EvaluationParameterParser()
+# The parser accumulates the compiled expression in its (shared) stack, so parsing must be serialized.
+_expr_lock = threading.Lock()
+
+CompiledEvaluationParameterExpression = namedtuple(
+    "CompiledEvaluationParameterExpression",
+    ["tokens", "program", "parse_error"],
+)
+CompiledEvaluationParameterExpression.__doc__ = """An evaluation parameter expression, parsed once.
+
+"tokens" are the top-level parse results, and "program" is the expression in postfix order, as evaluated by
+EvaluationParameterParser.evaluate_stack; if the expression could not be parsed, both are None and "parse_error" is
+the (message, line, column) of the parse failure.
+"""
+
+
+def _compile_evaluation_parameter_expression(
+    parameter_expression,
+) -> CompiledEvaluationParameterExpression:
+    with _expr_lock:
+        # Calling get_parser clears the stack
+        parser = expr.get_parser()
+        try:
+            tokens = parser.parseString(parameter_expression, parseAll=True)
+        except ParseException as err:
+            return CompiledEvaluationParameterExpression(
+                tokens=None, program=None, parse_error=(str(err), err.line, err.column)
+            )
+
+        return CompiledEvaluationParameterExpression(
+            tokens=tuple(tokens), program=tuple(expr.exprStack), parse_error=None
+        )
+
+
+_compile_cached_evaluation_parameter_expression = lru_cache(
+    maxsize=EVALUATION_PARAMETER_EXPRESSION_CACHE_SIZE
+)(_compile_evaluation_parameter_expression)
+
+
+def compile_evaluation_parameter_expression(
+    parameter_expression,
+) -> CompiledEvaluationParameterExpression:
+    """Parse an evaluation parameter expression, reusing the result of previous parses of the same expression.
+
+    The compiled expression is immutable, so that it can be evaluated against different evaluation parameters, by
+    concurrent threads, without parsing it again.
+    """
+    if isinstance(parameter_expression, str):
+        return _compile_cached_evaluation_parameter_expression(parameter_expression)
+
+    return _compile_evaluation_parameter_expression(parameter_expression)
 
 
 def find_evaluation_parameter_dependencies(parameter_expression):
@@ -222,23 +277,23 @@ def find_evaluation_parameter_dependencies(parameter_expression):
           - "other": set of non-GE URN strings that are required to evaluate the parameter expression
 
     """
-    expr = EvaluationParameterParser()
-
     dependencies = {"urns": set(), "other": set()}
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
     try:
-        _ = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        raise EvaluationParameterError(
-            f"Unable to parse evaluation parameter: {str(err)} at line {err.line}, column {err.column}"
+        compiled_expression = compile_evaluation_parameter_expression(
+            parameter_expression
         )
     except AttributeError as err:
         raise EvaluationParameterError(
             f"Unable to parse evaluation parameter: {str(err)}"
         )
 
-    for word in expr.exprStack:
+    if compiled_expression.parse_error is not None:
+        err_str, err_line, err_col = compiled_expression.parse_error
+        raise EvaluationParameterError(
+            f"Unable to parse evaluation parameter: {err_str} at line {err_line}, column {err_col}"
+        )
+
+    for word in compiled_expression.program:
         if isinstance(word, (int, float)):
             continue
 
@@ -288,16 +343,18 @@ def parse_evaluation_parameter(
     Valid variables must begin with an alphabetic character and may contain alphanumeric characters plus '_' and '$',
     EXCEPT if they begin with the string "urn:great_expectations" in which case they may also include additional
     characters to support inclusion of GE URLs (see :ref:`evaluation_parameters` for more information).
+
+    Expressions are compiled once (see compile_evaluation_parameter_expression), and evaluated against a copy of their
+    compiled program, so that this function may be called concurrently.
     """
     if evaluation_parameters is None:
         evaluation_parameters = {}
 
-    # Calling get_parser clears the stack
-    parser = expr.get_parser()
-    try:
-        L = parser.parseString(parameter_expression, parseAll=True)
-    except ParseException as err:
-        L = ["Parse Failure", parameter_expression, (str(err), err.line, err.column)]
+    compiled_expression = compile_evaluation_parameter_expression(parameter_expression)
+    if compiled_expression.parse_error is None:
+        L = compiled_expression.tokens
+    else:
+        L = ["Parse Failure", parameter_expression, compiled_expression.parse_error]
 
     if len(L) == 1 and L[0] not in evaluation_parameters:
         # In this special case there were no operations to find, so only one value, but we don't have something to
@@ -333,9 +390,11 @@ def parse_evaluation_parameter(
         return evaluation_parameters[L[0]]
 
     elif len(L) == 0 or L[0] != "Parse Failure":
-        for i, ob in enumerate(expr.exprStack):
+        # The compiled program is shared, so substitutions are made in (and the stack is consumed from) a copy of it.
+        program = list(compiled_expression.program)
+        for i, ob in enumerate(program):
             if isinstance(ob, str) and ob in evaluation_parameters:
-                expr.exprStack[i] = str(evaluation_parameters[ob])
+                program[i] = str(evaluation_parameters[ob])
 
     else:
         err_str, err_line, err_col = L[-1]
@@ -344,7 +403,7 @@ def parse_evaluation_parameter(
         )
 
     try:
-        result = expr.evaluate_stack(expr.exprStack)
+        result = expr.evaluate_stack(program)
     except Exception as e:
         exception_traceback = traceback.format_exc()
         exception_message = (
@@ -46,6 +46,56 @@ def parse_result_format(result_format):
     return result_format
 
 
+# Number of changes made to the kwargs of any ExpectationConfiguration since it was created (please see _ExpectationKwargs).
+_expectation_kwargs_change_count: int = 0
+
+
+def get_expectation_kwargs_change_count() -> int:
+    """Returns the number of changes made to the kwargs of ExpectationConfigurations since they were created, so that
+    indexes of expectations by their kwargs (e.g., of ExpectationSuite) can tell whether they must be rebuilt."""
+    return _expectation_kwargs_change_count
+
+
+def _count_expectation_kwargs_change():
+    global _expectation_kwargs_change_count
+    _expectation_kwargs_change_count += 1
+
+
+class _ExpectationKwargs(dict):
+    """The kwargs of an ExpectationConfiguration, which count the changes made to them in place.
+
+    Changes of the values (e.g., appending to a list) are not counted; indexes of expectations must check expectations
+    with such mutable kwarg values themselves.
+    """
+
+    __slots__ = ()
+
+    def _changed(method_name: str):
+        def method(self, *args, **kwargs):
+            result = getattr(dict, method_name)(self, *args, **kwargs)
+            _count_expectation_kwargs_change()
+            return result
+
+        method.__name__ = method_name
+        return method
+
+    __setitem__ = _changed("__setitem__")
+    __delitem__ = _changed("__delitem__")
+    clear = _changed("clear")
+    pop = _changed("pop")
+    popitem = _changed("popitem")
+    setdefault = _changed("setdefault")
+    update = _changed("update")
+    if hasattr(dict, "__ior__"):
+        __ior__ = _changed("__ior__")
+
+    del _changed
+
+    def __reduce_ex__(self, protocol):
+        # Copies are created with their items, rather than by setting their items one by one (which counts as changes).
+        return _ExpectationKwargs, (dict(self),)
+
+
 class ExpectationConfiguration(SerializableDictDot):
     """ExpectationConfiguration defines the parameters and name of a specific expectation."""
 
@@ -913,7 +963,7 @@ class ExpectationConfiguration(SerializableDictDot):
             raise InvalidExpectationConfigurationError(
                 "expectation configuration kwargs must be a dict."
             )
-        self._kwargs = kwargs
+        self._kwargs = _ExpectationKwargs(kwargs)
         self._raw_kwargs = None  # the kwargs before evaluation parameters are evaluated
         if meta is None:
             meta = {}
@@ -938,7 +988,8 @@ class ExpectationConfiguration(SerializableDictDot):
         )
 
         self._raw_kwargs = self._kwargs
-        self._kwargs = evaluation_args
+        self._kwargs = _ExpectationKwargs(evaluation_args)
+        _count_expectation_kwargs_change()
         if len(substituted_parameters) > 0:
             self.meta["substituted_parameters"] = substituted_parameters
 
@@ -980,6 +1031,8 @@ class ExpectationConfiguration(SerializableDictDot):
         patch = jsonpatch.JsonPatch([{"op": op, "path": path, "value": value}])
 
         patch.apply(self.kwargs, in_place=True)
+        # The patch may have changed a kwarg value (e.g., a list) in place.
+        _count_expectation_kwargs_change()
         return self
 
     @property
@@ -1,8 +1,10 @@
+import bisect
 import datetime
 import json
 import logging
+from collections import defaultdict
 from copy import deepcopy
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
 
 import great_expectations as ge
 from great_expectations import __version__ as ge_version
@@ -12,6 +14,7 @@ from great_expectations.core.evaluation_parameters import (
 from great_expectations.core.expectation_configuration import (
     ExpectationConfiguration,
     ExpectationConfigurationSchema,
+    get_expectation_kwargs_change_count,
 )
 from great_expectations.core.util import (
     convert_to_json_serializable,
@@ -36,6 +39,266 @@ from great_expectations.types import SerializableDictDot
 logger = logging.getLogger(__name__)
 
 
+def _to_hashable(value: Any) -> Hashable:
+    """Converts a kwarg value into a hashable value, such that equal values are converted into equal values.
+
+    Unequal values may also be converted into equal values (e.g., lists and tuples, or unhashable objects), so that
+    the expectations sharing an index key must still be compared with each other.
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _to_hashable(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_hashable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    try:
+        hash(value)
+    except TypeError:
+        return _UNHASHABLE_KWARG_VALUE
+    return value
+
+
+_UNHASHABLE_KWARG_VALUE = object()
+
+
+class _ExpectationIndex:
+    """Groups the expectations of a suite by expectation type and domain kwargs, and by expectation type and success
+    kwargs, so that finding the expectations matching a configuration only compares it with the expectations of its
+    group.
+
+    Expectations are grouped by identity, along with their slots: positions in the suite, which are not renumbered when
+    an expectation is removed; instead, the vacated slots are recorded, so that the position of a slot is the slot less
+    the number of vacated slots preceding it (until the slots are renumbered, once as many have been vacated as the
+    suite has expectations).  Before the index is searched,
+    expectations whose kwargs were changed in place are regrouped: all of them, if the kwargs of any expectation were
+    changed (please see get_expectation_kwargs_change_count), and otherwise those whose kwarg values searched by are
+    mutable (e.g., a "column_list" list, or, when matching success kwargs, a "value_set" list), as these values may be
+    changed without notice.
+    """
+
+    def __init__(self, expectations: List[ExpectationConfiguration]):
+        self._expectations = expectations
+        self._by_domain: Dict[Hashable, List[ExpectationConfiguration]] = defaultdict(
+            list
+        )
+        self._by_success: Dict[Hashable, List[ExpectationConfiguration]] = defaultdict(
+            list
+        )
+        self._keys: Dict[int, Tuple[Hashable, Hashable]] = {}
+        # Expectations with mutable domain (or success) kwarg values, by identity.
+        self._mutable_domain: Dict[int, ExpectationConfiguration] = {}
+        self._mutable_success: Dict[int, ExpectationConfiguration] = {}
+        self._slots: Dict[int, List[int]] = defaultdict(list)
+        # Sorted slots vacated by removed expectations.
+        self._vacated_slots: List[int] = []
+        self._kwargs_change_count: int = get_expectation_kwargs_change_count()
+        for position, expectation in enumerate(expectations):
+            self._add_to_groups(expectation)
+            self._slots[id(expectation)].append(position)
+
+    @staticmethod
+    def get_keys(
+        expectation_configuration: ExpectationConfiguration,
+    ) -> Tuple[Hashable, Hashable]:
+        expectation_type: str = expectation_configuration.expectation_type
+        return (
+            (
+                expectation_type,
+                _to_hashable(expectation_configuration.get_domain_kwargs()),
+            ),
+            (
+                expectation_type,
+                _to_hashable(expectation_configuration.get_success_kwargs()),
+            ),
+        )
+
+    def _add_to_groups(
+        self,
+        expectation: ExpectationConfiguration,
+        keys: Optional[Tuple[Hashable, Hashable]] = None,
+    ):
+        if keys is None:
+            keys = self._keys.get(id(expectation)) or self.get_keys(expectation)
+        self._keys[id(expectation)] = keys
+        self._by_domain[keys[0]].append(expectation)
+        self._by_success[keys[1]].append(expectation)
+        self._track_mutable_kwargs(expectation)
+
+    def _track_mutable_kwargs(self, expectation: ExpectationConfiguration):
+        for mutable, kwargs in (
+            (self._mutable_domain, expectation.get_domain_kwargs()),
+            (self._mutable_success, expectation.get_success_kwargs()),
+        ):
+            if any(isinstance(value, (list, dict, set)) for value in kwargs.values()):
+                mutable[id(expectation)] = expectation
+            else:
+                mutable.pop(id(expectation), None)
+
+    def _remove_from_groups(self, expectation: ExpectationConfiguration):
+        """Removes one occurrence of the expectation from its groups; returns whether it has other occurrences."""
+        domain_key, success_key = self._keys[id(expectation)]
+        for groups, key in (
+            (self._by_domain, domain_key),
+            (self._by_success, success_key),
+        ):
+            group: List[ExpectationConfiguration] = groups[key]
+            group.pop(next(i for i, e in enumerate(group) if e is expectation))
+            if not group:
+                del groups[key]
+
+        if any(e is expectation for e in self._by_domain.get(domain_key, [])):
+            return True
+
+        del self._keys[id(expectation)]
+        self._mutable_domain.pop(id(expectation), None)
+        self._mutable_success.pop(id(expectation), None)
+        return False
+
+    def _get_position(self, slot: int) -> int:
+        return slot - bisect.bisect_left(self._vacated_slots, slot)
+
+    def _pop_slot(self, position: int, expectation: ExpectationConfiguration) -> int:
+        """Removes the slot of the expectation at the given position of the suite from its slots and returns it."""
+        slots: List[int] = self._slots[id(expectation)]
+        slot: int = next(slot for slot in slots if self._get_position(slot) == position)
+        slots.remove(slot)
+        if not slots:
+            del self._slots[id(expectation)]
+        return slot
+
+    def append(self, expectation: ExpectationConfiguration):
+        """Indexes an expectation appended to the suite."""
+        self._add_to_groups(expectation)
+        # All vacated slots precede the slot of the appended expectation.
+        self._slots[id(expectation)].append(
+            len(self._expectations) - 1 + len(self._vacated_slots)
+        )
+
+    def replace(
+        self,
+        position: int,
+        expectation: ExpectationConfiguration,
+        new_expectation: ExpectationConfiguration,
+    ):
+        """Indexes an expectation replacing another one at the same position of the suite."""
+        self._remove_from_groups(expectation)
+        slot: int = self._pop_slot(position=position, expectation=expectation)
+        self._add_to_groups(new_expectation)
+        self._slots[id(new_expectation)].append(slot)
+
+    def remove(self, position: int, expectation: ExpectationConfiguration):
+        """Removes an expectation (one occurrence of it) removed from the given position of the suite from the index."""
+        self._remove_from_groups(expectation)
+        bisect.insort(
+            self._vacated_slots,
+            self._pop_slot(position=position, expectation=expectation),
+        )
+        if len(self._vacated_slots) > len(self._expectations):
+            self._renumber_slots()
+
+    def _renumber_slots(self):
+        slots: List[int]
+        for slots in self._slots.values():
+            slots[:] = [self._get_position(slot) for slot in slots]
+        self._vacated_slots = []
+
+    def update(
+        self,
+        expectation: ExpectationConfiguration,
+        keys: Optional[Tuple[Hashable, Hashable]] = None,
+    ):
+        """Indexes an expectation of the suite again, after its kwargs were changed."""
+        occurrences: int = sum(
+            e is expectation for e in self._by_domain[self._keys[id(expectation)][0]]
+        )
+        if keys is None:
+            keys = self.get_keys(expectation)
+        for _ in range(occurrences):
+            self._remove_from_groups(expectation)
+        for _ in range(occurrences):
+            self._add_to_groups(expectation, keys=keys)
+
+    def _update_changed_expectations(self, match_type: str):
+        """Regroups the expectations, whose kwargs were changed in place since they were grouped."""
+        kwargs_change_count: int = get_expectation_kwargs_change_count()
+        expectations: Iterable[ExpectationConfiguration]
+        expectation: ExpectationConfiguration
+        if kwargs_change_count != self._kwargs_change_count:
+            self._kwargs_change_count = kwargs_change_count
+            expectations = list({id(e): e for e in self._expectations}.values())
+            # Kwarg values may have been replaced with mutable ones (or the other way around).
+            for expectation in expectations:
+                self._track_mutable_kwargs(expectation)
+        elif match_type == "success":
+            expectations = list(self._mutable_success.values())
+        else:
+            expectations = list(self._mutable_domain.values())
+
+        for expectation in expectations:
+            keys: Tuple[Hashable, Hashable] = self.get_keys(expectation)
+            if keys != self._keys[id(expectation)]:
+                self.update(expectation, keys=keys)
+
+    def find_indexes(
+        self,
+        expectation_configuration: ExpectationConfiguration,
+        match_type: str,
+    ) -> List[int]:
+        self._update_changed_expectations(match_type=match_type)
+
+        domain_key, success_key = self.get_keys(expectation_configuration)
+        # Matching kwargs imply matching domain kwargs, whatever the match type.
+        if match_type == "success":
+            candidates = self._by_success.get(success_key, [])
+        else:
+            candidates = self._by_domain.get(domain_key, [])
+
+        match_indexes: List[int] = []
+        for expectation in {id(e): e for e in candidates}.values():
+            if expectation.isEquivalentTo(expectation_configuration, match_type):
+                match_indexes.extend(
+                    self._get_position(slot) for slot in self._slots[id(expectation)]
+                )
+
+        return sorted(match_indexes)
+
+
+class _ExpectationList(list):
+    """The list of the expectations of a suite, which notifies the suite when it is modified in place."""
+
+    def __init__(self, expectations, on_change: Callable[[], None]):
+        super().__init__(expectations)
+        self._on_change = on_change
+
+    def _changed(method_name: str):
+        def method(self, *args, **kwargs):
+            result = getattr(list, method_name)(self, *args, **kwargs)
+            self._on_change()
+            return result
+
+        method.__name__ = method_name
+        return method
+
+    __setitem__ = _changed("__setitem__")
+    __delitem__ = _changed("__delitem__")
+    __iadd__ = _changed("__iadd__")
+    __imul__ = _changed("__imul__")
+    append = _changed("append")
+    extend = _changed("extend")
+    insert = _changed("insert")
+    pop = _changed("pop")
+    remove = _changed("remove")
+    clear = _changed("clear")
+    sort = _changed("sort")
+    reverse = _changed("reverse")
+
+    del _changed
+
+    def __reduce_ex__(self, protocol):
+        # Copies are plain lists; the suite owning a copy wraps it again.
+        return list, (list(self),)
+
+
 class ExpectationSuite(SerializableDictDot):
     """
     This ExpectationSuite object has create, read, update, and delete functionality for its expectations:
@@ -43,6 +306,11 @@ class ExpectationSuite(SerializableDictDot):
         -read: self.find_expectation_indexes()
         -update: self.add_expectation() or self.patch_expectation()
         -delete: self.remove_expectation()
+
+    Expectations are indexed by expectation type and domain (or success) kwargs, so that these operations do not
+    compare the expectation with every expectation of the suite. The index is updated by the methods of the suite,
+    and rebuilt if the list of expectations is modified or replaced; expectations whose kwargs are modified in place
+    are found by their modified kwargs.
     """
 
     def __init__(
@@ -57,6 +325,7 @@ class ExpectationSuite(SerializableDictDot):
     ):
         self.expectation_suite_name = expectation_suite_name
         self.ge_cloud_id = ge_cloud_id
+        self._expectation_index: Optional[_ExpectationIndex] = None
         if expectations is None:
             expectations = []
         self.expectations = [
@@ -81,6 +350,35 @@ class ExpectationSuite(SerializableDictDot):
         ensure_json_serializable(meta)
         self.meta = meta
 
+    @property
+    def expectations(self) -> List[ExpectationConfiguration]:
+        return self._expectations
+
+    @expectations.setter
+    def expectations(self, expectations: List[ExpectationConfiguration]):
+        self._expectations = _ExpectationList(
+            expectations, on_change=self._invalidate_expectation_index
+        )
+        self._invalidate_expectation_index()
+
+    def _invalidate_expectation_index(self):
+        self._expectation_index = None
+
+    def _get_expectation_index(self) -> _ExpectationIndex:
+        if self._expectation_index is None:
+            self._expectation_index = _ExpectationIndex(self._expectations)
+        return self._expectation_index
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_expectations"] = list(self._expectations)
+        state["_expectation_index"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.expectations = state["_expectations"]
+
     def add_citation(
         self,
         comment: str,
@@ -259,7 +557,9 @@ class ExpectationSuite(SerializableDictDot):
            Notes:
                May want to add type-checking in the future.
         """
-        self.expectations.append(expectation_config)
+        list.append(self._expectations, expectation_config)
+        if self._expectation_index is not None:
+            self._expectation_index.append(expectation_config)
 
     def remove_expectation(
         self,
@@ -293,7 +593,7 @@ class ExpectationSuite(SerializableDictDot):
             if remove_multiple_matches:
                 removed_expectations = []
                 for index in sorted(found_expectation_indexes, reverse=True):
-                    removed_expectations.append(self.expectations.pop(index))
+                    removed_expectations.append(self._pop_expectation(index))
                 return removed_expectations
             else:
                 raise ValueError(
@@ -302,7 +602,25 @@ class ExpectationSuite(SerializableDictDot):
                 )
 
         else:
-            return [self.expectations.pop(found_expectation_indexes[0])]
+            return [self._pop_expectation(found_expectation_indexes[0])]
+
+    def _replace_expectation(
+        self, index: int, expectation_configuration: ExpectationConfiguration
+    ):
+        expectation: ExpectationConfiguration = self._expectations[index]
+        list.__setitem__(self._expectations, index, expectation_configuration)
+        if self._expectation_index is not None:
+            self._expectation_index.replace(
+                position=index,
+                expectation=expectation,
+                new_expectation=expectation_configuration,
+            )
+
+    def _pop_expectation(self, index: int) -> ExpectationConfiguration:
+        expectation: ExpectationConfiguration = list.pop(self._expectations, index)
+        if self._expectation_index is not None:
+            self._expectation_index.remove(position=index, expectation=expectation)
+        return expectation
 
     def remove_all_expectations_of_type(
         self, expectation_types: Union[List[str], str]
@@ -347,12 +665,12 @@ class ExpectationSuite(SerializableDictDot):
             raise InvalidExpectationConfigurationError(
                 "Ensure that expectation configuration is valid."
             )
-        match_indexes = []
-        for idx, expectation in enumerate(self.expectations):
-            if expectation.isEquivalentTo(expectation_configuration, match_type):
-                match_indexes.append(idx)
+        if not self._expectations:
+            return []
 
-        return match_indexes
+        return self._get_expectation_index().find_indexes(
+            expectation_configuration, match_type
+        )
 
     def find_expectations(
         self,
@@ -362,14 +680,7 @@ class ExpectationSuite(SerializableDictDot):
         found_expectation_indexes = self.find_expectation_indexes(
             expectation_configuration, match_type
         )
-        if len(found_expectation_indexes) > 0:
-            return [
-                expectation
-                for idx, expectation in enumerate(self.expectations)
-                if idx in found_expectation_indexes
-            ]
-        else:
-            return []
+        return [self.expectations[idx] for idx in found_expectation_indexes]
 
     def patch_expectation(
         self,
@@ -408,8 +719,13 @@ class ExpectationSuite(SerializableDictDot):
                 "criteria"
             )
 
-        self.expectations[found_expectation_indexes[0]].patch(op, path, value)
-        return self.expectations[found_expectation_indexes[0]]
+        expectation: ExpectationConfiguration = self.expectations[
+            found_expectation_indexes[0]
+        ]
+        expectation.patch(op, path, value)
+        if self._expectation_index is not None:
+            self._expectation_index.update(expectation)
+        return expectation
 
     def add_expectation(
         self,
@@ -447,9 +763,9 @@ class ExpectationSuite(SerializableDictDot):
             #   .kwargs, expectation_configuration.kwargs)
             # patch_expectation.apply(self.expectations[found_expectation_index].kwargs, in_place=True)
             if overwrite_existing:
-                self.expectations[
-                    found_expectation_indexes[0]
-                ] = expectation_configuration
+                self._replace_expectation(
+                    found_expectation_indexes[0], expectation_configuration
+                )
             else:
                 raise DataContextError(
                     "A matching ExpectationConfiguration already exists. If you would like to overwrite this "
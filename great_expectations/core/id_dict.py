@@ -3,13 +3,31 @@ import json
 
 
 class IDDict(dict):
+    """A dictionary that can compute a stable identifier ("id") of its contents.
+
+    The id computed with the default arguments of "to_id()" is memoized and is invalidated whenever the dictionary is
+    modified through any of its mutating methods.  Values held by the dictionary are treated as immutable: modifying
+    a nested value in place does not invalidate the memoized id.
+    """
+
     _id_ignore_keys = set()
+    _id = None
 
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is None and id_ignore_keys is None:
+            if self._id is None:
+                self._id = self._compute_id(
+                    id_keys=self.keys(), id_ignore_keys=self._id_ignore_keys
+                )
+            return self._id
+
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
             id_ignore_keys = self._id_ignore_keys
+        return self._compute_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+    def _compute_id(self, id_keys, id_ignore_keys):
         id_keys = set(id_keys) - set(id_ignore_keys)
         if len(id_keys) == 0:
             return tuple()
@@ -22,6 +40,43 @@ class IDDict(dict):
             json.dumps(_id_dict, sort_keys=True).encode("utf-8")
         ).hexdigest()
 
+    def _invalidate_id(self):
+        self._id = None
+
+    def __setitem__(self, key, value):
+        self._invalidate_id()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._invalidate_id()
+        super().__delitem__(key)
+
+    def clear(self):
+        self._invalidate_id()
+        super().clear()
+
+    def pop(self, *args):
+        self._invalidate_id()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._invalidate_id()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._invalidate_id()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._invalidate_id()
+        super().update(*args, **kwargs)
+
+    if hasattr(dict, "__ior__"):
+        # The in-place union operator ("|=") is only available as of Python 3.9.
+        def __ior__(self, other):
+            self._invalidate_id()
+            return super().__ior__(other)
+
 
 class BatchKwargs(IDDict):
     pass
@@ -0,0 +1,289 @@
+import math
+import random
+from typing import Any, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR = 0.01
+DEFAULT_DISTINCT_VALUES_SKETCH_RELATIVE_ERROR = 0.01
+
+# For a KLL sketch with parameter k, the normalized rank error is about 3.3 / k (e.g., 1.65% for k = 200).
+_KLL_ERROR_CONSTANT = 3.3
+_KLL_MIN_K = 8
+_KLL_CAPACITY_DECAY = 2.0 / 3.0
+
+_HLL_MIN_PRECISION = 4
+_HLL_MAX_PRECISION = 18
+
+
+def _validate_relative_error(relative_error: float) -> None:
+    if (
+        isinstance(relative_error, bool)
+        or not isinstance(relative_error, (int, float))
+        or not 0 < relative_error < 1
+    ):
+        raise ValueError(
+            f"The relative error of a sketch must be a number between 0 and 1 (received {relative_error})."
+        )
+
+
+def _concatenate(arrays: List[np.ndarray]) -> np.ndarray:
+    # Empty arrays are skipped, so that they do not change the type of the values (e.g., integers to floats).
+    non_empty_arrays: List[np.ndarray] = [array for array in arrays if array.size > 0]
+    if not non_empty_arrays:
+        return np.empty(0)
+
+    return np.concatenate(non_empty_arrays)
+
+
+class KllQuantileSketch:
+    """A mergeable sketch of the distribution of (non-null) values, answering quantile queries within a bounded rank
+    error (Karnin, Lang, and Liberty, "Optimal Quantile Approximation in Streams", 2016).
+
+    The sketch retains a number of values independent of the number of values added: values are added to the lowest
+    of a hierarchy of compactors; whenever a compactor exceeds its capacity, its values are sorted, and every other
+    value is promoted to the next compactor (with twice the weight), the others being discarded. Sketches built from
+    different data (e.g., batches, chunks, or partitions) are combined with "merge", without revisiting the data.
+    """
+
+    def __init__(
+        self,
+        relative_error: float = DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            relative_error: the tolerated error on the rank of quantiles, as a fraction of the number of values
+            seed: the seed of the random choices of the values promoted by compactions
+        """
+        _validate_relative_error(relative_error=relative_error)
+        self._relative_error = relative_error
+        self._k = max(_KLL_MIN_K, int(math.ceil(_KLL_ERROR_CONSTANT / relative_error)))
+        self._compactors: List[np.ndarray] = [np.empty(0)]
+        self._count = 0
+        self._min_value: Any = None
+        self._max_value: Any = None
+        self._random = random.Random(seed)
+
+    @property
+    def relative_error(self) -> float:
+        return self._relative_error
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def num_retained(self) -> int:
+        return sum(len(compactor) for compactor in self._compactors)
+
+    def update(self, values: Iterable) -> "KllQuantileSketch":
+        """Adds the values (which must be non-null and mutually comparable) to the sketch."""
+        values = np.asarray(values if isinstance(values, np.ndarray) else list(values))
+        if values.size == 0:
+            return self
+
+        values = values.ravel()
+        min_value = values.min()
+        max_value = values.max()
+        if self._count == 0:
+            self._min_value, self._max_value = min_value, max_value
+        else:
+            self._min_value = min(self._min_value, min_value)
+            self._max_value = max(self._max_value, max_value)
+
+        self._count += values.size
+        self._compactors[0] = _concatenate([self._compactors[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: "KllQuantileSketch") -> "KllQuantileSketch":
+        """Returns a new sketch of the values of both sketches (the coarser of the two accuracies is retained)."""
+        merged = KllQuantileSketch(
+            relative_error=max(self._relative_error, other._relative_error)
+        )
+        merged._random = random.Random(self._random.random())
+        merged._count = self._count + other._count
+        for sketch in (self, other):
+            if sketch._count == 0:
+                continue
+
+            if merged._min_value is None:
+                merged._min_value = sketch._min_value
+                merged._max_value = sketch._max_value
+            else:
+                merged._min_value = min(merged._min_value, sketch._min_value)
+                merged._max_value = max(merged._max_value, sketch._max_value)
+
+        num_levels: int = max(len(self._compactors), len(other._compactors))
+        merged._compactors = [
+            _concatenate(
+                [
+                    sketch._compactors[level]
+                    for sketch in (self, other)
+                    if level < len(sketch._compactors)
+                ]
+            )
+            for level in range(num_levels)
+        ]
+        merged._compress()
+        return merged
+
+    def quantiles(self, quantiles: Iterable[float]) -> List[Any]:
+        """Returns the approximate values at the given quantiles (None for all quantiles, if the sketch is empty)."""
+        quantiles = list(quantiles)
+        if self._count == 0:
+            return [None] * len(quantiles)
+
+        values: np.ndarray = _concatenate(self._compactors)
+        weights: np.ndarray = np.concatenate(
+            [
+                np.full(len(compactor), 2 ** level, dtype=np.int64)
+                for level, compactor in enumerate(self._compactors)
+            ]
+        )
+        order: np.ndarray = np.argsort(values, kind="mergesort")
+        values = values[order]
+        cumulative_weights: np.ndarray = np.cumsum(weights[order])
+
+        result: List[Any] = []
+        for quantile in quantiles:
+            if quantile <= 0:
+                result.append(self._min_value)
+            elif quantile >= 1:
+                result.append(self._max_value)
+            else:
+                # The value of (approximate) rank "nearest" to the quantile, as with pandas' "nearest" interpolation.
+                rank: int = int(round(quantile * (self._count - 1)))
+                index: int = int(
+                    np.searchsorted(cumulative_weights, rank, side="right")
+                )
+                result.append(values[min(index, len(values) - 1)])
+
+        return [
+            value.item() if isinstance(value, np.generic) else value for value in result
+        ]
+
+    def _get_capacity(self, level: int) -> int:
+        depth: int = len(self._compactors) - level - 1
+        return max(2, int(math.ceil(self._k * _KLL_CAPACITY_DECAY ** depth)))
+
+    def _compress(self) -> None:
+        while True:
+            level: Optional[int] = next(
+                (
+                    level
+                    for level, compactor in enumerate(self._compactors)
+                    if len(compactor) > self._get_capacity(level=level)
+                ),
+                None,
+            )
+            if level is None:
+                return
+
+            if level + 1 == len(self._compactors):
+                self._compactors.append(np.empty(0))
+
+            compactor: np.ndarray = np.sort(self._compactors[level], kind="mergesort")
+            # With an odd number of values, one value stays at its level.
+            even_length: int = len(compactor) - len(compactor) % 2
+            retained: np.ndarray = compactor[even_length:]
+            compactor = compactor[:even_length]
+            offset: int = self._random.randint(0, 1)
+            promoted: np.ndarray = compactor[offset::2]
+            self._compactors[level] = retained
+            self._compactors[level + 1] = _concatenate(
+                [self._compactors[level + 1], promoted]
+            )
+
+
+class HyperLogLogSketch:
+    """A mergeable sketch of the number of distinct (non-null) values, within a bounded relative error (Flajolet et al.,
+    "HyperLogLog: the analysis of a near-optimal cardinality estimation algorithm", 2007).
+
+    Values are hashed by their string representation, so that sketches built by different execution engines (or from
+    columns of different types) agree. Sketches built from different data are combined with "merge", without
+    revisiting the data.
+    """
+
+    def __init__(
+        self, relative_error: float = DEFAULT_DISTINCT_VALUES_SKETCH_RELATIVE_ERROR
+    ):
+        """
+        Args:
+            relative_error: the tolerated (standard) error on the number of distinct values, as a fraction of it
+        """
+        _validate_relative_error(relative_error=relative_error)
+        # The standard error of HyperLogLog with 2^precision registers is about 1.04 / sqrt(2^precision).
+        self._precision = min(
+            _HLL_MAX_PRECISION,
+            max(
+                _HLL_MIN_PRECISION,
+                int(math.ceil(math.log2((1.04 / relative_error) ** 2))),
+            ),
+        )
+        self._registers = np.zeros(2 ** self._precision, dtype=np.uint8)
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    def update(self, values: Iterable) -> "HyperLogLogSketch":
+        """Adds the (non-null) values to the sketch."""
+        values = np.asarray(
+            values if isinstance(values, np.ndarray) else list(values), dtype=object
+        ).ravel()
+        if values.size == 0:
+            return self
+
+        hashes: np.ndarray = pd.util.hash_array(values.astype(str).astype(object))
+        precision = np.uint64(self._precision)
+        indices: np.ndarray = (hashes >> (np.uint64(64) - precision)).astype(np.int64)
+        remaining_bits: np.ndarray = hashes << precision
+
+        # The rank of a hash is the position of the leftmost 1-bit of its remaining bits.
+        leading_zeros = np.zeros(len(hashes), dtype=np.uint8)
+        shifted_bits: np.ndarray = remaining_bits.copy()
+        for shift in (32, 16, 8, 4, 2, 1):
+            is_zero: np.ndarray = (shifted_bits >> np.uint64(64 - shift)) == 0
+            leading_zeros[is_zero] += shift
+            shifted_bits[is_zero] <<= np.uint64(shift)
+        leading_zeros[remaining_bits == 0] = 64
+        ranks: np.ndarray = np.minimum(leading_zeros, 64 - self._precision) + 1
+
+        np.maximum.at(self._registers, indices, ranks.astype(np.uint8))
+        return self
+
+    def merge(self, other: "HyperLogLogSketch") -> "HyperLogLogSketch":
+        """Returns a new sketch of the values of both sketches, which must have the same precision."""
+        if other._precision != self._precision:
+            raise ValueError(
+                f"HyperLogLog sketches of different precisions ({self._precision} and {other._precision}) cannot be "
+                "merged."
+            )
+
+        merged = HyperLogLogSketch.__new__(HyperLogLogSketch)
+        merged._precision = self._precision
+        merged._registers = np.maximum(self._registers, other._registers)
+        return merged
+
+    def count(self) -> int:
+        """Returns the estimated number of distinct values added to the sketch."""
+        num_registers: int = len(self._registers)
+        if num_registers >= 128:
+            alpha: float = 0.7213 / (1 + 1.079 / num_registers)
+        else:
+            alpha = {16: 0.673, 32: 0.697, 64: 0.709}[num_registers]
+
+        estimate: float = (
+            alpha
+            * num_registers ** 2
+            / np.sum(np.power(2.0, -self._registers.astype(np.float64)))
+        )
+        num_zero_registers: int = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * num_registers and num_zero_registers > 0:
+            # Linear counting is more accurate for small numbers of distinct values.
+            estimate = num_registers * math.log(num_registers / num_zero_registers)
+
+        return int(round(estimate))
@@ -1,26 +1,29 @@
+from functools import lru_cache
+from typing import Set
+
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
-from great_expectations.dataset import Dataset
-from great_expectations.expectations.registry import (
-    list_registered_expectation_implementations,
-)
+from great_expectations.expectations.registry_manifest import EXPECTATION_MODULES
+
 
-v2_batchkwargs_api_supported_expectation_types = [
-    el for el in Dataset.__dict__.keys() if el.startswith("expect_")
-]
+@lru_cache(maxsize=None)
+def get_ge_expectation_types() -> Set[str]:
+    """Returns the types of the Expectations provided by Great Expectations (the V2 and the V3 API ones)."""
+    # The legacy Dataset API is imported only when used, which keeps importing this module fast.
+    from great_expectations.dataset import Dataset
 
-v3_batchrequest_api_supported_expectation_types = (
-    list_registered_expectation_implementations()
-)
+    v2_batchkwargs_api_supported_expectation_types = [
+        el for el in Dataset.__dict__.keys() if el.startswith("expect_")
+    ]
+    v3_batchrequest_api_supported_expectation_types = list(EXPECTATION_MODULES)
 
-GE_EXPECTATION_TYPES = set(v2_batchkwargs_api_supported_expectation_types).union(
-    set(v3_batchrequest_api_supported_expectation_types)
-)
+    return set(v2_batchkwargs_api_supported_expectation_types).union(
+        set(v3_batchrequest_api_supported_expectation_types)
+    )
 
 
 class ExpectationSuiteAnonymizer(Anonymizer):
     def __init__(self, salt=None):
         super().__init__(salt=salt)
-        self._ge_expectation_types = GE_EXPECTATION_TYPES
 
     def anonymize_expectation_suite_info(self, expectation_suite):
         anonymized_info_dict = {}
@@ -30,9 +33,10 @@ class ExpectationSuiteAnonymizer(Anonymizer):
         expectation_types = [
             expectation.expectation_type for expectation in expectations
         ]
+        ge_expectation_types: Set[str] = get_ge_expectation_types()
         for expectation_type in set(expectation_types):
             expectation_info = {"count": expectation_types.count(expectation_type)}
-            if expectation_type in self._ge_expectation_types:
+            if expectation_type in ge_expectation_types:
                 expectation_info["expectation_type"] = expectation_type
             else:
                 expectation_info["anonymized_expectation_type"] = self.anonymize(
@@ -335,6 +335,9 @@ class BaseDataContext:
             )
         self._ge_cloud_mode = ge_cloud_mode
         self._ge_cloud_config = ge_cloud_config
+        # The config variables and the project config with variables substituted are cached (see "refresh()").
+        self._cached_config_variables = None
+        self._cached_project_config_with_variables_substituted = None
         self._project_config = project_config
         self._apply_global_config_overrides()
 
@@ -366,6 +369,7 @@ class BaseDataContext:
         self._project_config.anonymous_usage_statistics.data_context_id = (
             self._data_context_id
         )
+        self.refresh()
         self._initialize_usage_statistics(
             self.project_config_with_variables_substituted.anonymous_usage_statistics
         )
@@ -449,7 +453,8 @@ class BaseDataContext:
         Note that stores do NOT manage plugins.
         """
         for store_name, store_config in store_configs.items():
-            self._build_store_from_config(store_name, store_config)
+            # Store configs are updated while building stores; copies keep the cached substituted config intact.
+            self._build_store_from_config(store_name, copy.deepcopy(store_config))
 
     def _init_datasources(self, config):
         if not config.datasources:
@@ -621,7 +626,11 @@ class BaseDataContext:
         """
 
         self._project_config["stores"][store_name] = store_config
-        return self._build_store_from_config(store_name, store_config)
+        self.refresh()
+        new_store = self._build_store_from_config(store_name, store_config)
+        # Building the store may have updated its config (e.g., with the store backend id settings).
+        self.refresh()
+        return new_store
 
     def add_validation_operator(
         self, validation_operator_name, validation_operator_config
@@ -639,6 +648,7 @@ class BaseDataContext:
         self._project_config["validation_operators"][
             validation_operator_name
         ] = validation_operator_config
+        self.refresh()
         config = self.project_config_with_variables_substituted.validation_operators[
             validation_operator_name
         ]
@@ -813,6 +823,7 @@ class BaseDataContext:
 
     @property
     def project_config_with_variables_substituted(self) -> DataContextConfig:
+        """The project config with config variables substituted (cached; see "refresh()"), which must not be modified."""
         return self.get_config_with_variables_substituted()
 
     @property
@@ -896,7 +907,7 @@ class BaseDataContext:
 
     @property
     def instance_id(self):
-        instance_id = self._load_config_variables_file().get("instance_id")
+        instance_id = self.config_variables.get("instance_id")
         if instance_id is None:
             if self._in_memory_instance_id is not None:
                 return self._in_memory_instance_id
@@ -906,8 +917,30 @@ class BaseDataContext:
 
     @property
     def config_variables(self):
-        # Note Abe 20121114 : We should probably cache config_variables instead of loading them from disk every time.
-        return dict(self._load_config_variables_file())
+        return dict(self._get_cached_config_variables())
+
+    @property
+    def runtime_environment(self) -> dict:
+        return self._runtime_environment
+
+    @runtime_environment.setter
+    def runtime_environment(self, runtime_environment: dict):
+        self._runtime_environment = runtime_environment
+        self.refresh()
+
+    def refresh(self):
+        """
+        Discards the cached config variables and project config with variables substituted, so that they are loaded and
+        substituted again upon next access.
+
+        The cache is refreshed automatically when the project config or the config variables are changed through the
+        DataContext API (e.g., "set_config()", "add_store()", "add_datasource()", or "save_config_variable()") and
+        when the runtime environment is replaced; call this method after modifying the project config (e.g., as
+        returned by "get_config()") or the config variables file in any other way, or after changing environment
+        variables.
+        """
+        self._cached_config_variables = None
+        self._cached_project_config_with_variables_substituted = None
 
     #####
     #
@@ -928,20 +961,9 @@ class BaseDataContext:
                     config.read(config_path)
                     return dict(config.items(section="ge_cloud_config"))
             return {}
-        config_variables_file_path = self.get_config().config_variables_file_path
-        if config_variables_file_path:
+        var_path = self._get_config_variables_file_path(environment=dict(os.environ))
+        if var_path:
             try:
-                # If the user specifies the config variable path with an environment variable, we want to substitute it
-                defined_path = substitute_config_variable(
-                    config_variables_file_path, dict(os.environ)
-                )
-                if not os.path.isabs(defined_path):
-                    # A BaseDataContext will not have a root directory; in that case use the current directory
-                    # for any non-absolute path
-                    root_directory = self.root_directory or os.curdir
-                else:
-                    root_directory = ""
-                var_path = os.path.join(root_directory, defined_path)
                 with open(var_path) as config_variables_file:
                     return yaml.load(config_variables_file) or {}
             except OSError as e:
@@ -952,19 +974,62 @@ class BaseDataContext:
         else:
             return {}
 
+    def _get_config_variables_file_path(self, environment: dict) -> Optional[str]:
+        config_variables_file_path = self._project_config.config_variables_file_path
+        if not config_variables_file_path:
+            return None
+
+        # If the user specifies the config variable path with an environment variable, we want to substitute it
+        defined_path = substitute_config_variable(
+            config_variables_file_path, environment
+        )
+        if not os.path.isabs(defined_path):
+            # A BaseDataContext will not have a root directory; in that case use the current directory
+            # for any non-absolute path
+            root_directory = self.root_directory or os.curdir
+        else:
+            root_directory = ""
+        return os.path.join(root_directory, defined_path)
+
+    def _get_cached_config_variables(self) -> dict:
+        if self._cached_config_variables is None:
+            self._cached_config_variables = self._load_config_variables_file()
+
+        return self._cached_config_variables
+
     def get_config_with_variables_substituted(self, config=None) -> DataContextConfig:
         """
         Substitute vars in config of form ${var} or $(var) with values found in the following places,
         in order of precedence: ge_cloud_config (for Data Contexts in GE Cloud mode), runtime_environment,
         environment variables, config_variables, or ge_cloud_config_variable_defaults (allows certain variables to
         be optional in GE Cloud mode).
+
+        If no config is given, the project config is substituted; the result is cached until "refresh()" is called.
         """
-        if not config:
-            config = self._project_config
+        if config:
+            return self._substitute_config_variables(
+                config=config,
+                config_variables=self._get_cached_config_variables(),
+                environment=dict(os.environ),
+            )
+
+        if self._cached_project_config_with_variables_substituted is None:
+            self._cached_project_config_with_variables_substituted = (
+                self._substitute_config_variables(
+                    config=self._project_config,
+                    config_variables=self._get_cached_config_variables(),
+                    environment=dict(os.environ),
+                )
+            )
 
+        return self._cached_project_config_with_variables_substituted
+
+    def _substitute_config_variables(
+        self, config, config_variables: dict, environment: dict
+    ) -> DataContextConfig:
         substituted_config_variables = substitute_all_config_variables(
-            self.config_variables,
-            dict(os.environ),
+            config_variables,
+            environment,
             self.DOLLAR_SIGN_ESCAPE_STRING,
         )
 
@@ -973,7 +1038,7 @@ class BaseDataContext:
         # self.ge_cloud_config and will take precedence
         substitutions = {
             **substituted_config_variables,
-            **dict(os.environ),
+            **environment,
             **self.runtime_environment,
             **(self.ge_cloud_config.to_json_dict() if self.ge_cloud_mode else {}),
         }
@@ -1065,7 +1130,7 @@ class BaseDataContext:
             skip_if_substitution_variable=skip_if_substitution_variable,
         )
         config_variables[config_variable_name] = value
-        config_variables_filepath = self.get_config().config_variables_file_path
+        config_variables_filepath = self._project_config.config_variables_file_path
         if not config_variables_filepath:
             raise ge_exceptions.InvalidConfigError(
                 "'config_variables_file_path' property is not found in config - setting it is required to use this feature"
@@ -1088,6 +1153,8 @@ class BaseDataContext:
         with open(config_variables_filepath, "w") as config_variables_file:
             yaml.dump(config_variables, config_variables_file)
 
+        self.refresh()
+
     def delete_datasource(self, datasource_name: str):
         """Delete a data source
         Args:
@@ -1106,6 +1173,7 @@ class BaseDataContext:
                 # datasource_name].remove()
                 del self._project_config["datasources"][datasource_name]
                 del self._cached_datasources[datasource_name]
+                self.refresh()
             else:
                 raise ValueError(f"Datasource {datasource_name} not found")
 
@@ -1791,10 +1859,13 @@ class BaseDataContext:
         path: Optional[str] = None,
         batch_filter_parameters: Optional[dict] = None,
         expectation_suite_ge_cloud_id: Optional[str] = None,
+        batch_list: Optional[List[Batch]] = None,
         **kwargs,
     ) -> Validator:
         """
         This method applies only to the new (V3) Datasource schema.
+
+        The batches are loaded for the batch request(s), unless already loaded batches are passed as batch_list.
         """
 
         if (
@@ -1835,36 +1906,44 @@ class BaseDataContext:
                 "Only one of batch_request or batch_request_list may be specified"
             )
 
-        if not batch_request_list:
-            batch_request_list = [batch_request]
-
-        batch_list: List = []
-        for batch_request in batch_request_list:
-            batch_list.extend(
-                self.get_batch_list(
-                    datasource_name=datasource_name,
-                    data_connector_name=data_connector_name,
-                    data_asset_name=data_asset_name,
-                    batch_request=batch_request,
-                    batch_data=batch_data,
-                    data_connector_query=data_connector_query,
-                    batch_identifiers=batch_identifiers,
-                    limit=limit,
-                    index=index,
-                    custom_filter_function=custom_filter_function,
-                    batch_spec_passthrough=batch_spec_passthrough,
-                    sampling_method=sampling_method,
-                    sampling_kwargs=sampling_kwargs,
-                    splitter_method=splitter_method,
-                    splitter_kwargs=splitter_kwargs,
-                    runtime_parameters=runtime_parameters,
-                    query=query,
-                    path=path,
-                    batch_filter_parameters=batch_filter_parameters,
-                    **kwargs,
-                )
+        if batch_list is not None and (
+            batch_request is not None or batch_request_list is not None
+        ):
+            raise ValueError(
+                "batch_list may not be specified along with batch_request or batch_request_list"
             )
 
+        if batch_list is None:
+            if not batch_request_list:
+                batch_request_list = [batch_request]
+
+            batch_list = []
+            for batch_request in batch_request_list:
+                batch_list.extend(
+                    self.get_batch_list(
+                        datasource_name=datasource_name,
+                        data_connector_name=data_connector_name,
+                        data_asset_name=data_asset_name,
+                        batch_request=batch_request,
+                        batch_data=batch_data,
+                        data_connector_query=data_connector_query,
+                        batch_identifiers=batch_identifiers,
+                        limit=limit,
+                        index=index,
+                        custom_filter_function=custom_filter_function,
+                        batch_spec_passthrough=batch_spec_passthrough,
+                        sampling_method=sampling_method,
+                        sampling_kwargs=sampling_kwargs,
+                        splitter_method=splitter_method,
+                        splitter_kwargs=splitter_kwargs,
+                        runtime_parameters=runtime_parameters,
+                        query=query,
+                        path=path,
+                        batch_filter_parameters=batch_filter_parameters,
+                        **kwargs,
+                    )
+                )
+
         # We get a single batch_definition so we can get the execution_engine here. All batches will share the same one
         # So the batch itself doesn't matter. But we use -1 because that will be the latest batch loaded.
         batch_definition = batch_list[-1].batch_definition
@@ -1932,6 +2011,7 @@ class BaseDataContext:
             CommentedMap(**config)
         )
         self._project_config["datasources"][name] = datasource_config
+        self.refresh()
         datasource_config = self.project_config_with_variables_substituted.datasources[
             name
         ]
@@ -1946,6 +2026,7 @@ class BaseDataContext:
             except ge_exceptions.DatasourceInitializationError as e:
                 # Do not keep configuration that could not be instantiated.
                 del self._project_config["datasources"][name]
+                self.refresh()
                 raise e
         else:
             datasource = None
@@ -2000,6 +2081,7 @@ class BaseDataContext:
 
     def set_config(self, project_config: DataContextConfig):
         self._project_config = project_config
+        self.refresh()
 
     def get_config(
         self, mode="typed"
@@ -2104,6 +2186,7 @@ class BaseDataContext:
             key,
             value,
         ) in self.project_config_with_variables_substituted.datasources.items():
+            value = copy.deepcopy(value)
             value["name"] = key
 
             if "credentials" in value:
@@ -2164,6 +2247,7 @@ class BaseDataContext:
         ) in (
             self.project_config_with_variables_substituted.validation_operators.items()
         ):
+            value = copy.deepcopy(value)
             value["name"] = name
             validation_operators.append(value)
         return validation_operators
@@ -3498,6 +3582,7 @@ Generated, evaluated, and stored %d Expectations during profiling. Please review
                 )
                 store_name = instantiated_class.store_name or store_name
                 self._project_config["stores"][store_name] = config
+                self.refresh()
 
                 store_anonymizer = StoreAnonymizer(self.data_context_id)
                 usage_stats_event_payload = store_anonymizer.anonymize_store_info(
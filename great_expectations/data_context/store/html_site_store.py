@@ -1,4 +1,5 @@
 import inspect
+import json
 import logging
 import os
 from mimetypes import guess_type
@@ -14,7 +15,11 @@ from great_expectations.data_context.util import (
     instantiate_class_from_config,
     load_class,
 )
-from great_expectations.exceptions import ClassInstantiationError, DataContextError
+from great_expectations.exceptions import (
+    ClassInstantiationError,
+    DataContextError,
+    StoreConfigurationError,
+)
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
@@ -98,7 +103,7 @@ class HtmlSiteStore:
 
     _key_class = SiteSectionIdentifier
 
-    def __init__(self, store_backend=None, runtime_environment=None):
+    def __init__(self, store_backend=None, runtime_environment=None, incremental=False):
         store_backend_module_name = store_backend.get(
             "module_name", "great_expectations.data_context.store"
         )
@@ -198,6 +203,32 @@ class HtmlSiteStore:
                 class_name=store_backend["class_name"],
             )
 
+        # Only incremental builds keep a manifest of the rendered pages.
+        manifest_obj = None
+        if incremental:
+            manifest_config_defaults = {
+                "module_name": module_name,
+                "filepath_template": "data_docs_manifest.json",
+                "suppress_store_backend_id": True,
+            }
+            if is_ge_cloud_store:
+                manifest_config_defaults = {
+                    "module_name": module_name,
+                    "suppress_store_backend_id": True,
+                }
+
+            manifest_obj = instantiate_class_from_config(
+                config=store_backend,
+                runtime_environment=runtime_environment,
+                config_defaults=manifest_config_defaults,
+            )
+            if not manifest_obj:
+                raise ClassInstantiationError(
+                    module_name=module_name,
+                    package_name=None,
+                    class_name=store_backend["class_name"],
+                )
+
         static_assets_config_defaults = {
             "module_name": module_name,
             "filepath_template": None,
@@ -226,6 +257,8 @@ class HtmlSiteStore:
             "index_page": index_page_obj,
             "static_assets": static_assets_obj,
         }
+        if manifest_obj is not None:
+            self.store_backends["manifest"] = manifest_obj
 
         # NOTE: Instead of using the filesystem as the source of record for keys,
         # this class tracks keys separately in an internal set.
@@ -367,6 +400,37 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def get_manifest(self) -> dict:
+        """Returns the manifest of the pages rendered by incremental builds of the site (empty if there is none)."""
+        manifest_store_backend = self.store_backends.get("manifest")
+        if manifest_store_backend is None:
+            raise StoreConfigurationError(
+                "The manifest of a Data Docs site is only kept by incremental builds."
+            )
+
+        if not manifest_store_backend.has_key(()):
+            return {}
+
+        manifest = manifest_store_backend.get(())
+        if isinstance(manifest, bytes):
+            manifest = manifest.decode("utf-8")
+        try:
+            return json.loads(manifest)
+        except ValueError:
+            logger.warning(
+                "The Data Docs manifest could not be parsed; all pages will be rendered again."
+            )
+            return {}
+
+    def set_manifest(self, manifest: dict):
+        """Like the index page, the manifest uses a zero-length tuple as a key."""
+        return self.store_backends["manifest"].set(
+            (),
+            json.dumps(manifest, indent=2),
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
     def clean_site(self):
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Dict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from great_expectations.core.data_context_key import DataContextKey
 from great_expectations.data_context.store.ge_cloud_store_backend import (
@@ -154,6 +154,27 @@ class Store:
         else:
             return None
 
+    def get_many(self, keys: Iterable) -> List[Any]:
+        """Returns the values of the keys, in the order of the keys; the store backend may retrieve them concurrently."""
+        keys = list(keys)
+        # Stores overriding "get" retrieve their values one key at a time, so as to honor their own retrieval logic.
+        if type(self).get is not Store.get or StoreBackend.STORE_BACKEND_ID_KEY in keys:
+            return [self.get(key) for key in keys]
+
+        for key in keys:
+            self._validate_key(key)
+
+        values: List[Any] = self._store_backend.get_many(
+            [self.key_to_tuple(key) for key in keys]
+        )
+        deserialized_values: List[Any] = []
+        for key, value in zip(keys, values):
+            if value and self.ge_cloud_mode:
+                value = self.ge_cloud_response_json_to_object_dict(response_json=value)
+            deserialized_values.append(self.deserialize(key, value) if value else None)
+
+        return deserialized_values
+
     def set(self, key, value, **kwargs):
         if key == StoreBackend.STORE_BACKEND_ID_KEY:
             return self._store_backend.set(key, value, **kwargs)
@@ -163,6 +184,26 @@ class Store:
                 self.key_to_tuple(key), self.serialize(key, value), **kwargs
             )
 
+    def set_many(self, items: Iterable[Tuple[Any, Any]], **kwargs) -> List[Any]:
+        """Sets the values of the (key, value) items; the store backend may store them concurrently."""
+        items = list(items)
+        # Stores overriding "set" store their values one key at a time, so as to honor their own storage logic.
+        if type(self).set is not Store.set or any(
+            key == StoreBackend.STORE_BACKEND_ID_KEY for key, _ in items
+        ):
+            return [self.set(key, value, **kwargs) for key, value in items]
+
+        for key, _ in items:
+            self._validate_key(key)
+
+        return self._store_backend.set_many(
+            [
+                (self.key_to_tuple(key), self.serialize(key, value))
+                for key, value in items
+            ],
+            **kwargs,
+        )
+
     def list_keys(self):
         keys_without_store_backend_id = [
             key
@@ -171,6 +212,14 @@ class Store:
         ]
         return [self.tuple_to_key(key) for key in keys_without_store_backend_id]
 
+    def list_key_versions(self) -> Dict[Any, Optional[str]]:
+        """Returns the keys of the store, each with the version of its value reported by the store backend (if any)."""
+        return {
+            self.tuple_to_key(key): version
+            for key, version in self._store_backend.list_key_versions().items()
+            if not key == StoreBackend.STORE_BACKEND_ID_KEY
+        }
+
     def has_key(self, key):
         if key == StoreBackend.STORE_BACKEND_ID_KEY:
             return self._store_backend.has_key(key)
@@ -179,6 +228,20 @@ class Store:
                 return self._store_backend.has_key(key.to_fixed_length_tuple())
             return self._store_backend.has_key(key.to_tuple())
 
+    def has_many(self, keys: Iterable) -> List[bool]:
+        """Returns whether each of the keys exists, in the order of the keys."""
+        keys = list(keys)
+        if (
+            type(self).has_key is not Store.has_key
+            or StoreBackend.STORE_BACKEND_ID_KEY in keys
+        ):
+            return [self.has_key(key) for key in keys]
+
+        for key in keys:
+            self._validate_key(key)
+
+        return self._store_backend.has_many([self.key_to_tuple(key) for key in keys])
+
     def self_check(self, pretty_print):
         NotImplementedError(
             f"The test method is not implemented for Store class {self.__class__.__name__}."
@@ -1,7 +1,7 @@
 import logging
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pyparsing as pp
 
@@ -20,6 +20,10 @@ class StoreBackend(metaclass=ABCMeta):
       - _set
       - list_keys
       - _has_key
+
+    The bulk operations get_many, set_many, and has_many apply _get, _set, and _has_key to every key by default;
+    implementations whose requests are network round trips may override _get_many, _set_many, and _has_many to
+    issue them concurrently.
     """
 
     IGNORED_FILES = [".ipynb_checkpoints"]
@@ -131,6 +135,40 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def get_many(self, keys: Iterable[tuple], **kwargs) -> List[Any]:
+        """Returns the values of the keys, in the order of the keys."""
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        return self._get_many(keys, **kwargs)
+
+    def set_many(self, items: Iterable[Tuple[tuple, Any]], **kwargs) -> List[Any]:
+        """Sets the values of the (key, value) items, and returns the results of the setter, in the order of the items."""
+        items = list(items)
+        for key, value in items:
+            self._validate_key(key)
+            self._validate_value(value)
+        try:
+            return self._set_many(items, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
+    def has_many(self, keys: Iterable[tuple]) -> List[bool]:
+        """Returns whether each of the keys exists, in the order of the keys."""
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        return self._has_many(keys)
+
+    def list_key_versions(self) -> Dict[tuple, Optional[str]]:
+        """Returns the keys of the store backend, each with a version of its value that changes whenever the value is set
+        (e.g. the modification time or the ETag of its object), as reported by listing the keys; the version is None
+        for backends that do not report one."""
+        return {key: None for key in self.list_keys()}
+
     def move(self, source_key, dest_key, **kwargs):
         self._validate_key(source_key)
         self._validate_key(dest_key)
@@ -193,6 +231,15 @@ class StoreBackend(metaclass=ABCMeta):
     def _has_key(self, key):
         raise NotImplementedError
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Any]:
+        return [self._get(key, **kwargs) for key in keys]
+
+    def _set_many(self, items: List[Tuple[tuple, Any]], **kwargs) -> List[Any]:
+        return [self._set(key, value, **kwargs) for key, value in items]
+
+    def _has_many(self, keys: List[tuple]) -> List[bool]:
+        return [self._has_key(key) for key in keys]
+
     def is_ignored_key(self, key):
         for ignored in self.IGNORED_FILES:
             if ignored in key:
@@ -5,7 +5,13 @@ import random
 import re
 import shutil
 from abc import ABCMeta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+from great_expectations.core.cloud_client_pool import (
+    cloud_client_pool,
+    get_credentials_environment,
+)
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
 from great_expectations.util import filter_properties_dict
@@ -22,6 +28,10 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     three components.
     """
 
+    # The maximum number of requests issued concurrently by the bulk operations of store backends backed by network
+    # round trips (e.g. cloud object stores).
+    BULK_REQUEST_MAX_WORKERS = 16
+
     def __init__(
         self,
         filepath_template=None,
@@ -71,6 +81,15 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             self.verify_that_key_to_filepath_operation_is_reversible()
             self._fixed_length_key = True
 
+    def _map_concurrently(self, fn: Callable, items: list) -> List[Any]:
+        """Applies fn to the items with a bounded pool of threads, returning the results in the order of the items."""
+        max_workers: int = min(self.BULK_REQUEST_MAX_WORKERS, len(items))
+        if max_workers <= 1:
+            return [fn(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fn, items))
+
     def _validate_key(self, key):
         super()._validate_key(key)
 
@@ -342,7 +361,17 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         return False
 
     def list_keys(self, prefix=()):
-        key_list = []
+        return [key for key, _ in self._iter_keys_and_filepaths(prefix=prefix)]
+
+    def list_key_versions(self) -> Dict[tuple, Optional[str]]:
+        key_versions = {}
+        for key, full_filepath in self._iter_keys_and_filepaths():
+            stat_result = os.stat(full_filepath)
+            key_versions[key] = f"{stat_result.st_mtime_ns}-{stat_result.st_size}"
+
+        return key_versions
+
+    def _iter_keys_and_filepaths(self, prefix=()) -> Iterator[Tuple[tuple, str]]:
         for root, dirs, files in os.walk(
             os.path.join(self.full_base_directory, *prefix)
         ):
@@ -367,9 +396,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                     continue
                 key = self._convert_filepath_to_key(filepath)
                 if key and not self.is_ignored_key(key):
-                    key_list.append(key)
-
-        return key_list
+                    yield key, os.path.join(root, file_)
 
     def rrmdir(self, mroot, curpath):
         """
@@ -525,9 +552,17 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return s3_object_key
 
     def _get(self, key):
-        s3_object_key = self._build_s3_object_key(key)
+        return self._get_object(s3=self._get_client(), key=key)
+
+    def _get_many(self, keys, **kwargs):
+        # A single client (boto3 clients are thread-safe) is shared by all of the requests.
+        s3 = self._get_client()
+        return self._map_concurrently(
+            lambda key: self._get_object(s3=s3, key=key), keys
+        )
 
-        s3 = self._create_client()
+    def _get_object(self, s3, key):
+        s3_object_key = self._build_s3_object_key(key)
 
         try:
             s3_response_object = s3.get_object(Bucket=self.bucket, Key=s3_object_key)
@@ -550,21 +585,53 @@ class TupleS3StoreBackend(TupleStoreBackend):
         content_type="application/json",
         **kwargs,
     ):
-        s3_object_key = self._build_s3_object_key(key)
+        return self._put_object(
+            s3=self._get_client(),
+            key=key,
+            value=value,
+            content_encoding=content_encoding,
+            content_type=content_type,
+        )
 
-        s3 = self._create_resource()
+    def _set_many(
+        self,
+        items,
+        content_encoding="utf-8",
+        content_type="application/json",
+        **kwargs,
+    ):
+        s3 = self._get_client()
+        return self._map_concurrently(
+            lambda item: self._put_object(
+                s3=s3,
+                key=item[0],
+                value=item[1],
+                content_encoding=content_encoding,
+                content_type=content_type,
+            ),
+            items,
+        )
+
+    def _put_object(self, s3, key, value, content_encoding, content_type):
+        s3_object_key = self._build_s3_object_key(key)
 
         try:
-            result_s3 = s3.Object(self.bucket, s3_object_key)
             if isinstance(value, str):
-                result_s3.put(
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
                     Body=value.encode(content_encoding),
                     ContentEncoding=content_encoding,
                     ContentType=content_type,
                 )
             else:
-                result_s3.put(Body=value, ContentType=content_type)
-        except s3.meta.client.exceptions.ClientError as e:
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
+                    Body=value,
+                    ContentType=content_type,
+                )
+        except s3.exceptions.ClientError as e:
             logger.debug(str(e))
             raise StoreBackendError("Unable to set object in s3.")
 
@@ -587,7 +654,16 @@ class TupleS3StoreBackend(TupleStoreBackend):
         s3.Object(self.bucket, source_filepath).delete()
 
     def list_keys(self):
-        s3 = self._create_client()
+        return [key for key, _ in self._iter_keys_and_object_infos()]
+
+    def list_key_versions(self) -> Dict[tuple, Optional[str]]:
+        return {
+            key: s3_object_info.get("ETag")
+            for key, s3_object_info in self._iter_keys_and_object_infos()
+        }
+
+    def _iter_keys_and_object_infos(self) -> Iterator[Tuple[tuple, dict]]:
+        s3 = self._get_client()
         paginator = s3.get_paginator("list_objects_v2")
 
         if self.prefix:
@@ -613,7 +689,6 @@ class TupleS3StoreBackend(TupleStoreBackend):
             if current_page_contents is not None:
                 objects.extend(current_page_contents)
 
-        key_list = []
         for s3_object_info in objects:
             s3_object_key = s3_object_info["Key"]
             if self.platform_specific_separator:
@@ -635,12 +710,10 @@ class TupleS3StoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(s3_object_key)
             if key:
-                key_list.append(key)
-
-        return key_list
+                yield key, s3_object_info
 
     def get_url_for_key(self, key, protocol=None):
-        location = self._create_client().get_bucket_location(Bucket=self.bucket)[
+        location = self._get_client().get_bucket_location(Bucket=self.bucket)[
             "LocationConstraint"
         ]
         if self.boto3_options.get("endpoint_url"):
@@ -706,22 +779,37 @@ class TupleS3StoreBackend(TupleStoreBackend):
         all_keys = self.list_keys()
         return key in all_keys
 
+    def _has_many(self, keys):
+        # The keys are listed once for all of the keys, rather than once per key.
+        all_keys = set(self.list_keys())
+        return [key in all_keys for key in keys]
+
     @property
     def boto3_options(self):
         from botocore.client import Config
 
         result = {}
-        if self._boto3_options.get("signature_version"):
-            signature_version = self._boto3_options.pop("signature_version")
+        boto3_options: dict = dict(self._boto3_options)
+        if boto3_options.get("signature_version"):
+            signature_version = boto3_options.pop("signature_version")
             result["config"] = Config(signature_version=signature_version)
-        result.update(self._boto3_options)
+        result.update(boto3_options)
 
         return result
 
-    def _create_client(self):
+    def _get_client(self):
         import boto3
 
-        return boto3.client("s3", **self.boto3_options)
+        # Unlike resources, boto3 clients are thread-safe, so a single pooled client is shared by all of the requests.
+        return cloud_client_pool.get_client(
+            key=(
+                boto3.client,
+                "s3",
+                self._boto3_options,
+                get_credentials_environment(prefix="AWS_"),
+            ),
+            create_client=lambda: boto3.client("s3", **self.boto3_options),
+        )
 
     def _create_resource(self):
         import boto3
@@ -820,12 +908,18 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return gcs_object_key
 
     def _get(self, key):
-        gcs_object_key = self._build_gcs_object_key(key)
+        gcs = self._get_client()
+        return self._get_blob(bucket=gcs.bucket(self.bucket), key=key)
 
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
+    def _get_many(self, keys, **kwargs):
+        gcs = self._get_client()
         bucket = gcs.bucket(self.bucket)
+        return self._map_concurrently(
+            lambda key: self._get_blob(bucket=bucket, key=key), keys
+        )
+
+    def _get_blob(self, bucket, key):
+        gcs_object_key = self._build_gcs_object_key(key)
         gcs_response_object = bucket.get_blob(gcs_object_key)
         if not gcs_response_object:
             raise InvalidKeyError(
@@ -842,12 +936,37 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         content_type="application/json",
         **kwargs,
     ):
-        gcs_object_key = self._build_gcs_object_key(key)
-
-        from google.cloud import storage
+        gcs = self._get_client()
+        return self._upload_blob(
+            bucket=gcs.bucket(self.bucket),
+            key=key,
+            value=value,
+            content_encoding=content_encoding,
+            content_type=content_type,
+        )
 
-        gcs = storage.Client(project=self.project)
+    def _set_many(
+        self,
+        items,
+        content_encoding="utf-8",
+        content_type="application/json",
+        **kwargs,
+    ):
+        gcs = self._get_client()
         bucket = gcs.bucket(self.bucket)
+        return self._map_concurrently(
+            lambda item: self._upload_blob(
+                bucket=bucket,
+                key=item[0],
+                value=item[1],
+                content_encoding=content_encoding,
+                content_type=content_type,
+            ),
+            items,
+        )
+
+    def _upload_blob(self, bucket, key, value, content_encoding, content_type):
+        gcs_object_key = self._build_gcs_object_key(key)
         blob = bucket.blob(gcs_object_key)
 
         if isinstance(value, str):
@@ -860,9 +979,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return gcs_object_key
 
     def _move(self, source_key, dest_key, **kwargs):
-        from google.cloud import storage
-
-        gcs = storage.Client(project=self.project)
+        gcs = self._get_client()
         bucket = gcs.bucket(self.bucket)
 
         source_filepath = self._convert_key_to_filepath(source_key)
@@ -875,12 +992,30 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         blob = bucket.blob(source_filepath)
         _ = bucket.rename_blob(blob, dest_filepath)
 
+    def _get_client(self):
+        from google.cloud import storage
+
+        # GCS clients are thread-safe, so a single pooled client is shared by all of the requests.
+        return cloud_client_pool.get_client(
+            key=(
+                storage.Client,
+                self.project,
+                get_credentials_environment(prefix="GOOGLE_"),
+            ),
+            create_client=lambda: storage.Client(project=self.project),
+        )
+
     def list_keys(self):
-        key_list = []
+        return [key for key, _ in self._iter_keys_and_blobs()]
 
-        from google.cloud import storage
+    def list_key_versions(self) -> Dict[tuple, Optional[str]]:
+        return {
+            key: None if blob.generation is None else str(blob.generation)
+            for key, blob in self._iter_keys_and_blobs()
+        }
 
-        gcs = storage.Client(self.project)
+    def _iter_keys_and_blobs(self) -> Iterator[Tuple[tuple, Any]]:
+        gcs = self._get_client()
 
         for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
             gcs_object_name = blob.name
@@ -898,8 +1033,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(gcs_object_key)
             if key:
-                key_list.append(key)
-        return key_list
+                yield key, blob
 
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
@@ -939,10 +1073,9 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return path_url
 
     def remove_key(self, key):
-        from google.cloud import storage
         from google.cloud.exceptions import NotFound
 
-        gcs = storage.Client(project=self.project)
+        gcs = self._get_client()
         bucket = gcs.bucket(self.bucket)
         try:
             bucket.delete_blobs(blobs=list(bucket.list_blobs(prefix=self.prefix)))
@@ -954,6 +1087,11 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         all_keys = self.list_keys()
         return key in all_keys
 
+    def _has_many(self, keys):
+        # The keys are listed once for all of the keys, rather than once per key.
+        all_keys = set(self.list_keys())
+        return [key in all_keys for key in keys]
+
 
 class TupleAzureBlobStoreBackend(TupleStoreBackend):
     """
@@ -1003,25 +1141,60 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         from azure.storage.blob import BlobServiceClient
 
         if self.connection_string:
-            return BlobServiceClient.from_connection_string(
-                self.connection_string
-            ).get_container_client(self.container)
+            # Container clients are thread-safe, so a single pooled client is shared by all of the requests.
+            return cloud_client_pool.get_client(
+                key=(
+                    BlobServiceClient.from_connection_string,
+                    self.connection_string,
+                    self.container,
+                ),
+                create_client=lambda: BlobServiceClient.from_connection_string(
+                    self.connection_string
+                ).get_container_client(self.container),
+            )
         else:
             raise StoreBackendError(
                 "Unable to initialize ServiceClient, AZURE_STORAGE_CONNECTION_STRING should be set"
             )
 
     def _get(self, key):
-        az_blob_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
-        return (
-            self._get_container_client()
-            .download_blob(az_blob_key)
-            .readall()
-            .decode("utf-8")
+        return self._download_blob(
+            container_client=self._get_container_client(), key=key
+        )
+
+    def _get_many(self, keys, **kwargs):
+        # A single container client (which is thread-safe) is shared by all of the requests.
+        container_client = self._get_container_client()
+        return self._map_concurrently(
+            lambda key: self._download_blob(container_client=container_client, key=key),
+            keys,
         )
 
+    def _download_blob(self, container_client, key):
+        az_blob_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
+        return container_client.download_blob(az_blob_key).readall().decode("utf-8")
+
     def _set(self, key, value, content_encoding="utf-8", **kwargs):
+        return self._upload_blob(
+            container_client=self._get_container_client(),
+            key=key,
+            value=value,
+            content_encoding=content_encoding,
+        )
+
+    def _set_many(self, items, content_encoding="utf-8", **kwargs):
+        container_client = self._get_container_client()
+        return self._map_concurrently(
+            lambda item: self._upload_blob(
+                container_client=container_client,
+                key=item[0],
+                value=item[1],
+                content_encoding=content_encoding,
+            ),
+            items,
+        )
 
+    def _upload_blob(self, container_client, key, value, content_encoding):
         from azure.storage.blob import ContentSettings
 
         az_blob_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
@@ -1029,7 +1202,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         if isinstance(value, str):
             if az_blob_key.endswith(".html"):
                 my_content_settings = ContentSettings(content_type="text/html")
-                self._get_container_client().upload_blob(
+                container_client.upload_blob(
                     name=az_blob_key,
                     data=value,
                     encoding=content_encoding,
@@ -1037,21 +1210,23 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
                     content_settings=my_content_settings,
                 )
             else:
-                self._get_container_client().upload_blob(
+                container_client.upload_blob(
                     name=az_blob_key,
                     data=value,
                     encoding=content_encoding,
                     overwrite=True,
                 )
         else:
-            self._get_container_client().upload_blob(
-                name=az_blob_key, data=value, overwrite=True
-            )
+            container_client.upload_blob(name=az_blob_key, data=value, overwrite=True)
         return az_blob_key
 
     def list_keys(self):
-        key_list = []
+        return [key for key, _ in self._iter_keys_and_blobs()]
 
+    def list_key_versions(self) -> Dict[tuple, Optional[str]]:
+        return {key: blob.etag for key, blob in self._iter_keys_and_blobs()}
+
+    def _iter_keys_and_blobs(self) -> Iterator[Tuple[tuple, Any]]:
         for obj in self._get_container_client().list_blobs(
             name_starts_with=self.prefix
         ):
@@ -1068,8 +1243,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(az_blob_key)
 
-            key_list.append(key)
-        return key_list
+            yield key, obj
 
     def get_url_for_key(self, key, protocol=None):
         az_blob_key = self._convert_key_to_filepath(key)
@@ -1084,6 +1258,11 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         all_keys = self.list_keys()
         return key in all_keys
 
+    def _has_many(self, keys):
+        # The keys are listed once for all of the keys, rather than once per key.
+        all_keys = set(self.list_keys())
+        return [key in all_keys for key in keys]
+
     def _move(self, source_key, dest_key, **kwargs):
         source_blob_path = self._convert_key_to_filepath(source_key)
         if not source_blob_path.startswith(self.prefix):
@@ -304,6 +304,8 @@ class DataConnectorConfig(DictDot):
         prefix=None,
         # Both S3/Azure
         delimiter=None,
+        # S3/GCS/Azure
+        listing_cache_options=None,
         **kwargs,
     ):
         self._class_name = class_name
@@ -355,6 +357,10 @@ class DataConnectorConfig(DictDot):
         if delimiter is not None:
             self.delimiter = delimiter
 
+        # S3/GCS/Azure
+        if listing_cache_options is not None:
+            self.listing_cache_options = listing_cache_options
+
         for k, v in kwargs.items():
             setattr(self, k, v)
 
@@ -421,6 +427,11 @@ class DataConnectorConfigSchema(Schema):
     # Both S3/Azure
     delimiter = fields.String(required=False, allow_none=True)
 
+    # S3/GCS/Azure
+    listing_cache_options = fields.Dict(
+        keys=fields.Str(), required=False, allow_none=True
+    )
+
     data_asset_name_prefix = fields.String(required=False, allow_none=True)
     data_asset_name_suffix = fields.String(required=False, allow_none=True)
     include_schema_name = fields.Boolean(required=False, allow_none=True)
@@ -435,6 +446,8 @@ class DataConnectorConfigSchema(Schema):
         cls_or_instance=fields.Str(), required=False, allow_none=True
     )
     skip_inapplicable_tables = fields.Boolean(required=False, allow_none=True)
+    partition_discovery_max_workers = fields.Integer(required=False, allow_none=True)
+    lazy_partition_discovery = fields.Boolean(required=False, allow_none=True)
     batch_spec_passthrough = fields.Dict(required=False, allow_none=True)
 
     @validates_schema
@@ -504,6 +517,23 @@ S3/GCS type of the data connector (your data connector is "{data['class_name']}"
 continue.
                 """
             )
+        if ("listing_cache_options" in data) and not (
+            data["class_name"]
+            in [
+                "InferredAssetS3DataConnector",
+                "ConfiguredAssetS3DataConnector",
+                "InferredAssetAzureDataConnector",
+                "ConfiguredAssetAzureDataConnector",
+                "InferredAssetGCSDataConnector",
+                "ConfiguredAssetGCSDataConnector",
+            ]
+        ):
+            raise ge_exceptions.InvalidConfigError(
+                f"""Your current configuration uses one or more keys in a data connector that are required only by an
+S3/GCS/Azure type of the data connector (your data connector is "{data['class_name']}").  Please update your
+configuration to continue.
+                """
+            )
         if ("bucket" in data or "max_keys" in data) and not (
             data["class_name"]
             in [
@@ -613,12 +643,15 @@ class ExecutionEngineConfig(DictDot):
         boto3_options=None,
         azure_options=None,
         gcs_options=None,
+        metric_cache=None,
         **kwargs,
     ):
         self._class_name = class_name
         self._module_name = module_name
         if caching is not None:
             self.caching = caching
+        if metric_cache is not None:
+            self.metric_cache = metric_cache
         if batch_spec_defaults is not None:
             self._batch_spec_defaults = batch_spec_defaults
         if connection_string is not None:
@@ -668,6 +701,7 @@ class ExecutionEngineConfigSchema(Schema):
         keys=fields.Str(), values=fields.Str(), required=False, allow_none=True
     )
     caching = fields.Boolean(required=False, allow_none=True)
+    metric_cache = fields.Dict(required=False, allow_none=True)
     batch_spec_defaults = fields.Dict(required=False, allow_none=True)
 
     @validates_schema
@@ -1066,19 +1100,42 @@ class NotebooksConfigSchema(Schema):
 class ConcurrencyConfig(DictDot):
     """WARNING: This class is experimental."""
 
-    def __init__(self, enabled: Optional[bool] = False):
+    def __init__(
+        self,
+        enabled: Optional[bool] = False,
+        max_workers: Optional[int] = None,
+        use_processes: Optional[bool] = None,
+    ):
         """Initialize a concurrency configuration to control multithreaded execution.
 
         Args:
             enabled: Whether or not multithreading is enabled.
+            max_workers: Optional upper bound on the number of threads used for any single concurrent operation (e.g.
+                resolving the metrics of one level of a validation graph); if omitted, only the database query limit
+                applies.
+            use_processes: Whether checkpoints (if concurrency is enabled) run their validations in a pool of worker
+                processes, each of which loads its own batches, rather than in threads; the number of processes is
+                bounded by max_workers if set, and by the number of CPUs otherwise.
         """
         self._enabled = enabled
+        self._max_workers = max_workers
+        self._use_processes = use_processes
 
     @property
     def enabled(self):
         """Whether or not multithreading is enabled."""
         return self._enabled
 
+    @property
+    def max_workers(self) -> Optional[int]:
+        """Optional upper bound on the number of threads used for any single concurrent operation."""
+        return self._max_workers
+
+    @property
+    def use_processes(self) -> Optional[bool]:
+        """Whether checkpoints run their validations in worker processes rather than threads."""
+        return self._use_processes
+
     @property
     def max_database_query_concurrency(self) -> int:
         """Max number of concurrent database queries to execute with mulithreading."""
@@ -1112,6 +1169,22 @@ class ConcurrencyConfigSchema(Schema):
     """WARNING: This class is experimental."""
 
     enabled = fields.Boolean(default=False)
+    max_workers = fields.Integer(required=False, allow_none=True)
+    use_processes = fields.Boolean(required=False, allow_none=True)
+
+    # if keys have None value, remove in post_dump
+    REMOVE_KEYS_IF_NONE = [
+        "max_workers",
+        "use_processes",
+    ]
+
+    @post_dump
+    def remove_keys_if_none(self, data, **kwargs):
+        data = deepcopy(data)
+        for key in self.REMOVE_KEYS_IF_NONE:
+            if key in data and data[key] is None:
+                data.pop(key)
+        return data
 
 
 class GeCloudConfig(DictDot):
@@ -187,14 +187,18 @@ class BatchFilter:
         else:
             filter_function = self.best_effort_batch_definition_matcher()
         selected_batch_definitions: List[BatchDefinition]
-        selected_batch_definitions = list(
-            filter(
-                lambda batch_definition: filter_function(
-                    batch_identifiers=batch_definition.batch_identifiers,
-                ),
-                batch_definition_list,
+        if not (self.custom_filter_function or self.batch_filter_parameters):
+            # Every batch_definition matches; only index and limit select among them.
+            selected_batch_definitions = batch_definition_list
+        else:
+            selected_batch_definitions = list(
+                filter(
+                    lambda batch_definition: filter_function(
+                        batch_identifiers=batch_definition.batch_identifiers,
+                    ),
+                    batch_definition_list,
+                )
             )
-        )
         if self.index is None:
             selected_batch_definitions = selected_batch_definitions[: self.limit]
         else:
@@ -62,6 +62,7 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
         delimiter: str = "/",
         azure_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_cache_options: Optional[dict] = None,
     ):
         """
         ConfiguredAssetDataConnector for connecting to Azure.
@@ -78,6 +79,8 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
             delimiter (str): Azure delimiter
             azure_options (dict): wrapper object for **kwargs
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            listing_cache_options (dict): optional DataReferenceListingCache arguments ("ttl_seconds", "incremental",
+                "max_workers", "cache_file_path"), with which listings of data_references are cached
         """
         logger.debug(f'Constructing ConfiguredAssetAzureDataConnector "{name}".')
 
@@ -89,6 +92,7 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            listing_cache_options=listing_cache_options,
         )
         self._container = container
         self._name_starts_with = os.path.join(name_starts_with, "")
@@ -152,10 +156,14 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
             if asset.delimiter:
                 query_options["delimiter"] = asset.delimiter
 
-        path_list: List[str] = list_azure_keys(
-            azure=self._azure,
+        # Azure Blob Storage cannot list blobs following a given one, so stale listings are always listed fully.
+        path_list: List[str] = self._list_data_references(
             query_options=query_options,
-            recursive=False,
+            list_data_references=lambda: list_azure_keys(
+                azure=self._azure,
+                query_options=query_options,
+                recursive=False,
+            ),
         )
         return path_list
 
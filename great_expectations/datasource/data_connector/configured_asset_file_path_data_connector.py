@@ -40,6 +40,7 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
         default_regex: Optional[dict] = None,
         sorters: Optional[list] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_cache_options: Optional[dict] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data by taking in
@@ -54,6 +55,8 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            listing_cache_options (dict): optional DataReferenceListingCache arguments (e.g., "ttl_seconds"), with
+                which listings of data_references are cached
         """
         logger.debug(f'Constructing ConfiguredAssetFilePathDataConnector "{name}".')
         super().__init__(
@@ -63,6 +66,7 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            listing_cache_options=listing_cache_options,
         )
 
         if assets is None:
@@ -116,12 +120,23 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
         # Map data_references to batch_definitions
         self._data_references_cache = {}
 
-        for data_asset_name in self.get_available_data_asset_names():
+        data_asset_names: List[str] = self.get_available_data_asset_names()
+        # Data assets are listed independently of each other (concurrently, if so configured).
+        data_reference_lists: List[List[str]] = self._map_concurrently(
+            fn=lambda data_asset_name: self._get_data_reference_list(
+                data_asset_name=data_asset_name
+            ),
+            items=data_asset_names,
+        )
+
+        data_asset_name: str
+        data_reference_list: List[str]
+        for data_asset_name, data_reference_list in zip(
+            data_asset_names, data_reference_lists
+        ):
             self._data_references_cache[data_asset_name] = {}
 
-            for data_reference in self._get_data_reference_list(
-                data_asset_name=data_asset_name
-            ):
+            for data_reference in data_reference_list:
                 mapped_batch_definition_list: List[
                     BatchDefinition
                 ] = self._map_data_reference_to_batch_definition_list(
@@ -132,6 +147,9 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
                     data_reference
                 ] = mapped_batch_definition_list
 
+        # All listings of this refresh are persisted at once.
+        self._save_listing_cache()
+
     def _get_data_reference_list(
         self, data_asset_name: Optional[str] = None
     ) -> List[str]:
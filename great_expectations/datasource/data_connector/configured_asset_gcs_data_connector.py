@@ -1,3 +1,4 @@
+import copy
 import logging
 import os
 from typing import List, Optional
@@ -65,6 +66,7 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
         max_results: Optional[int] = None,
         gcs_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_cache_options: Optional[dict] = None,
     ):
         """
         ConfiguredAssetDataConnector for connecting to GCS.
@@ -82,6 +84,8 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
             max_results (int): max blob filepaths to return
             gcs_options (dict): wrapper object for optional GCS **kwargs
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            listing_cache_options (dict): optional DataReferenceListingCache arguments ("ttl_seconds", "incremental",
+                "max_workers", "cache_file_path"), with which listings of data_references are cached
         """
         logger.debug(f'Constructing ConfiguredAssetGCSDataConnector "{name}".')
 
@@ -93,6 +97,7 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            listing_cache_options=listing_cache_options,
         )
         self._bucket_or_name = bucket_or_name
         self._prefix = prefix
@@ -153,14 +158,22 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
             if asset.max_results:
                 query_options["max_results"] = asset.max_results
 
-        path_list: List[str] = [
-            key
-            for key in list_gcs_keys(
+        path_list: List[str] = self._list_data_references(
+            query_options=query_options,
+            list_data_references=lambda: list_gcs_keys(
                 gcs=self._gcs,
-                query_options=query_options,
+                query_options=copy.deepcopy(query_options),
                 recursive=False,
-            )
-        ]
+            ),
+            # GCS lists blobs, starting at (and including) "start_offset".
+            list_data_references_after=lambda start_after: list_gcs_keys(
+                gcs=self._gcs,
+                query_options=dict(
+                    copy.deepcopy(query_options), start_offset=start_after
+                ),
+                recursive=False,
+            ),
+        )
         return path_list
 
     def _get_full_file_path_for_asset(
@@ -1,3 +1,4 @@
+import copy
 import logging
 import os
 from typing import List, Optional
@@ -13,7 +14,10 @@ from great_expectations.datasource.data_connector.asset import Asset
 from great_expectations.datasource.data_connector.configured_asset_file_path_data_connector import (
     ConfiguredAssetFilePathDataConnector,
 )
-from great_expectations.datasource.data_connector.util import list_s3_keys
+from great_expectations.datasource.data_connector.util import (
+    list_s3_keys,
+    list_s3_keys_after,
+)
 from great_expectations.execution_engine import ExecutionEngine
 
 logger = logging.getLogger(__name__)
@@ -49,6 +53,7 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
         max_keys: Optional[int] = 1000,
         boto3_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_cache_options: Optional[dict] = None,
     ):
         """
         ConfiguredAssetDataConnector for connecting to S3.
@@ -66,6 +71,8 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             max_keys (int): S3 max_keys (default is 1000)
             boto3_options (dict): optional boto3 options
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            listing_cache_options (dict): optional DataReferenceListingCache arguments ("ttl_seconds", "incremental",
+                "max_workers", "cache_file_path"), with which listings of data_references are cached
         """
         logger.debug(f'Constructing ConfiguredAssetS3DataConnector "{name}".')
 
@@ -77,6 +84,7 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            listing_cache_options=listing_cache_options,
         )
         self._bucket = bucket
         self._prefix = os.path.join(prefix, "")
@@ -125,15 +133,24 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             if asset.max_keys:
                 query_options["MaxKeys"] = asset.max_keys
 
-        path_list: List[str] = [
-            key
-            for key in list_s3_keys(
+        path_list: List[str] = self._list_data_references(
+            query_options=query_options,
+            list_data_references=lambda: [
+                key
+                for key in list_s3_keys(
+                    s3=self._s3,
+                    query_options=copy.deepcopy(query_options),
+                    iterator_dict={},
+                    recursive=False,
+                )
+            ],
+            list_data_references_after=lambda start_after: list_s3_keys_after(
                 s3=self._s3,
                 query_options=query_options,
-                iterator_dict={},
+                start_after=start_after,
                 recursive=False,
-            )
-        ]
+            ),
+        )
         return path_list
 
     def _get_full_file_path_for_asset(
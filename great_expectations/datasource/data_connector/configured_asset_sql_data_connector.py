@@ -1,5 +1,7 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 
 from great_expectations.core.batch import (
     BatchDefinition,
@@ -14,10 +16,16 @@ from great_expectations.datasource.data_connector.util import (
 )
 from great_expectations.execution_engine import ExecutionEngine
 
+logger = logging.getLogger(__name__)
+
 try:
     import sqlalchemy as sa
+    from sqlalchemy.pool import QueuePool, SingletonThreadPool, StaticPool
 except ImportError:
     sa = None
+    QueuePool = None
+    SingletonThreadPool = None
+    StaticPool = None
 
 
 class ConfiguredAssetSqlDataConnector(DataConnector):
@@ -30,6 +38,8 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
         execution_engine (ExecutionEngine): An ExecutionEngine
         assets (str): assets
         batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+        partition_discovery_max_workers (int): maximum number of queries, which list the batch_identifiers of data
+            assets concurrently (bounded by the connection pool of the engine; None lists them sequentially)
     """
 
     def __init__(
@@ -39,10 +49,12 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
         execution_engine: Optional[ExecutionEngine] = None,
         assets: Optional[Dict[str, dict]] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        partition_discovery_max_workers: Optional[int] = None,
     ):
         if assets is None:
             assets = {}
         self._assets = assets
+        self._partition_discovery_max_workers = partition_discovery_max_workers
 
         super().__init__(
             name=name,
@@ -69,6 +81,7 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
         self,
         data_asset_name,
         data_asset_config,
+        engine=None,
     ):
         if "table_name" in data_asset_config:
             table_name = data_asset_config["table_name"]
@@ -81,7 +94,10 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
                 table_name=table_name, **data_asset_config["splitter_kwargs"]
             )
 
-            rows = self._execution_engine.engine.execute(split_query).fetchall()
+            if engine is None:
+                engine = self._execution_engine.engine
+
+            rows = engine.execute(split_query).fetchall()
 
             # Zip up split parameters with column names
             column_names = self._get_column_names_from_splitter_kwargs(
@@ -97,19 +113,88 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
     def _refresh_data_references_cache(self):
         self._data_references_cache = {}
 
-        for data_asset_name in self.assets:
-            data_asset = self.assets[data_asset_name]
-            batch_identifiers_list = (
+        self._refresh_data_references_cache_for_data_assets(
+            data_asset_names=list(self.assets.keys())
+        )
+
+    def _refresh_data_references_cache_for_data_assets(
+        self, data_asset_names: List[str]
+    ):
+        """
+        List the batch_identifiers of the given data assets (concurrently, if so configured) into the cache.
+        """
+        batch_identifiers_lists: List[List[dict]] = self._map_partition_discovery(
+            fn=lambda data_asset_name, engine: (
                 self._get_batch_identifiers_list_from_data_asset_config(
                     data_asset_name,
-                    data_asset,
+                    self.assets[data_asset_name],
+                    engine=engine,
                 )
-            )
+            ),
+            items=data_asset_names,
+        )
 
+        for data_asset_name, batch_identifiers_list in zip(
+            data_asset_names, batch_identifiers_lists
+        ):
             # TODO Abe 20201029 : Apply sorters to batch_identifiers_list here
             # TODO Will 20201102 : add sorting code here
             self._data_references_cache[data_asset_name] = batch_identifiers_list
 
+    def _get_partition_discovery_engine(self) -> Optional["sa.engine.Engine"]:
+        """
+        Returns the engine, on which partitions are discovered concurrently, or None if they are discovered sequentially.
+
+        Queries share the engine only if its connections are pooled (neither a single connection, which the execution
+        engine holds for some dialects, nor a connection per thread, as for in-memory SQLite).
+        """
+        max_workers: Optional[int] = self._partition_discovery_max_workers
+        if not max_workers or max_workers < 2:
+            return None
+
+        # For some dialects (e.g., sqlite, mssql, mysql, and snowflake), the execution engine replaces its engine by a
+        # single connection of it, which holds its temporary tables; partitions are discovered on that connection.
+        engine = self._execution_engine.engine
+        if not isinstance(engine, sa.engine.Engine) or isinstance(
+            engine.pool, (SingletonThreadPool, StaticPool)
+        ):
+            return None
+
+        return engine
+
+    def _get_partition_discovery_max_workers(self) -> int:
+        engine: Optional["sa.engine.Engine"] = self._get_partition_discovery_engine()
+        if engine is None:
+            return 1
+
+        max_workers: int = self._partition_discovery_max_workers
+        if isinstance(engine.pool, QueuePool):
+            # Workers beyond the capacity of the pool would only wait for connections.
+            max_overflow: int = getattr(engine.pool, "_max_overflow", -1)
+            if max_overflow >= 0:
+                max_workers = min(max_workers, engine.pool.size() + max_overflow)
+
+        return max(max_workers, 1)
+
+    def _map_partition_discovery(self, fn: Callable, items: Iterable) -> list:
+        """
+        Apply fn (which queries the database) to every item, on up to "partition_discovery_max_workers" threads.
+
+        fn is passed the item and the engine to query (None for the engine of the execution engine).
+        """
+        items = list(items)
+        max_workers: int = min(self._get_partition_discovery_max_workers(), len(items))
+        if max_workers < 2:
+            return [fn(item, None) for item in items]
+
+        engine: "sa.engine.Engine" = self._get_partition_discovery_engine()
+
+        logger.debug(
+            f'Discovering partitions of {len(items)} data assets on {max_workers} threads in DataConnector "{self.name}".'
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda item: fn(item, engine), items))
+
     def _get_column_names_from_splitter_kwargs(self, splitter_kwargs) -> List[str]:
         column_names: List[str] = []
 
@@ -129,6 +214,22 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
         """
         return list(self.assets.keys())
 
+    def _refresh_data_references_cache_for_self_check(self, max_examples: int):
+        """
+        Lists only the batch_identifiers of the data assets reported by self_check() (the first "max_examples" of them,
+        by name), rather than those of every data asset.
+        """
+        data_asset_names: List[str] = sorted(self.get_available_data_asset_names())[
+            :max_examples
+        ]
+        self._refresh_data_references_cache_for_data_assets(
+            data_asset_names=[
+                data_asset_name
+                for data_asset_name in data_asset_names
+                if data_asset_name not in self._data_references_cache
+            ]
+        )
+
     def get_unmatched_data_references(self) -> List[str]:
         """
         Returns the list of data_references unmatched by configuration by looping through items in _data_references_cache
@@ -142,7 +243,13 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
     def get_batch_definition_list_from_batch_request(self, batch_request: BatchRequest):
         self._validate_batch_request(batch_request=batch_request)
 
-        if len(self._data_references_cache) == 0:
+        # Only the batch_identifiers of the requested data asset are listed, if it is known.
+        if batch_request.data_asset_name in self.assets:
+            if batch_request.data_asset_name not in self._data_references_cache:
+                self._refresh_data_references_cache_for_data_assets(
+                    data_asset_names=[batch_request.data_asset_name]
+                )
+        elif len(self._data_references_cache) == 0:
             self._refresh_data_references_cache()
 
         batch_definition_list: List[BatchDefinition] = []
@@ -169,6 +276,14 @@ class ConfiguredAssetSqlDataConnector(DataConnector):
     def _get_data_reference_list_from_cache_by_data_asset_name(
         self, data_asset_name: str
     ) -> List[str]:
+        if (
+            data_asset_name not in self._data_references_cache
+            and data_asset_name in self.assets
+        ):
+            self._refresh_data_references_cache_for_data_assets(
+                data_asset_names=[data_asset_name]
+            )
+
         return self._data_references_cache[data_asset_name]
 
     def _map_data_reference_to_batch_definition_list(
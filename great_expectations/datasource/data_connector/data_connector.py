@@ -194,6 +194,13 @@ class DataConnector:
     ) -> dict:
         raise NotImplementedError
 
+    def _refresh_data_references_cache_for_self_check(self, max_examples: int):
+        """
+        Lists the data references reported by self_check() into the cache, unless they were listed before.
+        """
+        if len(self._data_references_cache) == 0:
+            self._refresh_data_references_cache()
+
     def self_check(self, pretty_print=True, max_examples=3):
         """
         Checks the configuration of the current DataConnector by doing the following :
@@ -214,8 +221,7 @@ class DataConnector:
             report_obj (dict): dictionary containing self_check output
 
         """
-        if len(self._data_references_cache) == 0:
-            self._refresh_data_references_cache()
+        self._refresh_data_references_cache_for_self_check(max_examples=max_examples)
 
         if pretty_print:
             print("\t" + self.name, ":", self.__class__.__name__)
@@ -0,0 +1,237 @@
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import great_expectations.exceptions as ge_exceptions
+
+logger = logging.getLogger(__name__)
+
+# Cached listings expire after an hour by default, so that data references added to a bucket/container are noticed.
+DEFAULT_LISTING_TTL_SECONDS: float = 3600.0
+
+
+class DataReferenceListingCache:
+    """
+    Caches the data references, which cloud data connectors (S3, GCS, and Azure) list from their buckets/containers,
+    per listing query, so that refreshing the data references cache of a data connector need not list them again.
+
+    A cached listing is used until it is older than "ttl_seconds" (an hour, by default); if "ttl_seconds" is explicitly
+    set to None, cached listings never expire, and new data references are only noticed after clear().  A stale
+    listing is listed again -- fully, or, if "incremental" is True and the store supports it, only for data references
+    following the greatest data reference listed before.  Incremental listing assumes that data references are only
+    added, in increasing lexicographic order (e.g., date-partitioned keys); removed data references are not noticed.
+
+    Independent listings (of assets, or of prefixes) are run concurrently on up to "max_workers" threads.  If
+    "cache_file_path" is given, cached listings are persisted to that JSON file, so that they survive process restarts;
+    the file is written once per save() (e.g., after a data connector refreshed its data references cache), rather than
+    after every listing query.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = DEFAULT_LISTING_TTL_SECONDS,
+        incremental: bool = False,
+        max_workers: Optional[int] = None,
+        cache_file_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            ttl_seconds (float): age, after which a cached listing is stale (None means that listings never expire)
+            incremental (bool): whether to list only data references following the ones listed before, if supported
+            max_workers (int): maximum number of threads listing independent queries (None lists them sequentially)
+            cache_file_path (str): optional path of a JSON file, in which cached listings are persisted
+        """
+        if ttl_seconds is not None and ttl_seconds < 0:
+            raise ge_exceptions.DataConnectorError(
+                f'"ttl_seconds" of a data reference listing cache must be non-negative (got {ttl_seconds}).'
+            )
+
+        if max_workers is not None and max_workers < 1:
+            raise ge_exceptions.DataConnectorError(
+                f'"max_workers" of a data reference listing cache must be positive (got {max_workers}).'
+            )
+
+        self._ttl_seconds = ttl_seconds
+        self._incremental = incremental
+        self._max_workers = max_workers
+        self._cache_file_path = cache_file_path
+
+        self._lock = threading.Lock()
+        # Cached listings are loaded from "cache_file_path" upon first use.
+        self._listings: Optional[Dict[str, Dict[str, Any]]] = None
+        # Whether cached listings changed since they were last persisted to "cache_file_path".
+        self._dirty: bool = False
+
+    @classmethod
+    def from_options(
+        cls, listing_cache_options: Optional[dict]
+    ) -> Optional["DataReferenceListingCache"]:
+        """Builds the listing cache of a data connector from its "listing_cache_options" (None disables caching)."""
+        if listing_cache_options is None:
+            return None
+
+        try:
+            return cls(**listing_cache_options)
+        except TypeError as e:
+            raise ge_exceptions.DataConnectorError(
+                f'Invalid "listing_cache_options" {listing_cache_options}: {e}'
+            )
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._ttl_seconds
+
+    @property
+    def incremental(self) -> bool:
+        return self._incremental
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        return self._max_workers
+
+    @property
+    def cache_file_path(self) -> Optional[str]:
+        return self._cache_file_path
+
+    @property
+    def is_concurrent(self) -> bool:
+        return self._max_workers is not None and self._max_workers > 1
+
+    def get_data_references(
+        self,
+        query_key: str,
+        list_data_references: Callable[[], List[str]],
+        list_data_references_after: Optional[Callable[[str], List[str]]] = None,
+    ) -> List[str]:
+        """
+        Returns the data references listed for the query, listing them only if no fresh listing is cached.
+
+        Args:
+            query_key (str): key identifying the listing query (e.g., serialized query options)
+            list_data_references (Callable): lists all data references of the query
+            list_data_references_after (Callable): lists the data references of the query, which follow the given
+                data reference in lexicographic order (None, if the store does not support incremental listing)
+
+        Returns:
+            List of data references of the query
+        """
+        with self._lock:
+            listing: Optional[Dict[str, Any]] = self._get_listings().get(query_key)
+
+        # The listing is as fresh as the time, at which it was started.
+        listed_at: float = time.time()
+        if listing is not None and not self._is_stale(
+            listing=listing, current_time=listed_at
+        ):
+            return list(listing["data_references"])
+
+        data_references: List[str]
+        if (
+            listing is not None
+            and self._incremental
+            and list_data_references_after is not None
+            and listing["data_references"]
+        ):
+            data_references = list(listing["data_references"])
+            known_data_references: set = set(data_references)
+            data_reference: str
+            for data_reference in list_data_references_after(max(data_references)):
+                if data_reference not in known_data_references:
+                    known_data_references.add(data_reference)
+                    data_references.append(data_reference)
+
+            logger.debug(
+                f"Listed {len(data_references) - len(listing['data_references'])} new data references incrementally."
+            )
+        else:
+            data_references = list(list_data_references())
+
+        with self._lock:
+            self._get_listings()[query_key] = {
+                "data_references": data_references,
+                "listed_at": listed_at,
+            }
+            self._dirty = True
+
+        return list(data_references)
+
+    def map_concurrently(self, fn: Callable, items: Iterable) -> list:
+        """Applies fn to every item (on up to "max_workers" threads) and returns the results in the order of items."""
+        items = list(items)
+        if not self.is_concurrent or len(items) < 2:
+            return [fn(item) for item in items]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(items))
+        ) as executor:
+            return list(executor.map(fn, items))
+
+    def save(self):
+        """Persists the cached listings to "cache_file_path" (if given), provided that they changed since last saved."""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            self._save_listings()
+            self._dirty = False
+
+    def clear(self):
+        """Discards all cached listings (including the persisted ones)."""
+        with self._lock:
+            self._listings = {}
+            self._dirty = False
+            if self._cache_file_path is not None and os.path.isfile(
+                self._cache_file_path
+            ):
+                os.remove(self._cache_file_path)
+
+    def _is_stale(self, listing: Dict[str, Any], current_time: float) -> bool:
+        if self._ttl_seconds is None:
+            return False
+
+        return current_time - listing["listed_at"] >= self._ttl_seconds
+
+    def _get_listings(self) -> Dict[str, Dict[str, Any]]:
+        if self._listings is None:
+            self._listings = self._load_listings()
+
+        return self._listings
+
+    def _load_listings(self) -> Dict[str, Dict[str, Any]]:
+        if self._cache_file_path is None or not os.path.isfile(self._cache_file_path):
+            return {}
+
+        try:
+            with open(self._cache_file_path) as infile:
+                listings: Any = json.load(infile)
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f'Ignoring unreadable data reference listing cache file "{self._cache_file_path}": {e}'
+            )
+            return {}
+
+        if not isinstance(listings, dict):
+            logger.warning(
+                f'Ignoring malformed data reference listing cache file "{self._cache_file_path}".'
+            )
+            return {}
+
+        return listings
+
+    def _save_listings(self):
+        if self._cache_file_path is None:
+            return
+
+        directory: str = os.path.dirname(os.path.abspath(self._cache_file_path))
+        os.makedirs(directory, exist_ok=True)
+        # The file is replaced atomically, so that concurrent readers never see a partially written file.
+        temp_file_path: str = (
+            f"{self._cache_file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(temp_file_path, "w") as outfile:
+            json.dump(self._listings, outfile)
+        os.replace(temp_file_path, self._cache_file_path)
@@ -1,5 +1,18 @@
+import json
 import logging
-from typing import Iterator, List, Optional, cast
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import (
@@ -14,6 +27,9 @@ from great_expectations.datasource.data_connector.batch_filter import (
     build_batch_filter,
 )
 from great_expectations.datasource.data_connector.data_connector import DataConnector
+from great_expectations.datasource.data_connector.data_reference_listing_cache import (
+    DataReferenceListingCache,
+)
 from great_expectations.datasource.data_connector.sorter import Sorter
 from great_expectations.datasource.data_connector.util import (
     batch_definition_matches_batch_request,
@@ -26,6 +42,131 @@ from great_expectations.execution_engine import ExecutionEngine
 logger = logging.getLogger(__name__)
 
 
+class _BatchDefinitionIndex:
+    """
+    Batch definitions in the data references cache of a FilePathDataConnector, grouped by data_asset_name, with every
+    group sorted (once) by the sorters of the data connector and indexed by its batch_identifiers, so that the batch
+    definitions of a data asset, whose batch_identifiers have given values, are found without scanning all of them.
+
+    The index is built from one data references cache object; it is rebuilt, whenever the cache is refreshed.
+    """
+
+    def __init__(
+        self,
+        data_references_cache: dict,
+        batch_definition_list: List[BatchDefinition],
+        sort_batch_definition_list: Callable[
+            [List[BatchDefinition]], List[BatchDefinition]
+        ],
+    ):
+        self._data_references_cache = data_references_cache
+        self._sort_batch_definition_list = sort_batch_definition_list
+
+        self._batch_definitions_by_data_asset_name: Dict[
+            str, List[BatchDefinition]
+        ] = defaultdict(list)
+        batch_definition: BatchDefinition
+        for batch_definition in batch_definition_list:
+            self._batch_definitions_by_data_asset_name[
+                batch_definition.data_asset_name
+            ].append(batch_definition)
+
+        self._sorted_batch_definitions_by_data_asset_name: Dict[
+            str, Optional[List[BatchDefinition]]
+        ] = {}
+        self._positions_by_data_asset_name: Dict[
+            str, Dict[Tuple[str, Hashable], List[int]]
+        ] = {}
+
+    def is_built_from(self, data_references_cache: dict) -> bool:
+        return self._data_references_cache is data_references_cache
+
+    def get_batch_definition_list(
+        self, data_asset_name: str, batch_identifiers: Optional[dict] = None
+    ) -> Optional[List[BatchDefinition]]:
+        """
+        Returns the sorted batch definitions of the data asset, whose batch_identifiers contain all of the given
+        batch_identifiers; the returned list must not be modified.
+
+        None is returned, if the index cannot answer the query (the caller then scans the batch definitions instead).
+        """
+        batch_definition_list: Optional[
+            List[BatchDefinition]
+        ] = self._get_sorted_batch_definition_list(data_asset_name=data_asset_name)
+        if batch_definition_list is None or not batch_identifiers:
+            return batch_definition_list
+
+        items: List[Tuple[str, Any]] = list(batch_identifiers.items())
+        try:
+            positions_list: List[List[int]] = [
+                self._get_positions(data_asset_name=data_asset_name).get(item, [])
+                for item in items
+            ]
+        except TypeError:
+            # Unhashable values are not indexed.
+            return None
+
+        # Candidates are taken from the shortest posting list, and checked against the remaining batch_identifiers.
+        positions: List[int] = min(positions_list, key=len)
+        return [
+            batch_definition_list[position]
+            for position in positions
+            if all(
+                key in batch_definition_list[position].batch_identifiers
+                and batch_definition_list[position].batch_identifiers[key] == value
+                for key, value in items
+            )
+        ]
+
+    def _get_sorted_batch_definition_list(
+        self, data_asset_name: str
+    ) -> Optional[List[BatchDefinition]]:
+        if data_asset_name not in self._sorted_batch_definitions_by_data_asset_name:
+            batch_definition_list: Optional[List[BatchDefinition]]
+            try:
+                batch_definition_list = self._sort_batch_definition_list(
+                    list(
+                        self._batch_definitions_by_data_asset_name.get(
+                            data_asset_name, []
+                        )
+                    )
+                )
+            except (ge_exceptions.SorterError, TypeError, ValueError):
+                # Batch definitions, which cannot be sorted, might still be filtered out by a request.
+                batch_definition_list = None
+
+            self._sorted_batch_definitions_by_data_asset_name[
+                data_asset_name
+            ] = batch_definition_list
+
+        return self._sorted_batch_definitions_by_data_asset_name[data_asset_name]
+
+    def _get_positions(
+        self, data_asset_name: str
+    ) -> Dict[Tuple[str, Hashable], List[int]]:
+        """
+        Maps every (key, value) pair of the batch_identifiers of the sorted batch definitions of the data asset to the
+        (increasing) positions of the batch definitions, whose batch_identifiers contain it.
+        """
+        if data_asset_name not in self._positions_by_data_asset_name:
+            positions: Dict[Tuple[str, Hashable], List[int]] = defaultdict(list)
+            position: int
+            batch_definition: BatchDefinition
+            for position, batch_definition in enumerate(
+                self._sorted_batch_definitions_by_data_asset_name[data_asset_name]
+            ):
+                for item in batch_definition.batch_identifiers.items():
+                    try:
+                        positions[item].append(position)
+                    except TypeError:
+                        # Unhashable values cannot be looked up.
+                        pass
+
+            self._positions_by_data_asset_name[data_asset_name] = dict(positions)
+
+        return self._positions_by_data_asset_name[data_asset_name]
+
+
 class FilePathDataConnector(DataConnector):
     """
     Base-class for DataConnector that are designed for connecting to filesystem-like data, which can include
@@ -44,6 +185,7 @@ class FilePathDataConnector(DataConnector):
         default_regex: Optional[dict] = None,
         sorters: Optional[list] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_cache_options: Optional[dict] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data. This class supports the configuration of default_regex
@@ -56,6 +198,8 @@ class FilePathDataConnector(DataConnector):
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            listing_cache_options (dict): optional DataReferenceListingCache arguments (e.g., "ttl_seconds"), with
+                which listings of data_references are cached
         """
         logger.debug(f'Constructing FilePathDataConnector "{name}".')
 
@@ -73,10 +217,70 @@ class FilePathDataConnector(DataConnector):
         self._sorters = build_sorters_from_config(config_list=sorters)
         self._validate_sorters_configuration()
 
+        self._batch_definition_index: Optional[_BatchDefinitionIndex] = None
+
+        self._listing_cache: Optional[
+            DataReferenceListingCache
+        ] = DataReferenceListingCache.from_options(
+            listing_cache_options=listing_cache_options
+        )
+
     @property
     def sorters(self) -> Optional[dict]:
         return self._sorters
 
+    @property
+    def listing_cache(self) -> Optional[DataReferenceListingCache]:
+        return self._listing_cache
+
+    def _list_data_references(
+        self,
+        query_options: dict,
+        list_data_references: Callable[[], List[str]],
+        list_data_references_after: Optional[Callable[[str], List[str]]] = None,
+    ) -> List[str]:
+        """
+        List the data_references of a query of the underlying data store, using the listing cache (if configured).
+
+        Args:
+            query_options (dict): options of the query (identifying the cached listing)
+            list_data_references (Callable): lists all data_references of the query
+            list_data_references_after (Callable): lists the data_references of the query, following the given one
+                (if the data store supports incremental listing)
+
+        Returns:
+            list of data_references of the query
+        """
+        if self._listing_cache is None:
+            return list_data_references()
+
+        query_key: str = json.dumps(
+            {"class_name": self.__class__.__name__, "query_options": query_options},
+            sort_keys=True,
+            default=str,
+        )
+        return self._listing_cache.get_data_references(
+            query_key=query_key,
+            list_data_references=list_data_references,
+            list_data_references_after=list_data_references_after,
+        )
+
+    def _save_listing_cache(self):
+        """
+        Persist the listings cached since the last save (if the listing cache is configured with a "cache_file_path").
+        """
+        if self._listing_cache is not None:
+            self._listing_cache.save()
+
+    def _map_concurrently(self, fn: Callable, items: Iterable) -> list:
+        """
+        Apply fn to every item, concurrently, if the listing cache allows multiple workers (and sequentially otherwise).
+        """
+        if self._listing_cache is None:
+            return [fn(item) for item in items]
+
+        return self._listing_cache.map_concurrently(fn=fn, items=items)
+
     def _get_data_reference_list_from_cache_by_data_asset_name(
         self, data_asset_name: str
     ) -> List[str]:
@@ -95,11 +299,6 @@ class FilePathDataConnector(DataConnector):
             )
         )
 
-        if len(self.sorters) > 0:
-            batch_definition_list = self._sort_batch_definition_list(
-                batch_definition_list=batch_definition_list
-            )
-
         path_list: List[str] = [
             map_batch_definition_to_data_reference_string_using_regex(
                 batch_definition=batch_definition,
@@ -156,19 +355,23 @@ class FilePathDataConnector(DataConnector):
         if len(self._data_references_cache) == 0:
             self._refresh_data_references_cache()
 
-        batch_definition_list: List[BatchDefinition] = list(
-            filter(
-                lambda batch_definition: batch_definition_matches_batch_request(
-                    batch_definition=batch_definition, batch_request=batch_request
-                ),
-                self._get_batch_definition_list_from_cache(),
+        batch_definition_list: Optional[
+            List[BatchDefinition]
+        ] = self._get_batch_definition_list_from_index(batch_request=batch_request)
+        if batch_definition_list is None:
+            batch_definition_list = list(
+                filter(
+                    lambda batch_definition: batch_definition_matches_batch_request(
+                        batch_definition=batch_definition, batch_request=batch_request
+                    ),
+                    self._get_batch_definition_list_from_cache(),
+                )
             )
-        )
 
-        if len(self.sorters) > 0:
-            batch_definition_list = self._sort_batch_definition_list(
-                batch_definition_list=batch_definition_list
-            )
+            if len(self.sorters) > 0:
+                batch_definition_list = self._sort_batch_definition_list(
+                    batch_definition_list=batch_definition_list
+                )
 
         if batch_request.data_connector_query is not None:
 
@@ -185,9 +388,69 @@ class FilePathDataConnector(DataConnector):
             batch_definition_list = batch_filter_obj.select_from_data_connector_query(
                 batch_definition_list=batch_definition_list
             )
+        else:
+            # The lists of the index must not be handed out.
+            batch_definition_list = list(batch_definition_list)
 
         return batch_definition_list
 
+    def _get_batch_definition_list_from_index(
+        self,
+        batch_request: BatchRequestBase,
+    ) -> Optional[List[BatchDefinition]]:
+        """
+        Look up the sorted batch_definitions of the data_asset_name of batch_request, which match its batch_identifiers
+        and the "batch_filter_parameters" of its data_connector_query, in the index of the data references cache.
+
+        Returns None, if the batch_request cannot be answered from the index (e.g., if it has no data_asset_name).
+        """
+        if not batch_request.data_asset_name:
+            return None
+
+        batch_identifiers: dict = {}
+        batch_filter_parameters: Any = None
+        if batch_request.data_connector_query:
+            batch_filter_parameters = batch_request.data_connector_query.get(
+                "batch_filter_parameters"
+            )
+
+        identifiers: Any
+        for identifiers in (batch_filter_parameters, batch_request.batch_identifiers):
+            if not identifiers:
+                continue
+
+            if not isinstance(identifiers, dict):
+                return None
+
+            key: str
+            for key in identifiers.keys():
+                if key in batch_identifiers and not (
+                    batch_identifiers[key] == identifiers[key]
+                ):
+                    return None
+
+            batch_identifiers.update(identifiers)
+
+        if self._batch_definition_index is None or not (
+            self._batch_definition_index.is_built_from(
+                data_references_cache=self._data_references_cache
+            )
+        ):
+            self._batch_definition_index = _BatchDefinitionIndex(
+                data_references_cache=self._data_references_cache,
+                batch_definition_list=self._get_batch_definition_list_from_cache(),
+                sort_batch_definition_list=lambda batch_definition_list: (
+                    self._sort_batch_definition_list(
+                        batch_definition_list=batch_definition_list
+                    )
+                ),
+            )
+
+        return self._batch_definition_index.get_batch_definition_list(
+            data_asset_name=batch_request.data_asset_name,
+            batch_identifiers=batch_identifiers,
+        )
+
     def _sort_batch_definition_list(
         self, batch_definition_list: List[BatchDefinition]
     ) -> List[BatchDefinition]:
@@ -52,6 +52,7 @@ class InferredAssetAzureDataConnector(InferredAssetFilePathDataConnector):
         delimiter: str = "/",
         azure_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_cache_options: Optional[dict] = None,
     ):
         """
         InferredAssetAzureDataConnector for connecting to Azure Blob Storage.
@@ -67,6 +68,8 @@ class InferredAssetAzureDataConnector(InferredAssetFilePathDataConnector):
             delimiter (str): Azure delimiter
             azure_options (dict): wrapper object for **kwargs
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            listing_cache_options (dict): optional DataReferenceListingCache arguments ("ttl_seconds", "incremental",
+                "max_workers", "cache_file_path"), with which listings of data_references are cached
         """
         logger.debug(f'Constructing InferredAssetAzureDataConnector "{name}".')
 
@@ -77,6 +80,7 @@ class InferredAssetAzureDataConnector(InferredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            listing_cache_options=listing_cache_options,
         )
 
         self._container = container
@@ -141,10 +145,14 @@ class InferredAssetAzureDataConnector(InferredAssetFilePathDataConnector):
             "delimiter": self._delimiter,
         }
 
-        path_list: List[str] = list_azure_keys(
-            azure=self._azure,
+        # Azure Blob Storage cannot list blobs following a given one, so stale listings are always listed fully.
+        path_list: List[str] = self._list_data_references(
             query_options=query_options,
-            recursive=True,
+            list_data_references=lambda: list_azure_keys(
+                azure=self._azure,
+                query_options=query_options,
+                recursive=True,
+            ),
         )
         return path_list
 
@@ -34,6 +34,7 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
         default_regex: Optional[dict] = None,
         sorters: Optional[list] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_cache_options: Optional[dict] = None,
     ):
         """
         Base class for DataConnectors that connect to filesystem-like data. This class supports the configuration of default_regex
@@ -46,6 +47,8 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
             default_regex (dict): Optional dict the filter and organize the data_references.
             sorters (list): Optional list if you want to sort the data_references
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            listing_cache_options (dict): optional DataReferenceListingCache arguments (e.g., "ttl_seconds"), with
+                which listings of data_references are cached
         """
         logger.debug(f'Constructing InferredAssetFilePathDataConnector "{name}".')
 
@@ -56,6 +59,7 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            listing_cache_options=listing_cache_options,
         )
 
     def _refresh_data_references_cache(self):
@@ -71,6 +75,9 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
             )
             self._data_references_cache[data_reference] = mapped_batch_definition_list
 
+        # All listings of this refresh are persisted at once.
+        self._save_listing_cache()
+
     def get_data_reference_list_count(self) -> int:
         """
         Returns the list of data_references known by this DataConnector by looping over all data_asset_names in
@@ -1,3 +1,4 @@
+import copy
 import logging
 import os
 from typing import List, Optional
@@ -63,6 +64,7 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
         max_results: Optional[int] = None,
         gcs_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_cache_options: Optional[dict] = None,
     ):
         """
         InferredAssetDataConnector for connecting to GCS.
@@ -79,6 +81,8 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
             max_results (int): max blob filepaths to return
             gcs_options (dict): wrapper object for optional GCS **kwargs
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            listing_cache_options (dict): optional DataReferenceListingCache arguments ("ttl_seconds", "incremental",
+                "max_workers", "cache_file_path"), with which listings of data_references are cached
         """
         logger.debug(f'Constructing InferredAssetGCSDataConnector "{name}".')
 
@@ -89,6 +93,7 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            listing_cache_options=listing_cache_options,
         )
 
         self._bucket_or_name = bucket_or_name
@@ -142,14 +147,22 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
             "max_results": self._max_results,
         }
 
-        path_list: List[str] = [
-            key
-            for key in list_gcs_keys(
+        path_list: List[str] = self._list_data_references(
+            query_options=query_options,
+            list_data_references=lambda: list_gcs_keys(
                 gcs=self._gcs,
-                query_options=query_options,
+                query_options=copy.deepcopy(query_options),
                 recursive=True,
-            )
-        ]
+            ),
+            # GCS lists blobs, starting at (and including) "start_offset".
+            list_data_references_after=lambda start_after: list_gcs_keys(
+                gcs=self._gcs,
+                query_options=dict(
+                    copy.deepcopy(query_options), start_offset=start_after
+                ),
+                recursive=True,
+            ),
+        )
         return path_list
 
     def _get_full_file_path(
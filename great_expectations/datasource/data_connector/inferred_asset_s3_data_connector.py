@@ -1,3 +1,4 @@
+import copy
 import logging
 import os
 from typing import List, Optional
@@ -14,7 +15,11 @@ except ImportError:
 from great_expectations.datasource.data_connector.inferred_asset_file_path_data_connector import (
     InferredAssetFilePathDataConnector,
 )
-from great_expectations.datasource.data_connector.util import list_s3_keys
+from great_expectations.datasource.data_connector.util import (
+    list_s3_keys,
+    list_s3_keys_after,
+    list_s3_keys_and_common_prefixes,
+)
 from great_expectations.execution_engine import ExecutionEngine
 
 logger = logging.getLogger(__name__)
@@ -48,6 +53,7 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
         max_keys: Optional[int] = 1000,
         boto3_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_cache_options: Optional[dict] = None,
     ):
         """
         InferredAssetS3DataConnector for connecting to S3.
@@ -64,6 +70,8 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             max_keys (int): S3 max_keys (default is 1000)
             boto3_options (dict): optional boto3 options
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            listing_cache_options (dict): optional DataReferenceListingCache arguments ("ttl_seconds", "incremental",
+                "max_workers", "cache_file_path"), with which listings of data_references are cached
         """
         logger.debug(f'Constructing InferredAssetS3DataConnector "{name}".')
 
@@ -74,6 +82,7 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             default_regex=default_regex,
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
+            listing_cache_options=listing_cache_options,
         )
 
         self._bucket = bucket
@@ -121,17 +130,55 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             "MaxKeys": self._max_keys,
         }
 
-        path_list: List[str] = [
-            key
-            for key in list_s3_keys(
+        path_list: List[str] = self._list_data_references(
+            query_options=query_options,
+            list_data_references=lambda: self._list_s3_keys(
+                query_options=query_options
+            ),
+            list_data_references_after=lambda start_after: list_s3_keys_after(
                 s3=self._s3,
                 query_options=query_options,
-                iterator_dict={},
+                start_after=start_after,
                 recursive=True,
-            )
-        ]
+            ),
+        )
         return path_list
 
+    def _list_s3_keys(self, query_options: dict) -> List[str]:
+        if self._listing_cache is None or not self._listing_cache.is_concurrent:
+            return [
+                key
+                for key in list_s3_keys(
+                    s3=self._s3,
+                    query_options=copy.deepcopy(query_options),
+                    iterator_dict={},
+                    recursive=True,
+                )
+            ]
+
+        # The keys below each of the common prefixes of the top level are listed concurrently.
+        keys: List[str]
+        common_prefixes: List[str]
+        keys, common_prefixes = list_s3_keys_and_common_prefixes(
+            s3=self._s3, query_options=query_options
+        )
+        prefix_key_lists: List[List[str]] = self._map_concurrently(
+            fn=lambda prefix: list(
+                list_s3_keys(
+                    s3=self._s3,
+                    query_options=dict(copy.deepcopy(query_options), Prefix=prefix),
+                    iterator_dict={},
+                    recursive=True,
+                )
+            ),
+            items=common_prefixes,
+        )
+        prefix_keys: List[str]
+        for prefix_keys in prefix_key_lists:
+            keys.extend(prefix_keys)
+
+        return keys
+
     def _get_full_file_path(
         self,
         path: str,
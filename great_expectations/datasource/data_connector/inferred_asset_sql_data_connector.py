@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional
+import logging
+from typing import Dict, Iterable, List, Optional, Union
 
 from great_expectations.datasource.data_connector.asset import Asset
 from great_expectations.datasource.data_connector.configured_asset_sql_data_connector import (
@@ -6,12 +7,33 @@ from great_expectations.datasource.data_connector.configured_asset_sql_data_conn
 )
 from great_expectations.execution_engine import ExecutionEngine
 
+logger = logging.getLogger(__name__)
+
 try:
     import sqlalchemy as sa
-    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.exc import OperationalError, SQLAlchemyError
 except ImportError:
     sa = None
 
+# Queries listing the (schema_name, table_name, type) of all tables and views at once, for dialects supporting them;
+# they list the same tables and views as the inspector of the dialect (which is called schema by schema otherwise).
+BULK_INTROSPECTION_QUERIES: Dict[str, str] = {
+    "postgresql": """
+        SELECT n.nspname AS schema_name, c.relname AS table_name,
+            CASE WHEN c.relkind IN ('r', 'p') THEN 'table' ELSE 'view' END AS type
+        FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname NOT LIKE 'pg_%' AND c.relkind IN ('r', 'p', 'v', 'm')
+        ORDER BY schema_name, type, table_name
+    """,
+    "mysql": """
+        SELECT table_schema AS schema_name, table_name AS table_name,
+            CASE WHEN table_type = 'BASE TABLE' THEN 'table' ELSE 'view' END AS type
+        FROM information_schema.tables
+        WHERE table_type IN ('BASE TABLE', 'VIEW')
+        ORDER BY schema_name, type, table_name
+    """,
+}
+
 
 class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
     """
@@ -35,6 +57,8 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         skip_inapplicable_tables: Optional[bool] = True,
         introspection_directives: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        partition_discovery_max_workers: Optional[int] = None,
+        lazy_partition_discovery: bool = False,
     ):
         """
         InferredAssetDataConnector for connecting to data on a SQL database
@@ -57,6 +81,11 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
                 If False, the class will throw an error during initialization if any such tables are encountered.
             introspection_directives (Dict): Arguments passed to the introspection method to guide introspection
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            partition_discovery_max_workers (int): maximum number of queries, which probe tables and list the
+                batch_identifiers of data assets concurrently (bounded by the connection pool of the engine)
+            lazy_partition_discovery (bool):
+                If True, tables are not queried during introspection (so skip_inapplicable_tables does not apply), and
+                the batch_identifiers of a data asset are only listed when it is requested.
         """
         self._data_asset_name_prefix = data_asset_name_prefix
         self._data_asset_name_suffix = data_asset_name_suffix
@@ -68,6 +97,7 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         self._excluded_tables = excluded_tables
         self._included_tables = included_tables
         self._skip_inapplicable_tables = skip_inapplicable_tables
+        self._lazy_partition_discovery = lazy_partition_discovery
 
         self._introspection_directives = introspection_directives or {}
 
@@ -77,6 +107,7 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             execution_engine=execution_engine,
             assets=None,
             batch_spec_passthrough=batch_spec_passthrough,
+            partition_discovery_max_workers=partition_discovery_max_workers,
         )
 
         # This cache will contain a "config" for each data_asset discovered via introspection.
@@ -101,7 +132,12 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         return self._introspected_assets_cache
 
     def _refresh_data_references_cache(self):
-        self._refresh_introspected_assets_cache(
+        self._data_references_cache = {}
+
+        # Tables probed during introspection need not be queried again.
+        probed_batch_identifiers_lists: Dict[
+            str, List[dict]
+        ] = self._refresh_introspected_assets_cache(
             self._data_asset_name_prefix,
             self._data_asset_name_suffix,
             self._include_schema_name,
@@ -113,8 +149,15 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             self._included_tables,
             self._skip_inapplicable_tables,
         )
+        self._data_references_cache.update(probed_batch_identifiers_lists)
 
-        super()._refresh_data_references_cache()
+        self._refresh_data_references_cache_for_data_assets(
+            data_asset_names=[
+                data_asset_name
+                for data_asset_name in self.assets
+                if data_asset_name not in self._data_references_cache
+            ]
+        )
 
     def _refresh_introspected_assets_cache(
         self,
@@ -128,10 +171,20 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         excluded_tables: List = None,
         included_tables: List = None,
         skip_inapplicable_tables: bool = True,
-    ):
+    ) -> Dict[str, List[dict]]:
+        """
+        Introspect the database for tables (and views), which become data assets, and probe them (unless partitions
+        are discovered lazily) with the splitter query of the data asset (concurrently, if so configured).
+
+        Returns:
+            batch_identifiers lists of the probed data assets (by data_asset_name)
+        """
         introspected_table_metadata = self._introspect_db(
             **self._introspection_directives
         )
+
+        data_asset_configs: Dict[str, dict] = {}
+        metadata_by_data_asset_name: Dict[str, dict] = {}
         for metadata in introspected_table_metadata:
             if (excluded_tables is not None) and (
                 metadata["schema_name"] + "." + metadata["table_name"]
@@ -173,13 +226,34 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
             if not sampling_kwargs is None:
                 data_asset_config["sampling_kwargs"] = sampling_kwargs
 
+            data_asset_configs[data_asset_name] = data_asset_config
+            metadata_by_data_asset_name[data_asset_name] = metadata
+
+        if self._lazy_partition_discovery:
+            self._introspected_assets_cache.update(data_asset_configs)
+            return {}
+
+        def probe_data_asset(
+            data_asset_name: str, engine
+        ) -> Union[List[dict], OperationalError]:
             # Attempt to fetch a list of batch_identifiers from the table
             try:
-                self._get_batch_identifiers_list_from_data_asset_config(
+                return self._get_batch_identifiers_list_from_data_asset_config(
                     data_asset_name,
-                    data_asset_config,
+                    data_asset_configs[data_asset_name],
+                    engine=engine,
                 )
             except OperationalError as e:
+                return e
+
+        data_asset_names: List[str] = list(data_asset_configs.keys())
+        probe_results: List[
+            Union[List[dict], OperationalError]
+        ] = self._map_partition_discovery(fn=probe_data_asset, items=data_asset_names)
+
+        probed_batch_identifiers_lists: Dict[str, List[dict]] = {}
+        for data_asset_name, probe_result in zip(data_asset_names, probe_results):
+            if isinstance(probe_result, OperationalError):
                 # If it doesn't work, then...
                 if skip_inapplicable_tables:
                     # No harm done. Just don't include this table in the list of assets.
@@ -187,12 +261,18 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
 
                 else:
                     # We're being strict. Crash now.
+                    metadata: dict = metadata_by_data_asset_name[data_asset_name]
                     raise ValueError(
                         f"Couldn't execute a query against table {metadata['table_name']} in schema {metadata['schema_name']}"
-                    ) from e
+                    ) from probe_result
 
             # Store an asset config for each introspected data asset.
-            self._introspected_assets_cache[data_asset_name] = data_asset_config
+            self._introspected_assets_cache[data_asset_name] = data_asset_configs[
+                data_asset_name
+            ]
+            probed_batch_identifiers_lists[data_asset_name] = probe_result
+
+        return probed_batch_identifiers_lists
 
     def _introspect_db(
         self,
@@ -207,30 +287,89 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
         ],
         system_tables: List[str] = ["sqlite_master"],  # sqlite
         include_views=True,
+        use_bulk_introspection: bool = True,
     ):
         engine = self._execution_engine.engine
-        inspector = sa.inspect(engine)
 
         selected_schema_name = schema_name
 
-        tables = []
-        for schema_name in inspector.get_schema_names():
+        def is_selected_schema(schema_name: str) -> bool:
             if (
                 ignore_information_schemas_and_system_tables
                 and schema_name in information_schemas
             ):
+                return False
+
+            return selected_schema_name is None or schema_name == selected_schema_name
+
+        table_metadata: Optional[List[dict]] = None
+        if use_bulk_introspection:
+            table_metadata = self._introspect_db_in_bulk()
+
+        if table_metadata is None:
+            table_metadata = self._introspect_db_with_inspector(
+                is_selected_schema=is_selected_schema,
+                include_views=include_views,
+            )
+
+        tables = []
+        for metadata in table_metadata:
+            if not is_selected_schema(schema_name=metadata["schema_name"]):
                 continue
 
-            if selected_schema_name is not None and schema_name != selected_schema_name:
+            if metadata["type"] == "view" and not include_views:
                 continue
 
-            for table_name in inspector.get_table_names(schema=schema_name):
+            if (ignore_information_schemas_and_system_tables) and (
+                metadata["table_name"] in system_tables
+            ):
+                continue
 
-                if (ignore_information_schemas_and_system_tables) and (
-                    table_name in system_tables
-                ):
-                    continue
+            tables.append(metadata)
+
+        return tables
+
+    def _introspect_db_in_bulk(self) -> Optional[List[dict]]:
+        """
+        List all tables and views with one query, if the dialect of the engine has a bulk introspection query.
+
+        Returns:
+            list of table metadata, or None if the tables must be listed with the inspector
+        """
+        engine = self._execution_engine.engine
+        query: Optional[str] = BULK_INTROSPECTION_QUERIES.get(engine.dialect.name)
+        if query is None:
+            return None
+
+        try:
+            rows = engine.execute(sa.text(query)).fetchall()
+        except SQLAlchemyError as e:
+            logger.debug(
+                f"Unable to introspect the database in bulk (using the inspector instead): {e}"
+            )
+            return None
 
+        return [
+            {
+                "schema_name": schema_name,
+                "table_name": table_name,
+                "type": table_type,
+            }
+            for schema_name, table_name, table_type in rows
+        ]
+
+    def _introspect_db_with_inspector(
+        self, is_selected_schema, include_views: bool
+    ) -> List[dict]:
+        engine = self._execution_engine.engine
+        inspector = sa.inspect(engine)
+
+        tables = []
+        for schema_name in inspector.get_schema_names():
+            if not is_selected_schema(schema_name=schema_name):
+                continue
+
+            for table_name in inspector.get_table_names(schema=schema_name):
                 tables.append(
                     {
                         "schema_name": schema_name,
@@ -249,12 +388,6 @@ class InferredAssetSqlDataConnector(ConfiguredAssetSqlDataConnector):
                     pass
                 else:
                     for view_name in view_names:
-
-                        if ignore_information_schemas_and_system_tables and (
-                            view_name in system_tables
-                        ):
-                            continue
-
                         tables.append(
                             {
                                 "schema_name": schema_name,
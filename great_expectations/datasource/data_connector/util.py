@@ -462,6 +462,81 @@ def list_s3_keys(
         del iterator_dict["continuation_token"]
 
 
+def list_s3_keys_and_common_prefixes(
+    s3, query_options: dict
+) -> Tuple[List[str], List[str]]:
+    """
+    Lists the keys and the common prefixes at the level of S3 specified by the bucket and prefix (and delimiter) of
+    query_options, so that the keys below the common prefixes can be listed independently of each other.
+    :param s3: s3 client connection
+    :param query_options: s3 query attributes ("Bucket", "Prefix", "Delimiter", "MaxKeys")
+    :return: tuple of the keys (of non-empty objects) and of the common prefixes at that level
+    """
+    query_options = copy.deepcopy(query_options)
+
+    keys: List[str] = []
+    common_prefixes: List[str] = []
+    while True:
+        logger.debug(f"Fetching objects from S3 with query options: {query_options}")
+        s3_objects_info: dict = s3.list_objects_v2(**query_options)
+        if not (keys or common_prefixes) and not any(
+            key in s3_objects_info for key in ["Contents", "CommonPrefixes"]
+        ):
+            raise ValueError("S3 query may not have been configured correctly.")
+
+        keys.extend(
+            item["Key"]
+            for item in s3_objects_info.get("Contents", [])
+            if item["Size"] > 0
+        )
+        common_prefixes.extend(
+            prefix_info["Prefix"]
+            for prefix_info in s3_objects_info.get("CommonPrefixes", [])
+        )
+        if not s3_objects_info["IsTruncated"]:
+            break
+
+        query_options["ContinuationToken"] = s3_objects_info["NextContinuationToken"]
+
+    return keys, common_prefixes
+
+
+def list_s3_keys_after(
+    s3, query_options: dict, start_after: str, recursive: bool = False
+) -> List[str]:
+    """
+    Lists the keys following start_after (in lexicographic order), which list_s3_keys would list for query_options,
+    using the "StartAfter" option of S3 (for incremental listing).  Recursive listings drop the delimiter, so that all
+    keys below the prefix are listed in one paginated sequence of requests.  Unlike for list_s3_keys, an empty result
+    is not an error, since no keys might have been added.
+    :param s3: s3 client connection
+    :param query_options: s3 query attributes ("Bucket", "Prefix", "Delimiter", "MaxKeys")
+    :param start_after: key, after which keys are listed
+    :param recursive: True for InferredAssetS3DataConnector and False for ConfiguredAssetS3DataConnector
+    :return: list of keys (of non-empty objects) following start_after
+    """
+    query_options = copy.deepcopy(query_options)
+    query_options["StartAfter"] = start_after
+    if recursive:
+        query_options.pop("Delimiter", None)
+
+    keys: List[str] = []
+    while True:
+        logger.debug(f"Fetching objects from S3 with query options: {query_options}")
+        s3_objects_info: dict = s3.list_objects_v2(**query_options)
+        keys.extend(
+            item["Key"]
+            for item in s3_objects_info.get("Contents", [])
+            if item["Size"] > 0
+        )
+        if not s3_objects_info["IsTruncated"]:
+            break
+
+        query_options["ContinuationToken"] = s3_objects_info["NextContinuationToken"]
+
+    return keys
+
+
 # TODO: <Alex>We need to move sorters and _validate_sorters_configuration() to DataConnector</Alex>
 # As a rule, this method should not be in "util", but in the specific high-level "DataConnector" class, where it is
 # called (and declared as private in that class).  Currently, this is "FilePathDataConnector".  However, since this
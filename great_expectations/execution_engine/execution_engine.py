@@ -1,14 +1,20 @@
 import copy
 import logging
+import weakref
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Dict, Iterable, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
 from ruamel.yaml import YAML
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchMarkers, BatchSpec
+from great_expectations.core.id_dict import IDDict
+from great_expectations.execution_engine.metric_cache import (
+    MetricCache,
+    build_metric_cache,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.util import filter_properties_dict
 from great_expectations.validator.validation_graph import MetricConfiguration
@@ -66,6 +72,7 @@ class ExecutionEngine(ABC):
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        metric_cache: Optional[Union[dict, MetricCache]] = None,
     ):
         self.name = name
         self._validator = validator
@@ -79,6 +86,20 @@ class ExecutionEngine(ABC):
         else:
             self._metric_cache = NoOpDict()
 
+        # The (optional) persistent metric cache holds the values of resolved metrics keyed by batch fingerprint (rather
+        # than by batch_id), so that they can be reused across validation runs for as long as the data is unchanged.
+        if metric_cache is not None and not self._caching:
+            logger.warning(
+                "A metric_cache was configured for an execution engine with caching disabled; ignoring the metric_cache."
+            )
+            metric_cache = None
+        self._persistent_metric_cache: Optional[MetricCache] = build_metric_cache(
+            metric_cache_config=metric_cache
+        )
+        self._batch_fingerprints: Dict[str, Optional[str]] = {}
+        # Fingerprints computed while building batch data (e.g., from the batch_spec), keyed by the batch data object.
+        self._batch_data_fingerprints = weakref.WeakKeyDictionary()
+
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
         batch_spec_defaults_keys = set(batch_spec_defaults.keys())
@@ -108,6 +129,7 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache": metric_cache,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -166,6 +188,11 @@ class ExecutionEngine(ABC):
     def dialect(self):
         return None
 
+    @property
+    def metric_cache(self) -> Optional[MetricCache]:
+        """The persistent metric cache (keyed by batch fingerprint) of this execution engine, if one is configured."""
+        return self._persistent_metric_cache
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -192,6 +219,7 @@ class ExecutionEngine(ABC):
         """
         self._batch_data_dict[batch_id] = batch_data
         self._active_batch_data_id = batch_id
+        self._batch_fingerprints.pop(batch_id, None)
 
     def _load_batch_data_from_dict(self, batch_data_dict):
         """
@@ -200,6 +228,101 @@ class ExecutionEngine(ABC):
         for batch_id, batch_data in batch_data_dict.items():
             self.load_batch_data(batch_id, batch_data)
 
+    def get_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Computes a fingerprint identifying the contents of the loaded batch, which keys the persistent metric cache.
+
+        Execution engines that cannot fingerprint their batches return None, which disables the persistent metric
+        cache for the batch.
+        """
+        batch_data: Any = self.loaded_batch_data_dict.get(batch_id)
+        if batch_data is None:
+            return None
+
+        try:
+            return self._batch_data_fingerprints.get(batch_data)
+        except TypeError:
+            # Batch data that cannot be weakly referenced is not fingerprinted.
+            return None
+
+    def _get_metric_cache_key(
+        self, metric_configuration: MetricConfiguration
+    ) -> Optional[Tuple]:
+        """Builds the key of the metric in the persistent metric cache: the batch_id of the metric domain is replaced
+        with the fingerprint of the batch, so that the key identifies the metric across validation runs."""
+        batch_id: Optional[str] = (
+            metric_configuration.metric_domain_kwargs.get("batch_id")
+            or self.active_batch_data_id
+        )
+        if batch_id is None or batch_id not in self.loaded_batch_data_dict:
+            return None
+
+        if batch_id not in self._batch_fingerprints:
+            self._batch_fingerprints[batch_id] = self.get_batch_fingerprint(
+                batch_id=batch_id
+            )
+
+        batch_fingerprint: Optional[str] = self._batch_fingerprints[batch_id]
+        if batch_fingerprint is None:
+            return None
+
+        metric_domain_kwargs: IDDict = IDDict(
+            {
+                key: value
+                for key, value in metric_configuration.metric_domain_kwargs.items()
+                if key != "batch_id"
+            }
+        )
+        return (
+            batch_fingerprint,
+            metric_configuration.metric_name,
+            metric_domain_kwargs.to_id(),
+            metric_configuration.metric_value_kwargs_id,
+        )
+
+    def get_cached_metrics(
+        self, metrics_to_resolve: Iterable[MetricConfiguration]
+    ) -> Dict[Tuple, Any]:
+        """Returns the values of the metrics available in the persistent metric cache, keyed by metric id.
+
+        Args:
+            metrics_to_resolve: the metrics to look up
+
+        Returns:
+            cached_metrics (Dict): a dictionary with the values of the metrics found in the cache.
+        """
+        if self._persistent_metric_cache is None:
+            return {}
+
+        metric_cache_keys: Dict[Tuple, Tuple] = {}
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metrics_to_resolve:
+            metric_cache_key: Optional[Tuple] = self._get_metric_cache_key(
+                metric_configuration=metric_configuration
+            )
+            if metric_cache_key is not None:
+                metric_cache_keys[metric_configuration.id] = metric_cache_key
+
+        return self._persistent_metric_cache.get_many(keys=metric_cache_keys)
+
+    def _cache_metrics(
+        self,
+        metric_configurations: Iterable[MetricConfiguration],
+        resolved_metrics: Dict[Tuple, Any],
+    ) -> None:
+        if self._persistent_metric_cache is None:
+            return
+
+        items: Dict[Tuple, Any] = {}
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            metric_cache_key: Optional[Tuple] = self._get_metric_cache_key(
+                metric_configuration=metric_configuration
+            )
+            if metric_cache_key is not None:
+                items[metric_cache_key] = resolved_metrics[metric_configuration.id]
+
+        self._persistent_metric_cache.set_many(items=items)
+
     def resolve_metrics(
         self,
         metrics_to_resolve: Iterable[MetricConfiguration],
@@ -220,7 +343,47 @@ class ExecutionEngine(ABC):
         if metrics is None:
             metrics = {}
 
-        resolved_metrics: Dict[Tuple, MetricConfiguration] = {}
+        metrics_to_resolve = list(metrics_to_resolve)
+        cached_metrics: Dict[Tuple, Any] = self.get_cached_metrics(
+            metrics_to_resolve=metrics_to_resolve
+        )
+
+        resolved_metrics: Dict[Tuple, Any]
+        metrics_to_cache: List[MetricConfiguration]
+        resolved_metrics, metrics_to_cache = self._compute_metrics(
+            metrics_to_resolve=[
+                metric_to_resolve
+                for metric_to_resolve in metrics_to_resolve
+                if metric_to_resolve.id not in cached_metrics
+            ],
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+        resolved_metrics.update(cached_metrics)
+
+        if self._caching:
+            self._metric_cache.update(resolved_metrics)
+            self._cache_metrics(
+                metric_configurations=metrics_to_cache,
+                resolved_metrics=resolved_metrics,
+            )
+
+        return resolved_metrics
+
+    def _compute_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[Dict[Tuple, Any], List[MetricConfiguration]]:
+        """Computes the values of the provided metrics, without consulting or updating the metric caches.
+
+        Returns:
+            A tuple consisting of the dictionary of resolved metrics and of the list of resolved metrics whose results
+            are metric values (as opposed to partial functions), which are the only ones that may be persisted.
+        """
+        resolved_metrics: Dict[Tuple, Any] = {}
+        metrics_to_cache: List[MetricConfiguration] = []
 
         metric_fn_bundle = []
         for metric_to_resolve in metrics_to_resolve:
@@ -257,6 +420,35 @@ class ExecutionEngine(ABC):
                     raise ge_exceptions.MetricError(
                         message=f'Missing metric dependency: {str(e)} for metric "{metric_to_resolve.metric_name}".'
                     )
+                metrics_to_cache.append(metric_to_resolve)
+                metric_fn_bundle.append(
+                    (
+                        metric_to_resolve,
+                        metric_fn,
+                        compute_domain_kwargs,
+                        accessor_domain_kwargs,
+                        metric_provider_kwargs,
+                    )
+                )
+                continue
+            metric_partial_fn = getattr(metric_fn, "metric_partial_fn", None)
+            if metric_partial_fn is not None:
+                # Value metrics that expose a partial (e.g., pandas column aggregates) are deferred, so that the engine
+                # can compute all of them that share a compute domain in a single pass over the data.
+                try:
+                    (
+                        metric_fn,
+                        compute_domain_kwargs,
+                        accessor_domain_kwargs,
+                    ) = metric_partial_fn(**metric_provider_kwargs)
+                except (
+                    ge_exceptions.MetricComputationError,
+                    ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError,
+                ) as e:
+                    raise ge_exceptions.MetricResolutionError(
+                        message=str(e), failed_metrics=(metric_to_resolve,)
+                    )
+                metrics_to_cache.append(metric_to_resolve)
                 metric_fn_bundle.append(
                     (
                         metric_to_resolve,
@@ -293,6 +485,7 @@ class ExecutionEngine(ABC):
                         message=str(e), failed_metrics=(metric_to_resolve,)
                     )
             elif metric_fn_type == MetricFunctionTypes.VALUE:
+                metrics_to_cache.append(metric_to_resolve)
                 try:
                     resolved_metrics[metric_to_resolve.id] = metric_fn(
                         **metric_provider_kwargs
@@ -330,15 +523,28 @@ class ExecutionEngine(ABC):
                 raise ge_exceptions.MetricResolutionError(
                     message=str(e), failed_metrics=[x[0] for x in metric_fn_bundle]
                 )
-        if self._caching:
-            self._metric_cache.update(resolved_metrics)
 
-        return resolved_metrics
+        return resolved_metrics, metrics_to_cache
 
     def resolve_metric_bundle(self, metric_fn_bundle):
         """Resolve a bundle of metrics with the same compute domain as part of a single trip to the compute engine."""
         raise NotImplementedError
 
+    def add_domain_records_consumers(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Registers the metrics of a validation graph, which are about to be resolved, as consumers of the records of
+        their domains, so that execution engines may retain the records consumed repeatedly (e.g., Spark persists
+        them); execution engines that do not retain domain records ignore it."""
+        pass
+
+    def remove_domain_records_consumers(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Unregisters resolved metrics as consumers of the records of their domains (please see
+        "add_domain_records_consumers()"), so that records without remaining consumers can be released."""
+        pass
+
     def get_domain_records(
         self,
         domain_kwargs: dict,
@@ -0,0 +1,232 @@
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.util import load_class, verify_dynamic_loading_support
+
+logger = logging.getLogger(__name__)
+
+
+class MetricCache(ABC):
+    """A size-bounded cache of resolved metric values, evicting the least recently used entries first.
+
+    ExecutionEngine uses a MetricCache to persist the values of resolved metrics across validation runs, keyed by the
+    metric id and a fingerprint of the batch of data on which the metric was computed (please see
+    ExecutionEngine.get_cached_metrics), so that metrics of batches whose data has not changed are not recomputed.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        """
+        Args:
+            max_size: the maximum number of entries held by the cache (if None, the size of the cache is unbounded).
+        """
+        if max_size is not None and max_size < 1:
+            raise ge_exceptions.InvalidConfigError(
+                f"""The "max_size" of a {self.__class__.__name__} must be a positive integer (received {max_size}).
+                """
+            )
+
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return self._max_size
+
+    @abstractmethod
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        """Returns the value cached for the key (marking it as the most recently used entry), or the default."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: Tuple, value: Any) -> None:
+        """Caches the value for the key, evicting the least recently used entries beyond "max_size"."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def get_many(self, keys: Dict[Hashable, Tuple]) -> Dict[Hashable, Any]:
+        """Returns, for each (name, key) pair, the value cached for the key under the given name (misses are omitted)."""
+        missing = object()
+        values: Dict[Hashable, Any] = {}
+        name: Hashable
+        key: Tuple
+        for name, key in keys.items():
+            value: Any = self.get(key=key, default=missing)
+            if value is not missing:
+                values[name] = value
+
+        return values
+
+    def set_many(self, items: Dict[Tuple, Any]) -> None:
+        key: Tuple
+        value: Any
+        for key, value in items.items():
+            self.set(key=key, value=value)
+
+
+class InMemoryMetricCache(MetricCache):
+    """A MetricCache held in memory, shared by all validations run with the same ExecutionEngine instance."""
+
+    def __init__(self, max_size: Optional[int] = None):
+        super().__init__(max_size=max_size)
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: Tuple, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if self._max_size is not None:
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteMetricCache(MetricCache):
+    """A MetricCache persisted on the local file system in a SQLite database, shared by all processes using the file.
+
+    Metric values are stored pickled; values that cannot be pickled are not cached.
+    """
+
+    _table_name = "ge_metric_cache"
+
+    def __init__(
+        self,
+        filepath: str,
+        max_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            filepath: path to the SQLite database file (created, together with its directory, if it does not exist).
+            max_size: the maximum number of entries held by the cache (if None, the size of the cache is unbounded).
+        """
+        super().__init__(max_size=max_size)
+
+        filepath = os.path.abspath(os.path.expanduser(filepath))
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        self._filepath = filepath
+
+        self._connection = sqlite3.connect(
+            filepath, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._table_name} "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, last_accessed REAL NOT NULL)"
+        )
+        self._connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {self._table_name}_last_accessed "
+            f"ON {self._table_name} (last_accessed)"
+        )
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @staticmethod
+    def _serialize_key(key: Tuple) -> str:
+        return json.dumps(key)
+
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        serialized_key: str = self._serialize_key(key=key)
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value FROM {self._table_name} WHERE key = ?",
+                (serialized_key,),
+            ).fetchone()
+            if row is None:
+                return default
+
+            self._connection.execute(
+                f"UPDATE {self._table_name} SET last_accessed = ? WHERE key = ?",
+                (time.time(), serialized_key),
+            )
+
+        try:
+            return pickle.loads(row[0])
+        except (pickle.UnpicklingError, AttributeError, ImportError, EOFError) as e:
+            logger.debug(f"Ignoring unreadable metric cache entry {key}: {e}")
+            return default
+
+    def set(self, key: Tuple, value: Any) -> None:
+        try:
+            serialized_value: bytes = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.debug(
+                f"Not caching metric {key}, whose value cannot be pickled: {e}"
+            )
+            return
+
+        with self._lock:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self._table_name} (key, value, last_accessed) VALUES (?, ?, ?)",
+                (self._serialize_key(key=key), serialized_value, time.time()),
+            )
+            if self._max_size is not None:
+                self._connection.execute(
+                    f"DELETE FROM {self._table_name} WHERE key NOT IN "
+                    f"(SELECT key FROM {self._table_name} ORDER BY last_accessed DESC LIMIT ?)",
+                    (self._max_size,),
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute(f"DELETE FROM {self._table_name}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                f"SELECT COUNT(*) FROM {self._table_name}"
+            ).fetchone()[0]
+
+
+def build_metric_cache(
+    metric_cache_config: Optional[Union[dict, MetricCache]]
+) -> Optional[MetricCache]:
+    """Instantiates a MetricCache from its configuration (a dictionary with a "class_name", an optional "module_name",
+    and the constructor arguments of the class); a MetricCache instance (or None) is returned unchanged.
+    """
+    if metric_cache_config is None or isinstance(metric_cache_config, MetricCache):
+        return metric_cache_config
+
+    metric_cache_config = dict(metric_cache_config)
+    class_name: str = metric_cache_config.pop("class_name", "InMemoryMetricCache")
+    module_name: str = metric_cache_config.pop(
+        "module_name", "great_expectations.execution_engine.metric_cache"
+    )
+    verify_dynamic_loading_support(module_name=module_name)
+    metric_cache_class = load_class(class_name=class_name, module_name=module_name)
+    if not issubclass(metric_cache_class, MetricCache):
+        raise ge_exceptions.InvalidConfigError(
+            f"""The metric cache class "{class_name}" must be a subclass of MetricCache.
+            """
+        )
+
+    return metric_cache_class(**metric_cache_config)
@@ -1,5 +1,9 @@
+import threading
+from typing import Callable, Iterable, Iterator, Optional
+
 import pandas as pd
 
+import great_expectations.exceptions as ge_exceptions
 from great_expectations.execution_engine.execution_engine import BatchData
 
 
@@ -11,3 +15,53 @@ class PandasBatchData(BatchData):
     @property
     def dataframe(self):
         return self._dataframe
+
+
+class ChunkedPandasBatchData(BatchData):
+    """Batch data that is read, one chunk (DataFrame) at a time, from a source that may not fit in memory.
+
+    The chunks are re-read from the source on every pass (please see iter_chunks); while a chunk is being processed,
+    it is available (to the iterating thread only) as the "dataframe" of the batch data.
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        chunk_reader_fn: Callable[[], Iterable[pd.DataFrame]],
+        chunk_fn: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    ):
+        """
+        Args:
+            execution_engine: the execution engine that owns the batch data
+            chunk_reader_fn: a function returning a new iterable (e.g., a pandas TextFileReader) over the chunks
+            chunk_fn: an optional function applied to every chunk (e.g., splitting and sampling)
+        """
+        super().__init__(execution_engine=execution_engine)
+        self._chunk_reader_fn = chunk_reader_fn
+        self._chunk_fn = chunk_fn
+        self._local = threading.local()
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        chunk_reader: Iterable[pd.DataFrame] = self._chunk_reader_fn()
+        try:
+            for chunk in chunk_reader:
+                if self._chunk_fn is not None:
+                    chunk = self._chunk_fn(chunk)
+                self._local.chunk = chunk
+                yield chunk
+        finally:
+            self._local.chunk = None
+            close: Optional[Callable] = getattr(chunk_reader, "close", None)
+            if close is not None:
+                close()
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        chunk: Optional[pd.DataFrame] = getattr(self._local, "chunk", None)
+        if chunk is None:
+            raise ge_exceptions.ExecutionEngineError(
+                "The data of a chunked batch can only be accessed one chunk at a time, while chunked metrics are being "
+                "computed."
+            )
+
+        return chunk
@@ -0,0 +1,274 @@
+import math
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+
+class ChunkedMetricAggregate:
+    """Describes how the values of a metric, computed on each chunk of a chunked batch, are combined into the value of
+    the metric on the whole batch.
+
+    By default, the metric itself is computed on every chunk; if a "chunk_partial_fn" is provided, it is applied to the
+    (non-null) values of the metric column in every chunk instead, and the resulting partial aggregates are combined.
+    """
+
+    def __init__(
+        self,
+        combine: Callable[[Any, Any, dict], Any],
+        finalize: Optional[Callable[[Any, dict], Any]] = None,
+        chunk_partial_fn: Optional[Callable[[pd.Series], Any]] = None,
+        is_complete: Optional[Callable[[Any, dict], bool]] = None,
+    ):
+        """
+        Args:
+            combine: combines the accumulated value with the value of the next chunk, given the metric value kwargs
+            finalize: converts the accumulated value into the value of the metric (defaults to the accumulated value)
+            chunk_partial_fn: computes the partial aggregate of a chunk from the column of the metric domain
+            is_complete: whether the accumulated value is final, so that the remaining chunks need not be processed
+        """
+        self._combine = combine
+        self._finalize = finalize
+        self._chunk_partial_fn = chunk_partial_fn
+        self._is_complete = is_complete
+
+    @property
+    def chunk_partial_fn(self) -> Optional[Callable[[pd.Series], Any]]:
+        return self._chunk_partial_fn
+
+    def combine(self, accumulated_value: Any, value: Any, metric_value_kwargs: dict):
+        return self._combine(accumulated_value, value, metric_value_kwargs)
+
+    def finalize(self, accumulated_value: Any, metric_value_kwargs: dict):
+        if self._finalize is None:
+            return accumulated_value
+
+        return self._finalize(accumulated_value, metric_value_kwargs)
+
+    def is_complete(self, accumulated_value: Any, metric_value_kwargs: dict) -> bool:
+        if self._is_complete is None:
+            return False
+
+        return self._is_complete(accumulated_value, metric_value_kwargs)
+
+
+def _combine_first(accumulated_value, value, metric_value_kwargs):
+    return accumulated_value
+
+
+def _is_complete_first(accumulated_value, metric_value_kwargs):
+    return True
+
+
+def _combine_sum(accumulated_value, value, metric_value_kwargs):
+    return accumulated_value + value
+
+
+def _combine_extremum(extremum_fn: Callable) -> Callable:
+    def combine(accumulated_value, value, metric_value_kwargs):
+        # Chunks without any non-null values in the column yield NaN.
+        if pd.isnull(accumulated_value):
+            return value
+        if pd.isnull(value):
+            return accumulated_value
+        return extremum_fn(accumulated_value, value)
+
+    return combine
+
+
+def _combine_set_union(accumulated_value, value, metric_value_kwargs):
+    return accumulated_value | value
+
+
+def _get_unexpected_limit(metric_value_kwargs: dict) -> Optional[int]:
+    """Unexpected values are sampled up to "partial_unexpected_count", unless the result format is "COMPLETE"."""
+    result_format: dict = metric_value_kwargs.get("result_format") or {}
+    if result_format.get("result_format") == "COMPLETE":
+        return None
+
+    return result_format.get("partial_unexpected_count")
+
+
+def _combine_unexpected_list(accumulated_value, value, metric_value_kwargs):
+    limit: Optional[int] = _get_unexpected_limit(metric_value_kwargs)
+    return (list(accumulated_value) + list(value))[:limit]
+
+
+def _combine_unexpected_rows(accumulated_value, value, metric_value_kwargs):
+    limit: Optional[int] = _get_unexpected_limit(metric_value_kwargs)
+    return pd.concat([accumulated_value, value]).iloc[:limit]
+
+
+def _is_complete_unexpected(accumulated_value, metric_value_kwargs):
+    limit: Optional[int] = _get_unexpected_limit(metric_value_kwargs)
+    return limit is not None and len(accumulated_value) >= limit
+
+
+def _combine_head(accumulated_value, value, metric_value_kwargs):
+    if metric_value_kwargs.get("fetch_all"):
+        return pd.concat([accumulated_value, value])
+
+    return pd.concat([accumulated_value, value]).head(
+        metric_value_kwargs.get("n_rows", 5)
+    )
+
+
+def _is_complete_head(accumulated_value, metric_value_kwargs):
+    return not metric_value_kwargs.get("fetch_all") and len(
+        accumulated_value
+    ) >= metric_value_kwargs.get("n_rows", 5)
+
+
+def _combine_sketches(accumulated_value, value, metric_value_kwargs):
+    return accumulated_value.merge(value)
+
+
+def _combine_value_counts(accumulated_value, value, metric_value_kwargs):
+    return pd.concat([accumulated_value, value]).groupby(level=0).sum()
+
+
+def _finalize_value_counts(accumulated_value, metric_value_kwargs):
+    # Mirrors the sorting of the "column.value_counts" metric.
+    counts: pd.Series = accumulated_value
+    sort: str = metric_value_kwargs.get("sort", "value")
+    if sort == "value":
+        try:
+            counts = counts.sort_index()
+        except TypeError:
+            counts.index = counts.index.astype(str)
+            counts = counts.sort_index()
+    elif sort == "counts":
+        counts = counts.sort_values()
+    counts.name = "count"
+    counts.index.name = "value"
+    return counts
+
+
+def _combine_histogram(accumulated_value, value, metric_value_kwargs):
+    return [
+        accumulated_count + count
+        for accumulated_count, count in zip(accumulated_value, value)
+    ]
+
+
+def _mean_partial(column: pd.Series) -> Tuple[int, Any]:
+    return column.count(), column.sum()
+
+
+def _combine_mean_partials(accumulated_value, value, metric_value_kwargs):
+    return accumulated_value[0] + value[0], accumulated_value[1] + value[1]
+
+
+def _finalize_mean(accumulated_value, metric_value_kwargs):
+    count, total = accumulated_value
+    if count == 0:
+        return float("nan")
+
+    return total / count
+
+
+def _variance_partial(column: pd.Series) -> Tuple[int, float, float]:
+    count: int = column.count()
+    if count == 0:
+        return 0, 0.0, 0.0
+
+    mean: float = column.mean()
+    return count, mean, ((column - mean) ** 2).sum()
+
+
+def _combine_variance_partials(accumulated_value, value, metric_value_kwargs):
+    # Parallel algorithm of Chan et al. for combining (count, mean, sum of squared deviations) partial aggregates.
+    count_a, mean_a, m2_a = accumulated_value
+    count_b, mean_b, m2_b = value
+    count: int = count_a + count_b
+    if count == 0:
+        return 0, 0.0, 0.0
+
+    delta: float = mean_b - mean_a
+    return (
+        count,
+        mean_a + delta * count_b / count,
+        m2_a + m2_b + delta ** 2 * count_a * count_b / count,
+    )
+
+
+def _finalize_standard_deviation(accumulated_value, metric_value_kwargs):
+    count, _, m2 = accumulated_value
+    if count < 2:
+        return float("nan")
+
+    # Sample standard deviation (ddof=1), consistently with pandas.Series.std().
+    return math.sqrt(m2 / (count - 1))
+
+
+def _distinct_values_partial(column: pd.Series) -> set:
+    return set(column.unique())
+
+
+def _finalize_count(accumulated_value, metric_value_kwargs):
+    return len(accumulated_value)
+
+
+CHUNKED_METRIC_AGGREGATES: Dict[str, ChunkedMetricAggregate] = {
+    "table.row_count": ChunkedMetricAggregate(combine=_combine_sum),
+    "table.columns": ChunkedMetricAggregate(
+        combine=_combine_first, is_complete=_is_complete_first
+    ),
+    "table.column_types": ChunkedMetricAggregate(
+        combine=_combine_first, is_complete=_is_complete_first
+    ),
+    "table.head": ChunkedMetricAggregate(
+        combine=_combine_head, is_complete=_is_complete_head
+    ),
+    "column.min": ChunkedMetricAggregate(combine=_combine_extremum(min)),
+    "column.max": ChunkedMetricAggregate(combine=_combine_extremum(max)),
+    "column.sum": ChunkedMetricAggregate(combine=_combine_sum),
+    "column.mean": ChunkedMetricAggregate(
+        combine=_combine_mean_partials,
+        finalize=_finalize_mean,
+        chunk_partial_fn=_mean_partial,
+    ),
+    "column.standard_deviation": ChunkedMetricAggregate(
+        combine=_combine_variance_partials,
+        finalize=_finalize_standard_deviation,
+        chunk_partial_fn=_variance_partial,
+    ),
+    "column.distinct_values": ChunkedMetricAggregate(combine=_combine_set_union),
+    "column.distinct_values.count": ChunkedMetricAggregate(
+        combine=_combine_set_union,
+        finalize=_finalize_count,
+        chunk_partial_fn=_distinct_values_partial,
+    ),
+    "column.value_counts": ChunkedMetricAggregate(
+        combine=_combine_value_counts, finalize=_finalize_value_counts
+    ),
+    "column.histogram": ChunkedMetricAggregate(combine=_combine_histogram),
+    "column.quantile_sketch": ChunkedMetricAggregate(combine=_combine_sketches),
+    "column.distinct_values.sketch": ChunkedMetricAggregate(combine=_combine_sketches),
+}
+
+# Metrics derived from map metrics are identified by their suffix.
+CHUNKED_MAP_METRIC_AGGREGATES: Dict[str, ChunkedMetricAggregate] = {
+    ".unexpected_count": ChunkedMetricAggregate(combine=_combine_sum),
+    ".filtered_row_count": ChunkedMetricAggregate(combine=_combine_sum),
+    ".unexpected_values": ChunkedMetricAggregate(
+        combine=_combine_unexpected_list, is_complete=_is_complete_unexpected
+    ),
+    ".unexpected_index_list": ChunkedMetricAggregate(
+        combine=_combine_unexpected_list, is_complete=_is_complete_unexpected
+    ),
+    ".unexpected_rows": ChunkedMetricAggregate(
+        combine=_combine_unexpected_rows, is_complete=_is_complete_unexpected
+    ),
+}
+
+
+def get_chunked_metric_aggregate(metric_name: str) -> Optional[ChunkedMetricAggregate]:
+    """Returns how the metric is aggregated over the chunks of a chunked batch (None if it cannot be)."""
+    if metric_name in CHUNKED_METRIC_AGGREGATES:
+        return CHUNKED_METRIC_AGGREGATES[metric_name]
+
+    for suffix, chunked_metric_aggregate in CHUNKED_MAP_METRIC_AGGREGATES.items():
+        if metric_name.endswith(suffix):
+            return chunked_metric_aggregate
+
+    return None
@@ -6,9 +6,10 @@ import os
 import pickle
 import random
 import warnings
+from collections import ChainMap
 from functools import partial
-from io import BytesIO
-from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+from io import BufferedReader, BytesIO, RawIOBase
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -22,10 +23,27 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.cloud_client_pool import (
+    cloud_client_pool,
+    get_credentials_environment,
+)
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
 from great_expectations.execution_engine import ExecutionEngine
-from great_expectations.execution_engine.execution_engine import MetricDomainTypes
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.execution_engine import (
+    MetricDomainTypes,
+    MetricPartialFunctionTypes,
+)
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+)
+from great_expectations.execution_engine.pandas_chunked_metrics import (
+    ChunkedMetricAggregate,
+    get_chunked_metric_aggregate,
+)
+from great_expectations.expectations.registry import get_metric_provider
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -108,48 +126,116 @@ Notes:
         azure_options: dict = kwargs.pop("azure_options", {})
         gcs_options: dict = kwargs.pop("gcs_options", {})
 
-        # Try initializing cloud provider client. If unsuccessful, we'll catch it when/if a BatchSpec is passed in.
+        # Cloud provider clients are acquired from the shared client pool upon first use (rather than upon construction),
+        # so that engines, which never read from S3, Azure, or GCS, do not pay for creating clients.  If unsuccessful,
+        # we'll catch it when/if a BatchSpec is passed in.
+        self._boto3_options = boto3_options
+        self._azure_options = azure_options
+        self._gcs_options = gcs_options
+        self._cloud_clients: Dict[str, Any] = {}
+
+        super().__init__(*args, **kwargs)
+
+        self._config.update(
+            {
+                "discard_subset_failing_expectations": self.discard_subset_failing_expectations,
+                "boto3_options": boto3_options,
+                "azure_options": azure_options,
+                "gcs_options": gcs_options,
+            }
+        )
+
+    @property
+    def _s3(self):
+        if "s3" not in self._cloud_clients:
+            self._cloud_clients["s3"] = self._get_s3_client()
+
+        return self._cloud_clients["s3"]
+
+    @_s3.setter
+    def _s3(self, s3):
+        self._cloud_clients["s3"] = s3
+
+    @property
+    def _azure(self):
+        if "azure" not in self._cloud_clients:
+            self._cloud_clients["azure"] = self._get_azure_client()
+
+        return self._cloud_clients["azure"]
+
+    @_azure.setter
+    def _azure(self, azure):
+        self._cloud_clients["azure"] = azure
+
+    @property
+    def _gcs(self):
+        if "gcs" not in self._cloud_clients:
+            self._cloud_clients["gcs"] = self._get_gcs_client()
+
+        return self._cloud_clients["gcs"]
+
+    @_gcs.setter
+    def _gcs(self, gcs):
+        self._cloud_clients["gcs"] = gcs
+
+    def _get_s3_client(self):
+        boto3_options: dict = self._boto3_options
         try:
-            self._s3 = boto3.client("s3", **boto3_options)
+            return cloud_client_pool.get_client(
+                key=(
+                    boto3.client,
+                    "s3",
+                    boto3_options,
+                    get_credentials_environment(prefix="AWS_"),
+                ),
+                create_client=lambda: boto3.client("s3", **boto3_options),
+            )
         except (TypeError, AttributeError):
-            self._s3 = None
+            return None
 
+    def _get_azure_client(self):
+        azure_options: dict = self._azure_options
         try:
             if "conn_str" in azure_options:
-                self._azure = BlobServiceClient.from_connection_string(**azure_options)
+                create_azure_client = BlobServiceClient.from_connection_string
             else:
-                self._azure = BlobServiceClient(**azure_options)
+                create_azure_client = BlobServiceClient
+            return cloud_client_pool.get_client(
+                key=(create_azure_client, azure_options),
+                create_client=lambda: create_azure_client(**azure_options),
+            )
         except (TypeError, AttributeError):
-            self._azure = None
+            return None
 
+    def _get_gcs_client(self):
+        gcs_options: dict = self._gcs_options
         # Can only configure a GCS connection by 1) seting an env var OR 2) passing explicit credentials
         if os.getenv("GOOGLE_APPLICATION_CREDENTIALS") is None and gcs_options == {}:
-            self._gcs = None
-        else:
-            try:
-                credentials = None  # If configured with gcloud CLI / env vars
-                if "filename" in gcs_options:
-                    credentials = service_account.Credentials.from_service_account_file(
-                        **gcs_options
-                    )
-                elif "info" in gcs_options:
-                    credentials = service_account.Credentials.from_service_account_info(
-                        **gcs_options
-                    )
-                self._gcs = storage.Client(credentials=credentials, **gcs_options)
-            except (TypeError, AttributeError):
-                self._gcs = None
+            return None
 
-        super().__init__(*args, **kwargs)
+        def create_gcs_client():
+            credentials = None  # If configured with gcloud CLI / env vars
+            if "filename" in gcs_options:
+                credentials = service_account.Credentials.from_service_account_file(
+                    **gcs_options
+                )
+            elif "info" in gcs_options:
+                credentials = service_account.Credentials.from_service_account_info(
+                    **gcs_options
+                )
+            return storage.Client(credentials=credentials, **gcs_options)
 
-        self._config.update(
-            {
-                "discard_subset_failing_expectations": self.discard_subset_failing_expectations,
-                "boto3_options": boto3_options,
-                "azure_options": azure_options,
-                "gcs_options": gcs_options,
-            }
-        )
+        try:
+            return cloud_client_pool.get_client(
+                key=(
+                    storage.Client,
+                    gcs_options,
+                    get_credentials_environment(prefix="GOOGLE_"),
+                ),
+                create_client=create_gcs_client,
+            )
+        except (TypeError, AttributeError):
+            return None
 
     def configure_validator(self, validator):
         super().configure_validator(validator)
@@ -158,7 +244,7 @@ Notes:
     def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
         if isinstance(batch_data, pd.DataFrame):
             batch_data = PandasBatchData(self, batch_data)
-        elif isinstance(batch_data, PandasBatchData):
+        elif isinstance(batch_data, (PandasBatchData, ChunkedPandasBatchData)):
             pass
         else:
             raise ge_exceptions.GreatExpectationsError(
@@ -166,6 +252,29 @@ Notes:
             )
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def get_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """The fingerprint of a pandas batch combines the "pandas_data_fingerprint" of its contents (which ignores
+        column names) with its column names and types; batches too large to be hashed are not fingerprinted."""
+        batch_fingerprint: Optional[str] = super().get_batch_fingerprint(
+            batch_id=batch_id
+        )
+        if batch_fingerprint is not None:
+            return batch_fingerprint
+
+        batch_data: Optional[PandasBatchData] = self.loaded_batch_data_dict.get(
+            batch_id
+        )
+        if not isinstance(batch_data, PandasBatchData):
+            return None
+
+        df: pd.DataFrame = batch_data.dataframe
+        if df.memory_usage().sum() >= HASH_THRESHOLD:
+            return None
+
+        return _get_pandas_batch_fingerprint(
+            df=df, pandas_data_fingerprint=hash_pandas_dataframe(df)
+        )
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -212,13 +321,27 @@ Please check your config."""
                 inferred_compression_param = sniff_s3_compression(s3_url)
                 if inferred_compression_param is not None:
                     reader_options["compression"] = inferred_compression_param
-            s3_object = s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
             logger.debug(
                 "Fetching s3 object. Bucket: {} Key: {}".format(
                     s3_url.bucket, s3_url.key
                 )
             )
             reader_fn = self._get_reader_fn(reader_method, s3_url.key)
+            if self._is_chunked(reader_options=reader_options):
+                # The object is streamed (rather than buffered in memory), and fetched again on every pass.
+                return (
+                    self._build_chunked_batch_data(
+                        batch_spec=batch_spec,
+                        chunk_reader_fn=lambda: reader_fn(
+                            s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)[
+                                "Body"
+                            ],
+                            **reader_options,
+                        ),
+                    ),
+                    batch_markers,
+                )
+            s3_object = s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
             buf = BytesIO(s3_object["Body"].read())
             buf.seek(0)
             df = reader_fn(buf, **reader_options)
@@ -237,11 +360,24 @@ Please check your config."""
             blob_client = azure_engine.get_blob_client(
                 container=azure_url.container, blob=azure_url.blob
             )
-            azure_object = blob_client.download_blob()
             logger.debug(
                 f"Fetching Azure blob. Container: {azure_url.container} Blob: {azure_url.blob}"
             )
             reader_fn = self._get_reader_fn(reader_method, azure_url.blob)
+            if self._is_chunked(reader_options=reader_options):
+                return (
+                    self._build_chunked_batch_data(
+                        batch_spec=batch_spec,
+                        chunk_reader_fn=lambda: reader_fn(
+                            BufferedReader(
+                                _BytesIteratorIO(blob_client.download_blob().chunks())
+                            ),
+                            **reader_options,
+                        ),
+                    ),
+                    batch_markers,
+                )
+            azure_object = blob_client.download_blob()
             buf = BytesIO(azure_object.readall())
             buf.seek(0)
             df = reader_fn(buf, **reader_options)
@@ -262,6 +398,18 @@ Please check your config."""
                 f"Fetching GCS blob. Bucket: {gcs_url.bucket} Blob: {gcs_url.blob}"
             )
             reader_fn = self._get_reader_fn(reader_method, gcs_url.blob)
+            if self._is_chunked(reader_options=reader_options) and hasattr(
+                gcs_blob, "open"
+            ):
+                return (
+                    self._build_chunked_batch_data(
+                        batch_spec=batch_spec,
+                        chunk_reader_fn=lambda: reader_fn(
+                            gcs_blob.open("rb"), **reader_options
+                        ),
+                    ),
+                    batch_markers,
+                )
             buf = BytesIO(gcs_blob.download_as_bytes())
             buf.seek(0)
             df = reader_fn(buf, **reader_options)
@@ -271,6 +419,14 @@ Please check your config."""
             reader_options: dict = batch_spec.reader_options
             path: str = batch_spec.path
             reader_fn: Callable = self._get_reader_fn(reader_method, path)
+            if self._is_chunked(reader_options=reader_options):
+                return (
+                    self._build_chunked_batch_data(
+                        batch_spec=batch_spec,
+                        chunk_reader_fn=lambda: reader_fn(path, **reader_options),
+                    ),
+                    batch_markers,
+                )
             df = reader_fn(path, **reader_options)
 
         else:
@@ -279,13 +435,37 @@ Please check your config."""
             )
 
         df = self._apply_splitting_and_sampling_methods(batch_spec, df)
+        typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
+
         if df.memory_usage().sum() < HASH_THRESHOLD:
             batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
-
-        typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
+            if self.metric_cache is not None:
+                self._batch_data_fingerprints[
+                    typed_batch_data
+                ] = _get_pandas_batch_fingerprint(
+                    df=df,
+                    pandas_data_fingerprint=batch_markers["pandas_data_fingerprint"],
+                )
 
         return typed_batch_data, batch_markers
 
+    @staticmethod
+    def _is_chunked(reader_options: Optional[dict]) -> bool:
+        """Batches are read in chunks (please see ChunkedPandasBatchData) if the reader options specify a "chunksize"."""
+        return bool(reader_options and reader_options.get("chunksize"))
+
+    def _build_chunked_batch_data(
+        self,
+        batch_spec: BatchSpec,
+        chunk_reader_fn: Callable[[], Iterable[pd.DataFrame]],
+    ) -> ChunkedPandasBatchData:
+        # Splitting and sampling methods select rows independently of one another, and hence apply chunk by chunk.
+        return ChunkedPandasBatchData(
+            execution_engine=self,
+            chunk_reader_fn=chunk_reader_fn,
+            chunk_fn=partial(self._apply_splitting_and_sampling_methods, batch_spec),
+        )
+
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
         if batch_spec.get("splitter_method"):
             splitter_fn = getattr(self, batch_spec.get("splitter_method"))
@@ -612,6 +792,417 @@ Please check your config."""
 
         return data, compute_domain_kwargs, accessor_domain_kwargs
 
+    def _compute_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[Dict[Tuple, Any], List[MetricConfiguration]]:
+        """Metrics of chunked batches (please see ChunkedPandasBatchData) are aggregated over the chunks of the batch
+        (please see _compute_chunked_metrics); all other metrics are computed as usual."""
+        metrics_to_resolve = list(metrics_to_resolve)
+        chunked_metrics: List[MetricConfiguration] = [
+            metric_to_resolve
+            for metric_to_resolve in metrics_to_resolve
+            if isinstance(
+                self._get_metric_batch_data(metric_configuration=metric_to_resolve),
+                ChunkedPandasBatchData,
+            )
+        ]
+        if not chunked_metrics:
+            return super()._compute_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        chunked_metric_ids = {metric.id for metric in chunked_metrics}
+        resolved_metrics: Dict[Tuple, Any]
+        metrics_to_cache: List[MetricConfiguration]
+        resolved_metrics, metrics_to_cache = super()._compute_metrics(
+            metrics_to_resolve=[
+                metric_to_resolve
+                for metric_to_resolve in metrics_to_resolve
+                if metric_to_resolve.id not in chunked_metric_ids
+            ],
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+        resolved_metrics.update(
+            self._compute_chunked_metrics(
+                metrics_to_resolve=chunked_metrics,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+        )
+        metrics_to_cache.extend(
+            metric
+            for metric in chunked_metrics
+            if not isinstance(resolved_metrics[metric.id], _DeferredChunkedMetric)
+        )
+        return resolved_metrics, metrics_to_cache
+
+    def _get_metric_batch_data(self, metric_configuration: MetricConfiguration):
+        batch_id: Optional[str] = (
+            metric_configuration.metric_domain_kwargs.get("batch_id")
+            or self.active_batch_data_id
+        )
+        return self.loaded_batch_data_dict.get(batch_id)
+
+    def _get_resolved_metric(self, metric_id: Tuple, metrics: Dict[Tuple, Any]):
+        if metric_id in metrics:
+            return metrics[metric_id]
+
+        if self._caching:
+            return self._metric_cache.get(metric_id)
+
+        return None
+
+    def _compute_chunked_metrics(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple, Any]:
+        """Computes metrics of chunked batches, reading each batch at most once for all of its metrics.
+
+        Partial metrics (e.g., map conditions) are deferred, and computed chunk by chunk only when a metric depending on
+        them is aggregated. Metrics with a chunked aggregate (please see pandas_chunked_metrics) are computed on every
+        chunk, and their values combined; the pass over the chunks stops early once all values are final (e.g., once
+        "partial_unexpected_count" unexpected values have been sampled). Metrics without a chunked aggregate can only
+        be computed from the values of their dependencies (otherwise, a MetricResolutionError is raised).
+        """
+        resolved_metrics: Dict[Tuple, Any] = {}
+        metrics_to_aggregate: Dict[
+            int, Tuple[ChunkedPandasBatchData, List[MetricConfiguration]]
+        ] = {}
+        metrics_to_compute: List[MetricConfiguration] = []
+
+        metric_to_resolve: MetricConfiguration
+        for metric_to_resolve in metrics_to_resolve:
+            _, metric_fn = get_metric_provider(
+                metric_name=metric_to_resolve.metric_name, execution_engine=self
+            )
+            if isinstance(
+                getattr(metric_fn, "metric_fn_type", None), MetricPartialFunctionTypes
+            ):
+                resolved_metrics[metric_to_resolve.id] = _DeferredChunkedMetric(
+                    metric_configuration=metric_to_resolve
+                )
+            elif get_chunked_metric_aggregate(metric_to_resolve.metric_name) is None:
+                metrics_to_compute.append(metric_to_resolve)
+            else:
+                batch_data: ChunkedPandasBatchData = self._get_metric_batch_data(
+                    metric_configuration=metric_to_resolve
+                )
+                metrics_to_aggregate.setdefault(id(batch_data), (batch_data, []))[
+                    1
+                ].append(metric_to_resolve)
+
+        if metrics_to_compute:
+            unsupported_metrics: List[MetricConfiguration] = [
+                metric
+                for metric in metrics_to_compute
+                if any(
+                    isinstance(
+                        self._get_resolved_metric(
+                            metric_id=dependency.id, metrics=metrics
+                        ),
+                        _DeferredChunkedMetric,
+                    )
+                    for dependency in metric.metric_dependencies.values()
+                )
+            ]
+            if unsupported_metrics:
+                raise ge_exceptions.MetricResolutionError(
+                    message=f"""Metrics {[metric.metric_name for metric in unsupported_metrics]} cannot be computed \
+on chunked batches.
+""",
+                    failed_metrics=unsupported_metrics,
+                )
+
+            try:
+                resolved_metrics.update(
+                    super()._compute_metrics(
+                        metrics_to_resolve=metrics_to_compute,
+                        metrics=metrics,
+                        runtime_configuration=runtime_configuration,
+                    )[0]
+                )
+            except ge_exceptions.ExecutionEngineError as e:
+                raise ge_exceptions.MetricResolutionError(
+                    message=f"""Metrics {[metric.metric_name for metric in metrics_to_compute]} cannot be computed \
+on chunked batches: {e}
+""",
+                    failed_metrics=metrics_to_compute,
+                )
+
+        batch_data: ChunkedPandasBatchData
+        aggregated_metrics: List[MetricConfiguration]
+        for batch_data, aggregated_metrics in metrics_to_aggregate.values():
+            resolved_metrics.update(
+                self._aggregate_chunked_metrics(
+                    batch_data=batch_data,
+                    metrics_to_resolve=aggregated_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        return resolved_metrics
+
+    def _aggregate_chunked_metrics(
+        self,
+        batch_data: ChunkedPandasBatchData,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple, Any]:
+        aggregates: Dict[Tuple, ChunkedMetricAggregate] = {
+            metric.id: get_chunked_metric_aggregate(metric.metric_name)
+            for metric in metrics_to_resolve
+        }
+        accumulated_values: Dict[Tuple, Any] = {}
+        active_metrics: List[MetricConfiguration] = metrics_to_resolve
+
+        chunks = batch_data.iter_chunks()
+        try:
+            for _ in chunks:
+                # Partial metrics are only valid for the current chunk.
+                chunk_metrics: Dict[Tuple, Any] = {}
+                metrics_to_compute: List[MetricConfiguration] = [
+                    metric
+                    for metric in active_metrics
+                    if aggregates[metric.id].chunk_partial_fn is None
+                ]
+                self._resolve_deferred_chunked_metrics(
+                    metric_configurations=metrics_to_compute,
+                    chunk_metrics=chunk_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+                chunk_values: Dict[Tuple, Any] = {}
+                if metrics_to_compute:
+                    # Computing the metrics of a chunk together preserves the bundling of column aggregates.
+                    chunk_values = super()._compute_metrics(
+                        metrics_to_resolve=metrics_to_compute,
+                        metrics=ChainMap(chunk_metrics, metrics),
+                        runtime_configuration=runtime_configuration,
+                    )[0]
+
+                metric: MetricConfiguration
+                for metric in active_metrics:
+                    aggregate: ChunkedMetricAggregate = aggregates[metric.id]
+                    if aggregate.chunk_partial_fn is None:
+                        value = chunk_values[metric.id]
+                    else:
+                        value = aggregate.chunk_partial_fn(
+                            self._get_chunk_column(metric_configuration=metric)
+                        )
+
+                    if metric.id in accumulated_values:
+                        value = aggregate.combine(
+                            accumulated_values[metric.id],
+                            value,
+                            metric.metric_value_kwargs,
+                        )
+                    accumulated_values[metric.id] = value
+
+                active_metrics = [
+                    metric
+                    for metric in active_metrics
+                    if not aggregates[metric.id].is_complete(
+                        accumulated_values[metric.id], metric.metric_value_kwargs
+                    )
+                ]
+                if not active_metrics:
+                    break
+        finally:
+            chunks.close()
+
+        if len(accumulated_values) < len(metrics_to_resolve):
+            raise ge_exceptions.MetricResolutionError(
+                message="Metrics cannot be computed on a chunked batch without any chunks.",
+                failed_metrics=metrics_to_resolve,
+            )
+
+        return {
+            metric.id: aggregates[metric.id].finalize(
+                accumulated_values[metric.id], metric.metric_value_kwargs
+            )
+            for metric in metrics_to_resolve
+        }
+
+    def _resolve_deferred_chunked_metrics(
+        self,
+        metric_configurations: List[MetricConfiguration],
+        chunk_metrics: Dict[Tuple, Any],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Optional[dict] = None,
+    ) -> None:
+        """Computes, on the current chunk, the deferred partial metrics that the given metrics (transitively) depend
+        on, storing them in "chunk_metrics"."""
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            for dependency in metric_configuration.metric_dependencies.values():
+                if dependency.id in chunk_metrics:
+                    continue
+
+                deferred_metric = self._get_resolved_metric(
+                    metric_id=dependency.id, metrics=metrics
+                )
+                if not isinstance(deferred_metric, _DeferredChunkedMetric):
+                    continue
+
+                self._resolve_deferred_chunked_metrics(
+                    metric_configurations=[deferred_metric.metric_configuration],
+                    chunk_metrics=chunk_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+                chunk_metrics.update(
+                    super()._compute_metrics(
+                        metrics_to_resolve=[deferred_metric.metric_configuration],
+                        metrics=ChainMap(chunk_metrics, metrics),
+                        runtime_configuration=runtime_configuration,
+                    )[0]
+                )
+
+    def _get_chunk_column(self, metric_configuration: MetricConfiguration) -> pd.Series:
+        df, _, accessor_domain_kwargs = self.get_compute_domain(
+            domain_kwargs=metric_configuration.metric_domain_kwargs,
+            domain_type=MetricDomainTypes.COLUMN,
+        )
+        column: pd.Series = df[accessor_domain_kwargs["column"]]
+        return column[column.notnull()]
+
+    def resolve_metric_bundle(
+        self,
+        metric_fn_bundle: Iterable[Tuple[MetricConfiguration, Any, dict, dict, dict]],
+    ) -> dict:
+        """For every metric in a set of Metrics to resolve, groups the aggregate functions by compute domain and column,
+        so that each compute domain is obtained only once and each column (together with its non-null values) is
+        extracted only once, no matter how many aggregates are computed over it.
+
+        Each aggregate function still reduces the shared column on its own: pandas offers no fused reduction of several
+        aggregates (Series.agg with a list of functions applies them one after the other), and the aggregates of
+        metric providers are arbitrary functions of a Series.
+
+        An aggregate that fails within the bundle is resolved again on its own (through the value function of its
+        metric); only the metrics that fail on their own as well are reported in the raised MetricResolutionError.
+
+            Args:
+                metric_fn_bundle (Iterable[Tuple[MetricConfiguration, Callable, dict, dict, dict]): \
+                    A Dictionary containing a MetricProvider's MetricConfiguration (its unique identifier), its metric
+                    aggregate function (which accepts a column Series), its compute and accessor domain kwargs, and
+                    the arguments to pass to the metric provider function.
+
+            Returns:
+                A dictionary of metric names and their corresponding now-computed values.
+        """
+        resolved_metrics = {}
+        failed_metrics: Dict[Tuple, Tuple[MetricConfiguration, Exception]] = {}
+
+        def _resolve_metric_alone(
+            metric_to_resolve: MetricConfiguration,
+            engine_fn: Callable,
+            metric_provider_kwargs: dict,
+        ):
+            try:
+                resolved_metrics[metric_to_resolve.id] = engine_fn.metric_value_fn(
+                    **metric_provider_kwargs
+                )
+            except (
+                ge_exceptions.MetricComputationError,
+                ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError,
+            ) as e:
+                failed_metrics[metric_to_resolve.id] = (metric_to_resolve, e)
+
+        # We need to obtain the records only once for each domain (row_condition, etc.).
+        aggregates: Dict[str, dict] = {}
+        for (
+            metric_to_resolve,
+            engine_fn,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+            metric_provider_kwargs,
+        ) in metric_fn_bundle:
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+            domain_id = compute_domain_kwargs.to_id()
+            if domain_id not in aggregates:
+                aggregates[domain_id] = {
+                    "columns": {},
+                    "domain_kwargs": compute_domain_kwargs,
+                }
+            column_name = accessor_domain_kwargs["column"]
+            aggregates[domain_id]["columns"].setdefault(column_name, []).append(
+                (metric_to_resolve, engine_fn, metric_provider_kwargs)
+            )
+
+        for aggregate in aggregates.values():
+            domain_kwargs = aggregate["domain_kwargs"]
+            try:
+                df = self.get_domain_records(
+                    domain_kwargs=domain_kwargs,
+                )
+            except ge_exceptions.MetricComputationError:
+                # Each metric of the domain is resolved (and reports its error) on its own.
+                for column_aggregates in aggregate["columns"].values():
+                    for (
+                        metric_to_resolve,
+                        engine_fn,
+                        metric_provider_kwargs,
+                    ) in column_aggregates:
+                        _resolve_metric_alone(
+                            metric_to_resolve, engine_fn, metric_provider_kwargs
+                        )
+                continue
+
+            num_metrics = 0
+            for column_name, column_aggregates in aggregate["columns"].items():
+                column = df[column_name]
+                nonnull_column = None
+                for (
+                    metric_to_resolve,
+                    engine_fn,
+                    metric_provider_kwargs,
+                ) in column_aggregates:
+                    try:
+                        if getattr(engine_fn, "filter_column_isnull", False):
+                            if nonnull_column is None:
+                                # The non-null values are extracted once for all aggregates filtering nulls.
+                                nonnull_column = column[column.notnull()]
+                            resolved_metrics[metric_to_resolve.id] = engine_fn(
+                                column=nonnull_column
+                            )
+                        else:
+                            resolved_metrics[metric_to_resolve.id] = engine_fn(
+                                column=column
+                            )
+                    except (
+                        ge_exceptions.MetricComputationError,
+                        ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError,
+                    ):
+                        _resolve_metric_alone(
+                            metric_to_resolve, engine_fn, metric_provider_kwargs
+                        )
+                num_metrics += len(column_aggregates)
+            logger.debug(
+                f"PandasExecutionEngine computed {num_metrics} metrics on domain_id {domain_kwargs.to_id()}"
+            )
+
+        if failed_metrics:
+            raise ge_exceptions.MetricResolutionError(
+                message="; ".join(str(e) for _, e in failed_metrics.values()),
+                failed_metrics=[
+                    metric_configuration
+                    for metric_configuration, _ in failed_metrics.values()
+                ],
+            )
+
+        return resolved_metrics
+
     ### Splitter methods for partitioning dataframes ###
     @staticmethod
     def _split_on_whole_table(
@@ -762,6 +1353,53 @@ Please check your config."""
         return df[matches]
 
 
+def _get_pandas_batch_fingerprint(
+    df: pd.DataFrame, pandas_data_fingerprint: str
+) -> str:
+    columns: List[Tuple[str, str]] = [
+        (str(column), str(dtype)) for column, dtype in df.dtypes.items()
+    ]
+    return hashlib.md5(
+        f"{pandas_data_fingerprint}{columns}".encode("utf-8")
+    ).hexdigest()
+
+
+class _DeferredChunkedMetric:
+    """Stands for the value of a partial metric (e.g., a map condition) on a chunked batch, which is only computed
+    chunk by chunk, while the metrics depending on it are aggregated over the chunks."""
+
+    def __init__(self, metric_configuration: MetricConfiguration):
+        self.metric_configuration = metric_configuration
+
+    def __repr__(self):
+        return f"<deferred chunked metric {self.metric_configuration.metric_name}>"
+
+
+class _BytesIteratorIO(RawIOBase):
+    """A readable raw stream over an iterator of bytes (e.g., the chunks of a download), to be wrapped in a
+    BufferedReader, so that the downloaded object is never held in memory as a whole."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        super().__init__()
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+
+        size: int = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
 def hash_pandas_dataframe(df):
     try:
         obj = pd.util.hash_pandas_object(df, index=True).values
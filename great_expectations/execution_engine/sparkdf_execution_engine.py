@@ -2,10 +2,11 @@ import copy
 import datetime
 import hashlib
 import logging
+import threading
 import uuid
 import warnings
 from functools import reduce
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple, Union
 
 from great_expectations.core.batch import BatchMarkers
 from great_expectations.core.batch_spec import (
@@ -36,7 +37,7 @@ logger = logging.getLogger(__name__)
 try:
     import pyspark
     import pyspark.sql.functions as F
-    from pyspark import SparkContext
+    from pyspark import SparkContext, StorageLevel
     from pyspark.sql import DataFrame, SparkSession
     from pyspark.sql.readwriter import DataFrameReader
     from pyspark.sql.types import (
@@ -51,6 +52,7 @@ try:
 except ImportError:
     pyspark = None
     SparkContext = None
+    StorageLevel = None
     SparkSession = None
     DataFrame = None
     DataFrameReader = None
@@ -152,12 +154,23 @@ class SparkDFExecutionEngine(ExecutionEngine):
         self,
         *args,
         persist=True,
+        persist_storage_level="MEMORY_AND_DISK",
         spark_config=None,
         force_reuse_spark_context=False,
         **kwargs,
     ):
         # Creation of the Spark DataFrame is done outside this class
         self._persist = persist
+        self._persist_storage_level = persist_storage_level
+
+        # Domain records (the batch DataFrame, filtered by row conditions and "ignore_row_if" directives) are memoized
+        # per domain, and those consumed repeatedly while a validation graph is resolved are persisted until their last
+        # consumer has been resolved (please see "add_domain_records_consumers()").
+        self._domain_records: Dict[str, DataFrame] = {}
+        self._domain_records_requests: Dict[str, int] = {}
+        self._domain_records_consumers: Dict[str, Set[Tuple]] = {}
+        self._persisted_domain_records_keys: Set[str] = set()
+        self._domain_records_lock = threading.RLock()
 
         if spark_config is None:
             spark_config = {}
@@ -173,6 +186,10 @@ class SparkDFExecutionEngine(ExecutionEngine):
         self._spark_config = spark_config
         self.spark = spark
 
+        if persist and StorageLevel is not None:
+            # Fails early on an unrecognized storage level.
+            self._get_persist_storage_level()
+
         azure_options: dict = kwargs.pop("azure_options", {})
         self._azure_options = azure_options
 
@@ -181,6 +198,7 @@ class SparkDFExecutionEngine(ExecutionEngine):
         self._config.update(
             {
                 "persist": self._persist,
+                "persist_storage_level": self._persist_storage_level,
                 "spark_config": spark_config,
                 "azure_options": azure_options,
             }
@@ -206,6 +224,8 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "SparkDFExecutionEngine requires batch data that is either a DataFrame or a SparkDFBatchData object"
             )
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+        # Records memoized for a batch previously loaded under the same batch_id are stale.
+        self.clear_domain_records()
 
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
@@ -375,6 +395,10 @@ Please check your config."""
         Uses the given domain kwargs (which include row_condition, condition_parser, and ignore_row_if directives) to
         obtain and/or query a batch. Returns in the format of a Spark DataFrame.
 
+        The records of every domain are memoized, so that the metrics computed on the same domain share one DataFrame;
+        if "persist" is enabled, the records of filtered domains, which are consumed repeatedly while a validation graph
+        is resolved, are persisted (with "persist_storage_level"), so that their filters are not evaluated again.
+
         Args:
             domain_kwargs (dict) - A dictionary consisting of the domain kwargs specifying which data to obtain
 
@@ -387,6 +411,158 @@ Please check your config."""
                 "SparkDFExecutionEngine does not currently support multiple named tables."
             )
 
+        domain_records_kwargs: IDDict = self._get_domain_records_kwargs(
+            domain_kwargs=domain_kwargs
+        )
+        domain_records_key: str = domain_records_kwargs.to_id()
+        with self._domain_records_lock:
+            data: Optional[DataFrame] = self._domain_records.get(domain_records_key)
+            if data is None:
+                data = self._build_domain_records(domain_kwargs=domain_kwargs)
+                self._domain_records[domain_records_key] = data
+
+            self._domain_records_requests[domain_records_key] = (
+                self._domain_records_requests.get(domain_records_key, 0) + 1
+            )
+            # The unfiltered records of the batch are not persisted.
+            if self._is_filtered_domain(
+                domain_records_kwargs=domain_records_kwargs
+            ) and self._should_persist_domain_records(
+                domain_records_key=domain_records_key
+            ):
+                data = data.persist(self._get_persist_storage_level())
+                self._domain_records[domain_records_key] = data
+                self._persisted_domain_records_keys.add(domain_records_key)
+                logger.debug(
+                    f"SparkDFExecutionEngine persisted the records of domain {domain_records_key}."
+                )
+
+        return data
+
+    def add_domain_records_consumers(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Registers the metrics of a validation graph, which are about to be resolved, as consumers of the records of
+        their domains; filtered records with several consumers are persisted upon first use."""
+        with self._domain_records_lock:
+            metric_configuration: MetricConfiguration
+            for metric_configuration in metric_configurations:
+                self._domain_records_consumers.setdefault(
+                    self._get_domain_records_kwargs(
+                        domain_kwargs=metric_configuration.metric_domain_kwargs
+                    ).to_id(),
+                    set(),
+                ).add(metric_configuration.id)
+
+    def remove_domain_records_consumers(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Unregisters resolved metrics as consumers of the records of their domains; records without remaining
+        consumers are unpersisted, and, once no consumers remain at all, every memoized domain is released."""
+        with self._domain_records_lock:
+            metric_configuration: MetricConfiguration
+            for metric_configuration in metric_configurations:
+                domain_records_key: str = self._get_domain_records_kwargs(
+                    domain_kwargs=metric_configuration.metric_domain_kwargs
+                ).to_id()
+                consumer_ids: Optional[Set[Tuple]] = self._domain_records_consumers.get(
+                    domain_records_key
+                )
+                if consumer_ids is None:
+                    continue
+
+                consumer_ids.discard(metric_configuration.id)
+                if not consumer_ids:
+                    del self._domain_records_consumers[domain_records_key]
+                    self._release_domain_records(domain_records_key=domain_records_key)
+
+            if not self._domain_records_consumers:
+                self.clear_domain_records()
+
+    def clear_domain_records(self) -> None:
+        """Releases (and unpersists) the records of all memoized domains."""
+        with self._domain_records_lock:
+            for domain_records_key in list(self._domain_records.keys()):
+                self._release_domain_records(domain_records_key=domain_records_key)
+
+            self._domain_records_requests = {}
+
+    def _get_persist_storage_level(self) -> "StorageLevel":
+        storage_level: Optional[StorageLevel] = getattr(
+            StorageLevel, str(self._persist_storage_level), None
+        )
+        if not isinstance(storage_level, StorageLevel):
+            raise ExecutionEngineError(
+                f'Unrecognized persist_storage_level "{self._persist_storage_level}" for SparkDFExecutionEngine.'
+            )
+
+        return storage_level
+
+    def _should_persist_domain_records(self, domain_records_key: str) -> bool:
+        if (
+            not self._persist
+            or domain_records_key in self._persisted_domain_records_keys
+        ):
+            return False
+
+        # The records are consumed repeatedly if several metrics of the graph are registered as their consumers, or if
+        # they are requested again (e.g., by metrics adding a null-filtering row condition to their domain) while the
+        # graph is being resolved.
+        return len(self._domain_records_consumers.get(domain_records_key, ())) > 1 or (
+            bool(self._domain_records_consumers)
+            and self._domain_records_requests.get(domain_records_key, 0) > 1
+        )
+
+    def _release_domain_records(self, domain_records_key: str) -> None:
+        data: Optional[DataFrame] = self._domain_records.pop(domain_records_key, None)
+        self._domain_records_requests.pop(domain_records_key, None)
+        if domain_records_key in self._persisted_domain_records_keys:
+            self._persisted_domain_records_keys.discard(domain_records_key)
+            if data is not None:
+                data.unpersist()
+                logger.debug(
+                    f"SparkDFExecutionEngine unpersisted the records of domain {domain_records_key}."
+                )
+
+    def _get_domain_records_kwargs(self, domain_kwargs: dict) -> IDDict:
+        """Returns the domain kwargs, which determine the records of a domain (please see "_build_domain_records()"):
+        the batch, the row condition, and the "ignore_row_if" directive (with its columns)."""
+        batch_id: Optional[str] = domain_kwargs.get("batch_id")
+        if batch_id is None:
+            batch_id = self.active_batch_data_id
+
+        records_kwargs: dict = {"batch_id": batch_id}
+        if domain_kwargs.get("row_condition"):
+            records_kwargs["row_condition"] = domain_kwargs["row_condition"]
+            records_kwargs["condition_parser"] = domain_kwargs.get("condition_parser")
+
+        if "column" not in domain_kwargs and "ignore_row_if" in domain_kwargs:
+            if "column_A" in domain_kwargs and "column_B" in domain_kwargs:
+                records_kwargs["column_A"] = domain_kwargs["column_A"]
+                records_kwargs["column_B"] = domain_kwargs["column_B"]
+                records_kwargs["ignore_row_if"] = domain_kwargs["ignore_row_if"]
+            elif "column_list" in domain_kwargs:
+                records_kwargs["column_list"] = domain_kwargs["column_list"]
+                records_kwargs["ignore_row_if"] = domain_kwargs["ignore_row_if"]
+
+        return IDDict(records_kwargs)
+
+    @staticmethod
+    def _is_filtered_domain(domain_records_kwargs: IDDict) -> bool:
+        """Whether the records of a domain are filtered (rather than being all of the records of the batch)."""
+        return "row_condition" in domain_records_kwargs or domain_records_kwargs.get(
+            "ignore_row_if"
+        ) in [
+            "both_values_are_missing",
+            "either_value_is_missing",
+            "all_values_are_missing",
+            "any_value_is_missing",
+        ]
+
+    def _build_domain_records(
+        self,
+        domain_kwargs: dict,
+    ) -> DataFrame:
         batch_id = domain_kwargs.get("batch_id")
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
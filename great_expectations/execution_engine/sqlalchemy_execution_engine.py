@@ -1,5 +1,6 @@
 import copy
 import datetime
+import hashlib
 import logging
 import traceback
 import warnings
@@ -164,6 +165,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         batch_data_dict=None,
         create_temp_table=True,
         concurrency: Optional[ConcurrencyConfig] = None,
+        metric_cache: Optional[dict] = None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ):
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -191,8 +193,14 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
                 concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.
+                metric_cache (dict): \
+                    Configuration of a MetricCache persisting resolved metrics across validation runs, keyed by
+                    batch fingerprint. Batches are fingerprinted by their database and selectable, so cached metrics
+                    assume that the underlying data does not change between runs.
         """
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name, batch_data_dict=batch_data_dict, metric_cache=metric_cache
+        )
         self._name = name
 
         self._credentials = credentials
@@ -294,6 +302,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "metric_cache": metric_cache,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -992,6 +1001,42 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             .where(split_clause)
         )
 
+    def get_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """The fingerprint of a SQL batch combines the database URL (without password) with the query or the compiled
+        selectable from which the batch was built, and hence does not capture changes to the data itself."""
+        batch_fingerprint: Optional[str] = super().get_batch_fingerprint(
+            batch_id=batch_id
+        )
+        if batch_fingerprint is not None:
+            return batch_fingerprint
+
+        batch_data: Optional[SqlAlchemyBatchData] = self.loaded_batch_data_dict.get(
+            batch_id
+        )
+        if batch_data is None:
+            return None
+
+        return self._get_selectable_fingerprint(selectable=batch_data.selectable)
+
+    def _get_selectable_fingerprint(
+        self, selectable: Union[str, Selectable]
+    ) -> Optional[str]:
+        if not isinstance(selectable, str):
+            try:
+                selectable = str(
+                    selectable.compile(
+                        dialect=self.engine.dialect,
+                        compile_kwargs={"literal_binds": True},
+                    )
+                )
+            except Exception as e:
+                logger.debug(f"Unable to fingerprint selectable: {e}")
+                return None
+
+        return hashlib.md5(
+            f"{repr(self.engine.engine.url)}{selectable}".encode("utf-8")
+        ).hexdigest()
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:
@@ -1058,4 +1103,14 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 source_schema_name=source_schema_name,
             )
 
+        if self.metric_cache is not None and batch_data is not None:
+            # The batch is fingerprinted by its source query or selectable (any temporary table has a random name).
+            batch_fingerprint: Optional[str] = self._get_selectable_fingerprint(
+                selectable=query
+                if isinstance(batch_spec, RuntimeQueryBatchSpec)
+                else selectable
+            )
+            if batch_fingerprint is not None:
+                self._batch_data_fingerprints[batch_data] = batch_fingerprint
+
         return batch_data, batch_markers
@@ -40,6 +40,9 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
             If True, the minimum proportion of unique values must be strictly larger than min_value, default=False
         strict_max (boolean):
             If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
+        allow_relative_error (boolean or float):
+            If True (or a relative error between 0 and 1), the number of unique values is estimated with a mergeable \
+            sketch on backends that support it (pandas and Spark), instead of being counted exactly, default=False
 
     Other Parameters:
         result_format (str or None): \
@@ -91,7 +94,13 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
 
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.unique_proportion",)
-    success_keys = ("min_value", "strict_min", "max_value", "strict_max")
+    success_keys = (
+        "min_value",
+        "strict_min",
+        "max_value",
+        "strict_max",
+        "allow_relative_error",
+    )
 
     # Default values
     default_kwarg_values = {
@@ -99,6 +108,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         "max_value": None,
         "strict_min": None,
         "strict_max": None,
+        "allow_relative_error": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
@@ -120,6 +130,24 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         super().validate_configuration(configuration)
         self.validate_metric_value_between_configuration(configuration=configuration)
 
+    def get_validation_dependencies(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        all_dependencies = super().get_validation_dependencies(
+            configuration, execution_engine, runtime_configuration
+        )
+        # column.unique_proportion only receives "allow_relative_error" if it is requested, so that the id of the
+        # exact metric is unchanged
+        allow_relative_error = configuration.kwargs.get("allow_relative_error")
+        if allow_relative_error:
+            all_dependencies["metrics"]["column.unique_proportion"].metric_value_kwargs[
+                "allow_relative_error"
+            ] = allow_relative_error
+        return all_dependencies
+
     @classmethod
     @renderer(renderer_type="renderer.prescriptive")
     @render_evaluation_parameter_string
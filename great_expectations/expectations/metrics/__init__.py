@@ -2,6 +2,8 @@ from .meta_metric_provider import (  # isort:skip
     MetaMetricProvider,
     DeprecatedMetaMetricProvider,
 )
+from great_expectations.expectations.registry import set_up_lazy_package_attributes
+
 from .column_aggregate_metric_provider import (
     ColumnMetricProvider,  # This class name is being deprecated (use "ColumnAggregateMetricProvider" going forward).
 )
@@ -10,9 +12,6 @@ from .column_aggregate_metric_provider import (
     column_aggregate_partial,
     column_aggregate_value,
 )
-from .column_aggregate_metrics import *
-from .column_map_metrics import *
-from .column_pair_map_metrics import *
 from .map_metric_provider import (
     ColumnMapMetricProvider,
     MapMetricProvider,
@@ -28,5 +27,63 @@ from .metric_provider import (
     metric_partial,
     metric_value,
 )
-from .multicolumn_map_metrics import *
-from .table_metrics import *
+
+# The modules defining these Metrics are imported upon first access.
+_ATTRIBUTE_MODULES = {
+    "ColumnDistinctValues": ".column_aggregate_metrics.column_distinct_values",
+    "ColumnDistinctValuesCount": ".column_aggregate_metrics.column_distinct_values",
+    "ColumnHistogram": ".column_aggregate_metrics.column_histogram",
+    "ColumnMax": ".column_aggregate_metrics.column_max",
+    "ColumnMean": ".column_aggregate_metrics.column_mean",
+    "ColumnMedian": ".column_aggregate_metrics.column_median",
+    "ColumnMin": ".column_aggregate_metrics.column_min",
+    "ColumnMostCommonValue": ".column_aggregate_metrics.column_most_common_value",
+    "ColumnParameterizedDistributionKSTestPValue": ".column_aggregate_metrics.column_parameterized_distribution_ks_test_p_value",
+    "ColumnPartition": ".column_aggregate_metrics.column_partition",
+    "ColumnUniqueProportion": ".column_aggregate_metrics.column_proportion_of_unique_values",
+    "ColumnQuantileValues": ".column_aggregate_metrics.column_quantile_values",
+    "ColumnDistinctValuesSketch": ".column_aggregate_metrics.column_sketches",
+    "ColumnQuantileSketch": ".column_aggregate_metrics.column_sketches",
+    "ColumnStandardDeviation": ".column_aggregate_metrics.column_standard_deviation",
+    "ColumnSum": ".column_aggregate_metrics.column_sum",
+    "ColumnValueCounts": ".column_aggregate_metrics.column_value_counts",
+    "ColumnValuesBetweenCount": ".column_aggregate_metrics.column_values_between_count",
+    "ColumnValuesValueLength": ".column_map_metrics.column_value_lengths",
+    "ColumnValuesValueLengthEquals": ".column_map_metrics.column_value_lengths",
+    "ColumnValuesBetween": ".column_map_metrics.column_values_between",
+    "ColumnValuesDateutilParseable": ".column_map_metrics.column_values_dateutil_parseable",
+    "ColumnValuesDecreasing": ".column_map_metrics.column_values_decreasing",
+    "ColumnValuesInSet": ".column_map_metrics.column_values_in_set",
+    "ColumnValuesInTypeList": ".column_map_metrics.column_values_in_type_list",
+    "ColumnValuesIncreasing": ".column_map_metrics.column_values_increasing",
+    "ColumnValuesJsonParseable": ".column_map_metrics.column_values_json_parseable",
+    "ColumnValuesMatchJsonSchema": ".column_map_metrics.column_values_match_json_schema",
+    "ColumnValuesMatchLikePattern": ".column_map_metrics.column_values_match_like_pattern",
+    "ColumnValuesMatchLikePatternList": ".column_map_metrics.column_values_match_like_pattern_list",
+    "ColumnValuesMatchRegex": ".column_map_metrics.column_values_match_regex",
+    "ColumnValuesMatchRegexList": ".column_map_metrics.column_values_match_regex_list",
+    "ColumnValuesMatchStrftimeFormat": ".column_map_metrics.column_values_match_strftime_format",
+    "ColumnValuesNonNull": ".column_map_metrics.column_values_non_null",
+    "ColumnValuesNotInSet": ".column_map_metrics.column_values_not_in_set",
+    "ColumnValuesNotMatchLikePattern": ".column_map_metrics.column_values_not_match_like_pattern",
+    "ColumnValuesNotMatchLikePatternList": ".column_map_metrics.column_values_not_match_like_pattern_list",
+    "ColumnValuesNotMatchRegex": ".column_map_metrics.column_values_not_match_regex",
+    "ColumnValuesNotMatchRegexList": ".column_map_metrics.column_values_not_match_regex_list",
+    "ColumnValuesNull": ".column_map_metrics.column_values_null",
+    "ColumnValuesOfType": ".column_map_metrics.column_values_of_type",
+    "ColumnValuesUnique": ".column_map_metrics.column_values_unique",
+    "ColumnValuesZScore": ".column_map_metrics.column_values_z_score",
+    "ColumnPairValuesEqual": ".column_pair_map_metrics.column_pair_values_equal",
+    "ColumnPairValuesAGreaterThanB": ".column_pair_map_metrics.column_pair_values_greater",
+    "ColumnPairValuesInSet": ".column_pair_map_metrics.column_pair_values_in_set",
+    "CompoundColumnsUnique": ".multicolumn_map_metrics.compound_columns_unique",
+    "MulticolumnSumEqual": ".multicolumn_map_metrics.multicolumn_sum_equal",
+    "SelectColumnValuesUniqueWithinRecord": ".multicolumn_map_metrics.select_column_values_unique_within_record",
+    "TableColumnCount": ".table_metrics.table_column_count",
+    "ColumnTypes": ".table_metrics.table_column_types",
+    "TableColumns": ".table_metrics.table_columns",
+    "TableHead": ".table_metrics.table_head",
+    "TableRowCount": ".table_metrics.table_row_count",
+}
+
+set_up_lazy_package_attributes(globals(), _ATTRIBUTE_MODULES)
@@ -1,7 +1,10 @@
+import copy
 import logging
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, Type
 
+import pandas as pd
+
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core import ExpectationConfiguration
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
@@ -86,6 +89,44 @@ def column_aggregate_value(
                     _metrics=metrics,
                 )
 
+            def metric_partial_fn(
+                cls,
+                execution_engine: PandasExecutionEngine,
+                metric_domain_kwargs: Dict,
+                metric_value_kwargs: Dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: Dict,
+            ):
+                """Defers the aggregate so that the engine can bundle it with other aggregates over the same domain."""
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+                )
+
+                compute_domain_kwargs = copy.deepcopy(metric_domain_kwargs)
+                column_name = compute_domain_kwargs.pop("column")
+                accessor_domain_kwargs = {"column": column_name}
+
+                if column_name not in metrics["table.columns"]:
+                    raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                        message=f'Error: The column "{column_name}" in BatchData does not exist.'
+                    )
+
+                def metric_aggregate(column: pd.Series):
+                    return metric_fn(
+                        cls,
+                        column=column,
+                        **metric_value_kwargs,
+                        _metrics=metrics,
+                    )
+
+                metric_aggregate.filter_column_isnull = filter_column_isnull
+                # The metric is resolved on its own if its aggregate fails within a bundle.
+                metric_aggregate.metric_value_fn = inner_func
+                return metric_aggregate, compute_domain_kwargs, accessor_domain_kwargs
+
+            if MetricDomainTypes(domain_type) == MetricDomainTypes.COLUMN:
+                inner_func.metric_partial_fn = metric_partial_fn
+
             return inner_func
 
         return wrapper
@@ -1,17 +1,25 @@
-from .column_distinct_values import ColumnDistinctValues, ColumnDistinctValuesCount
-from .column_histogram import ColumnHistogram
-from .column_max import ColumnMax
-from .column_mean import ColumnMean
-from .column_median import ColumnMedian
-from .column_min import ColumnMin
-from .column_most_common_value import ColumnMostCommonValue
-from .column_parameterized_distribution_ks_test_p_value import (
-    ColumnParameterizedDistributionKSTestPValue,
-)
-from .column_partition import ColumnPartition
-from .column_proportion_of_unique_values import ColumnUniqueProportion
-from .column_quantile_values import ColumnQuantileValues
-from .column_standard_deviation import ColumnStandardDeviation
-from .column_sum import ColumnSum
-from .column_value_counts import ColumnValueCounts
-from .column_values_between_count import ColumnValuesBetweenCount
+from great_expectations.expectations.registry import set_up_lazy_package_attributes
+
+# The modules defining these attributes are imported upon first access.
+_ATTRIBUTE_MODULES = {
+    "ColumnDistinctValues": ".column_distinct_values",
+    "ColumnDistinctValuesCount": ".column_distinct_values",
+    "ColumnHistogram": ".column_histogram",
+    "ColumnMax": ".column_max",
+    "ColumnMean": ".column_mean",
+    "ColumnMedian": ".column_median",
+    "ColumnMin": ".column_min",
+    "ColumnMostCommonValue": ".column_most_common_value",
+    "ColumnParameterizedDistributionKSTestPValue": ".column_parameterized_distribution_ks_test_p_value",
+    "ColumnPartition": ".column_partition",
+    "ColumnUniqueProportion": ".column_proportion_of_unique_values",
+    "ColumnQuantileValues": ".column_quantile_values",
+    "ColumnDistinctValuesSketch": ".column_sketches",
+    "ColumnQuantileSketch": ".column_sketches",
+    "ColumnStandardDeviation": ".column_standard_deviation",
+    "ColumnSum": ".column_sum",
+    "ColumnValueCounts": ".column_value_counts",
+    "ColumnValuesBetweenCount": ".column_values_between_count",
+}
+
+set_up_lazy_package_attributes(globals(), _ATTRIBUTE_MODULES)
@@ -1,6 +1,9 @@
 from typing import Optional
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.sketches import (
+    DEFAULT_DISTINCT_VALUES_SKETCH_RELATIVE_ERROR,
+)
 from great_expectations.execution_engine import (
     ExecutionEngine,
     PandasExecutionEngine,
@@ -18,6 +21,9 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     sa as sa,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_sketches import (
+    get_sketch_relative_error,
+)
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.validator.validation_graph import MetricConfiguration
 
@@ -25,7 +31,11 @@ from great_expectations.validator.validation_graph import MetricConfiguration
 def unique_proportion(_metrics):
     """Computes the proportion of unique non-null values out of all non-null values"""
     total_values = _metrics.get("table.row_count")
-    unique_values = _metrics.get("column.distinct_values.count")
+    distinct_values_sketch = _metrics.get("column.distinct_values.sketch")
+    if distinct_values_sketch is not None:
+        unique_values = distinct_values_sketch.count()
+    else:
+        unique_values = _metrics.get("column.distinct_values.count")
     null_count = _metrics.get("column_values.nonnull.unexpected_count")
 
     # Ensuring that we do not divide by 0, returning 0 if all values are nulls (we only consider non-nulls unique values)
@@ -65,10 +75,23 @@ class ColumnUniqueProportion(ColumnAggregateMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
-        dependencies["column.distinct_values.count"] = MetricConfiguration(
-            metric_name="column.distinct_values.count",
-            metric_domain_kwargs=metric.metric_domain_kwargs,
+        relative_error: Optional[float] = get_sketch_relative_error(
+            allow_relative_error=metric.metric_value_kwargs.get("allow_relative_error"),
+            default_relative_error=DEFAULT_DISTINCT_VALUES_SKETCH_RELATIVE_ERROR,
         )
+        if relative_error and isinstance(
+            execution_engine, (PandasExecutionEngine, SparkDFExecutionEngine)
+        ):
+            dependencies["column.distinct_values.sketch"] = MetricConfiguration(
+                metric_name="column.distinct_values.sketch",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={"relative_error": relative_error},
+            )
+        else:
+            dependencies["column.distinct_values.count"] = MetricConfiguration(
+                metric_name="column.distinct_values.count",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+            )
 
         dependencies["column_values.nonnull.unexpected_count"] = MetricConfiguration(
             metric_name="column_values.nonnull.unexpected_count",
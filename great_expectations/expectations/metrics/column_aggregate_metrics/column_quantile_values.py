@@ -1,11 +1,14 @@
 import logging
 import traceback
 from collections.abc import Iterable
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.sketches import DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
@@ -21,8 +24,12 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     sa as sa,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_sketches import (
+    get_sketch_relative_error,
+)
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -62,8 +69,12 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
     value_keys = ("quantiles", "allow_relative_error")
 
     @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, quantiles, allow_relative_error, **kwargs):
+    def _pandas(cls, column, quantiles, allow_relative_error, _metrics, **kwargs):
         """Quantile Function"""
+        quantile_sketch = _metrics.get("column.quantile_sketch")
+        if quantile_sketch is not None:
+            return quantile_sketch.quantiles(quantiles)
+
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
 
         if not allow_relative_error:
@@ -177,6 +188,36 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
             )
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        """With pandas, a relative error (True, or a number between 0 and 1) is allowed by answering the quantiles
+        from a mergeable "column.quantile_sketch" (other backends compute approximate quantiles natively)."""
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        relative_error: Optional[float] = get_sketch_relative_error(
+            allow_relative_error=metric.metric_value_kwargs.get("allow_relative_error"),
+            default_relative_error=DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR,
+        )
+        if isinstance(execution_engine, PandasExecutionEngine) and relative_error:
+            dependencies["column.quantile_sketch"] = MetricConfiguration(
+                metric_name="column.quantile_sketch",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={"relative_error": relative_error},
+            )
+
+        return dependencies
+
 
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, sqlalchemy_engine
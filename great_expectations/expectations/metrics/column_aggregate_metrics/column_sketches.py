@@ -0,0 +1,149 @@
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from great_expectations.core.sketches import (
+    DEFAULT_DISTINCT_VALUES_SKETCH_RELATIVE_ERROR,
+    DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR,
+    HyperLogLogSketch,
+    KllQuantileSketch,
+)
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+)
+from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.import_manager import F
+from great_expectations.expectations.metrics.metric_provider import metric_value
+
+# Spark partitions are added to sketches in slices of rows, so that partitions need not fit in memory.
+SPARK_SKETCH_UPDATE_SIZE = 100000
+
+
+def get_sketch_relative_error(
+    allow_relative_error: Any, default_relative_error: float
+) -> Optional[float]:
+    """Returns the relative error of the sketch to use for the "allow_relative_error" argument of a metric, or None if
+    the metric must be computed exactly (or, for pandas quantiles, with an interpolation method).
+
+    True allows the default relative error of the sketch; a number between 0 and 1 is the relative error itself.
+    """
+    if allow_relative_error is True:
+        return default_relative_error
+
+    if (
+        not isinstance(allow_relative_error, bool)
+        and isinstance(allow_relative_error, (int, float))
+        and 0 < allow_relative_error < 1
+    ):
+        return float(allow_relative_error)
+
+    return None
+
+
+def _build_spark_sketch(
+    execution_engine: SparkDFExecutionEngine,
+    metric_domain_kwargs: Dict,
+    sketch_fn: Callable[[], Any],
+):
+    """Builds a sketch on every partition of the (non-null) column, and merges the sketches of the partitions."""
+    df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+        domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+    )
+    column_name: str = accessor_domain_kwargs["column"]
+
+    def build_partition_sketch(rows: Iterable) -> Iterable:
+        sketch = sketch_fn()
+        rows = iter(rows)
+        while True:
+            values: list = [row[0] for row in islice(rows, SPARK_SKETCH_UPDATE_SIZE)]
+            if not values:
+                break
+            sketch.update(values)
+
+        yield sketch
+
+    return (
+        df.select(column_name)
+        .where(F.col(column_name).isNotNull())
+        .rdd.mapPartitions(build_partition_sketch)
+        .fold(sketch_fn(), lambda sketch, other: sketch.merge(other))
+    )
+
+
+class ColumnQuantileSketch(ColumnAggregateMetricProvider):
+    """A KllQuantileSketch of the non-null values of the column, answering quantile queries within "relative_error"
+    (as a fraction of the number of values) of their exact rank; sketches of different batches can be merged."""
+
+    metric_name = "column.quantile_sketch"
+    value_keys = ("relative_error",)
+    filter_column_isnull = True
+    default_kwarg_values = {
+        "relative_error": DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR,
+    }
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, relative_error=None, **kwargs):
+        return KllQuantileSketch(
+            relative_error=relative_error or DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR
+        ).update(column.to_numpy())
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        relative_error: float = (
+            metric_value_kwargs.get("relative_error")
+            or DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR
+        )
+        return _build_spark_sketch(
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            sketch_fn=lambda: KllQuantileSketch(relative_error=relative_error),
+        )
+
+
+class ColumnDistinctValuesSketch(ColumnAggregateMetricProvider):
+    """A HyperLogLogSketch of the non-null values of the column, estimating their number of distinct values within
+    "relative_error" (as a fraction of that number); sketches of different batches can be merged."""
+
+    metric_name = "column.distinct_values.sketch"
+    value_keys = ("relative_error",)
+    filter_column_isnull = True
+    default_kwarg_values = {
+        "relative_error": DEFAULT_DISTINCT_VALUES_SKETCH_RELATIVE_ERROR,
+    }
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, relative_error=None, **kwargs):
+        return HyperLogLogSketch(
+            relative_error=relative_error
+            or DEFAULT_DISTINCT_VALUES_SKETCH_RELATIVE_ERROR
+        ).update(column.to_numpy())
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        relative_error: float = (
+            metric_value_kwargs.get("relative_error")
+            or DEFAULT_DISTINCT_VALUES_SKETCH_RELATIVE_ERROR
+        )
+        return _build_spark_sketch(
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            sketch_fn=lambda: HyperLogLogSketch(relative_error=relative_error),
+        )
@@ -1,3 +1,10 @@
-from .column_pair_values_equal import ColumnPairValuesEqual
-from .column_pair_values_greater import ColumnPairValuesAGreaterThanB
-from .column_pair_values_in_set import ColumnPairValuesInSet
+from great_expectations.expectations.registry import set_up_lazy_package_attributes
+
+# The modules defining these attributes are imported upon first access.
+_ATTRIBUTE_MODULES = {
+    "ColumnPairValuesEqual": ".column_pair_values_equal",
+    "ColumnPairValuesAGreaterThanB": ".column_pair_values_greater",
+    "ColumnPairValuesInSet": ".column_pair_values_in_set",
+}
+
+set_up_lazy_package_attributes(globals(), _ATTRIBUTE_MODULES)
@@ -22,7 +22,7 @@ from great_expectations.execution_engine.execution_engine import (
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     OperationalError,
 )
-from great_expectations.expectations.metrics.import_manager import F, Window, sa
+from great_expectations.expectations.metrics.import_manager import F, sa
 from great_expectations.expectations.metrics.metric_provider import (
     MetricProvider,
     metric_partial,
@@ -1358,7 +1358,7 @@ def _pandas_map_condition_unexpected_count(
     return np.count_nonzero(metrics["unexpected_condition"][0])
 
 
-def _pandas_column_map_condition_values(
+def _pandas_map_condition_unexpected_records(
     cls,
     execution_engine: PandasExecutionEngine,
     metric_domain_kwargs: Dict,
@@ -1366,14 +1366,29 @@ def _pandas_column_map_condition_values(
     metrics: Dict[str, Any],
     **kwargs,
 ):
-    """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
+    """Returns the records of the domain that do not meet the condition of the map metric, up to the number of them
+    reported for the result format (all of them for the "COMPLETE" result format, or if no result format is given).
+
+    The unexpected records are selected once per condition and result format, and shared by all of the metrics
+    reporting them (values, index list, and rows); only the unexpected records are retained, rather than all of the
+    records of the domain.
+    """
     (
         boolean_mapped_unexpected_values,
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics["unexpected_condition"]
+    """
+    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
+    with all of the available "domain_kwargs" keys.
+    """
+    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
     df = execution_engine.get_domain_records(
-        domain_kwargs=compute_domain_kwargs,
+        domain_kwargs=domain_kwargs,
+    )
+
+    unexpected_positions = np.flatnonzero(
+        np.asarray(boolean_mapped_unexpected_values) == True
     )
 
     ###
@@ -1385,36 +1400,81 @@ def _pandas_column_map_condition_values(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
 
-    if "column" not in accessor_domain_kwargs:
-        raise ValueError(
-            """No "column" found in provided metric_domain_kwargs, but it is required for a column map metric
-(_pandas_column_map_condition_values).
-"""
-        )
+    if "column" in accessor_domain_kwargs:
+        column_name = accessor_domain_kwargs["column"]
 
-    column_name = accessor_domain_kwargs["column"]
+        if column_name not in metrics["table.columns"]:
+            raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                message=f'Error: The column "{column_name}" in BatchData does not exist.'
+            )
 
-    if column_name not in metrics["table.columns"]:
-        raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-            message=f'Error: The column "{column_name}" in BatchData does not exist.'
+        if filter_column_isnull:
+            # The condition is only evaluated on the non-null values of the column; rather than copying the records
+            # with non-null values, the positions of the unexpected values among them are mapped back to the records.
+            unexpected_positions = np.flatnonzero(df[column_name].notnull().to_numpy())[
+                unexpected_positions
+            ]
+
+    elif "column_A" in accessor_domain_kwargs and "column_B" in accessor_domain_kwargs:
+        column_list = [
+            accessor_domain_kwargs["column_A"],
+            accessor_domain_kwargs["column_B"],
+        ]
+
+        for column_name in column_list:
+            if column_name not in metrics["table.columns"]:
+                raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                    message=f'Error: The column "{column_name}" in BatchData does not exist.'
+                )
+
+    elif "column_list" in accessor_domain_kwargs:
+        column_list = accessor_domain_kwargs["column_list"]
+
+        for column_name in column_list:
+            if column_name not in metrics["table.columns"]:
+                raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                    message=f'Error: The column "{column_name}" in BatchData does not exist.'
+                )
+
+    limit: Optional[int] = None
+    if metric_value_kwargs.get("result_format") is not None:
+        limit = _get_unexpected_limit(
+            result_format=metric_value_kwargs["result_format"]
         )
 
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
+    return df.iloc[unexpected_positions[:limit]]
 
-    domain_values = df[column_name]
 
-    domain_values = domain_values[boolean_mapped_unexpected_values == True]
+def _get_pandas_unexpected_records(
+    cls,
+    execution_engine: PandasExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns the shared "unexpected_records" dependency, computing it if it was not resolved as a metric."""
+    if "unexpected_records" in metrics:
+        return metrics["unexpected_records"]
+
+    return _pandas_map_condition_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
+    )
 
-    result_format = metric_value_kwargs["result_format"]
 
+def _get_unexpected_limit(result_format: dict) -> Optional[int]:
     if result_format["result_format"] == "COMPLETE":
-        return list(domain_values)
-    else:
-        return list(domain_values[: result_format["partial_unexpected_count"]])
+        return None
 
+    return result_format["partial_unexpected_count"]
 
-def _pandas_column_pair_map_condition_values(
+
+def _pandas_column_map_condition_values(
     cls,
     execution_engine: PandasExecutionEngine,
     metric_domain_kwargs: Dict,
@@ -1423,21 +1483,41 @@ def _pandas_column_pair_map_condition_values(
     **kwargs,
 ):
     """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics["unexpected_condition"]
-    """
-    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
-    with all of the available "domain_kwargs" keys.
-    """
-    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
-    df = execution_engine.get_domain_records(
-        domain_kwargs=domain_kwargs,
+    accessor_domain_kwargs = metrics["unexpected_condition"][2]
+    if "column" not in accessor_domain_kwargs:
+        raise ValueError(
+            """No "column" found in provided metric_domain_kwargs, but it is required for a column map metric
+(_pandas_column_map_condition_values).
+"""
+        )
+
+    column_name = accessor_domain_kwargs["column"]
+
+    unexpected_records = _get_pandas_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
     )
 
-    if not ("column_A" in domain_kwargs and "column_B" in domain_kwargs):
+    return list(unexpected_records[column_name])
+
+
+def _pandas_column_pair_map_condition_values(
+    cls,
+    execution_engine: PandasExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
+    accessor_domain_kwargs = metrics["unexpected_condition"][2]
+    if not (
+        "column_A" in accessor_domain_kwargs and "column_B" in accessor_domain_kwargs
+    ):
         raise ValueError(
             """No "column_A" and "column_B" found in provided metric_domain_kwargs, but it is required for a column pair map metric
 (_pandas_column_pair_map_condition_values).
@@ -1449,30 +1529,22 @@ def _pandas_column_pair_map_condition_values(
     # noinspection PyPep8Naming
     column_B_name = accessor_domain_kwargs["column_B"]
 
-    column_list = [column_A_name, column_B_name]
-
-    for column_name in column_list:
-        if column_name not in metrics["table.columns"]:
-            raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-                message=f'Error: The column "{column_name}" in BatchData does not exist.'
-            )
-
-    domain_values = df[column_list]
-
-    domain_values = domain_values[boolean_mapped_unexpected_values == True]
-
-    result_format = metric_value_kwargs["result_format"]
+    unexpected_records = _get_pandas_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
+    )
 
-    unexpected_list = [
+    return [
         value_pair
         for value_pair in zip(
-            domain_values[column_A_name].values, domain_values[column_B_name].values
+            unexpected_records[column_A_name].values,
+            unexpected_records[column_B_name].values,
         )
     ]
-    if result_format["result_format"] == "COMPLETE":
-        return unexpected_list
-    else:
-        return unexpected_list[: result_format["partial_unexpected_count"]]
 
 
 def _pandas_column_pair_map_condition_filtered_row_count(
@@ -1526,20 +1598,7 @@ def _pandas_multicolumn_map_condition_values(
     **kwargs,
 ):
     """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics["unexpected_condition"]
-    """
-    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
-    with all of the available "domain_kwargs" keys.
-    """
-    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
-    df = execution_engine.get_domain_records(
-        domain_kwargs=domain_kwargs,
-    )
-
+    accessor_domain_kwargs = metrics["unexpected_condition"][2]
     if "column_list" not in accessor_domain_kwargs:
         raise ValueError(
             """No "column_list" found in provided metric_domain_kwargs, but it is required for a multicolumn map metric
@@ -1549,24 +1608,16 @@ def _pandas_multicolumn_map_condition_values(
 
     column_list = accessor_domain_kwargs["column_list"]
 
-    for column_name in column_list:
-        if column_name not in metrics["table.columns"]:
-            raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-                message=f'Error: The column "{column_name}" in BatchData does not exist.'
-            )
-
-    domain_values = df[column_list]
+    unexpected_records = _get_pandas_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
+    )
 
-    domain_values = domain_values[boolean_mapped_unexpected_values == True]
-
-    result_format = metric_value_kwargs["result_format"]
-
-    if result_format["result_format"] == "COMPLETE":
-        return domain_values.to_dict("records")
-    else:
-        return domain_values[: result_format["partial_unexpected_count"]].to_dict(
-            "records"
-        )
+    return unexpected_records[column_list].to_dict("records")
 
 
 def _pandas_multicolumn_map_condition_filtered_row_count(
@@ -1688,57 +1739,16 @@ def _pandas_map_condition_index(
     metrics: Dict[str, Any],
     **kwargs,
 ):
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics.get("unexpected_condition")
-    """
-    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
-    with all of the available "domain_kwargs" keys.
-    """
-    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
-    df = execution_engine.get_domain_records(
-        domain_kwargs=domain_kwargs,
-    )
-
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+    unexpected_records = _get_pandas_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
     )
 
-    if "column" in accessor_domain_kwargs:
-        column_name = accessor_domain_kwargs["column"]
-
-        if column_name not in metrics["table.columns"]:
-            raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-                message=f'Error: The column "{column_name}" in BatchData does not exist.'
-            )
-
-        if filter_column_isnull:
-            df = df[df[column_name].notnull()]
-
-    elif "column_list" in accessor_domain_kwargs:
-        column_list = accessor_domain_kwargs["column_list"]
-
-        for column_name in column_list:
-            if column_name not in metrics["table.columns"]:
-                raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-                    message=f'Error: The column "{column_name}" in BatchData does not exist.'
-                )
-
-    result_format = metric_value_kwargs["result_format"]
-
-    df = df[boolean_mapped_unexpected_values]
-
-    if result_format["result_format"] == "COMPLETE":
-        return list(df.index)
-
-    return list(df.index[: result_format["partial_unexpected_count"]])
+    return list(unexpected_records.index)
 
 
 def _pandas_column_map_condition_value_counts(
@@ -1750,26 +1760,7 @@ def _pandas_column_map_condition_value_counts(
     **kwargs,
 ):
     """Returns respective value counts for distinct column values"""
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics.get("unexpected_condition")
-    df = execution_engine.get_domain_records(
-        domain_kwargs=compute_domain_kwargs,
-    )
-
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
-    )
-
-    column_name = accessor_domain_kwargs["column"]
-
+    accessor_domain_kwargs = metrics["unexpected_condition"][2]
     if "column" not in accessor_domain_kwargs:
         raise ValueError(
             """No "column" found in provided metric_domain_kwargs, but it is required for a column map metric
@@ -1777,27 +1768,29 @@ def _pandas_column_map_condition_value_counts(
 """
         )
 
-    if column_name not in metrics["table.columns"]:
-        raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-            message=f'Error: The column "{column_name}" in BatchData does not exist.'
-        )
+    column_name = accessor_domain_kwargs["column"]
 
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
+    # Value counts are computed over all of the unexpected values, whatever the result format.
+    unexpected_records = _pandas_map_condition_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs={
+            k: v for k, v in metric_value_kwargs.items() if k != "result_format"
+        },
+        metrics=metrics,
+        **kwargs,
+    )
 
-    domain_values = df[column_name]
+    unexpected_values = unexpected_records[column_name]
 
     result_format = metric_value_kwargs["result_format"]
     value_counts = None
     try:
-        value_counts = domain_values[boolean_mapped_unexpected_values].value_counts()
+        value_counts = unexpected_values.value_counts()
     except ValueError:
         try:
-            value_counts = (
-                domain_values[boolean_mapped_unexpected_values]
-                .apply(tuple)
-                .value_counts()
-            )
+            value_counts = unexpected_values.apply(tuple).value_counts()
         except ValueError:
             pass
 
@@ -1819,57 +1812,16 @@ def _pandas_map_condition_rows(
     **kwargs,
 ):
     """Return values from the specified domain (ignoring the column constraint) that match the map-style metric in the metrics dictionary."""
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics.get("unexpected_condition")
-    """
-    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
-    with all of the available "domain_kwargs" keys.
-    """
-    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
-    df = execution_engine.get_domain_records(
-        domain_kwargs=domain_kwargs,
+    unexpected_records = _get_pandas_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
     )
 
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
-    )
-
-    if "column" in accessor_domain_kwargs:
-        column_name = accessor_domain_kwargs["column"]
-
-        if column_name not in metrics["table.columns"]:
-            raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-                message=f'Error: The column "{column_name}" in BatchData does not exist.'
-            )
-
-        if filter_column_isnull:
-            df = df[df[column_name].notnull()]
-
-    elif "column_list" in accessor_domain_kwargs:
-        column_list = accessor_domain_kwargs["column_list"]
-
-        for column_name in column_list:
-            if column_name not in metrics["table.columns"]:
-                raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-                    message=f'Error: The column "{column_name}" in BatchData does not exist.'
-                )
-
-    result_format = metric_value_kwargs["result_format"]
-
-    df = df[boolean_mapped_unexpected_values]
-
-    if result_format["result_format"] == "COMPLETE":
-        return df
-
-    return df.iloc[: result_format["partial_unexpected_count"]]
+    return unexpected_records
 
 
 def _sqlalchemy_map_condition_unexpected_count_aggregate_fn(
@@ -1985,7 +1937,7 @@ def _sqlalchemy_map_condition_unexpected_count_value(
     return convert_to_json_serializable(unexpected_count)
 
 
-def _sqlalchemy_column_map_condition_values(
+def _sqlalchemy_map_condition_unexpected_records(
     cls,
     execution_engine: SqlAlchemyExecutionEngine,
     metric_domain_kwargs: Dict,
@@ -1994,16 +1946,104 @@ def _sqlalchemy_column_map_condition_values(
     **kwargs,
 ):
     """
-    Particularly for the purpose of finding unexpected values, returns all the metric values which do not meet an
-    expected Expectation condition for ColumnMapExpectation Expectations.
+    Returns the domain columns (labelled by their names) of the rows which do not meet an expected Expectation
+    condition, up to the number of them reported for the result format (all of them for the "COMPLETE" result format,
+    or if no result format is given).
+
+    The rows are selected with a single query per condition and result format, which is shared by all of the metrics
+    reporting unexpected values.
     """
     unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics.get(
         "unexpected_condition"
     )
+    """
+    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
+    with all of the available "domain_kwargs" keys.
+    """
+    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
     selectable = execution_engine.get_domain_records(
-        domain_kwargs=compute_domain_kwargs,
+        domain_kwargs=domain_kwargs,
+    )
+
+    query = (
+        sa.select(
+            [
+                sa.column(column_name).label(column_name)
+                for column_name in _get_domain_column_names(accessor_domain_kwargs)
+            ]
+        )
+        .select_from(selectable)
+        .where(unexpected_condition)
     )
+    result_format = metric_value_kwargs.get("result_format")
+    if result_format is not None and result_format["result_format"] != "COMPLETE":
+        query = query.limit(result_format["partial_unexpected_count"])
+    try:
+        return execution_engine.engine.execute(query).fetchall()
+    except OperationalError as oe:
+        exception_message: str = f"An SQL execution Exception occurred: {str(oe)}."
+        raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+            message=exception_message
+        )
+
+
+def _get_sqlalchemy_unexpected_records(
+    cls,
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns the shared "unexpected_records" dependency, querying them if they were not resolved as a metric."""
+    if "unexpected_records" in metrics:
+        return metrics["unexpected_records"]
+
+    return _sqlalchemy_map_condition_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
+    )
+
+
+def _get_domain_column_names(accessor_domain_kwargs: Dict) -> List[str]:
+    column_names: List[str]
+    if "column" in accessor_domain_kwargs:
+        column_names = [accessor_domain_kwargs["column"]]
+    elif "column_A" in accessor_domain_kwargs and "column_B" in accessor_domain_kwargs:
+        column_names = [
+            accessor_domain_kwargs["column_A"],
+            accessor_domain_kwargs["column_B"],
+        ]
+    elif "column_list" in accessor_domain_kwargs:
+        column_names = list(accessor_domain_kwargs["column_list"])
+    else:
+        raise ValueError(
+            """No "column", "column_A" and "column_B", or "column_list" found in provided metric_domain_kwargs, but \
+one of them is required for selecting unexpected records.
+"""
+        )
+
+    # Each column is selected (and labelled) only once.
+    return list(dict.fromkeys(column_names))
 
+
+def _sqlalchemy_column_map_condition_values(
+    cls,
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """
+    Particularly for the purpose of finding unexpected values, returns all the metric values which do not meet an
+    expected Expectation condition for ColumnMapExpectation Expectations.
+    """
+    accessor_domain_kwargs = metrics["unexpected_condition"][2]
     if "column" not in accessor_domain_kwargs:
         raise ValueError(
             """No "column" found in provided metric_domain_kwargs, but it is required for a column map metric
@@ -2018,20 +2058,16 @@ def _sqlalchemy_column_map_condition_values(
             message=f'Error: The column "{column_name}" in BatchData does not exist.'
         )
 
-    query = (
-        sa.select([sa.column(column_name).label("unexpected_values")])
-        .select_from(selectable)
-        .where(unexpected_condition)
+    unexpected_records = _get_sqlalchemy_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
     )
 
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] != "COMPLETE":
-        query = query.limit(result_format["partial_unexpected_count"])
-
-    return [
-        val.unexpected_values
-        for val in execution_engine.engine.execute(query).fetchall()
-    ]
+    return [row[column_name] for row in unexpected_records]
 
 
 def _sqlalchemy_column_pair_map_condition_values(
@@ -2043,19 +2079,7 @@ def _sqlalchemy_column_pair_map_condition_values(
     **kwargs,
 ):
     """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics["unexpected_condition"]
-    """
-    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
-    with all of the available "domain_kwargs" keys.
-    """
-    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
-    selectable = execution_engine.get_domain_records(
-        domain_kwargs=domain_kwargs,
-    )
+    accessor_domain_kwargs = metrics["unexpected_condition"][2]
 
     # noinspection PyPep8Naming
     column_A_name = accessor_domain_kwargs["column_A"]
@@ -2070,24 +2094,22 @@ def _sqlalchemy_column_pair_map_condition_values(
                 message=f'Error: The column "{column_name}" in BatchData does not exist.'
             )
 
-    query = (
-        sa.select(
-            sa.column(column_A_name).label("unexpected_values_A"),
-            sa.column(column_B_name).label("unexpected_values_B"),
-        )
-        .select_from(selectable)
-        .where(boolean_mapped_unexpected_values)
+    unexpected_records = _get_sqlalchemy_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
     )
 
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] != "COMPLETE":
-        query = query.limit(result_format["partial_unexpected_count"])
-
-    unexpected_list = [
-        (val.unexpected_values_A, val.unexpected_values_B)
-        for val in execution_engine.engine.execute(query).fetchall()
+    return [
+        (
+            row[column_A_name],
+            row[column_B_name],
+        )
+        for row in unexpected_records
     ]
-    return unexpected_list
 
 
 def _sqlalchemy_column_pair_map_condition_filtered_row_count(
@@ -2136,20 +2158,7 @@ def _sqlalchemy_multicolumn_map_condition_values(
     **kwargs,
 ):
     """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics["unexpected_condition"]
-    """
-    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
-    with all of the available "domain_kwargs" keys.
-    """
-    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
-    selectable = execution_engine.get_domain_records(
-        domain_kwargs=domain_kwargs,
-    )
-
+    accessor_domain_kwargs = metrics["unexpected_condition"][2]
     if "column_list" not in accessor_domain_kwargs:
         raise ValueError(
             """No "column_list" found in provided metric_domain_kwargs, but it is required for a multicolumn map metric
@@ -2165,18 +2174,19 @@ def _sqlalchemy_multicolumn_map_condition_values(
                 message=f'Error: The column "{column_name}" in BatchData does not exist.'
             )
 
-    column_selector = [sa.column(column_name) for column_name in column_list]
-    query = (
-        sa.select(column_selector)
-        .select_from(selectable)
-        .where(boolean_mapped_unexpected_values)
+    unexpected_records = _get_sqlalchemy_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
     )
 
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] != "COMPLETE":
-        query = query.limit(result_format["partial_unexpected_count"])
-
-    return [dict(val) for val in execution_engine.engine.execute(query).fetchall()]
+    return [
+        {column_name: row[column_name] for column_name in column_list}
+        for row in unexpected_records
+    ]
 
 
 def _sqlalchemy_multicolumn_map_condition_filtered_row_count(
@@ -2343,6 +2353,22 @@ def _spark_map_condition_unexpected_count_value(
     return filtered.count()
 
 
+def _spark_collect_unexpected_rows(filtered, result_format: dict) -> list:
+    """
+    Collects the rows of a (filtered) Spark DataFrame of unexpected records: all of them for the "COMPLETE" result
+    format, and only the first "partial_unexpected_count" ones otherwise.
+
+    The partial sample is limited before it is collected, so that partitions are scanned only until the limit is
+    reached; in contrast to numbering the rows over a global (un-partitioned) window, this neither moves the domain into
+    a single partition nor sorts it.  Since collecting preserves the order of the partitions (and of the rows within
+    them), the first unexpected records of the domain are returned.
+    """
+    if result_format["result_format"] == "COMPLETE":
+        return filtered.collect()
+
+    return filtered.limit(result_format["partial_unexpected_count"]).collect()
+
+
 def _spark_column_map_condition_values(
     cls,
     execution_engine: SparkDFExecutionEngine,
@@ -2373,27 +2399,15 @@ def _spark_column_map_condition_values(
             message=f'Error: The column "{column_name}" in BatchData does not exist.'
         )
 
-    data = (
-        df.withColumn("__row_number", F.row_number().over(Window.orderBy(F.lit(1))))
-        .withColumn("__unexpected", unexpected_condition)
-        .orderBy(F.col("__row_number"))
-    )
-
     filtered = (
-        data.filter(F.col("__unexpected") == True)
-        .drop(F.col("__unexpected"))
-        .drop(F.col("__row_number"))
+        df.withColumn("__unexpected", unexpected_condition)
+        .filter(F.col("__unexpected") == True)
+        .select(F.col(column_name))
     )
 
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        rows = filtered.select(F.col(column_name)).collect()
-    else:
-        rows = (
-            filtered.select(F.col(column_name))
-            .limit(result_format["partial_unexpected_count"])
-            .collect()
-        )
+    rows = _spark_collect_unexpected_rows(
+        filtered=filtered, result_format=metric_value_kwargs["result_format"]
+    )
     return [row[column_name] for row in rows]
 
 
@@ -2431,11 +2445,9 @@ def _spark_column_map_condition_value_counts(
 
     filtered = data.filter(F.col("__unexpected") == True).drop(F.col("__unexpected"))
     value_counts = filtered.groupBy(F.col(column_name)).count()
-    if result_format["result_format"] == "COMPLETE":
-        rows = value_counts.collect()
-    else:
-        rows = value_counts.collect()[: result_format["partial_unexpected_count"]]
-    return rows
+    return _spark_collect_unexpected_rows(
+        filtered=value_counts, result_format=result_format
+    )
 
 
 def _spark_map_condition_rows(
@@ -2458,24 +2470,15 @@ def _spark_map_condition_rows(
         domain_kwargs=domain_kwargs,
     )
 
-    data = (
-        df.withColumn("__row_number", F.row_number().over(Window.orderBy(F.lit(1))))
-        .withColumn("__unexpected", unexpected_condition)
-        .orderBy(F.col("__row_number"))
-    )
-
     filtered = (
-        data.filter(F.col("__unexpected") == True)
+        df.withColumn("__unexpected", unexpected_condition)
+        .filter(F.col("__unexpected") == True)
         .drop(F.col("__unexpected"))
-        .drop(F.col("__row_number"))
     )
 
-    result_format = metric_value_kwargs["result_format"]
-
-    if result_format["result_format"] == "COMPLETE":
-        return filtered.collect()
-    else:
-        return filtered.limit(result_format["partial_unexpected_count"]).collect()
+    return _spark_collect_unexpected_rows(
+        filtered=filtered, result_format=metric_value_kwargs["result_format"]
+    )
 
 
 def _spark_column_pair_map_condition_values(
@@ -2514,27 +2517,15 @@ def _spark_column_pair_map_condition_values(
                 message=f'Error: The column "{column_name}" in BatchData does not exist.'
             )
 
-    data = (
-        df.withColumn("__row_number", F.row_number().over(Window.orderBy(F.lit(1))))
-        .withColumn("__unexpected", boolean_mapped_unexpected_values)
-        .orderBy(F.col("__row_number"))
-    )
-
     filtered = (
-        data.filter(F.col("__unexpected") == True)
-        .drop(F.col("__unexpected"))
-        .drop(F.col("__row_number"))
+        df.withColumn("__unexpected", boolean_mapped_unexpected_values)
+        .filter(F.col("__unexpected") == True)
+        .select([F.col(column_A_name), F.col(column_B_name)])
     )
 
-    result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        rows = filtered.select([F.col(column_A_name), F.col(column_B_name)]).collect()
-    else:
-        rows = (
-            filtered.select([F.col(column_A_name), F.col(column_B_name)])
-            .limit(result_format["partial_unexpected_count"])
-            .collect()
-        )
+    rows = _spark_collect_unexpected_rows(
+        filtered=filtered, result_format=metric_value_kwargs["result_format"]
+    )
 
     unexpected_list = [(row[column_A_name], row[column_B_name]) for row in rows]
     return unexpected_list
@@ -2613,36 +2604,20 @@ def _spark_multicolumn_map_condition_values(
                 message=f'Error: The column "{column_name}" in BatchData does not exist.'
             )
 
-    data = (
-        df.withColumn("__row_number", F.row_number().over(Window.orderBy(F.lit(1))))
-        .withColumn("__unexpected", boolean_mapped_unexpected_values)
-        .orderBy(F.col("__row_number"))
-    )
-
-    filtered = (
-        data.filter(F.col("__unexpected") == True)
-        .drop(F.col("__unexpected"))
-        .drop(F.col("__row_number"))
-    )
-
     column_selector = [F.col(column_name) for column_name in column_list]
 
-    domain_values = filtered.select(column_selector)
+    domain_values = (
+        df.withColumn("__unexpected", boolean_mapped_unexpected_values)
+        .filter(F.col("__unexpected") == True)
+        .select(column_selector)
+    )
 
     result_format = metric_value_kwargs["result_format"]
-    if result_format["result_format"] == "COMPLETE":
-        domain_values = (
-            domain_values.select(column_selector).toPandas().to_dict("records")
-        )
-    else:
-        domain_values = (
-            domain_values.select(column_selector)
-            .limit(result_format["partial_unexpected_count"])
-            .toPandas()
-            .to_dict("records")
-        )
+    if result_format["result_format"] != "COMPLETE":
+        # See "_spark_collect_unexpected_rows()" on limiting the partial sample before it is collected.
+        domain_values = domain_values.limit(result_format["partial_unexpected_count"])
 
-    return domain_values
+    return domain_values.toPandas().to_dict("records")
 
 
 def _spark_multicolumn_map_condition_filtered_row_count(
@@ -2760,6 +2735,15 @@ class MapMetricProvider(MetricProvider):
                         metric_provider=_pandas_map_condition_unexpected_count,
                         metric_fn_type=MetricFunctionTypes.VALUE,
                     )
+                    register_metric(
+                        metric_name=metric_name + ".unexpected_records",
+                        metric_domain_keys=metric_domain_keys,
+                        metric_value_keys=metric_value_keys,
+                        execution_engine=engine,
+                        metric_class=cls,
+                        metric_provider=_pandas_map_condition_unexpected_records,
+                        metric_fn_type=metric_fn_type,
+                    )
                     register_metric(
                         metric_name=metric_name + ".unexpected_index_list",
                         metric_domain_keys=metric_domain_keys,
@@ -2845,6 +2829,15 @@ class MapMetricProvider(MetricProvider):
                         metric_provider=condition_provider,
                         metric_fn_type=metric_fn_type,
                     )
+                    register_metric(
+                        metric_name=metric_name + ".unexpected_records",
+                        metric_domain_keys=metric_domain_keys,
+                        metric_value_keys=metric_value_keys,
+                        execution_engine=engine,
+                        metric_class=cls,
+                        metric_provider=_sqlalchemy_map_condition_unexpected_records,
+                        metric_fn_type=metric_fn_type,
+                    )
                     register_metric(
                         metric_name=metric_name + ".unexpected_rows",
                         metric_domain_keys=metric_domain_keys,
@@ -3144,6 +3137,7 @@ class MapMetricProvider(MetricProvider):
             ".unexpected_value_counts",
             ".unexpected_index_list",
             ".unexpected_rows",
+            ".unexpected_records",
             ".filtered_row_count",
         ]:
             if metric_name.endswith(metric_suffix):
@@ -3153,6 +3147,35 @@ class MapMetricProvider(MetricProvider):
                     base_metric_value_kwargs,
                 )
 
+        # Metrics reporting unexpected records (with the same result format) share them (where the execution engine
+        # provides them), rather than each selecting them from the domain.
+        for metric_suffix in [
+            ".unexpected_values",
+            ".unexpected_index_list",
+            ".unexpected_rows",
+        ]:
+            if metric_name.endswith(metric_suffix):
+                if metric_suffix == ".unexpected_rows" and isinstance(
+                    execution_engine, SqlAlchemyExecutionEngine
+                ):
+                    # Unexpected records selected by SQL hold only the domain columns, not the whole rows.
+                    continue
+
+                unexpected_records_metric_name = (
+                    metric_name[: -len(metric_suffix)] + ".unexpected_records"
+                )
+                try:
+                    _ = get_metric_provider(
+                        unexpected_records_metric_name, execution_engine
+                    )
+                    dependencies["unexpected_records"] = MetricConfiguration(
+                        unexpected_records_metric_name,
+                        metric.metric_domain_kwargs,
+                        metric.metric_value_kwargs,
+                    )
+                except ge_exceptions.MetricProviderError:
+                    pass
+
         try:
             _ = get_metric_provider(metric_name + ".map", execution_engine)
             dependencies["metric_map_fn"] = MetricConfiguration(
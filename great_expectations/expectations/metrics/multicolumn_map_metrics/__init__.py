@@ -1,5 +1,10 @@
-from .compound_columns_unique import CompoundColumnsUnique
-from .multicolumn_sum_equal import MulticolumnSumEqual
-from .select_column_values_unique_within_record import (
-    SelectColumnValuesUniqueWithinRecord,
-)
+from great_expectations.expectations.registry import set_up_lazy_package_attributes
+
+# The modules defining these attributes are imported upon first access.
+_ATTRIBUTE_MODULES = {
+    "CompoundColumnsUnique": ".compound_columns_unique",
+    "MulticolumnSumEqual": ".multicolumn_sum_equal",
+    "SelectColumnValuesUniqueWithinRecord": ".select_column_values_unique_within_record",
+}
+
+set_up_lazy_package_attributes(globals(), _ATTRIBUTE_MODULES)
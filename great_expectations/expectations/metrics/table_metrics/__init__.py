@@ -1,5 +1,12 @@
-from .table_column_count import TableColumnCount
-from .table_column_types import ColumnTypes
-from .table_columns import TableColumns
-from .table_head import TableHead
-from .table_row_count import TableRowCount
+from great_expectations.expectations.registry import set_up_lazy_package_attributes
+
+# The modules defining these attributes are imported upon first access.
+_ATTRIBUTE_MODULES = {
+    "TableColumnCount": ".table_column_count",
+    "ColumnTypes": ".table_column_types",
+    "TableColumns": ".table_columns",
+    "TableHead": ".table_head",
+    "TableRowCount": ".table_row_count",
+}
+
+set_up_lazy_package_attributes(globals(), _ATTRIBUTE_MODULES)
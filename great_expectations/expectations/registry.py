@@ -1,9 +1,16 @@
+import importlib
 import logging
+import sys
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric import Metric
+from great_expectations.expectations.registry_manifest import (
+    EXPECTATION_MODULES,
+    METRIC_MODULES,
+    RENDERER_MODULES,
+)
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 logger = logging.getLogger(__name__)
@@ -12,6 +19,12 @@ _registered_expectations = {}
 _registered_metrics = {}
 _registered_renderers = {}
 
+# The Expectations and Metrics of these packages are registered lazily, upon first use (see "registry_manifest.py").
+LAZILY_REGISTERED_PACKAGES: Tuple[str, ...] = (
+    "great_expectations.expectations.core",
+    "great_expectations.expectations.metrics",
+)
+
 """
 {
   "metric_name"
@@ -30,6 +43,7 @@ def register_renderer(
     renderer_fn: Callable,
 ):
     renderer_name = renderer_fn._renderer_type
+    _import_registering_module(name=object_name, manifest=RENDERER_MODULES)
     if object_name not in _registered_renderers:
         logger.debug(f"Registering {renderer_name} for expectation_type {object_name}.")
         _registered_renderers[object_name] = {
@@ -64,11 +78,19 @@ def register_renderer(
 
 
 def get_renderer_impl(object_name, renderer_type):
+    if object_name not in _registered_renderers:
+        _import_registering_module(name=object_name, manifest=RENDERER_MODULES)
     return _registered_renderers.get(object_name, {}).get(renderer_type)
 
 
+def list_registered_renderer_object_names() -> List[str]:
+    _import_all_registering_modules(manifest=RENDERER_MODULES)
+    return list(_registered_renderers.keys())
+
+
 def register_expectation(expectation: Type["Expectation"]) -> None:
     expectation_type = expectation.expectation_type
+    _import_registering_module(name=expectation_type, manifest=EXPECTATION_MODULES)
     # TODO: add version to key
     if expectation_type in _registered_expectations:
         if _registered_expectations[expectation_type] == expectation:
@@ -105,6 +127,7 @@ def register_metric(
 ) -> dict:
     res = {}
     execution_engine_name = execution_engine.__name__
+    _import_registering_module(name=metric_name, manifest=METRIC_MODULES)
     logger.debug(f"Registering metric: {metric_name}")
     if metric_provider is not None and metric_fn_type is not None:
         metric_provider.metric_fn_type = metric_fn_type
@@ -169,6 +192,7 @@ def register_metric(
 def get_metric_provider(
     metric_name: str, execution_engine: "ExecutionEngine"
 ) -> Tuple["MetricProvider", Callable]:
+    _import_metric_module(metric_name=metric_name)
     try:
         metric_definition = _registered_metrics[metric_name]
         return metric_definition["providers"][type(execution_engine).__name__]
@@ -181,6 +205,7 @@ def get_metric_provider(
 def get_metric_function_type(
     metric_name: str, execution_engine: "ExecutionEngine"
 ) -> Optional[Union["MetricPartialFunctionTypes", "MetricFunctionTypes"]]:
+    _import_metric_module(metric_name=metric_name)
     try:
         metric_definition = _registered_metrics[metric_name]
         provider_fn, provider_class = metric_definition["providers"][
@@ -198,6 +223,7 @@ def get_metric_kwargs(
     configuration: Optional["ExpectationConfiguration"] = None,
     runtime_configuration: Optional[dict] = None,
 ) -> Dict:
+    _import_metric_module(metric_name=metric_name)
     try:
         metric_definition = _registered_metrics.get(metric_name)
         if metric_definition is None:
@@ -254,12 +280,15 @@ def get_domain_metrics_dict_by_name(
 
 
 def get_expectation_impl(expectation_name):
+    if expectation_name not in _registered_expectations:
+        _import_registering_module(name=expectation_name, manifest=EXPECTATION_MODULES)
     return _registered_expectations.get(expectation_name)
 
 
 def list_registered_expectation_implementations(
     expectation_root: Type["Expectation"] = None,
 ) -> List[str]:
+    _import_all_registering_modules(manifest=EXPECTATION_MODULES)
     registered_expectation_implementations = []
     for (
         expectation_name,
@@ -273,3 +302,127 @@ def list_registered_expectation_implementations(
             registered_expectation_implementations.append(expectation_name)
 
     return registered_expectation_implementations
+
+
+def _import_metric_module(metric_name: str) -> None:
+    if metric_name not in _registered_metrics:
+        _import_registering_module(name=metric_name, manifest=METRIC_MODULES)
+
+
+def _import_registering_module(name: str, manifest: Dict[str, str]) -> None:
+    """
+    Imports the module, which registers the named Expectation, Metric, or renderer object, if it is in the manifest.
+
+    This is also done before a name is registered, so that the core registration always precedes (and never overwrites)
+    registrations by plugins, e.g., of a provider overriding a core Metric for a single ExecutionEngine.
+
+    The module is imported even if it is already in "sys.modules", where it appears as soon as its import starts: the
+    import returns at once for a loaded module, waits for another thread still importing it (rather than seeing its
+    names unregistered), and is reentrant for the thread importing it (e.g., for the module's own registrations).
+    """
+    module_name: Optional[str] = manifest.get(name)
+    if module_name is not None:
+        importlib.import_module(module_name)
+
+
+def _import_all_registering_modules(manifest: Dict[str, str]) -> None:
+    module_name: str
+    for module_name in sorted(set(manifest.values())):
+        importlib.import_module(module_name)
+
+
+def set_up_lazy_package_attributes(
+    package_globals: Dict[str, Any], attribute_modules: Dict[str, str]
+) -> None:
+    """
+    Makes the attributes (e.g., Expectation and Metric classes) of a package importable from it, without importing the
+    modules that define them until they are first accessed (the modules are imported eagerly on Python < 3.7, which
+    does not support module-level "__getattr__").
+
+    Args:
+        package_globals: the "globals()" of the package "__init__" module
+        attribute_modules: the module (relative to the package), which defines each attribute of the package
+    """
+    package_name: str = package_globals["__name__"]
+
+    def _get_attribute(name: str) -> Any:
+        try:
+            module_name: str = attribute_modules[name]
+        except KeyError:
+            raise AttributeError(
+                f"module '{package_name}' has no attribute '{name}'"
+            ) from None
+
+        value: Any = getattr(
+            importlib.import_module(module_name, package=package_name), name
+        )
+        package_globals[name] = value
+        return value
+
+    if sys.version_info < (3, 7):
+        name: str
+        for name in attribute_modules:
+            _get_attribute(name)
+        return
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(attribute_modules))
+
+    package_globals["__all__"] = sorted(
+        {name for name in package_globals if not name.startswith("_")}
+        | set(attribute_modules)
+    )
+    package_globals["__getattr__"] = _get_attribute
+    package_globals["__dir__"] = __dir__
+
+
+def build_registry_manifest() -> Dict[str, Dict[str, str]]:
+    """
+    Imports all attributes of the lazily registered packages and maps the name of every Expectation, Metric, and
+    renderer object they register to the module, which registers it (see "scripts/generate_registry_manifest.py").
+    """
+    package_name: str
+    for package_name in LAZILY_REGISTERED_PACKAGES:
+        package = importlib.import_module(package_name)
+        name: str
+        for name in dir(package):
+            getattr(package, name)
+
+    registering_classes: Dict[str, Dict[str, Iterable[type]]] = {
+        "EXPECTATION_MODULES": {
+            name: [expectation]
+            for name, expectation in _registered_expectations.items()
+        },
+        "METRIC_MODULES": {
+            name: [metric_class for metric_class, _ in definition["providers"].values()]
+            for name, definition in _registered_metrics.items()
+        },
+        "RENDERER_MODULES": {
+            name: [parent_class for parent_class, _ in renderers.values()]
+            for name, renderers in _registered_renderers.items()
+        },
+    }
+
+    manifest: Dict[str, Dict[str, str]] = {}
+    manifest_name: str
+    classes_by_name: Dict[str, Iterable[type]]
+    for manifest_name, classes_by_name in registering_classes.items():
+        manifest[manifest_name] = {}
+        name: str
+        classes: Iterable[type]
+        for name, classes in sorted(classes_by_name.items()):
+            module_names: set = {
+                registering_class.__module__
+                for registering_class in classes
+                if registering_class.__module__.startswith(
+                    "great_expectations.expectations."
+                )
+            }
+            if len(module_names) > 1:
+                raise ge_exceptions.GreatExpectationsError(
+                    f'"{name}" is registered by more than one module: {sorted(module_names)}.'
+                )
+            if module_names:
+                manifest[manifest_name][name] = module_names.pop()
+
+    return manifest
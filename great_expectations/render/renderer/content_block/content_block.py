@@ -6,9 +6,9 @@ from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
 from great_expectations.expectations.registry import (
-    _registered_renderers,
     get_expectation_impl,
     get_renderer_impl,
+    list_registered_renderer_object_names,
 )
 from great_expectations.render.types import (
     CollapseContent,
@@ -366,7 +366,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
     def list_available_expectations(cls):
         expectations = [
             object_name
-            for object_name in _registered_renderers
+            for object_name in list_registered_renderer_object_names()
             if object_name.startswith("expect_")
         ]
         return expectations
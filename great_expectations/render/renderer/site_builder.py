@@ -1,10 +1,17 @@
+import hashlib
+import json
 import logging
 import os
 import traceback
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 
 import great_expectations.exceptions as exceptions
-from great_expectations.core.util import nested_update
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+)
+from great_expectations.core.util import convert_to_json_serializable, nested_update
 from great_expectations.data_context.store.html_site_store import (
     GeCloudIdentifier,
     HtmlSiteStore,
@@ -106,6 +113,27 @@ class SiteBuilder:
                     view:
                         module_name: great_expectations.render.view
                         class_name: DefaultJinjaIndexPageView
+
+    With ``incremental: true``, the site keeps a manifest of its rendered pages
+    next to the index page, with the version of the resource each page was
+    rendered from (as reported by listing the source store, e.g. the
+    modification time or ETag of its object; validation results, which are
+    written once per run, need none) and the information of its index link.
+    Builds render only new or changed resources, remove the pages of deleted
+    resources, and patch the index from the manifest instead of listing the
+    site and reading every validation result::
+
+        local_site:
+            class_name: SiteBuilder
+            incremental: true
+            store_backend:
+                class_name: TupleFilesystemStoreBackend
+                base_directory: uncommitted/data_docs/local_site/
+
+    With ``max_workers`` greater than 1, the pages of each section are
+    rendered in that many worker processes, while resources are read and
+    pages are written by as many threads; the pages are the same as those of
+    a sequential build. Renderers must then be picklable.
     """
 
     def __init__(
@@ -118,6 +146,8 @@ class SiteBuilder:
         site_section_builders=None,
         runtime_environment=None,
         ge_cloud_mode=False,
+        incremental=False,
+        max_workers=None,
         **kwargs,
     ):
         self.site_name = site_name
@@ -125,6 +155,9 @@ class SiteBuilder:
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
         self.ge_cloud_mode = ge_cloud_mode
+        # GE Cloud renders JSON Data Docs, which are not tracked by a manifest.
+        self.incremental = incremental and not ge_cloud_mode
+        self.max_workers = max_workers
 
         usage_statistics_config = data_context.anonymous_usage_statistics
         data_context_id = None
@@ -169,7 +202,9 @@ class SiteBuilder:
             )
         else:
             self.target_store = HtmlSiteStore(
-                store_backend=store_backend, runtime_environment=runtime_environment
+                store_backend=store_backend,
+                runtime_environment=runtime_environment,
+                incremental=self.incremental,
             )
 
         default_site_section_builders_config = {
@@ -232,6 +267,8 @@ class SiteBuilder:
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "ge_cloud_mode": self.ge_cloud_mode,
+                    "incremental": self.incremental,
+                    "max_workers": self.max_workers,
                 },
                 config_defaults={"name": site_section_name, "module_name": module_name},
             )
@@ -264,6 +301,7 @@ class SiteBuilder:
                 },
                 "site_section_builders_config": site_section_builders,
                 "ge_cloud_mode": self.ge_cloud_mode,
+                "incremental": self.incremental,
             },
             config_defaults={
                 "name": "site_index_builder",
@@ -350,6 +388,8 @@ class DefaultSiteSectionBuilder:
         view=None,
         data_context_id=None,
         ge_cloud_mode=False,
+        incremental=False,
+        max_workers=None,
         **kwargs,
     ):
         self.name = name
@@ -360,6 +400,8 @@ class DefaultSiteSectionBuilder:
         self.data_context_id = data_context_id
         self.show_how_to_buttons = show_how_to_buttons
         self.ge_cloud_mode = ge_cloud_mode
+        self.incremental = incremental and not ge_cloud_mode
+        self.max_workers = max_workers
         if renderer is None:
             raise exceptions.InvalidConfigError(
                 "SiteSectionBuilder requires a renderer configuration "
@@ -368,6 +410,7 @@ class DefaultSiteSectionBuilder:
         module_name = (
             renderer.get("module_name") or "great_expectations.render.renderer"
         )
+        self._renderer_config = renderer
         self.renderer_class = instantiate_class_from_config(
             config=renderer,
             runtime_environment={"data_context": data_context},
@@ -387,14 +430,16 @@ class DefaultSiteSectionBuilder:
                 "class_name": "DefaultJinjaPageView",
             }
         module_name = view.get("module_name") or module_name
-        self.view_class = instantiate_class_from_config(
-            config=view,
-            runtime_environment={
+        # Views are not picklable: worker processes instantiate their own from the configuration.
+        self._view_config = {
+            "config": view,
+            "runtime_environment": {
                 "custom_styles_directory": custom_styles_directory,
                 "custom_views_directory": custom_views_directory,
             },
-            config_defaults={"module_name": module_name},
-        )
+            "config_defaults": {"module_name": module_name},
+        }
+        self.view_class = instantiate_class_from_config(**self._view_config)
         if not self.view_class:
             raise exceptions.ClassInstantiationError(
                 module_name=view["module_name"],
@@ -403,103 +448,407 @@ class DefaultSiteSectionBuilder:
             )
 
     def build(self, resource_identifiers=None):
-        source_store_keys = self.source_store.list_keys()
+        source_store_key_versions = None
+        if self.incremental:
+            # A single listing of the source store reports both the keys and the versions of the resources.
+            source_store_key_versions = self.source_store.list_key_versions()
+            source_store_keys = list(source_store_key_versions.keys())
+        else:
+            source_store_keys = self.source_store.list_keys()
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        section_resource_keys = []
         for resource_key in source_store_keys:
-            # if no resource_identifiers are passed, the section
-            # builder will build
-            # a page for every keys in its source store.
-            # if the caller did pass resource_identifiers, the section builder
-            # will build pages only for the specified resources
-            if resource_identifiers and resource_key not in resource_identifiers:
-                continue
-
             if self.run_name_filter and not isinstance(resource_key, GeCloudIdentifier):
                 if not resource_key_passes_run_name_filter(
                     resource_key, self.run_name_filter
                 ):
                     continue
+            section_resource_keys.append(resource_key)
+
+        # if no resource_identifiers are passed, the section
+        # builder will build
+        # a page for every keys in its source store.
+        # if the caller did pass resource_identifiers, the section builder
+        # will build pages only for the specified resources
+        resource_keys = [
+            resource_key
+            for resource_key in section_resource_keys
+            if not resource_identifiers or resource_key in resource_identifiers
+        ]
+
+        if self.incremental:
+            self._build_incrementally(
+                resource_keys=resource_keys,
+                section_resource_keys=section_resource_keys,
+                source_store_key_versions=source_store_key_versions,
+            )
+            return
+
+        self._render_resources(
+            resource_keys=resource_keys, get_resource=self._get_resource
+        )
+
+    def _get_resource(self, resource_key):
+        try:
+            return self.source_store.get(resource_key)
+        except exceptions.InvalidKeyError:
+            logger.warning(
+                f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+            )
+            return None
+
+    def _build_incrementally(
+        self, resource_keys, section_resource_keys, source_store_key_versions
+    ):
+        """Renders only the resources that are new, changed since their page was rendered, or missing a page, and patches
+        the manifest of the site: the entries of rendered resources are recorded, and the pages and entries of resources
+        removed from the source store are removed.
+
+        Changes are detected from the versions of the resources reported by listing the source store (such as the
+        modification times or the ETags of their objects), without reading the resources themselves.
+
+        Only resource_keys (the resources requested by the caller) are rendered into a valid manifest of the section.
+        If the section has no manifest yet, or it was rendered differently, all section_resource_keys are rendered
+        instead, since the index of the site is built from the manifest alone.
+        """
+        manifest = self.target_store.get_manifest()
+        section_manifest = manifest.get("sections", {}).get(self.name) or {}
+        rendered_resources = {
+            tuple(entry["key"]): entry
+            for entry in section_manifest.get("resources", [])
+        }
+
+        source_key_tuples = {
+            source_store_key.to_tuple()
+            for source_store_key in source_store_key_versions
+        }
+        page_store_backend = self.target_store.store_backends[
+            self.source_store.key_class
+        ]
+        for key_tuple in list(rendered_resources.keys()):
+            if key_tuple not in source_key_tuples:
+                del rendered_resources[key_tuple]
+                if page_store_backend.has_key(key_tuple):
+                    page_store_backend.remove_key(key_tuple)
+
+        # Pages rendered with another renderer, view or version must all be rendered again.
+        fingerprint = self._get_rendering_fingerprint()
+        if section_manifest.get("fingerprint") != fingerprint:
+            rendered_resources = {}
+            resource_keys = section_resource_keys
+
+        page_key_tuples = {tuple(key) for key in page_store_backend.list_keys()}
+        changed_resource_keys = []
+        resource_versions = {}
+        for resource_key in resource_keys:
+            key_tuple = resource_key.to_tuple()
+            version = source_store_key_versions.get(resource_key)
+            if version is None and isinstance(resource_key, ValidationResultIdentifier):
+                # Validation results are written once, under the identifier of their run.
+                version = "run_id"
+            rendered_resource = rendered_resources.get(key_tuple)
+            if (
+                version is not None
+                and rendered_resource is not None
+                and rendered_resource.get("version") == version
+                and key_tuple in page_key_tuples
+            ):
+                continue
+
+            # Pages that fail to render are rendered again by the next build.
+            rendered_resources.pop(key_tuple, None)
+            changed_resource_keys.append(resource_key)
+            resource_versions[resource_key] = version
+
+        def record_rendered_resource(resource_key, resource):
+            key_tuple = resource_key.to_tuple()
+            rendered_resources[key_tuple] = {
+                "key": list(key_tuple),
+                "version": resource_versions[resource_key],
+                "index_link": self._get_index_link_info(resource),
+            }
+
+        self._render_resources(
+            resource_keys=changed_resource_keys,
+            get_resource=self._get_resource,
+            on_rendered=record_rendered_resource,
+        )
+
+        manifest.setdefault("sections", {})[self.name] = {
+            "fingerprint": fingerprint,
+            "resources": list(rendered_resources.values()),
+        }
+        self.target_store.set_manifest(manifest)
+
+    def _get_rendering_fingerprint(self):
+        import great_expectations as ge
+
+        rendering_config = json.dumps(
+            {
+                "renderer_class": self._get_class_path(self.renderer_class),
+                "renderer": self._renderer_config,
+                "view_class": self._get_class_path(self.view_class),
+                "view": self._view_config["config"],
+                "view_runtime_environment": self._view_config["runtime_environment"],
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return ":".join(
+            [
+                ge.__version__,
+                hashlib.sha256(rendering_config.encode("utf-8")).hexdigest(),
+                str(self.show_how_to_buttons),
+                str(self.data_context_id),
+            ]
+        )
+
+    @staticmethod
+    def _get_class_path(obj):
+        return f"{type(obj).__module__}.{type(obj).__qualname__}"
+
+    @staticmethod
+    def _get_index_link_info(resource):
+        """The parts of an index link that cannot be derived from the key of the resource."""
+        if not isinstance(resource, ExpectationSuiteValidationResult):
+            return None
+
+        return {
+            "validation_success": resource.success,
+            "batch_kwargs": convert_to_json_serializable(
+                resource.meta.get("batch_kwargs", {})
+            ),
+            "batch_spec": convert_to_json_serializable(
+                resource.meta.get("batch_spec", {})
+            ),
+        }
+
+    def _render_resources(self, resource_keys, get_resource, on_rendered=None):
+        """Renders the pages of the resources into the target store, in the order of their keys.
+
+        :param get_resource: returns the resource of a key (or None if it cannot be retrieved)
+        :param on_rendered: called with the key and the resource of every page written to the target store
+        """
+        if self.max_workers is not None and self.max_workers > 1:
+            self._render_resources_concurrently(
+                resource_keys=resource_keys,
+                get_resource=get_resource,
+                on_rendered=on_rendered,
+            )
+            return
+
+        for resource_key in resource_keys:
+            resource = get_resource(resource_key)
+            if resource is None:
+                continue
+
+            self._log_rendering(resource_key)
             try:
-                resource = self.source_store.get(resource_key)
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+                self._write_page(
+                    resource_key=resource_key,
+                    content=_render_page(
+                        renderer=self.renderer_class,
+                        view=self.view_class,
+                        resource=resource,
+                        **self._get_render_page_kwargs(),
+                    ),
                 )
+            except Exception as e:
+                self._log_rendering_error(e)
                 continue
 
-            if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.expectation_suite_name
-                logger.debug(
-                    "        Rendering expectation suite {}".format(
-                        expectation_suite_name
+            if on_rendered is not None:
+                on_rendered(resource_key, resource)
+
+    def _render_resources_concurrently(
+        self, resource_keys, get_resource, on_rendered=None
+    ):
+        """Pipelines the retrieval of the resources and the writing of their pages, in a pool of threads, with the
+        (CPU bound) rendering of the pages, in a pool of worker processes.
+
+        Every stage keeps at most twice max_workers resources in flight, and consumes them in the order of their keys,
+        so that the pages (and the calls to on_rendered) are the same as those of a sequential build.
+        """
+        window = 2 * self.max_workers
+        indexed_resource_keys = iter(resource_keys)
+        retrievals = deque()
+        renderings = deque()
+        writes = deque()
+        render_page_kwargs = self._get_render_page_kwargs()
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_initialize_rendering_worker,
+            initargs=(self.renderer_class, self._view_config),
+        ) as render_executor, ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as io_executor:
+
+            def submit_retrievals():
+                for resource_key in islice(
+                    indexed_resource_keys, window - len(retrievals)
+                ):
+                    retrievals.append(
+                        (resource_key, io_executor.submit(get_resource, resource_key))
                     )
-                )
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = (
-                    resource_key.expectation_suite_identifier.expectation_suite_name
-                )
-                if self.name == "profiling":
-                    logger.debug(
-                        "        Rendering profiling for batch {}".format(
-                            resource_key.batch_identifier
+
+            submit_retrievals()
+            while retrievals or renderings or writes:
+                if retrievals and len(renderings) < window:
+                    resource_key, retrieval = retrievals.popleft()
+                    submit_retrievals()
+                    resource = retrieval.result()
+                    if resource is not None:
+                        self._log_rendering(resource_key)
+                        renderings.append(
+                            (
+                                resource_key,
+                                resource,
+                                render_executor.submit(
+                                    _render_page_in_worker,
+                                    resource=resource,
+                                    **render_page_kwargs,
+                                ),
+                            )
+                        )
+                elif renderings and len(writes) < window:
+                    resource_key, resource, rendering = renderings.popleft()
+                    try:
+                        content = rendering.result()
+                    except Exception as e:
+                        self._log_rendering_error(e)
+                        continue
+
+                    writes.append(
+                        (
+                            resource_key,
+                            resource,
+                            io_executor.submit(
+                                self._write_page,
+                                resource_key=resource_key,
+                                content=content,
+                            ),
                         )
                     )
                 else:
+                    resource_key, resource, write = writes.popleft()
+                    try:
+                        write.result()
+                    except Exception as e:
+                        self._log_rendering_error(e)
+                        continue
 
-                    logger.debug(
-                        "        Rendering validation: run name: {}, run time: {}, suite {} for batch {}".format(
-                            run_name,
-                            run_time,
-                            expectation_suite_name,
-                            resource_key.batch_identifier,
-                        )
-                    )
+                    if on_rendered is not None:
+                        on_rendered(resource_key, resource)
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
-
-                if self.ge_cloud_mode:
-                    self.target_store.set(
-                        GeCloudIdentifier(
-                            resource_type="rendered_data_doc",
-                        ),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.ge_cloud_id,
-                    )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
+    def _get_render_page_kwargs(self):
+        return {
+            "data_context_id": self.data_context_id,
+            "show_how_to_buttons": self.show_how_to_buttons,
+            "ge_cloud_mode": self.ge_cloud_mode,
+        }
+
+    def _log_rendering(self, resource_key):
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.expectation_suite_name
+            logger.debug(
+                "        Rendering expectation suite {}".format(expectation_suite_name)
+            )
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = (
+                resource_key.expectation_suite_identifier.expectation_suite_name
+            )
+            if self.name == "profiling":
+                logger.debug(
+                    "        Rendering profiling for batch {}".format(
+                        resource_key.batch_identifier
                     )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
+                )
+            else:
+
+                logger.debug(
+                    "        Rendering validation: run name: {}, run time: {}, suite {} for batch {}".format(
+                        run_name,
+                        run_time,
+                        expectation_suite_name,
+                        resource_key.batch_identifier,
                     )
-            except Exception as e:
-                exception_message = f"""\
+                )
+
+    def _write_page(self, resource_key, content):
+        if self.ge_cloud_mode:
+            self.target_store.set(
+                GeCloudIdentifier(
+                    resource_type="rendered_data_doc",
+                ),
+                content,
+                source_type=resource_key.resource_type,
+                source_id=resource_key.ge_cloud_id,
+            )
+        else:
+            # Verify type
+            self.target_store.set(
+                SiteSectionIdentifier(
+                    site_section_name=self.name,
+                    resource_identifier=resource_key,
+                ),
+                content,
+            )
+
+    @staticmethod
+    def _log_rendering_error(e):
+        exception_message = f"""\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
                 """
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{str(e)}".  '
-                    f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)
+        exception_traceback = traceback.format_exc()
+        exception_message += (
+            f'{type(e).__name__}: "{str(e)}".  ' f'Traceback: "{exception_traceback}".'
+        )
+        logger.error(exception_message)
+
+
+def _render_page(
+    renderer, view, resource, data_context_id, show_how_to_buttons, ge_cloud_mode
+):
+    """Renders the page of a resource: its rendered content in GE Cloud mode, and its viewable (HTML) content
+    otherwise."""
+    rendered_content = renderer.render(resource)
+    if ge_cloud_mode:
+        return rendered_content
+
+    return view.render(
+        rendered_content,
+        data_context_id=data_context_id,
+        show_how_to_buttons=show_how_to_buttons,
+    )
+
+
+# The renderer and the view of the site section built by a worker process.
+_rendering_worker_renderer = None
+_rendering_worker_view = None
+
+
+def _initialize_rendering_worker(renderer, view_config):
+    global _rendering_worker_renderer, _rendering_worker_view
+    _rendering_worker_renderer = renderer
+    _rendering_worker_view = instantiate_class_from_config(**view_config)
+
+
+def _render_page_in_worker(resource, **kwargs):
+    return _render_page(
+        renderer=_rendering_worker_renderer,
+        view=_rendering_worker_view,
+        resource=resource,
+        **kwargs,
+    )
 
 
 class DefaultSiteIndexBuilder:
@@ -518,6 +867,7 @@ class DefaultSiteIndexBuilder:
         view=None,
         data_context_id=None,
         source_stores=None,
+        incremental=False,
         **kwargs,
     ):
         # NOTE: This method is almost identical to DefaultSiteSectionBuilder
@@ -530,6 +880,7 @@ class DefaultSiteIndexBuilder:
         self.show_how_to_buttons = show_how_to_buttons
         self.source_stores = source_stores or {}
         self.site_section_builders_config = site_section_builders_config or {}
+        self.incremental = incremental
 
         if renderer is None:
             renderer = {
@@ -633,6 +984,67 @@ class DefaultSiteIndexBuilder:
 
         return index_links_dict
 
+    def _add_manifest_resources_to_index_links_dict(self, index_links_dict):
+        """Adds the links to the pages recorded in the manifest of the site (with the success, batch_kwargs and batch_spec
+        of their validation results, as recorded when their pages were rendered) to the index."""
+        manifest_sections = self.target_store.get_manifest().get("sections", {})
+        for section_name in ["expectations", "profiling", "validations"]:
+            if (
+                not self.site_section_builders_config.get(section_name, "None")
+                or self.site_section_builders_config.get(section_name, "None")
+                in FALSEY_YAML_STRINGS
+            ):
+                continue
+
+            resources = manifest_sections.get(section_name, {}).get("resources", [])
+            if section_name == "expectations":
+                for resource in resources:
+                    self.add_resource_info_to_index_links_dict(
+                        index_links_dict=index_links_dict,
+                        expectation_suite_name=ExpectationSuiteIdentifier.from_tuple(
+                            tuple(resource["key"])
+                        ).expectation_suite_name,
+                        section_name=section_name,
+                    )
+                continue
+
+            validation_result_keys_and_links = [
+                (
+                    ValidationResultIdentifier.from_tuple(tuple(resource["key"])),
+                    resource["index_link"],
+                )
+                for resource in resources
+            ]
+            if section_name == "validations":
+                validation_result_keys_and_links = sorted(
+                    validation_result_keys_and_links,
+                    key=lambda x: x[0].run_id.run_time,
+                    reverse=True,
+                )
+                if self.validation_results_limit:
+                    validation_result_keys_and_links = validation_result_keys_and_links[
+                        : self.validation_results_limit
+                    ]
+            for validation_result_key, index_link in validation_result_keys_and_links:
+                batch_kwargs = index_link["batch_kwargs"]
+                batch_spec = index_link["batch_spec"]
+                self.add_resource_info_to_index_links_dict(
+                    index_links_dict=index_links_dict,
+                    expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+                    section_name=section_name,
+                    batch_identifier=validation_result_key.batch_identifier,
+                    run_id=validation_result_key.run_id,
+                    validation_success=index_link["validation_success"]
+                    if section_name == "validations"
+                    else None,
+                    run_time=validation_result_key.run_id.run_time,
+                    run_name=validation_result_key.run_id.run_name,
+                    asset_name=batch_kwargs.get("data_asset_name")
+                    or batch_spec.get("data_asset_name"),
+                    batch_kwargs=batch_kwargs,
+                    batch_spec=batch_spec,
+                )
+
     def get_calls_to_action(self):
         usage_statistics = None
         # db_driver = None
@@ -738,17 +1150,27 @@ class DefaultSiteIndexBuilder:
         if self.show_how_to_buttons:
             index_links_dict["cta_object"] = self.get_calls_to_action()
 
+        if self.incremental:
+            # Incremental builds patch the index from the manifest of the site, in which section builders record the
+            # pages they render and remove, instead of listing the site and reading every validation result again.
+            self._add_manifest_resources_to_index_links_dict(
+                index_links_dict=index_links_dict
+            )
+            return self._write_index_page(index_links_dict=index_links_dict)
+
         if (
             # TODO why is this duplicated?
             self.site_section_builders_config.get("expectations", "None")
             and self.site_section_builders_config.get("expectations", "None")
             not in FALSEY_YAML_STRINGS
         ):
-            expectation_suite_source_keys = self.data_context.stores[
-                self.site_section_builders_config["expectations"].get(
-                    "source_store_name"
-                )
-            ].list_keys()
+            expectation_suite_source_keys = set(
+                self.data_context.stores[
+                    self.site_section_builders_config["expectations"].get(
+                        "source_store_name"
+                    )
+                ].list_keys()
+            )
             expectation_suite_site_keys = [
                 ExpectationSuiteIdentifier.from_tuple(expectation_suite_tuple)
                 for expectation_suite_tuple in self.target_store.store_backends[
@@ -791,9 +1213,13 @@ class DefaultSiteIndexBuilder:
                 not in FALSEY_YAML_STRINGS
                 else "profiling"
             )
-            validation_and_profiling_result_source_keys = self.data_context.stores[
-                self.site_section_builders_config[source_store].get("source_store_name")
-            ].list_keys()
+            validation_and_profiling_result_source_keys = set(
+                self.data_context.stores[
+                    self.site_section_builders_config[source_store].get(
+                        "source_store_name"
+                    )
+                ].list_keys()
+            )
             validation_and_profiling_result_site_keys = [
                 ValidationResultIdentifier.from_tuple(validation_result_tuple)
                 for validation_result_tuple in self.target_store.store_backends[
@@ -921,6 +1347,9 @@ class DefaultSiteIndexBuilder:
                     )
                     logger.warning(error_msg)
 
+        return self._write_index_page(index_links_dict=index_links_dict)
+
+    def _write_index_page(self, index_links_dict):
         try:
             rendered_content = self.renderer_class.render(index_links_dict)
             viewable_content = self.view_class.render(
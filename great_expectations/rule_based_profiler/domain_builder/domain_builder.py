@@ -5,6 +5,7 @@ import great_expectations.exceptions as ge_exceptions
 from great_expectations import DataContext
 from great_expectations.rule_based_profiler.domain_builder import Domain
 from great_expectations.rule_based_profiler.parameter_builder import ParameterContainer
+from great_expectations.rule_based_profiler.util import BatchCache
 from great_expectations.rule_based_profiler.util import (
     get_batch_ids as get_batch_ids_from_batch_request,
 )
@@ -38,6 +39,8 @@ class DomainBuilder(ABC):
         self._data_context = data_context
         self._batch_request = batch_request
 
+        self._batch_cache: Optional[BatchCache] = None
+
     def get_domains(
         self,
         variables: Optional[ParameterContainer] = None,
@@ -70,6 +73,7 @@ class DomainBuilder(ABC):
             domain=None,
             variables=variables,
             parameters=None,
+            batch_cache=self._batch_cache,
         )
 
     def _get_batch_ids(
@@ -82,6 +86,7 @@ class DomainBuilder(ABC):
             domain=None,
             variables=variables,
             parameters=None,
+            batch_cache=self._batch_cache,
         )
 
     def get_batch_id(
@@ -104,3 +109,12 @@ class DomainBuilder(ABC):
     @property
     def data_context(self) -> DataContext:
         return self._data_context
+
+    @property
+    def batch_cache(self) -> Optional[BatchCache]:
+        """Batches and validators shared by the builders of the Profiler during a profiling run (see BatchCache)."""
+        return self._batch_cache
+
+    @batch_cache.setter
+    def batch_cache(self, batch_cache: Optional[BatchCache]):
+        self._batch_cache = batch_cache
@@ -1,5 +1,5 @@
 from numbers import Number
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from great_expectations import DataContext
 from great_expectations.rule_based_profiler.domain_builder import Domain
@@ -8,6 +8,7 @@ from great_expectations.rule_based_profiler.parameter_builder import (
     ParameterContainer,
     build_parameter_container,
 )
+from great_expectations.validator.validation_graph import MetricConfiguration
 from great_expectations.validator.validator import Validator
 
 
@@ -55,6 +56,23 @@ class MetricParameterBuilder(ParameterBuilder):
         self._enforce_numeric_metric = enforce_numeric_metric
         self._replace_nan_with_zero = replace_nan_with_zero
 
+    def get_metric_configurations(
+        self,
+        domain: Domain,
+        *,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        return self.build_metric_configurations(
+            batch_ids=[self.get_batch_id(variables=variables)],
+            metric_name=self._metric_name,
+            metric_domain_kwargs=self._metric_domain_kwargs,
+            metric_value_kwargs=self._metric_value_kwargs,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
     def _build_parameters(
         self,
         parameter_container: ParameterContainer,
@@ -18,6 +18,7 @@ from great_expectations.rule_based_profiler.util import (
     get_parameter_value_and_validate_return_type,
 )
 from great_expectations.util import is_numeric
+from great_expectations.validator.validation_graph import MetricConfiguration
 from great_expectations.validator.validator import Validator
 
 MAX_DECIMALS: int = 9
@@ -61,6 +62,9 @@ class NumericMetricRangeMultiBatchParameterBuilder(ParameterBuilder):
         replace_nan_with_zero: Optional[Union[str, bool]] = True,
         false_positive_rate: Optional[Union[str, float]] = 5.0e-2,
         num_bootstrap_samples: Optional[Union[str, int]] = None,
+        bootstrap_random_seed: Optional[Union[str, int]] = None,
+        bootstrap_memory_budget_bytes: Optional[Union[str, int]] = None,
+        bootstrap_max_workers: Optional[Union[str, int]] = None,
         round_decimals: Optional[Union[str, int]] = None,
         truncate_values: Optional[
             Union[str, Dict[str, Union[Optional[int], Optional[float]]]]
@@ -84,6 +88,12 @@ class NumericMetricRangeMultiBatchParameterBuilder(ParameterBuilder):
             identifying unexpected values as judged by the upper- and lower- quantiles of the observed metric data.
             num_bootstrap_samples: Applicable only for the "bootstrap" sampling method -- if omitted (default), then
             9999 is used (default in "https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.bootstrap.html").
+            bootstrap_random_seed: Applicable only for the "bootstrap" sampling method -- seed of the random number
+            generator drawing the bootstrap samples (if omitted, then the estimates are not reproducible).
+            bootstrap_memory_budget_bytes: Applicable only for the "bootstrap" sampling method -- upper bound on the
+            memory used for drawing bootstrap samples at a time (if omitted, then 64 MiB is used).
+            bootstrap_max_workers: Applicable only for the "bootstrap" sampling method -- if greater than 1, then
+            blocks of bootstrap samples are drawn in a pool of that many worker processes.
             round_decimals: user-configured non-negative integer indicating the number of decimals of the
             rounding precision of the computed parameter values (i.e., min_value, max_value) prior to packaging them on
             output.  If omitted, then no rounding is performed, unless the computed value is already an integer.
@@ -110,6 +120,9 @@ class NumericMetricRangeMultiBatchParameterBuilder(ParameterBuilder):
         self._false_positive_rate = false_positive_rate
 
         self._num_bootstrap_samples = num_bootstrap_samples
+        self._bootstrap_random_seed = bootstrap_random_seed
+        self._bootstrap_memory_budget_bytes = bootstrap_memory_budget_bytes
+        self._bootstrap_max_workers = bootstrap_max_workers
 
         self._round_decimals = round_decimals
 
@@ -131,6 +144,31 @@ detected.
             )
         self._truncate_values = truncate_values
 
+    def get_metric_configurations(
+        self,
+        domain: Domain,
+        *,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        batch_ids: Optional[List[str]] = self.get_batch_ids(
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        if not batch_ids:
+            return []
+
+        return self.build_metric_configurations(
+            batch_ids=batch_ids,
+            metric_name=self._metric_name,
+            metric_domain_kwargs=self._metric_domain_kwargs,
+            metric_value_kwargs=self._metric_value_kwargs,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
     def _build_parameters(
         self,
         parameter_container: ParameterContainer,
@@ -324,10 +362,42 @@ detected.
         else:
             n_resamples = num_bootstrap_samples
 
+        # Obtain bootstrap_random_seed override from rule state (i.e., variables and parameters); from instance variable otherwise.
+        random_seed: Optional[int] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self._bootstrap_random_seed,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        # Obtain bootstrap_memory_budget_bytes override from rule state (i.e., variables and parameters); from instance variable otherwise.
+        memory_budget_bytes: Optional[
+            int
+        ] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self._bootstrap_memory_budget_bytes,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        # Obtain bootstrap_max_workers override from rule state (i.e., variables and parameters); from instance variable otherwise.
+        max_workers: Optional[int] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self._bootstrap_max_workers,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+
         return compute_bootstrap_quantiles(
             metric_values=metric_values,
             false_positive_rate=false_positive_rate,
             n_resamples=n_resamples,
+            random_seed=random_seed,
+            memory_budget_bytes=memory_budget_bytes,
+            max_workers=max_workers,
         )
 
     def _get_truncate_values_using_heuristics(
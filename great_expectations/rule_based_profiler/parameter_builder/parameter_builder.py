@@ -1,7 +1,7 @@
 import copy
 from abc import ABC, abstractmethod
 from numbers import Number
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -9,7 +9,10 @@ import great_expectations.exceptions as ge_exceptions
 from great_expectations.data_context import DataContext
 from great_expectations.rule_based_profiler.domain_builder import Domain
 from great_expectations.rule_based_profiler.parameter_builder import ParameterContainer
-from great_expectations.rule_based_profiler.util import build_metric_domain_kwargs
+from great_expectations.rule_based_profiler.util import (
+    BatchCache,
+    build_metric_domain_kwargs,
+)
 from great_expectations.rule_based_profiler.util import (
     get_batch_ids as get_batch_ids_from_batch_request,
 )
@@ -63,6 +66,9 @@ class ParameterBuilder(ABC):
         self._data_context = data_context
         self._batch_request = batch_request
 
+        self._resolved_metrics: Dict[Tuple, Any] = {}
+        self._batch_cache: Optional[BatchCache] = None
+
     def build_parameters(
         self,
         parameter_container: ParameterContainer,
@@ -89,6 +95,19 @@ class ParameterBuilder(ABC):
     ):
         pass
 
+    def get_metric_configurations(
+        self,
+        domain: Domain,
+        *,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Returns the metrics that build_parameters() computes for the domain, if they are known in advance, so that the
+        Profiler can resolve the metrics of all of its rules and parameter builders together (see "resolved_metrics").
+        """
+        return []
+
     def get_validator(
         self,
         domain: Optional[Domain] = None,
@@ -102,6 +121,7 @@ class ParameterBuilder(ABC):
             domain=domain,
             variables=variables,
             parameters=parameters,
+            batch_cache=self._batch_cache,
         )
 
     def get_batch_ids(
@@ -116,6 +136,7 @@ class ParameterBuilder(ABC):
             domain=domain,
             variables=variables,
             parameters=parameters,
+            batch_cache=self._batch_cache,
         )
 
     def get_batch_id(
@@ -192,9 +213,12 @@ class ParameterBuilder(ABC):
             "metric_value_kwargs": metric_value_kwargs,
             "metric_dependencies": None,
         }
-        metric_value: Union[Any, Number] = validator.get_metric(
-            metric=MetricConfiguration(**metric_configuration_arguments)
-        )
+        metric_value: Union[Any, Number] = self.resolve_metrics(
+            validator=validator,
+            metric_configurations=[
+                MetricConfiguration(**metric_configuration_arguments)
+            ],
+        )[0]
         if enforce_numeric_metric:
             if not is_numeric(value=metric_value):
                 raise ge_exceptions.ProfilerExecutionError(
@@ -267,21 +291,28 @@ class ParameterBuilder(ABC):
             parameters=parameters,
         )
 
-        metric_values: List[Union[Any, Number]] = []
+        metric_configurations: List[MetricConfiguration] = []
 
-        metric_value: Union[Any, Number]
         batch_id: str
         for batch_id in batch_ids:
             metric_domain_kwargs["batch_id"] = batch_id
-            metric_configuration_arguments: Dict[str, Any] = {
-                "metric_name": metric_name,
-                "metric_domain_kwargs": metric_domain_kwargs,
-                "metric_value_kwargs": metric_value_kwargs,
-                "metric_dependencies": None,
-            }
-            metric_value = validator.get_metric(
-                metric=MetricConfiguration(**metric_configuration_arguments)
+            metric_configurations.append(
+                MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    metric_value_kwargs=metric_value_kwargs,
+                    metric_dependencies=None,
+                )
             )
+
+        # The metric is computed on all batches in a single pass over one validation graph (rather than one per batch).
+        metric_values: List[Union[Any, Number]] = self.resolve_metrics(
+            validator=validator, metric_configurations=metric_configurations
+        )
+
+        idx: int
+        metric_value: Union[Any, Number]
+        for idx, metric_value in enumerate(metric_values):
             if enforce_numeric_metric:
                 if not is_numeric(value=metric_value):
                     raise ge_exceptions.ProfilerExecutionError(
@@ -295,9 +326,7 @@ class ParameterBuilder(ABC):
                             f"""Computation of metric "{metric_name}" resulted in NaN ("not a number") value.
 """
                         )
-                    metric_value = 0.0
-
-            metric_values.append(metric_value)
+                    metric_values[idx] = 0.0
 
         return {
             "metric_values": metric_values,
@@ -312,6 +341,95 @@ class ParameterBuilder(ABC):
             },
         }
 
+    def build_metric_configurations(
+        self,
+        batch_ids: List[str],
+        metric_name: str,
+        metric_domain_kwargs: Optional[Union[str, dict]] = None,
+        metric_value_kwargs: Optional[Union[str, dict]] = None,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """Builds the configurations of the metric computed by get_metric() and get_metrics() on the given batches."""
+        # Obtain value kwargs from rule state (i.e., variables and parameters); from instance variable otherwise.
+        metric_value_kwargs = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=metric_value_kwargs,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        batch_id: str
+        return [
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=build_metric_domain_kwargs(
+                    batch_id=batch_id,
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                ),
+                metric_value_kwargs=metric_value_kwargs,
+                metric_dependencies=None,
+            )
+            for batch_id in batch_ids
+        ]
+
+    def resolve_metrics(
+        self,
+        validator: Validator,
+        metric_configurations: List[MetricConfiguration],
+    ) -> List[Any]:
+        """
+        Returns the values of the metrics (in order), taking those resolved ahead of time from "resolved_metrics" and
+        resolving all others together, using one validation graph.
+        """
+        metric_ids: List[Tuple] = [
+            metric_configuration.id for metric_configuration in metric_configurations
+        ]
+        unresolved_metric_configurations: Dict[Tuple, MetricConfiguration] = {
+            metric_id: metric_configuration
+            for metric_id, metric_configuration in zip(
+                metric_ids, metric_configurations
+            )
+            if metric_id not in self._resolved_metrics
+        }
+
+        metric_values: Dict[Tuple, Any] = {}
+        if unresolved_metric_configurations:
+            # Metric ids are captured before resolution, since the Validator adds default kwargs to the configurations.
+            metric_values = validator.get_metrics(
+                metrics=unresolved_metric_configurations
+            )
+
+        return [
+            metric_values[metric_id]
+            if metric_id in metric_values
+            else self._resolved_metrics[metric_id]
+            for metric_id in metric_ids
+        ]
+
+    @property
+    def resolved_metrics(self) -> Dict[Tuple, Any]:
+        """Metric values, by metric id, resolved ahead of time by the Profiler (see get_metric_configurations)."""
+        return self._resolved_metrics
+
+    @resolved_metrics.setter
+    def resolved_metrics(self, resolved_metrics: Optional[Dict[Tuple, Any]]):
+        self._resolved_metrics = resolved_metrics or {}
+
+    @property
+    def batch_cache(self) -> Optional[BatchCache]:
+        """Batches and validators shared by the builders of the Profiler during a profiling run (see BatchCache)."""
+        return self._batch_cache
+
+    @batch_cache.setter
+    def batch_cache(self, batch_cache: Optional[BatchCache]):
+        self._batch_cache = batch_cache
+
     @property
     def parameter_name(self) -> str:
         return self._parameter_name
@@ -1,10 +1,12 @@
+import logging
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations import DataContext
 from great_expectations.core import ExpectationConfiguration, ExpectationSuite
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.rule_based_profiler.domain_builder import Domain
 from great_expectations.rule_based_profiler.domain_builder.domain_builder import (
     DomainBuilder,
 )
@@ -19,6 +21,11 @@ from great_expectations.rule_based_profiler.parameter_builder.parameter_containe
     build_parameter_container_for_variables,
 )
 from great_expectations.rule_based_profiler.rule.rule import Rule
+from great_expectations.rule_based_profiler.util import BatchCache
+from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+logger = logging.getLogger(__name__)
 
 
 class Profiler:
@@ -225,13 +232,135 @@ class Profiler:
                 profiler_config=self._profiler_config,
             )
 
+        # The batches of every batch request are loaded once for all rules (and their builders) of the profiling run.
+        batch_cache: BatchCache = BatchCache()
+        self._set_batch_cache(batch_cache=batch_cache)
+        try:
+            expectation_configurations: List[
+                ExpectationConfiguration
+            ] = self._generate_expectation_configurations()
+        finally:
+            self._set_batch_cache(batch_cache=None)
+            batch_cache.clear()
+
+        expectation_configuration: ExpectationConfiguration
+        for expectation_configuration in expectation_configurations:
+            expectation_suite.add_expectation(
+                expectation_configuration=expectation_configuration
+            )
+
+        return expectation_suite
+
+    def _generate_expectation_configurations(self) -> List[ExpectationConfiguration]:
+        rule: Rule
+        rule_domains: List[Tuple[Rule, List[Domain]]] = [
+            (rule, rule.get_domains()) for rule in self._rules
+        ]
+
+        resolved_metrics: Dict[Tuple, Any] = self._resolve_metrics(
+            rule_domains=rule_domains
+        )
+
+        expectation_configurations: List[ExpectationConfiguration] = []
+
+        domains: List[Domain]
+        parameter_builder: ParameterBuilder
+        for rule, domains in rule_domains:
+            for parameter_builder in rule.parameter_builders or []:
+                parameter_builder.resolved_metrics = resolved_metrics
+
+            try:
+                expectation_configurations.extend(rule.generate(domains=domains))
+            finally:
+                for parameter_builder in rule.parameter_builders or []:
+                    parameter_builder.resolved_metrics = None
+
+        return expectation_configurations
+
+    def _set_batch_cache(self, batch_cache: Optional[BatchCache]):
         rule: Rule
         for rule in self._rules:
-            expectation_configurations: List[ExpectationConfiguration] = rule.generate()
-            expectation_configuration: ExpectationConfiguration
-            for expectation_configuration in expectation_configurations:
-                expectation_suite.add_expectation(
-                    expectation_configuration=expectation_configuration
+            rule.domain_builder.batch_cache = batch_cache
+            parameter_builder: ParameterBuilder
+            for parameter_builder in rule.parameter_builders or []:
+                parameter_builder.batch_cache = batch_cache
+
+    @staticmethod
+    def _resolve_metrics(
+        rule_domains: List[Tuple[Rule, List[Domain]]]
+    ) -> Dict[Tuple, Any]:
+        """
+        Resolves the metrics, which the parameter builders of all rules compute for the domains of their rules, ahead of
+        evaluating the rules.  The metrics are collected from all rules, parameter builders, domains, and batches first,
+        and then resolved together (in a single pass over one validation graph per execution engine), so that the
+        execution engine can bundle their computations and resolve independent metrics concurrently.
+
+        Metrics, whose arguments depend on parameters built by other parameter builders, are not known in advance; they
+        are resolved when the rule is evaluated.
+
+        :return: metric values by metric id
+        """
+        metric_configurations_by_execution_engine: Dict[
+            int, Tuple[Validator, Dict[Tuple, MetricConfiguration]]
+        ] = {}
+
+        rule: Rule
+        domains: List[Domain]
+        for rule, domains in rule_domains:
+            variables: ParameterContainer = rule.variables
+            parameter_builder: ParameterBuilder
+            for parameter_builder in rule.parameter_builders or []:
+                domain: Domain
+                for domain in domains:
+                    try:
+                        # No parameters have been built yet; references to them raise KeyError.
+                        metric_configurations: List[
+                            MetricConfiguration
+                        ] = parameter_builder.get_metric_configurations(
+                            domain=domain, variables=variables, parameters={}
+                        )
+                        if not metric_configurations:
+                            continue
+
+                        validator: Optional[
+                            Validator
+                        ] = parameter_builder.get_validator(
+                            domain=domain, variables=variables, parameters={}
+                        )
+                        if validator is None:
+                            continue
+                    except (KeyError, ge_exceptions.ProfilerExecutionError):
+                        continue
+
+                    (
+                        _,
+                        engine_metric_configurations,
+                    ) = metric_configurations_by_execution_engine.setdefault(
+                        id(validator.execution_engine), (validator, {})
+                    )
+                    engine_metric_configurations.update(
+                        {
+                            metric_configuration.id: metric_configuration
+                            for metric_configuration in metric_configurations
+                        }
+                    )
+
+        resolved_metrics: Dict[Tuple, Any] = {}
+        for (
+            validator,
+            engine_metric_configurations,
+        ) in metric_configurations_by_execution_engine.values():
+            try:
+                resolved_metrics.update(
+                    validator.get_metrics(metrics=engine_metric_configurations)
+                )
+            except (
+                ge_exceptions.MetricResolutionError,
+                ge_exceptions.MetricComputationError,
+            ) as e:
+                # The metrics are resolved (and their errors raised) when the rules are evaluated instead.
+                logger.warning(
+                    f"Unable to resolve the metrics of the profiler rules ahead of time: {e}"
                 )
 
-        return expectation_suite
+        return resolved_metrics
@@ -41,20 +41,29 @@ class Rule:
 
         self._parameters = {}
 
+    def get_domains(self) -> List[Domain]:
+        """
+        Builds the list of Domain objects, to which the rule applies, using its domain builder.
+
+        :return: List of Domain objects of the rule
+        """
+        return self._domain_builder.get_domains(variables=self.variables)
+
     def generate(
         self,
+        domains: Optional[List[Domain]] = None,
     ) -> List[ExpectationConfiguration]:
         """
         Builds a list of Expectation Configurations, returning a single Expectation Configuration entry for every
         ConfigurationBuilder available based on the instantiation.
 
+        :param domains: Domain objects of the rule, if already built (using get_domains); built otherwise
         :return: List of Corresponding Expectation Configurations representing every configured rule
         """
         expectation_configurations: List[ExpectationConfiguration] = []
 
-        domains: List[Domain] = self._domain_builder.get_domains(
-            variables=self.variables
-        )
+        if domains is None:
+            domains = self.get_domains()
 
         domain: Domain
         for domain in domains:
@@ -85,6 +94,18 @@ class Rule:
 
         return expectation_configurations
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def domain_builder(self) -> DomainBuilder:
+        return self._domain_builder
+
+    @property
+    def parameter_builders(self) -> List[ParameterBuilder]:
+        return self._parameter_builders
+
     @property
     def variables(self) -> ParameterContainer:
         # Returning a copy of the "self._variables" state variable in order to prevent write-before-read hazard.
@@ -1,5 +1,6 @@
 import copy
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from numbers import Number
 from typing import Any, Dict, List, Optional, Union
 
@@ -17,6 +18,54 @@ from great_expectations.validator.validator import Validator
 
 NP_EPSILON: Union[Number, np.float64] = np.finfo(float).eps
 
+# Upper bound on the memory used at a time for drawing and reducing bootstrap resamples (per process).
+DEFAULT_BOOTSTRAP_MEMORY_BUDGET_BYTES: int = 64 * 1024 * 1024
+
+
+class BatchCache:
+    """
+    Holds the Batch objects and the Validator, obtained for every batch request, for the duration of a profiling run,
+    so that the batches matching a batch request are loaded (and a Validator for them is created) only once, no matter
+    how many rules, domains, and builders use the same batch request.
+    """
+
+    def __init__(self):
+        self._batch_lists: Dict[str, List[Batch]] = {}
+        self._validators: Dict[str, Validator] = {}
+
+    def get_batch_list(
+        self, data_context: DataContext, batch_request: BatchRequest
+    ) -> List[Batch]:
+        batch_list: Optional[List[Batch]] = self._batch_lists.get(batch_request.id)
+        if batch_list is None:
+            batch_list = data_context.get_batch_list(batch_request=batch_request)
+            self._batch_lists[batch_request.id] = batch_list
+
+        return batch_list
+
+    def get_validator(
+        self,
+        data_context: DataContext,
+        batch_request: BatchRequest,
+        expectation_suite_name: str,
+    ) -> Validator:
+        validator: Optional[Validator] = self._validators.get(batch_request.id)
+        if validator is None:
+            batch_list: List[Batch] = self.get_batch_list(
+                data_context=data_context, batch_request=batch_request
+            )
+            validator = data_context.get_validator(
+                batch_list=batch_list,
+                create_expectation_suite_with_name=expectation_suite_name,
+            )
+            self._validators[batch_request.id] = validator
+
+        return validator
+
+    def clear(self):
+        self._batch_lists.clear()
+        self._validators.clear()
+
 
 def get_validator(
     purpose: str,
@@ -26,6 +75,7 @@ def get_validator(
     domain: Optional[Domain] = None,
     variables: Optional[ParameterContainer] = None,
     parameters: Optional[Dict[str, ParameterContainer]] = None,
+    batch_cache: Optional[BatchCache] = None,
 ) -> Optional[Validator]:
     if batch_request is None:
         return None
@@ -47,6 +97,13 @@ def get_validator(
             f"{expectation_suite_name}_{domain.id}_suite_{str(uuid.uuid4())[:8]}"
         )
 
+    if batch_cache is not None:
+        return batch_cache.get_validator(
+            data_context=data_context,
+            batch_request=batch_request,
+            expectation_suite_name=expectation_suite_name,
+        )
+
     return data_context.get_validator(
         batch_request=batch_request,
         create_expectation_suite_with_name=expectation_suite_name,
@@ -59,6 +116,7 @@ def get_batch_ids(
     domain: Optional[Domain] = None,
     variables: Optional[ParameterContainer] = None,
     parameters: Optional[Dict[str, ParameterContainer]] = None,
+    batch_cache: Optional[BatchCache] = None,
 ) -> Optional[List[str]]:
     if batch_request is None:
         return None
@@ -70,7 +128,13 @@ def get_batch_ids(
         parameters=parameters,
     )
 
-    batch_list: List[Batch] = data_context.get_batch_list(batch_request=batch_request)
+    batch_list: List[Batch]
+    if batch_cache is None:
+        batch_list = data_context.get_batch_list(batch_request=batch_request)
+    else:
+        batch_list = batch_cache.get_batch_list(
+            data_context=data_context, batch_request=batch_request
+        )
 
     batch: Batch
     batch_ids: List[str] = [batch.id for batch in batch_list]
@@ -217,24 +281,108 @@ def compute_bootstrap_quantiles(
     metric_values: np.ndarray,
     false_positive_rate: np.float64,
     n_resamples: int,
+    random_seed: Optional[int] = None,
+    memory_budget_bytes: Optional[int] = None,
+    max_workers: Optional[int] = None,
 ) -> tuple:
-    bootstraps: np.ndarray = np.random.choice(
-        metric_values, size=(n_resamples, metric_values.size)
+    """
+    Estimates the lower and upper quantiles (as determined by false_positive_rate) of the distribution of metric_values
+    as the means of the corresponding quantiles of "n_resamples" bootstrap resamples of metric_values.
+
+    Instead of materializing all resamples at once, they are drawn and reduced in blocks, whose size is bounded by
+    "memory_budget_bytes".  Every block is drawn using its own random number generator, seeded from "random_seed", so
+    that the estimates are reproducible (given "random_seed"), no matter whether the blocks are processed sequentially
+    or in a pool of "max_workers" worker processes.  The pool parallelizes the blocks of this one estimate (not the
+    domains of a rule, whose parameters are built sequentially by parameter builders holding a DataContext, which
+    cannot be shipped to worker processes).
+    """
+    metric_values = np.asarray(metric_values, dtype=np.float64)
+    if memory_budget_bytes is None:
+        memory_budget_bytes = DEFAULT_BOOTSTRAP_MEMORY_BUDGET_BYTES
+
+    quantiles: np.ndarray = np.array(
+        [false_positive_rate / 2, 1.0 - (false_positive_rate / 2)]
     )
-    lower_quantile = np.mean(
-        np.quantile(
-            bootstraps,
-            q=false_positive_rate / 2,
-            axis=1,
-            interpolation="linear",  # can be omitted ("linear" is default)
-        )
+
+    # Every resample takes up its indices, its values, and the copy partitioned by np.quantile (8 bytes per element).
+    resample_size_bytes: int = 3 * 8 * metric_values.size
+    block_size: int = max(
+        1, min(n_resamples, memory_budget_bytes // resample_size_bytes)
     )
-    upper_quantile = np.mean(
+    block_sizes: List[int] = [block_size] * (n_resamples // block_size)
+    if n_resamples % block_size:
+        block_sizes.append(n_resamples % block_size)
+
+    block_seeds: List[int] = _draw_random_seeds(
+        random_number_generator=_get_random_number_generator(random_seed=random_seed),
+        size=len(block_sizes),
+    )
+
+    quantile_sums: List[np.ndarray]
+    if max_workers is not None and max_workers > 1 and len(block_sizes) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(block_sizes))
+        ) as executor:
+            quantile_sums = list(
+                executor.map(
+                    _sum_bootstrap_quantiles,
+                    [metric_values] * len(block_sizes),
+                    [quantiles] * len(block_sizes),
+                    block_sizes,
+                    block_seeds,
+                )
+            )
+    else:
+        quantile_sums = [
+            _sum_bootstrap_quantiles(
+                metric_values=metric_values,
+                quantiles=quantiles,
+                n_resamples=num_block_resamples,
+                random_seed=block_seed,
+            )
+            for num_block_resamples, block_seed in zip(block_sizes, block_seeds)
+        ]
+
+    lower_quantile, upper_quantile = np.sum(quantile_sums, axis=0) / n_resamples
+    return lower_quantile, upper_quantile
+
+
+def _sum_bootstrap_quantiles(
+    metric_values: np.ndarray,
+    quantiles: np.ndarray,
+    n_resamples: int,
+    random_seed: int,
+) -> np.ndarray:
+    """Draws a block of bootstrap resamples of metric_values and sums up their quantiles (one sum per quantile)."""
+    bootstraps: np.ndarray = _get_random_number_generator(
+        random_seed=random_seed
+    ).choice(metric_values, size=(n_resamples, metric_values.size))
+    return np.sum(
         np.quantile(
             bootstraps,
-            q=1.0 - (false_positive_rate / 2),
+            q=quantiles,
             axis=1,
             interpolation="linear",  # can be omitted ("linear" is default)
-        )
+        ),
+        axis=1,
     )
-    return lower_quantile, upper_quantile
+
+
+def _get_random_number_generator(
+    random_seed: Optional[int] = None,
+) -> Union["np.random.Generator", np.random.RandomState]:
+    # numpy.random.Generator is available in numpy 1.17 and newer.
+    if hasattr(np.random, "default_rng"):
+        return np.random.default_rng(random_seed)
+
+    return np.random.RandomState(random_seed)
+
+
+def _draw_random_seeds(
+    random_number_generator: Union["np.random.Generator", np.random.RandomState],
+    size: int,
+) -> List[int]:
+    draw_integers = getattr(random_number_generator, "integers", None) or getattr(
+        random_number_generator, "randint"
+    )
+    return [int(seed) for seed in draw_integers(0, 2 ** 31 - 1, size=size)]
@@ -36,7 +36,10 @@ from great_expectations.exceptions import (
     PluginClassNotFoundError,
     PluginModuleNotFoundError,
 )
-from great_expectations.expectations.registry import _registered_expectations
+from great_expectations.expectations.registry import (
+    get_expectation_impl,
+    list_registered_expectation_implementations,
+)
 
 try:
     # This library moved in python 3.8
@@ -1060,7 +1063,8 @@ def generate_library_json_from_registered_expectations():
     """Generate the JSON object used to populate the public gallery"""
     library_json = {}
 
-    for expectation_name, expectation in _registered_expectations.items():
+    for expectation_name in list_registered_expectation_implementations():
+        expectation = get_expectation_impl(expectation_name)
         report_object = expectation().run_diagnostics()
         library_json[expectation_name] = report_object
 
@@ -1,11 +1,19 @@
-import copy
 import json
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.id_dict import IDDict
 
 
 class MetricConfiguration:
+    # Validation graphs for large suites allocate very many metric configurations; "__slots__" keeps them compact.
+    __slots__ = (
+        "_metric_name",
+        "_metric_domain_kwargs",
+        "_metric_value_kwargs",
+        "_metric_dependencies",
+    )
+
     def __init__(
         self,
         metric_name: str,
@@ -62,10 +70,11 @@ class MetricConfiguration:
 
     @property
     def id(self) -> Tuple[str, str, str]:
+        # The ids of the domain and value kwargs are memoized by IDDict (and invalidated whenever they are modified).
         return (
-            self.metric_name,
-            self.metric_domain_kwargs_id,
-            self.metric_value_kwargs_id,
+            self._metric_name,
+            self._metric_domain_kwargs.to_id(),
+            self._metric_value_kwargs.to_id(),
         )
 
     def to_json_dict(self) -> dict:
@@ -81,6 +90,8 @@ class MetricConfiguration:
 
 
 class MetricEdge:
+    __slots__ = ("_left", "_right")
+
     def __init__(
         self, left: MetricConfiguration, right: Optional[MetricConfiguration] = None
     ):
@@ -103,19 +114,137 @@ class MetricEdge:
 
 
 class ValidationGraph:
+    """A graph of metrics (nodes) and their dependencies (edges).
+
+    In addition to the list of edges, the graph maintains, keyed by metric id, the metric configurations as well as the
+    adjacency lists of dependencies and dependents of every metric, so that metrics can be scheduled for resolution in
+    topological order (please see get_ready_metric_sets) without rescanning the edges.
+    """
+
     def __init__(self, edges: Optional[List[MetricEdge]] = None):
-        if edges:
-            self._edges = edges
-        else:
-            self._edges = []
+        self._edges = []
+        self._edge_ids = set()
+        self._metric_configurations: Dict[Tuple, MetricConfiguration] = {}
+        self._dependency_ids: Dict[Tuple, Set[Tuple]] = {}
+        self._dependent_ids: Dict[Tuple, Set[Tuple]] = {}
 
-        self._edge_ids = {edge.id for edge in self._edges}
+        if edges:
+            for edge in edges:
+                self.add(edge)
 
     def add(self, edge: MetricEdge):
-        if edge.id not in self._edge_ids:
-            self._edges.append(edge)
-            self._edge_ids.add(edge.id)
+        edge_id = edge.id
+        if edge_id in self._edge_ids:
+            return
+
+        self._edges.append(edge)
+        self._edge_ids.add(edge_id)
+
+        left_id = edge_id[0]
+        if left_id not in self._metric_configurations:
+            self._metric_configurations[left_id] = edge.left
+            self._dependency_ids[left_id] = set()
+            self._dependent_ids[left_id] = set()
+
+        if edge.right is not None:
+            right_id = edge_id[1]
+            if right_id not in self._metric_configurations:
+                self._metric_configurations[right_id] = edge.right
+                self._dependency_ids[right_id] = set()
+                self._dependent_ids[right_id] = set()
+            self._dependency_ids[left_id].add(right_id)
+            self._dependent_ids[right_id].add(left_id)
+
+    @property
+    def edges(self) -> List[MetricEdge]:
+        # A shallow copy suffices to keep callers from adding edges that bypass the adjacency lists of the graph.
+        return list(self._edges)
 
     @property
-    def edges(self):
-        return copy.deepcopy(self._edges)
+    def metric_configurations(self) -> Dict[Tuple, MetricConfiguration]:
+        return self._metric_configurations
+
+    def get_dependency_ids(self, metric_id: Tuple) -> Set[Tuple]:
+        return self._dependency_ids.get(metric_id, set())
+
+    def get_dependent_ids(self, metric_id: Tuple) -> Set[Tuple]:
+        return self._dependent_ids.get(metric_id, set())
+
+    def get_unresolved_metric_ids(self, metrics: Dict[Tuple, Any]) -> Set[Tuple]:
+        return {
+            metric_id
+            for metric_id in self._metric_configurations.keys()
+            if metric_id not in metrics
+        }
+
+    def get_ready_metric_sets(
+        self,
+        metrics: Dict[Tuple, Any],
+        metric_ids_to_skip: Optional[Set[Tuple]] = None,
+    ) -> Iterator[List[MetricConfiguration]]:
+        """Yields, level by level, the metrics whose dependencies have all been resolved (Kahn's algorithm).
+
+        The caller is expected to add the values of the yielded metrics to the "metrics" dictionary before requesting
+        the next set; each yielded metric then decrements the in-degree of its dependents, and the dependents whose
+        in-degree reaches zero form the next set.  Metrics already present in "metrics" are never yielded.
+
+        Args:
+            metrics: dictionary of already-resolved metric values, keyed by metric id (updated by the caller).
+            metric_ids_to_skip: ids of metrics that need not be resolved (e.g., because all of their dependents have
+                already been resolved); they are never yielded, and their dependents do not wait for them.
+
+        Raises:
+            MetricResolutionError: if, once no metric is ready any longer, some metrics remain unresolved (for
+                example, because of a circular dependency or because resolution did not yield a value for a metric).
+        """
+        if metric_ids_to_skip is None:
+            metric_ids_to_skip = set()
+
+        unresolved_metric_ids: Set[Tuple] = (
+            self.get_unresolved_metric_ids(metrics=metrics) - metric_ids_to_skip
+        )
+        in_degrees: Dict[Tuple, int] = {
+            metric_id: len(
+                [
+                    dependency_id
+                    for dependency_id in self._dependency_ids[metric_id]
+                    if dependency_id not in metrics
+                    and dependency_id not in metric_ids_to_skip
+                ]
+            )
+            for metric_id in unresolved_metric_ids
+        }
+        ready_metric_ids: List[Tuple] = [
+            metric_id for metric_id, in_degree in in_degrees.items() if in_degree == 0
+        ]
+
+        while ready_metric_ids:
+            yield [
+                self._metric_configurations[metric_id] for metric_id in ready_metric_ids
+            ]
+
+            next_ready_metric_ids: List[Tuple] = []
+            for metric_id in ready_metric_ids:
+                if metric_id not in metrics:
+                    continue
+
+                unresolved_metric_ids.discard(metric_id)
+                for dependent_id in self._dependent_ids[metric_id]:
+                    if dependent_id not in in_degrees:
+                        continue
+
+                    in_degrees[dependent_id] -= 1
+                    if in_degrees[dependent_id] == 0:
+                        next_ready_metric_ids.append(dependent_id)
+
+            ready_metric_ids = next_ready_metric_ids
+
+        if unresolved_metric_ids:
+            raise ge_exceptions.MetricResolutionError(
+                message=f"Unable to resolve {len(unresolved_metric_ids)} metric(s) of the validation graph, because "
+                f"their dependencies could not be resolved.",
+                failed_metrics=[
+                    self._metric_configurations[metric_id]
+                    for metric_id in unresolved_metric_ids
+                ],
+            )
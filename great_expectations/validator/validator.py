@@ -14,6 +14,7 @@ from dateutil.parser import parse
 from tqdm.auto import tqdm
 
 from great_expectations import __version__ as ge_version
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import Batch
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_suite import (
@@ -24,11 +25,10 @@ from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationValidationResult,
 )
-from great_expectations.core.id_dict import BatchSpec
+from great_expectations.core.id_dict import BatchSpec, IDDict
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_asset.util import recursively_convert_to_json_serializable
-from great_expectations.dataset import PandasDataset, SparkDFDataset, SqlAlchemyDataset
-from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.exceptions import (
     GreatExpectationsError,
     InvalidExpectationConfigurationError,
@@ -40,6 +40,9 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.execution_engine import (
+    MetricPartialFunctionTypes,
+)
 from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
 from great_expectations.expectations.registry import (
     get_expectation_impl,
@@ -68,6 +71,7 @@ class Validator:
         expectation_suite_name=None,
         data_context=None,
         batches=None,
+        concurrency: Optional[ConcurrencyConfig] = None,
         **kwargs,
     ):
         """
@@ -82,9 +86,17 @@ class Validator:
         *args, **kwargs, and a named kwarg...so we use the inelegant solution of popping from kwargs, leaving the
         support for the profiler parameter not obvious from the signature.
 
+        :param concurrency (ConcurrencyConfig) = None: Controls whether independent metrics of the validation graph are
+            resolved in parallel; if omitted, the concurrency configuration of the data_context (if any) is used.
+
         """
 
         self._data_context = data_context
+        if concurrency is None:
+            concurrency = getattr(data_context, "concurrency", None)
+        if concurrency is None:
+            concurrency = ConcurrencyConfig()
+        self._concurrency = concurrency
         self._execution_engine = execution_engine
         self._expose_dataframe_methods = False
         self._validator_config = {}
@@ -290,6 +302,10 @@ class Validator:
         inst_expectation.__name__ = name
         return inst_expectation
 
+    @property
+    def concurrency(self) -> ConcurrencyConfig:
+        return self._concurrency
+
     @property
     def execution_engine(self):
         """Returns the execution engine being used by the validator at the given time"""
@@ -536,62 +552,180 @@ class Validator:
         if runtime_configuration is None:
             runtime_configuration = {}
 
-        pbar = None
-
-        done: bool = False
-        while not done:
-            ready_metrics, needed_metrics = self._parse_validation_graph(
-                validation_graph=graph, metrics=metrics
+        metric_ids_to_skip: Set[Tuple] = set()
+        if self._execution_engine.metric_cache is not None:
+            metrics.update(
+                self._execution_engine.get_cached_metrics(
+                    metrics_to_resolve=[
+                        graph.metric_configurations[metric_id]
+                        for metric_id in graph.get_unresolved_metric_ids(
+                            metrics=metrics
+                        )
+                    ]
+                )
+            )
+            metric_ids_to_skip = self._get_metric_ids_to_skip(
+                graph=graph, metrics=metrics
             )
 
-            if pbar is None:
-                # noinspection PyProtectedMember
-                pbar = tqdm(
-                    total=len(ready_metrics) + len(needed_metrics),
-                    desc="Calculating Metrics",
-                    disable=len(graph.edges) < 3,
+        unresolved_metrics: List[MetricConfiguration] = [
+            graph.metric_configurations[metric_id]
+            for metric_id in graph.get_unresolved_metric_ids(metrics=metrics)
+            - metric_ids_to_skip
+        ]
+
+        # noinspection PyProtectedMember
+        pbar = tqdm(
+            total=len(unresolved_metrics),
+            desc="Calculating Metrics",
+            disable=len(graph.edges) < 3,
+        )
+        pbar.update(0)
+
+        # The execution engine may retain the records of domains consumed by several metrics of the graph, until the
+        # last of those metrics has been resolved.
+        self._execution_engine.add_domain_records_consumers(
+            metric_configurations=unresolved_metrics
+        )
+        try:
+            ready_metrics: List[MetricConfiguration]
+            for ready_metrics in graph.get_ready_metric_sets(
+                metrics=metrics, metric_ids_to_skip=metric_ids_to_skip
+            ):
+                metrics.update(
+                    self._resolve_ready_metrics(
+                        metrics_to_resolve=ready_metrics,
+                        metrics=metrics,
+                        runtime_configuration=runtime_configuration,
+                    )
                 )
-                pbar.update(0)
+                self._execution_engine.remove_domain_records_consumers(
+                    metric_configurations=ready_metrics
+                )
+                pbar.update(len(ready_metrics))
+        finally:
+            self._execution_engine.remove_domain_records_consumers(
+                metric_configurations=unresolved_metrics
+            )
 
-            metrics.update(
-                self._resolve_metrics(
+        pbar.close()
+
+    def _get_metric_ids_to_skip(
+        self,
+        graph: ValidationGraph,
+        metrics: Dict[Tuple, Any],
+    ) -> Set[Tuple]:
+        """Returns the ids of the partial metrics (e.g., map conditions) of the graph that need not be resolved.
+
+        Partial metrics are only consumed by the metrics that depend on them; once all of those have been resolved
+        (e.g., served from the metric cache of the execution engine), the partial metrics are no longer needed.
+        """
+        metric_ids_to_skip: Set[Tuple] = set()
+        candidate_metric_ids: List[Tuple] = [
+            dependency_id
+            for metric_id in graph.metric_configurations.keys()
+            if metric_id in metrics
+            for dependency_id in graph.get_dependency_ids(metric_id)
+        ]
+        while candidate_metric_ids:
+            metric_id: Tuple = candidate_metric_ids.pop()
+            if metric_id in metrics or metric_id in metric_ids_to_skip:
+                continue
+
+            dependent_ids: Set[Tuple] = graph.get_dependent_ids(metric_id)
+            if not dependent_ids or not all(
+                dependent_id in metrics or dependent_id in metric_ids_to_skip
+                for dependent_id in dependent_ids
+            ):
+                continue
+
+            _, metric_fn = get_metric_provider(
+                graph.metric_configurations[metric_id].metric_name,
+                self._execution_engine,
+            )
+            if not isinstance(
+                getattr(metric_fn, "metric_fn_type", None), MetricPartialFunctionTypes
+            ):
+                continue
+
+            metric_ids_to_skip.add(metric_id)
+            candidate_metric_ids.extend(graph.get_dependency_ids(metric_id))
+
+        return metric_ids_to_skip
+
+    def _resolve_ready_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple, Any]:
+        """Resolves metrics whose dependencies have all been met.  Since these metrics are independent of one another,
+        when concurrency is enabled they are dispatched in parallel groups (please see _group_ready_metrics), so that
+        the wall-clock time of a graph level approaches that of its slowest group rather than the sum over all groups.
+        """
+        metric_groups: List[List[MetricConfiguration]] = []
+        if self.concurrency.enabled:
+            metric_groups = self._group_ready_metrics(
+                metrics_to_resolve=metrics_to_resolve
+            )
+
+        if len(metric_groups) < 2:
+            return self._resolve_metrics(
+                execution_engine=self._execution_engine,
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        resolved_metrics: Dict[Tuple, Any] = {}
+        with AsyncExecutor(
+            self.concurrency, max_workers=len(metric_groups)
+        ) as async_executor:
+            async_results: List[AsyncResult] = [
+                async_executor.submit(
+                    self._resolve_metrics,
                     execution_engine=self._execution_engine,
-                    metrics_to_resolve=ready_metrics,
+                    metrics_to_resolve=metric_group,
                     metrics=metrics,
                     runtime_configuration=runtime_configuration,
                 )
-            )
-            pbar.update(len(ready_metrics))
+                for metric_group in metric_groups
+            ]
+            for async_result in async_results:
+                resolved_metrics.update(async_result.result())
 
-            if len(ready_metrics) + len(needed_metrics) == 0:
-                done = True
+        return resolved_metrics
 
-        pbar.close()
+    def _group_ready_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+    ) -> List[List[MetricConfiguration]]:
+        """Splits metrics that are ready to be resolved into groups that can be resolved independently.
 
-    @staticmethod
-    def _parse_validation_graph(
-        validation_graph: ValidationGraph,
-        metrics: Dict[Tuple, Any],
-    ):
-        """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
-        validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in validation_graph.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
+        Metrics that the execution engine bundles (e.g. aggregates computed in a single query per compute domain) are
+        kept together per table domain, so that bundling is preserved; every other metric forms a group of its own.
+        """
+        bundled_metric_groups: Dict[str, List[MetricConfiguration]] = {}
+        metric_groups: List[List[MetricConfiguration]] = []
+        for metric_configuration in metrics_to_resolve:
+            _, metric_fn = get_metric_provider(
+                metric_configuration.metric_name, self._execution_engine
+            )
+            if metric_fn is None or hasattr(metric_fn, "metric_partial_fn"):
+                table_domain_kwargs: IDDict = IDDict(
+                    {
+                        key: value
+                        for key, value in metric_configuration.metric_domain_kwargs.items()
+                        if key not in ["column", "column_A", "column_B", "column_list"]
+                    }
+                )
+                bundled_metric_groups.setdefault(
+                    table_domain_kwargs.to_id(), []
+                ).append(metric_configuration)
+            else:
+                metric_groups.append([metric_configuration])
 
-        return maybe_ready - unmet_dependency, unmet_dependency
+        return list(bundled_metric_groups.values()) + metric_groups
 
     @staticmethod
     def _resolve_metrics(
@@ -1517,6 +1651,16 @@ class BridgeValidator:
             expectation_engine (ExecutionEngine): The current Execution Engine being utilized. If this is not set, it is
             determined by the type of data within the given batch
         """
+        # The legacy Dataset API is imported only when used, which keeps importing this module fast.
+        from great_expectations.dataset import (
+            PandasDataset,
+            SparkDFDataset,
+            SqlAlchemyDataset,
+        )
+        from great_expectations.dataset.sqlalchemy_dataset import (
+            SqlAlchemyBatchReference,
+        )
+
         self.batch = batch
         self.expectation_suite = expectation_suite
 
@@ -1566,6 +1710,15 @@ class BridgeValidator:
         Bridges between Execution Engines in providing access to the batch data. Validates that Dataset classes
         contain proper type of data (i.e. a Pandas Dataset does not contain SqlAlchemy data)
         """
+        from great_expectations.dataset import (
+            PandasDataset,
+            SparkDFDataset,
+            SqlAlchemyDataset,
+        )
+        from great_expectations.dataset.sqlalchemy_dataset import (
+            SqlAlchemyBatchReference,
+        )
+
         if issubclass(self.expectation_engine, PandasDataset):
             import pandas as pd
 
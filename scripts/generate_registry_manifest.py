@@ -0,0 +1,64 @@
+"""
+Usage: `python scripts/generate_registry_manifest.py [--check]`
+
+This script generates great_expectations/expectations/registry_manifest.py, which maps the name of every Expectation,
+Metric, and renderer object registered by the "great_expectations.expectations" package to the module registering it.
+The registry imports these modules upon first use of the names, instead of importing all of them eagerly.
+
+Please rerun this script whenever Expectations or Metrics are added to, renamed, or moved within the package.  With
+"--check", the script does not write the manifest, but exits with a non-zero status if it is out of date.
+"""
+
+import os
+import sys
+from typing import Dict
+
+MANIFEST_FILE_PATH: str = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "great_expectations",
+    "expectations",
+    "registry_manifest.py",
+)
+
+MANIFEST_HEADER: str = '''"""
+Maps the name of every Expectation, Metric, and renderer object registered by the "great_expectations.expectations"
+package to the module registering it, so that the registry imports the module only upon first use of the name.
+
+This file is generated by "scripts/generate_registry_manifest.py" -- please do not edit it manually.
+"""
+
+from typing import Dict'''
+
+
+def render_registry_manifest(manifest: Dict[str, Dict[str, str]]) -> str:
+    """Renders the registry manifest as the source code of the "registry_manifest" module"""
+    lines = [MANIFEST_HEADER]
+    for manifest_name, modules_by_name in manifest.items():
+        lines.append("")
+        lines.append(f"{manifest_name}: Dict[str, str] = {{")
+        for name, module_name in modules_by_name.items():
+            lines.append(f'    "{name}": "{module_name}",')
+        lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_registry_manifest() -> str:
+    # Imported here, so that a stale manifest (which the registry imports) does not break this module's import.
+    from great_expectations.expectations.registry import build_registry_manifest
+
+    return render_registry_manifest(manifest=build_registry_manifest())
+
+
+if __name__ == "__main__":
+    source: str = generate_registry_manifest()
+    if "--check" in sys.argv[1:]:
+        with open(MANIFEST_FILE_PATH) as f:
+            if f.read() != source:
+                print(
+                    f"{MANIFEST_FILE_PATH} is out of date; please run scripts/generate_registry_manifest.py."
+                )
+                sys.exit(1)
+    else:
+        with open(MANIFEST_FILE_PATH, "w") as f:
+            f.write(source)
@@ -11,8 +11,12 @@ import great_expectations as ge
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.checkpoint import Checkpoint, LegacyCheckpoint
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
+from great_expectations.core import ExpectationConfiguration
 from great_expectations.data_context.data_context import DataContext
-from great_expectations.data_context.types.base import CheckpointConfig
+from great_expectations.data_context.types.base import (
+    CheckpointConfig,
+    ConcurrencyConfig,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ConfigurationIdentifier,
 )
@@ -1696,3 +1700,202 @@ def test_newstyle_checkpoint_config_substitution_nested(
         substituted_config_template_and_runtime_kwargs.to_json_dict()
         == expected_nested_checkpoint_config_template_and_runtime_template_name.to_json_dict()
     )
+
+
+def test_newstyle_checkpoint_runs_validations_in_worker_processes(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+    context.get_config().concurrency = ConcurrencyConfig(
+        enabled=True, max_workers=2, use_processes=True
+    )
+    context.refresh()
+    suite = context.create_expectation_suite("my_expectation_suite")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_to_exist", kwargs={"column": "Name"}
+        )
+    )
+    context.save_expectation_suite(suite)
+
+    data_asset_names = ["Titanic_1911", "Titanic_1912", "Titanic_19120414_1313"]
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": data_asset_name,
+                }
+            }
+            for data_asset_name in data_asset_names
+        ],
+    )
+    result: CheckpointResult = checkpoint.run()
+
+    assert result.success
+    # Results are collected in the order of the validations.
+    assert [
+        validation_result_identifier.batch_identifier
+        for validation_result_identifier in result.run_results.keys()
+    ] == [
+        context.get_batch_list(
+            datasource_name="my_datasource",
+            data_connector_name="my_basic_data_connector",
+            data_asset_name=data_asset_name,
+        )[0].id
+        for data_asset_name in data_asset_names
+    ]
+    # The worker processes store the validation results with the stores of the data context.
+    assert len(context.validations_store.list_keys()) == 3
+
+
+def test_newstyle_checkpoint_isolates_failed_validations_run_concurrently(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+    context.get_config().concurrency = ConcurrencyConfig(
+        enabled=True, max_workers=2, use_processes=True
+    )
+    context.refresh()
+    context.create_expectation_suite("my_expectation_suite")
+
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": data_asset_name,
+                }
+            }
+            for data_asset_name in ["Titanic_1911", "Titanic_1066", "Titanic_1912"]
+        ],
+    )
+    with pytest.raises(ge_exceptions.CheckpointError, match=r"validation\[1\]"):
+        checkpoint.run()
+
+    # The other validations ran to completion.
+    assert len(context.validations_store.list_keys()) == 2
+
+
+def test_newstyle_checkpoint_wraps_failed_batch_loading_once_when_run_serially(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+    context.create_expectation_suite("my_expectation_suite")
+
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": "Titanic_1911",
+                }
+            }
+        ],
+    )
+    with mock.patch.object(
+        context,
+        "get_validator",
+        side_effect=ge_exceptions.ExecutionEngineError("Batch failed to load."),
+    ), pytest.raises(ge_exceptions.CheckpointError) as e:
+        checkpoint.run()
+
+    assert str(e.value).count("Exception occurred") == 1
+    assert str(e.value) == (
+        "Exception occurred while running validation[0] of Checkpoint 'my_checkpoint': Batch failed to load.."
+    )
+
+
+def test_newstyle_checkpoint_reraises_original_exception_of_validations_run_in_threads(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+    context.get_config().concurrency = ConcurrencyConfig(enabled=True, max_workers=2)
+    context.refresh()
+    context.create_expectation_suite("my_expectation_suite")
+
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": data_asset_name,
+                }
+            }
+            for data_asset_name in ["Titanic_1911", "Titanic_1912"]
+        ],
+    )
+
+    class ValidationFailure(Exception):
+        def __init__(self, message: str, validation_operator_name: str):
+            super().__init__(message)
+            self.validation_operator_name = validation_operator_name
+
+    def run(self, assets_to_validate, **kwargs):
+        raise ValidationFailure("Validation failed.", self.name)
+
+    with mock.patch(
+        "great_expectations.checkpoint.checkpoint.ActionListValidationOperator.run",
+        new=run,
+    ):
+        with pytest.raises(ValidationFailure) as e:
+            checkpoint.run()
+
+    # In threads, the exception of the first failed validation is raised as it is.
+    assert e.value.validation_operator_name == "my_checkpoint-checkpoint-validation[0]"
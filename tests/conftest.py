@@ -3187,6 +3187,7 @@ def site_builder_data_context_with_html_store_titanic_random(
         "enabled": True,
         "data_context_id": "f43d4897-385f-4366-82b0-1a8eda2bf79c",
     }
+    context.refresh()
 
     return context
 
@@ -3258,6 +3259,7 @@ def site_builder_data_context_v013_with_html_store_titanic_random(
         "enabled": True,
         "data_context_id": "f43d4897-385f-4366-82b0-1a8eda2bf79c",
     }
+    context.refresh()
 
     return context
 
@@ -21,3 +21,25 @@ def test_async_executor_does_not_execute_concurrently_when_concurrency_enabled_w
         ConcurrencyConfig(enabled=True), max_workers=1
     ) as async_executor:
         assert not async_executor.execute_concurrently
+
+
+def test_async_executor_does_not_execute_concurrently_when_concurrency_config_limits_to_single_max_worker():
+    with AsyncExecutor(
+        ConcurrencyConfig(enabled=True, max_workers=1), max_workers=100
+    ) as async_executor:
+        assert not async_executor.execute_concurrently
+
+
+def test_async_executor_executes_in_processes_when_concurrency_enabled_with_use_processes():
+    with AsyncExecutor(
+        ConcurrencyConfig(enabled=True, max_workers=2),
+        max_workers=100,
+        use_processes=True,
+    ) as async_executor:
+        assert async_executor.execute_in_processes
+        assert async_executor.submit(pow, 2, 10).result() == 1024
+
+    with AsyncExecutor(
+        ConcurrencyConfig(enabled=True), max_workers=2
+    ) as async_executor:
+        assert not async_executor.execute_in_processes
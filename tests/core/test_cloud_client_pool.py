@@ -0,0 +1,158 @@
+import logging
+import os
+import threading
+from unittest import mock
+
+import pytest
+
+from great_expectations.core.cloud_client_pool import CloudClientPool
+
+
+def test_cloud_client_pool_creates_client_once_per_key():
+    pool = CloudClientPool()
+    create_client = mock.Mock(side_effect=lambda: object())
+
+    client = pool.get_client(
+        key=("s3", {"region_name": "us-east-1", "config": {"retries": [1, 2]}}),
+        create_client=create_client,
+    )
+    assert (
+        pool.get_client(
+            key=("s3", {"config": {"retries": [1, 2]}, "region_name": "us-east-1"}),
+            create_client=create_client,
+        )
+        is client
+    )
+    assert create_client.call_count == 1
+
+    other_client = pool.get_client(
+        key=("s3", {"region_name": "us-west-2"}), create_client=create_client
+    )
+    assert other_client is not client
+    assert create_client.call_count == 2
+    assert len(pool) == 2
+
+    pool.clear()
+    assert len(pool) == 0
+    assert (
+        pool.get_client(
+            key=("s3", {"region_name": "us-west-2"}), create_client=create_client
+        )
+        is not other_client
+    )
+
+
+def test_cloud_client_pool_does_not_pool_failed_clients():
+    pool = CloudClientPool()
+
+    with pytest.raises(TypeError):
+        pool.get_client(key=("s3", {}), create_client=mock.Mock(side_effect=TypeError))
+    assert len(pool) == 0
+
+    client = pool.get_client(key=("s3", {}), create_client=lambda: "client")
+    assert client == "client"
+
+
+def test_cloud_client_pool_shares_client_across_threads():
+    pool = CloudClientPool()
+    create_client = mock.Mock(side_effect=lambda: object())
+    clients = []
+
+    def get_client():
+        clients.append(pool.get_client(key=("gcs",), create_client=create_client))
+
+    threads = [threading.Thread(target=get_client) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert create_client.call_count == 1
+    assert len({id(client) for client in clients}) == 1
+
+
+def test_cloud_client_pool_creates_clients_outside_of_pool_lock():
+    pool = CloudClientPool()
+    creating_slow_client = threading.Event()
+    release_slow_client = threading.Event()
+
+    def create_slow_client():
+        creating_slow_client.set()
+        assert release_slow_client.wait(timeout=10)
+        return "slow client"
+
+    slow_thread = threading.Thread(
+        target=pool.get_client,
+        kwargs={"key": ("azure",), "create_client": create_slow_client},
+    )
+    slow_thread.start()
+    assert creating_slow_client.wait(timeout=10)
+
+    # A client for another key is created while the slow client is being created.
+    assert pool.get_client(key=("s3",), create_client=lambda: "client") == "client"
+
+    release_slow_client.set()
+    slow_thread.join()
+    assert pool.get_client(key=("azure",), create_client=mock.Mock()) == "slow client"
+
+
+def test_cloud_client_pool_discards_least_recently_used_clients():
+    pool = CloudClientPool(max_clients=2)
+    create_client = mock.Mock(side_effect=lambda: object())
+
+    client_a = pool.get_client(key=("a",), create_client=create_client)
+    pool.get_client(key=("b",), create_client=create_client)
+    assert pool.get_client(key=("a",), create_client=create_client) is client_a
+    pool.get_client(key=("c",), create_client=create_client)
+    assert len(pool) == 2
+    assert create_client.call_count == 3
+
+    assert pool.get_client(key=("a",), create_client=create_client) is client_a
+    pool.get_client(key=("b",), create_client=create_client)
+    assert create_client.call_count == 4
+
+    with pytest.raises(ValueError):
+        CloudClientPool(max_clients=0)
+
+
+def test_cloud_client_pool_does_not_share_clients_with_forked_processes():
+    pool = CloudClientPool()
+    client = pool.get_client(key=("s3",), create_client=lambda: object())
+
+    with mock.patch(
+        "great_expectations.core.cloud_client_pool.os.getpid",
+        return_value=os.getpid() + 1,
+    ):
+        assert (
+            pool.get_client(key=("s3",), create_client=lambda: object()) is not client
+        )
+        assert len(pool) == 1
+
+
+def test_cloud_client_pool_does_not_log_credentials(caplog):
+    class BlobServiceClient:
+        pass
+
+    pool = CloudClientPool(max_clients=1)
+    secrets = ["my-secret-access-key", "AccountKey=my-account-key", "my-private-key"]
+
+    with caplog.at_level(
+        logging.DEBUG, logger="great_expectations.core.cloud_client_pool"
+    ):
+        pool.get_client(
+            key=(
+                BlobServiceClient,
+                {"aws_secret_access_key": secrets[0], "conn_str": secrets[1]},
+                {"AWS_SECRET_ACCESS_KEY": secrets[0]},
+            ),
+            create_client=lambda: object(),
+        )
+        # The first client is discarded (and logged again) to make room for this one.
+        pool.get_client(
+            key=(BlobServiceClient, {"info": {"private_key": secrets[2]}}),
+            create_client=lambda: object(),
+        )
+
+    assert "BlobServiceClient" in caplog.text
+    for secret in secrets:
+        assert secret not in caplog.text
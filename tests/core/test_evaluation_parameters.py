@@ -1,9 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from timeit import timeit
 
 import pytest
 
 from great_expectations.core.evaluation_parameters import (
+    EvaluationParameterParser,
     _deduplicate_evaluation_parameter_dependencies,
+    compile_evaluation_parameter_expression,
     find_evaluation_parameter_dependencies,
     parse_evaluation_parameter,
 )
@@ -125,6 +128,59 @@ def test_parser_timing():
     )
 
 
+def test_evaluation_parameter_expressions_are_compiled_once(monkeypatch):
+    parameter_expression = "trunc(compiled_once_a * 2 + compiled_once_b)"
+    compiled_expression = compile_evaluation_parameter_expression(parameter_expression)
+    assert compile_evaluation_parameter_expression(parameter_expression) is (
+        compiled_expression
+    )
+
+    def fail_to_parse(self):
+        raise AssertionError("The expression must not be parsed again")
+
+    monkeypatch.setattr(EvaluationParameterParser, "get_parser", fail_to_parse)
+    assert (
+        parse_evaluation_parameter(
+            parameter_expression, {"compiled_once_a": 2, "compiled_once_b": 1.5}
+        )
+        == 5
+    )
+    assert (
+        parse_evaluation_parameter(
+            parameter_expression, {"compiled_once_a": 10, "compiled_once_b": 0}
+        )
+        == 20
+    )
+    assert find_evaluation_parameter_dependencies(parameter_expression) == {
+        "urns": set(),
+        "other": {"compiled_once_a", "compiled_once_b"},
+    }
+    # Evaluating the expression does not alter its compiled program.
+    assert compile_evaluation_parameter_expression(parameter_expression) is (
+        compiled_expression
+    )
+
+
+def test_evaluation_parameter_parse_failures_are_raised_for_every_evaluation():
+    for _ in range(2):
+        with pytest.raises(EvaluationParameterError) as e:
+            parse_evaluation_parameter("a + ", {"a": 1})
+        assert "Parse Failure" in str(e.value)
+
+
+def test_parse_evaluation_parameter_concurrently():
+    def evaluate(value):
+        return parse_evaluation_parameter(
+            "concurrent_a * 2 + concurrent_b",
+            {"concurrent_a": value, "concurrent_b": -value},
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(evaluate, range(1000)))
+
+    assert results == list(range(1000))
+
+
 def test_find_evaluation_parameter_dependencies():
     parameter_expression = "(-3 * urn:great_expectations:validations:profile:expect_column_stdev_to_be_between.result.observed_value:column=norm) + urn:great_expectations:validations:profile:expect_column_mean_to_be_between.result.observed_value:column=norm"
     dependencies = find_evaluation_parameter_dependencies(parameter_expression)
@@ -1,3 +1,6 @@
+import pickle
+from copy import deepcopy
+
 import pytest
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
@@ -428,3 +431,186 @@ def test_remove_all_expectations_of_type(
     assert suite_with_table_and_column_expectations.isEquivalentTo(
         suite_with_column_pair_and_table_expectations
     )
+
+
+def _find_expectation_indexes_by_scan(suite, expectation_configuration, match_type):
+    return [
+        idx
+        for idx, expectation in enumerate(suite.expectations)
+        if expectation.isEquivalentTo(expectation_configuration, match_type)
+    ]
+
+
+@pytest.fixture
+def large_suite():
+    return ExpectationSuite(
+        expectation_suite_name="large",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": f"column_{idx % 50}", "value_set": [idx % 7]},
+            )
+            for idx in range(500)
+        ],
+    )
+
+
+@pytest.mark.parametrize("match_type", ["domain", "success"])
+def test_find_expectation_indexes_matches_scan_after_mutations(
+    large_suite, exp1, exp2, match_type
+):
+    queries = [
+        exp1,
+        exp2,
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "column_3", "value_set": [3]},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "column_10", "value_set": [3]},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "patched_column", "value_set": [1]},
+        ),
+    ]
+
+    def assert_consistent():
+        for query in queries:
+            assert large_suite.find_expectation_indexes(
+                query, match_type
+            ) == _find_expectation_indexes_by_scan(large_suite, query, match_type)
+
+    assert_consistent()
+
+    large_suite.append_expectation(exp1)
+    large_suite.expectations.append(exp2)
+    large_suite.expectations.insert(0, deepcopy(exp1))
+    assert_consistent()
+
+    large_suite.remove_expectation(
+        queries[2], match_type="domain", remove_multiple_matches=True
+    )
+    large_suite.expectations.pop(5)
+    del large_suite.expectations[10:20]
+    assert_consistent()
+
+    large_suite.expectations[0] = deepcopy(queries[4])
+    large_suite.patch_expectation(
+        expectation_configuration=queries[4],
+        op="replace",
+        path="/value_set",
+        value=[3],
+        match_type="domain",
+    )
+    assert_consistent()
+
+    large_suite.expectations = list(reversed(large_suite.expectations))
+    assert_consistent()
+
+
+def test_add_expectation_overwrite_updates_index(large_suite):
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "new_column", "value_set": [1]},
+    )
+    large_suite.add_expectation(expectation_configuration)
+    assert large_suite.find_expectation_indexes(expectation_configuration) == [500]
+
+    updated_expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "new_column", "value_set": [2]},
+    )
+    large_suite.add_expectation(
+        updated_expectation_configuration, overwrite_existing=True
+    )
+    assert len(large_suite.expectations) == 501
+    assert large_suite.find_expectation_indexes(
+        updated_expectation_configuration, match_type="success"
+    ) == [500]
+    assert (
+        large_suite.find_expectation_indexes(
+            expectation_configuration, match_type="success"
+        )
+        == []
+    )
+
+
+def test_find_expectation_indexes_does_not_scan_suite(large_suite, exp1, monkeypatch):
+    large_suite.append_expectation(exp1)
+    # Builds the index before counting comparisons.
+    large_suite.find_expectation_indexes(exp1)
+
+    comparisons = []
+    is_equivalent_to = ExpectationConfiguration.isEquivalentTo
+
+    def counting_is_equivalent_to(self, other, match_type="success"):
+        comparisons.append(self)
+        return is_equivalent_to(self, other, match_type)
+
+    monkeypatch.setattr(
+        ExpectationConfiguration, "isEquivalentTo", counting_is_equivalent_to
+    )
+    assert large_suite.find_expectation_indexes(exp1) == [500]
+    assert len(comparisons) == 1
+
+
+def test_expectation_index_survives_copy_and_pickle(large_suite, exp1):
+    large_suite.append_expectation(exp1)
+    large_suite.find_expectation_indexes(exp1)
+
+    for suite in (deepcopy(large_suite), pickle.loads(pickle.dumps(large_suite))):
+        assert suite.find_expectation_indexes(exp1) == [500]
+        suite.remove_expectation(exp1)
+        assert suite.find_expectation_indexes(exp1) == []
+        assert type(suite.expectations) is type(large_suite.expectations)
+
+    assert large_suite.find_expectation_indexes(exp1) == [500]
+
+
+def test_find_expectation_indexes_after_kwargs_are_changed_in_place(large_suite):
+    # Builds the index before changing kwargs.
+    large_suite.find_expectation_indexes(large_suite.expectations[0])
+
+    large_suite.expectations[0].kwargs["column"] = "renamed_column"
+    assert (
+        large_suite.find_expectation_indexes(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": "renamed_column"},
+            )
+        )
+        == [0]
+    )
+
+    # Changes of mutable kwarg values are not counted, but are noticed as well.
+    large_suite.expectations[1].kwargs["value_set"].append(42)
+    assert (
+        large_suite.find_expectation_indexes(
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": "column_1", "value_set": [1, 42]},
+            ),
+            match_type="success",
+        )
+        == [1]
+    )
+
+
+def test_find_expectation_indexes_after_removing_expectations(large_suite, exp1):
+    large_suite.append_expectation(exp1)
+    large_suite.find_expectation_indexes(exp1)
+
+    for position in [499, 0, 250, 3]:
+        large_suite.remove_expectation(
+            large_suite.expectations[position],
+            match_type="success",
+            remove_multiple_matches=True,
+        )
+        expected_position = len(large_suite.expectations) - 1
+        assert large_suite.find_expectation_indexes(exp1) == [expected_position]
+        for query in large_suite.expectations[:3]:
+            assert large_suite.find_expectation_indexes(
+                query, match_type="success"
+            ) == _find_expectation_indexes_by_scan(large_suite, query, "success")
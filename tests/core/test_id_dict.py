@@ -0,0 +1,73 @@
+import copy
+import pickle
+
+from great_expectations.core.id_dict import IDDict
+from great_expectations.validator.validation_graph import MetricConfiguration
+
+
+def test_id_dict_to_id_is_memoized():
+    id_dict = IDDict({"column": "a", "batch_id": "1234"})
+    id_ = id_dict.to_id()
+    assert id_dict.to_id() is id_
+    assert id_dict.to_id(id_keys=["column"]) == "column=a"
+    assert id_dict.to_id() is id_
+
+
+def test_id_dict_to_id_is_invalidated_on_mutation():
+    id_dict = IDDict({"column": "a", "batch_id": "1234"})
+    original_id = id_dict.to_id()
+
+    id_dict["column"] = "b"
+    assert id_dict.to_id() != original_id
+    assert id_dict.to_id() == IDDict({"column": "b", "batch_id": "1234"}).to_id()
+
+    id_dict.update({"column": "a"})
+    assert id_dict.to_id() == original_id
+
+    id_dict.pop("batch_id")
+    assert id_dict.to_id() == "column=a"
+
+    id_dict.setdefault("batch_id", "1234")
+    assert id_dict.to_id() == original_id
+
+    del id_dict["batch_id"]
+    assert id_dict.to_id() == "column=a"
+
+    id_dict.popitem()
+    assert id_dict.to_id() == tuple()
+
+    id_dict["column"] = "a"
+    id_dict.clear()
+    assert id_dict.to_id() == tuple()
+
+
+def test_id_dict_copies_have_consistent_ids():
+    id_dict = IDDict({"column": "a", "batch_id": "1234"})
+    original_id = id_dict.to_id()
+
+    deep_copy = copy.deepcopy(id_dict)
+    assert deep_copy.to_id() == original_id
+    deep_copy.pop("column")
+    assert deep_copy.to_id() == "batch_id=1234"
+    assert id_dict.to_id() == original_id
+
+    assert pickle.loads(pickle.dumps(id_dict)).to_id() == original_id
+
+
+def test_metric_configuration_id_reflects_kwargs_mutation():
+    metric_configuration = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a", "batch_id": "1234"},
+    )
+    original_id = metric_configuration.id
+    assert metric_configuration.id == original_id
+
+    metric_configuration.metric_domain_kwargs["column"] = "b"
+    assert metric_configuration.id != original_id
+    assert (
+        metric_configuration.id
+        == MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "b", "batch_id": "1234"},
+        ).id
+    )
@@ -0,0 +1,86 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from great_expectations.core.sketches import HyperLogLogSketch, KllQuantileSketch
+
+
+def _get_rank_errors(values, sketch, quantiles):
+    sorted_values = np.sort(values)
+    return [
+        abs(np.searchsorted(sorted_values, value) / len(values) - quantile)
+        for value, quantile in zip(sketch.quantiles(quantiles), quantiles)
+    ]
+
+
+def test_kll_quantile_sketch_is_exact_for_few_values():
+    sketch = KllQuantileSketch().update([3, 1, 2, 5, 4])
+    assert sketch.count == 5
+    assert sketch.quantiles([0.0, 0.25, 0.5, 0.75, 1.0]) == [1, 2, 3, 4, 5]
+    assert KllQuantileSketch().quantiles([0.5]) == [None]
+
+
+def test_kll_quantile_sketch_bounds_rank_error_and_size():
+    values = np.random.default_rng(seed=7).normal(size=200000)
+    quantiles = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+    sketch = KllQuantileSketch(relative_error=0.01)
+    for chunk in np.array_split(values, 20):
+        sketch.update(chunk)
+
+    assert sketch.count == len(values)
+    assert sketch.num_retained < 1000
+    assert max(_get_rank_errors(values, sketch, quantiles)) < 0.01
+    assert sketch.quantiles([0.0, 1.0]) == [values.min(), values.max()]
+
+
+def test_kll_quantile_sketches_merge_without_revisiting_data():
+    values = np.random.default_rng(seed=11).exponential(size=100000)
+    sketches = [
+        KllQuantileSketch(relative_error=0.01).update(chunk)
+        for chunk in np.array_split(values, 4)
+    ]
+    # Sketch states survive serialization (e.g., in a metric cache) before being merged.
+    sketches = [pickle.loads(pickle.dumps(sketch)) for sketch in sketches]
+
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged = merged.merge(sketch)
+
+    assert merged.count == len(values)
+    assert sketches[0].count == 25000
+    assert max(_get_rank_errors(values, merged, [0.1, 0.5, 0.9])) < 0.01
+
+
+def test_sketches_reject_invalid_relative_errors():
+    for relative_error in [0, 1, 1.5, True, "0.1"]:
+        with pytest.raises(ValueError):
+            KllQuantileSketch(relative_error=relative_error)
+        with pytest.raises(ValueError):
+            HyperLogLogSketch(relative_error=relative_error)
+
+
+def test_hyperloglog_sketch_estimates_distinct_count():
+    assert HyperLogLogSketch().count() == 0
+    assert HyperLogLogSketch().update(["a", "b", "a", "c", "b"]).count() == 3
+
+    values = np.random.default_rng(seed=3).integers(0, 100000, size=300000)
+    sketch = HyperLogLogSketch(relative_error=0.01)
+    for chunk in np.array_split(values, 10):
+        sketch.update(chunk)
+
+    distinct_count = len(np.unique(values))
+    assert abs(sketch.count() - distinct_count) / distinct_count < 0.03
+
+
+def test_hyperloglog_sketches_merge_without_revisiting_data():
+    first = HyperLogLogSketch().update(range(0, 6000))
+    second = HyperLogLogSketch().update(range(4000, 10000))
+
+    merged = first.merge(second)
+    assert abs(merged.count() - 10000) / 10000 < 0.03
+    assert merged.count() == HyperLogLogSketch().update(range(10000)).count()
+
+    with pytest.raises(ValueError):
+        first.merge(HyperLogLogSketch(relative_error=0.1))
@@ -396,6 +396,21 @@ def test_InMemoryStoreBackend():
         my_store.get_url_for_key(my_key)
 
 
+def test_InMemoryStoreBackend_bulk_operations():
+    my_store = InMemoryStoreBackend()
+
+    my_store.set_many([(("A",), "aaa"), (("B",), {"x": 1})])
+    assert my_store.get_many([("B",), ("A",)]) == [{"x": 1}, "aaa"]
+    assert my_store.has_many([("A",), ("C",), ("B",)]) == [True, False, True]
+    assert my_store.get_many([]) == []
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get_many([("A",), ("C",)])
+
+    with pytest.raises(TypeError):
+        my_store.get_many([("A",), "B"])
+
+
 def test_tuple_filesystem_store_filepath_prefix_error(tmp_path_factory):
     path = str(
         tmp_path_factory.mktemp("test_tuple_filesystem_store_filepath_prefix_error")
@@ -478,6 +493,14 @@ test_TupleFilesystemStoreBackend__dir0/
         my_file_BBB
 """
     )
+    # Listing the keys reports the modification time and size of their files as their versions.
+    key_versions = my_store.list_key_versions()
+    assert set(key_versions.keys()) == set(my_store.list_keys())
+    my_store.set(("AAA",), "changed_aaa")
+    changed_key_versions = my_store.list_key_versions()
+    assert changed_key_versions[("AAA",)] != key_versions[("AAA",)]
+    assert changed_key_versions[("BBB",)] == key_versions[("BBB",)]
+
     my_store.remove_key(("BBB",))
     with pytest.raises(InvalidKeyError):
         assert my_store.get(("BBB",)) == ""
@@ -875,6 +898,58 @@ def test_tuple_s3_store_backend_slash_conditions():
     )
 
 
+@mock_s3
+def test_TupleS3StoreBackend_bulk_operations():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}",
+        bucket=bucket,
+        prefix=prefix,
+    )
+
+    keys = [(f"key_{index}",) for index in range(40)]
+    assert (
+        my_store.set_many(
+            [(key, f"value_{index}") for index, key in enumerate(keys)],
+            content_type="text/html",
+        )
+        == [f"{prefix}/my_file_key_{index}" for index in range(40)]
+    )
+
+    # Values are returned in the order of the keys.
+    assert my_store.get_many(reversed(keys)) == [
+        f"value_{index}" for index in reversed(range(40))
+    ]
+    assert my_store.has_many([("key_0",), ("key_40",), ("key_39",)]) == [
+        True,
+        False,
+        True,
+    ]
+    assert (
+        boto3.client("s3").get_object(Bucket=bucket, Key=f"{prefix}/my_file_key_0")[
+            "ContentType"
+        ]
+        == "text/html"
+    )
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get_many([("key_0",), ("key_40",)])
+
+    # Listing the keys reports the ETag of their objects as their versions.
+    key_versions = my_store.list_key_versions()
+    assert set(key_versions.keys()) == {(".ge_store_backend_id",), *keys}
+    my_store.set(("key_0",), "changed_value_0")
+    changed_key_versions = my_store.list_key_versions()
+    assert changed_key_versions[("key_0",)] != key_versions[("key_0",)]
+    assert changed_key_versions[("key_1",)] == key_versions[("key_1",)]
+
+
 @mock_s3
 def test_TupleS3StoreBackend_with_empty_prefixes():
     """
@@ -94,6 +94,105 @@ def test_ValidationsStore_with_TupleS3StoreBackend():
     assert test_utils.validate_uuid4(my_store.store_backend_id)
 
 
+@freeze_time("09/26/2019 13:42:41")
+@mock_s3
+def test_ValidationsStore_bulk_operations_with_TupleS3StoreBackend():
+    bucket = "test_validation_store_bucket"
+    prefix = "test/prefix"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = ValidationsStore(
+        store_backend={
+            "class_name": "TupleS3StoreBackend",
+            "bucket": bucket,
+            "prefix": prefix,
+        }
+    )
+
+    keys = [
+        ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(
+                expectation_suite_name="asset.quarantine",
+            ),
+            run_id=f"20191007T151224.1234Z_prod_{index}",
+            batch_identifier="batch_id",
+        )
+        for index in range(10)
+    ]
+    my_store.set_many(
+        [
+            (key, ExpectationSuiteValidationResult(success=index % 2 == 0))
+            for index, key in enumerate(keys)
+        ]
+    )
+
+    assert set(my_store.list_keys()) == set(keys)
+    assert my_store.has_many(keys) == [True] * 10
+    assert my_store.get_many(keys) == [
+        ExpectationSuiteValidationResult(
+            success=index % 2 == 0, statistics={}, results=[]
+        )
+        for index in range(10)
+    ]
+
+    with pytest.raises(TypeError):
+        my_store.get_many(keys + ["not_a_ValidationResultIdentifier"])
+    with pytest.raises(TypeError):
+        my_store.has_many(keys + ["not_a_ValidationResultIdentifier"])
+
+
+def test_ValidationsStore_get_many_honors_overridden_get():
+    class AnnotatingValidationsStore(ValidationsStore):
+        def get(self, key):
+            value = super().get(key)
+            value.meta["annotated"] = True
+            return value
+
+    my_store = AnnotatingValidationsStore(
+        store_backend={
+            "class_name": "InMemoryStoreBackend",
+        }
+    )
+    key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(
+            expectation_suite_name="asset.quarantine",
+        ),
+        run_id="20191007T151224.1234Z_prod",
+        batch_identifier="batch_id",
+    )
+    my_store.set(key, ExpectationSuiteValidationResult(success=True))
+
+    # The values are retrieved with the overridden "get" rather than with the bulk operation of the store backend.
+    assert my_store.get_many([key])[0].meta == {"annotated": True}
+
+
+def test_ValidationsStore_set_many_honors_overridden_set():
+    class AnnotatingValidationsStore(ValidationsStore):
+        def set(self, key, value, **kwargs):
+            value.meta["annotated"] = True
+            return super().set(key, value, **kwargs)
+
+    my_store = AnnotatingValidationsStore(
+        store_backend={
+            "class_name": "InMemoryStoreBackend",
+        }
+    )
+    key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(
+            expectation_suite_name="asset.quarantine",
+        ),
+        run_id="20191007T151224.1234Z_prod",
+        batch_identifier="batch_id",
+    )
+
+    # The values are stored with the overridden "set" rather than with the bulk operation of the store backend.
+    my_store.set_many([(key, ExpectationSuiteValidationResult(success=True))])
+    assert my_store.get(key).meta == {"annotated": True}
+
+
 @freeze_time("09/26/2019 13:42:41")
 def test_ValidationsStore_with_InMemoryStoreBackend():
     my_store = ValidationsStore(
@@ -3,6 +3,7 @@ from great_expectations.data_context.types.base import (
     ConcurrencyConfig,
     DataContextConfig,
     InMemoryStoreBackendDefaults,
+    concurrencyConfigSchema,
 )
 
 
@@ -29,3 +30,30 @@ def test_data_context_concurrency_property():
         )
     )
     assert data_context.concurrency.enabled
+
+
+def test_concurrency_max_workers_with_dict():
+    data_context_config = DataContextConfig(
+        concurrency={"enabled": True, "max_workers": 8}
+    )
+    assert data_context_config.concurrency.max_workers == 8
+
+
+def test_concurrency_max_workers_is_not_serialized_when_not_set():
+    assert concurrencyConfigSchema.dump(ConcurrencyConfig(enabled=True)) == {
+        "enabled": True
+    }
+    assert concurrencyConfigSchema.dump(
+        ConcurrencyConfig(enabled=True, max_workers=8)
+    ) == {"enabled": True, "max_workers": 8}
+
+
+def test_concurrency_use_processes_with_dict():
+    data_context_config = DataContextConfig(
+        concurrency={"enabled": True, "use_processes": True}
+    )
+    assert data_context_config.concurrency.use_processes
+    assert concurrencyConfigSchema.dump(data_context_config.concurrency) == {
+        "enabled": True,
+        "use_processes": True,
+    }
@@ -92,6 +92,8 @@ def test_setting_config_variables_is_visible_immediately(
     context._project_config["datasources"]["mydatasource"]["batch_kwargs_generators"][
         "mygenerator"
     ]["reader_options"]["test_variable_sub1"] = "${replace_me_2}"
+    # the substituted config is cached until the context is refreshed
+    context.refresh()
 
     # verify that the value of the config variable is immediately updated.
     # verify that the config variable will be substituted with the value from the file if the
@@ -126,6 +128,7 @@ def test_setting_config_variables_is_visible_immediately(
     context._project_config["datasources"]["mydatasource"]["batch_kwargs_generators"][
         "mygenerator"
     ]["reader_options"]["test_variable_sub_escaped_dict"] = "${escaped_password_dict}"
+    context.refresh()
 
     assert (
         context.get_config().datasources["mydatasource"]["batch_kwargs_generators"][
@@ -181,6 +184,7 @@ def test_setting_config_variables_is_visible_immediately(
     try:
         # verify that the value of the env var takes precedence over the one from the config variables file
         os.environ["replace_me_2"] = "value_from_env_var"
+        context.refresh()
         assert (
             context.get_config_with_variables_substituted().datasources["mydatasource"][
                 "batch_kwargs_generators"
@@ -357,6 +361,8 @@ def test_substitute_env_var_in_config_variable_file(
     monkeypatch.setenv("FOO", "correct_val_of_replace_me")
     monkeypatch.setenv("REPLACE_ME_ESCAPED_ENV", r"ive_been_\$replaced")
     context = empty_data_context_with_config_variables
+    # environment variables set after the context was created are substituted once it is refreshed
+    context.refresh()
     context_config = context.get_config_with_variables_substituted()
     my_generator = context_config["datasources"]["mydatasource"][
         "batch_kwargs_generators"
@@ -797,7 +803,7 @@ def test_create_data_context_and_config_vars_in_code(tmp_path_factory, monkeypat
     context.add_datasource(
         initialize=False,
         name="test_datasource",
-        **datasource_config_schema.dump(datasource_config)
+        **datasource_config_schema.dump(datasource_config),
     )
 
     assert context.list_datasources()[0]["credentials"] == {
@@ -837,3 +843,107 @@ def test_create_data_context_and_config_vars_in_code(tmp_path_factory, monkeypat
 
     assert config_vars_file_contents["escaped"] == r"\$SOME_VAR"
     assert config_vars_file_contents["escaped_curly"] == r"\${SOME_VAR}"
+
+
+def test_project_config_with_variables_substituted_is_cached_until_changed(
+    data_context_with_variables_in_config, monkeypatch
+):
+    context = data_context_with_variables_in_config
+
+    config = context.project_config_with_variables_substituted
+    assert context.project_config_with_variables_substituted is config
+    assert context.get_config_with_variables_substituted() is config
+
+    # changing the project config through the DataContext API refreshes the cache
+    context.add_store(
+        "my_new_store",
+        {
+            "module_name": "great_expectations.data_context.store",
+            "class_name": "ValidationsStore",
+        },
+    )
+    assert context.project_config_with_variables_substituted is not config
+    assert "my_new_store" in context.project_config_with_variables_substituted.stores
+
+    config = context.project_config_with_variables_substituted
+    context.set_config(context.get_config())
+    assert context.project_config_with_variables_substituted is not config
+
+    # reading the config, the config variables or the environment does not refresh the cache
+    config = context.project_config_with_variables_substituted
+    monkeypatch.setenv("replace_me", "value_from_env_var")
+    context.get_config()
+    assert context.config_variables["replace_me"] == {"n1": "v1"}
+    assert context.project_config_with_variables_substituted is config
+    assert context.get_config_with_variables_substituted() is config
+
+    # changed environment variables are substituted once the context is refreshed
+    context.refresh()
+    assert context.project_config_with_variables_substituted is not config
+    assert (
+        context.project_config_with_variables_substituted.datasources["mydatasource"][
+            "batch_kwargs_generators"
+        ]["mygenerator"]["reader_options"]["test_variable_sub1"]
+        == "value_from_env_var"
+    )
+
+
+def test_project_config_with_variables_substituted_reflects_modified_config_variables_file_after_refresh(
+    data_context_with_variables_in_config,
+):
+    context = data_context_with_variables_in_config
+    config_variables_file_path = os.path.join(
+        context.root_directory, context.get_config().config_variables_file_path
+    )
+
+    assert context.config_variables["replace_me"] == {"n1": "v1"}
+    assert context.project_config_with_variables_substituted.datasources[
+        "mydatasource"
+    ]["batch_kwargs_generators"]["mygenerator"]["reader_options"][
+        "test_variable_sub1"
+    ] == {
+        "n1": "v1"
+    }
+
+    config_variables = context._load_config_variables_file()
+    config_variables["replace_me"] = {"n1": "v2"}
+    with open(config_variables_file_path, "w") as outfile:
+        yaml.dump(config_variables, outfile)
+
+    assert context.config_variables["replace_me"] == {"n1": "v1"}
+    context.refresh()
+    assert context.config_variables["replace_me"] == {"n1": "v2"}
+    assert context.project_config_with_variables_substituted.datasources[
+        "mydatasource"
+    ]["batch_kwargs_generators"]["mygenerator"]["reader_options"][
+        "test_variable_sub1"
+    ] == {
+        "n1": "v2"
+    }
+
+
+def test_refresh_after_modifying_project_config_in_place(
+    data_context_with_variables_in_config,
+):
+    context = data_context_with_variables_in_config
+
+    reader_options = context._project_config["datasources"]["mydatasource"][
+        "batch_kwargs_generators"
+    ]["mygenerator"]["reader_options"]
+    assert context.project_config_with_variables_substituted.datasources[
+        "mydatasource"
+    ]["batch_kwargs_generators"]["mygenerator"]["reader_options"][
+        "test_variable_sub1"
+    ] == {
+        "n1": "v1"
+    }
+
+    reader_options["test_variable_sub1"] = "unsubstituted_value"
+    context.refresh()
+
+    assert (
+        context.project_config_with_variables_substituted.datasources["mydatasource"][
+            "batch_kwargs_generators"
+        ]["mygenerator"]["reader_options"]["test_variable_sub1"]
+        == "unsubstituted_value"
+    )
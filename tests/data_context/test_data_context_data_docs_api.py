@@ -180,6 +180,7 @@ def test_open_docs_with_two_local_sites_specify_open_one(
 def context_with_no_sites(empty_data_context):
     context = empty_data_context
     context._project_config["data_docs_sites"] = None
+    context.refresh()
     return context
 
 
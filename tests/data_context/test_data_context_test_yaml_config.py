@@ -227,6 +227,7 @@ def test_checkpoint_store_with_filesystem_store_backend(
 
     checkpoint_store_name: str = my_checkpoint_store.config["store_name"]
     context.get_config()["checkpoint_store_name"] = checkpoint_store_name
+    context.refresh()
 
     assert (
         context.get_config_with_variables_substituted().checkpoint_store_name
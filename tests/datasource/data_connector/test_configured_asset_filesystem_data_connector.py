@@ -1355,3 +1355,192 @@ def test_basic_instantiation_with_nested_directories(tmp_path_factory):
         # FIXME: (Sam) example_data_reference removed temporarily in PR #2590:
         # "example_data_reference": {},
     }
+
+
+@pytest.fixture
+def data_connector_with_sorted_assets(tmp_path_factory):
+    base_directory = str(tmp_path_factory.mktemp("test_batch_definition_index"))
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=[
+            f"{asset}/{name}_{timestamp}_{price}.csv"
+            for asset in ["alpha", "beta"]
+            for name in ["abe", "alex", "eugene", "james", "will"]
+            for timestamp in ["20200713", "20200809", "20200810", "20201129"]
+            for price in ["1000", "1500"]
+        ],
+    )
+
+    my_data_connector: ConfiguredAssetFilesystemDataConnector = (
+        ConfiguredAssetFilesystemDataConnector(
+            name="my_data_connector",
+            datasource_name="test_environment",
+            base_directory=base_directory,
+            glob_directive="*.csv",
+            default_regex={
+                "pattern": "(.+)_(.+)_(.+)\\.csv",
+                "group_names": ["name", "timestamp", "price"],
+            },
+            assets={
+                "alpha": {"base_directory": "alpha"},
+                "beta": {"base_directory": "beta"},
+            },
+            sorters=[
+                {
+                    "orderby": "asc",
+                    "class_name": "LexicographicSorter",
+                    "name": "name",
+                },
+                {
+                    "datetime_format": "%Y%m%d",
+                    "orderby": "desc",
+                    "class_name": "DateTimeSorter",
+                    "name": "timestamp",
+                },
+                {"orderby": "desc", "class_name": "NumericSorter", "name": "price"},
+            ],
+        )
+    )
+    return my_data_connector
+
+
+@pytest.mark.parametrize(
+    "data_connector_query,batch_identifiers,limit",
+    [
+        (None, None, None),
+        (None, None, 3),
+        ({"batch_filter_parameters": {"name": "james"}}, None, None),
+        (
+            {"batch_filter_parameters": {"name": "james", "price": "1500"}},
+            None,
+            None,
+        ),
+        ({"batch_filter_parameters": {"name": "nobody"}}, None, None),
+        (
+            {"batch_filter_parameters": {"timestamp": "20200809"}, "index": -1},
+            None,
+            None,
+        ),
+        ({"batch_filter_parameters": {"price": "1000"}, "index": "1:5"}, None, None),
+        ({"batch_filter_parameters": {"price": "1000"}, "limit": 2}, None, 5),
+        ({"index": 3}, None, None),
+        ({"index": "-4:"}, {"name": "alex"}, None),
+        (None, {"name": "will", "timestamp": "20201129"}, None),
+        (
+            {"batch_filter_parameters": {"name": "will"}},
+            {"name": "alex"},
+            None,
+        ),
+        (
+            {"custom_filter_function": lambda batch_identifiers: True, "index": 0},
+            {"price": "1500"},
+            None,
+        ),
+    ],
+)
+def test_batch_definition_index_matches_scan_of_all_batch_definitions(
+    data_connector_with_sorted_assets,
+    data_connector_query,
+    batch_identifiers,
+    limit,
+):
+    my_data_connector = data_connector_with_sorted_assets
+
+    for data_asset_name in ["alpha", "beta"]:
+        batch_request = BatchRequestBase(
+            datasource_name="test_environment",
+            data_connector_name="my_data_connector",
+            data_asset_name=data_asset_name,
+            data_connector_query=data_connector_query,
+            batch_identifiers=batch_identifiers,
+            limit=limit,
+        )
+        batch_definition_list: List[
+            BatchDefinition
+        ] = my_data_connector._get_batch_definition_list_from_batch_request(
+            batch_request=batch_request
+        )
+        with mock.patch.object(
+            my_data_connector,
+            "_get_batch_definition_list_from_index",
+            return_value=None,
+        ):
+            expected_batch_definition_list: List[
+                BatchDefinition
+            ] = my_data_connector._get_batch_definition_list_from_batch_request(
+                batch_request=batch_request
+            )
+
+        assert batch_definition_list == expected_batch_definition_list
+        assert all(
+            batch_definition.data_asset_name == data_asset_name
+            for batch_definition in batch_definition_list
+        )
+
+
+def test_batch_definition_index_does_not_scan_batch_definitions(
+    data_connector_with_sorted_assets,
+):
+    my_data_connector = data_connector_with_sorted_assets
+    batch_request = BatchRequest(
+        datasource_name="test_environment",
+        data_connector_name="my_data_connector",
+        data_asset_name="alpha",
+        data_connector_query={
+            "batch_filter_parameters": {"name": "eugene", "timestamp": "20200810"}
+        },
+    )
+
+    with mock.patch(
+        "great_expectations.datasource.data_connector.file_path_data_connector.batch_definition_matches_batch_request",
+        side_effect=AssertionError("batch definitions must not be scanned"),
+    ):
+        batch_definition_list: List[
+            BatchDefinition
+        ] = my_data_connector.get_batch_definition_list_from_batch_request(
+            batch_request=batch_request
+        )
+
+    assert [
+        batch_definition.batch_identifiers for batch_definition in batch_definition_list
+    ] == [
+        {"name": "eugene", "timestamp": "20200810", "price": "1500"},
+        {"name": "eugene", "timestamp": "20200810", "price": "1000"},
+    ]
+
+
+def test_batch_definition_index_is_rebuilt_after_refresh(
+    data_connector_with_sorted_assets,
+):
+    my_data_connector = data_connector_with_sorted_assets
+    batch_request = BatchRequest(
+        datasource_name="test_environment",
+        data_connector_name="my_data_connector",
+        data_asset_name="alpha",
+        data_connector_query={"batch_filter_parameters": {"name": "zed"}},
+    )
+
+    assert (
+        my_data_connector.get_batch_definition_list_from_batch_request(
+            batch_request=batch_request
+        )
+        == []
+    )
+
+    create_files_in_directory(
+        directory=my_data_connector.base_directory,
+        file_name_list=["alpha/zed_20200713_1000.csv"],
+    )
+    my_data_connector._refresh_data_references_cache()
+
+    batch_definition_list: List[
+        BatchDefinition
+    ] = my_data_connector.get_batch_definition_list_from_batch_request(
+        batch_request=batch_request
+    )
+    assert len(batch_definition_list) == 1
+    assert batch_definition_list[0].batch_identifiers == {
+        "name": "zed",
+        "timestamp": "20200713",
+        "price": "1000",
+    }
@@ -1111,3 +1111,73 @@ assets:
         )
         == 5
     )
+
+
+@mock_s3
+def test_listing_cache_lists_assets_concurrently_and_incrementally():
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+
+    test_df: pd.DataFrame = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+
+    def put_objects(keys: List[str]):
+        for key in keys:
+            client.put_object(
+                Bucket=bucket,
+                Body=test_df.to_csv(index=False).encode("utf-8"),
+                Key=key,
+            )
+
+    put_objects(
+        keys=[
+            f"{data_asset_name}/{data_asset_name}-{index}.csv"
+            for data_asset_name in ["alpha", "beta", "gamma"]
+            for index in range(1, 4)
+        ]
+    )
+
+    my_data_connector = ConfiguredAssetS3DataConnector(
+        name="my_data_connector",
+        datasource_name="FAKE_DATASOURCE_NAME",
+        default_regex={
+            "pattern": "(.+)/(.+)-(.*)\\.csv",
+            "group_names": ["directory", "name", "index"],
+        },
+        bucket=bucket,
+        prefix="",
+        assets={
+            "alpha": {"prefix": "alpha/"},
+            "beta": {"prefix": "beta/"},
+            "gamma": {"prefix": "gamma/"},
+        },
+        listing_cache_options={
+            "ttl_seconds": 0,
+            "incremental": True,
+            "max_workers": 3,
+        },
+    )
+
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache()
+    assert my_data_connector.get_data_reference_list_count() == 9
+    assert my_data_connector.get_unmatched_data_references() == []
+
+    put_objects(keys=["beta/beta-4.csv"])
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache()
+    assert my_data_connector.get_data_reference_list_count() == 10
+    assert (
+        len(
+            my_data_connector.get_batch_definition_list_from_batch_request(
+                BatchRequest(
+                    datasource_name="FAKE_DATASOURCE_NAME",
+                    data_connector_name="my_data_connector",
+                    data_asset_name="beta",
+                )
+            )
+        )
+        == 4
+    )
@@ -0,0 +1,180 @@
+import json
+import threading
+from unittest import mock
+
+import pytest
+
+import great_expectations.exceptions.exceptions as ge_exceptions
+from great_expectations.datasource.data_connector.data_reference_listing_cache import (
+    DEFAULT_LISTING_TTL_SECONDS,
+    DataReferenceListingCache,
+)
+
+
+def test_listing_cache_lists_query_once_while_fresh():
+    listing_cache: DataReferenceListingCache = DataReferenceListingCache(ttl_seconds=60)
+    list_data_references = mock.Mock(return_value=["a.csv", "b.csv"])
+
+    for _ in range(3):
+        assert listing_cache.get_data_references(
+            query_key="query", list_data_references=list_data_references
+        ) == ["a.csv", "b.csv"]
+
+    assert list_data_references.call_count == 1
+
+
+def test_listing_cache_lists_stale_query_again():
+    listing_cache: DataReferenceListingCache = DataReferenceListingCache(ttl_seconds=60)
+    list_data_references = mock.Mock(side_effect=[["a.csv"], ["a.csv", "b.csv"]])
+
+    with mock.patch(
+        "great_expectations.datasource.data_connector.data_reference_listing_cache.time.time",
+        side_effect=[1000.0, 1059.0, 1060.0],
+    ):
+        assert listing_cache.get_data_references(
+            query_key="query", list_data_references=list_data_references
+        ) == ["a.csv"]
+        assert listing_cache.get_data_references(
+            query_key="query", list_data_references=list_data_references
+        ) == ["a.csv"]
+        assert listing_cache.get_data_references(
+            query_key="query", list_data_references=list_data_references
+        ) == ["a.csv", "b.csv"]
+
+    assert list_data_references.call_count == 2
+
+
+def test_listing_cache_lists_stale_query_incrementally():
+    listing_cache: DataReferenceListingCache = DataReferenceListingCache(
+        ttl_seconds=0, incremental=True
+    )
+    list_data_references = mock.Mock(return_value=["2021/01.csv", "2021/02.csv"])
+    list_data_references_after = mock.Mock(return_value=["2021/02.csv", "2021/03.csv"])
+
+    listing_cache.get_data_references(
+        query_key="query",
+        list_data_references=list_data_references,
+        list_data_references_after=list_data_references_after,
+    )
+    assert (
+        listing_cache.get_data_references(
+            query_key="query",
+            list_data_references=list_data_references,
+            list_data_references_after=list_data_references_after,
+        )
+        == ["2021/01.csv", "2021/02.csv", "2021/03.csv"]
+    )
+
+    assert list_data_references.call_count == 1
+    list_data_references_after.assert_called_once_with("2021/02.csv")
+
+
+def test_listing_cache_lists_fully_without_incremental_support():
+    listing_cache: DataReferenceListingCache = DataReferenceListingCache(
+        ttl_seconds=0, incremental=True
+    )
+    list_data_references = mock.Mock(side_effect=[["a.csv"], ["b.csv"]])
+
+    listing_cache.get_data_references(
+        query_key="query", list_data_references=list_data_references
+    )
+    assert listing_cache.get_data_references(
+        query_key="query", list_data_references=list_data_references
+    ) == ["b.csv"]
+
+
+def test_listing_cache_persists_listings(tmp_path):
+    cache_file_path: str = str(tmp_path / "listings.json")
+    listing_cache: DataReferenceListingCache = DataReferenceListingCache(
+        cache_file_path=cache_file_path
+    )
+    listing_cache.get_data_references(
+        query_key="query", list_data_references=lambda: ["a.csv"]
+    )
+    assert not (tmp_path / "listings.json").exists()
+
+    listing_cache.save()
+    with open(cache_file_path) as infile:
+        assert json.load(infile)["query"]["data_references"] == ["a.csv"]
+
+    listing_cache = DataReferenceListingCache(cache_file_path=cache_file_path)
+    assert listing_cache.get_data_references(
+        query_key="query", list_data_references=mock.Mock(side_effect=AssertionError)
+    ) == ["a.csv"]
+
+    listing_cache.clear()
+    assert not (tmp_path / "listings.json").exists()
+
+
+def test_listing_cache_saves_listings_once_and_only_if_changed(tmp_path):
+    listing_cache: DataReferenceListingCache = DataReferenceListingCache(
+        cache_file_path=str(tmp_path / "listings.json")
+    )
+
+    with mock.patch(
+        "great_expectations.datasource.data_connector.data_reference_listing_cache.os.replace"
+    ) as mock_replace:
+        for query_key in ["query_1", "query_2", "query_3"]:
+            listing_cache.get_data_references(
+                query_key=query_key, list_data_references=lambda: ["a.csv"]
+            )
+        assert mock_replace.call_count == 0
+
+        listing_cache.save()
+        listing_cache.save()
+        assert mock_replace.call_count == 1
+
+        # Fresh listings are not changed, so they are not saved again.
+        listing_cache.get_data_references(
+            query_key="query_1", list_data_references=lambda: ["b.csv"]
+        )
+        listing_cache.save()
+        assert mock_replace.call_count == 1
+
+
+def test_listing_cache_default_ttl_seconds():
+    assert DataReferenceListingCache().ttl_seconds == DEFAULT_LISTING_TTL_SECONDS
+    assert DataReferenceListingCache(ttl_seconds=None).ttl_seconds is None
+
+
+def test_listing_cache_ignores_unreadable_cache_file(tmp_path):
+    cache_file_path = tmp_path / "listings.json"
+    cache_file_path.write_text("{not json")
+
+    listing_cache: DataReferenceListingCache = DataReferenceListingCache(
+        cache_file_path=str(cache_file_path)
+    )
+    assert listing_cache.get_data_references(
+        query_key="query", list_data_references=lambda: ["a.csv"]
+    ) == ["a.csv"]
+
+
+def test_listing_cache_maps_concurrently():
+    listing_cache: DataReferenceListingCache = DataReferenceListingCache(max_workers=4)
+    thread_idents: set = set()
+    barrier: threading.Barrier = threading.Barrier(4, timeout=10)
+
+    def list_asset(asset: str) -> str:
+        thread_idents.add(threading.get_ident())
+        barrier.wait()
+        return asset.upper()
+
+    assert listing_cache.map_concurrently(
+        fn=list_asset, items=["a", "b", "c", "d"]
+    ) == ["A", "B", "C", "D"]
+    assert len(thread_idents) == 4
+
+
+@pytest.mark.parametrize(
+    "listing_cache_options",
+    [
+        {"ttl_seconds": -1},
+        {"max_workers": 0},
+        {"ttl": 60},
+    ],
+)
+def test_listing_cache_rejects_invalid_options(listing_cache_options):
+    with pytest.raises(ge_exceptions.DataConnectorError):
+        DataReferenceListingCache.from_options(
+            listing_cache_options=listing_cache_options
+        )
@@ -1040,3 +1040,187 @@ def test_redundant_information_in_naming_convention_bucket_too_many_sorters():
 def test_bad_s3_regex_paths(path, expectation):
     with expectation:
         _check_valid_s3_path(path)
+
+
+def _put_s3_objects(client, bucket: str, keys: List[str]):
+    test_df: pd.DataFrame = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+    for key in keys:
+        client.put_object(
+            Bucket=bucket, Body=test_df.to_csv(index=False).encode("utf-8"), Key=key
+        )
+
+
+def _build_s3_data_connector_with_listing_cache(
+    bucket: str, listing_cache_options: dict
+) -> InferredAssetS3DataConnector:
+    return InferredAssetS3DataConnector(
+        name="my_data_connector",
+        datasource_name="FAKE_DATASOURCE_NAME",
+        default_regex={
+            "pattern": r"(.+)/(.+)-(\d+)\.csv",
+            "group_names": ["data_asset_name", "letter", "number"],
+        },
+        bucket=bucket,
+        prefix="",
+        listing_cache_options=listing_cache_options,
+    )
+
+
+@mock_s3
+def test_listing_cache_reuses_listing_until_stale():
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+    _put_s3_objects(
+        client=client, bucket=bucket, keys=["path/A-100.csv", "directory/B-1.csv"]
+    )
+
+    my_data_connector: InferredAssetS3DataConnector = (
+        _build_s3_data_connector_with_listing_cache(
+            bucket=bucket, listing_cache_options={"ttl_seconds": 3600}
+        )
+    )
+
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache()
+    assert my_data_connector.get_data_reference_list_count() == 2
+
+    _put_s3_objects(client=client, bucket=bucket, keys=["path/A-101.csv"])
+    with mock.patch.object(
+        my_data_connector._s3,
+        "list_objects_v2",
+        side_effect=AssertionError("fresh listings must not be listed again"),
+    ):
+        # noinspection PyProtectedMember
+        my_data_connector._refresh_data_references_cache()
+    assert my_data_connector.get_data_reference_list_count() == 2
+
+    my_data_connector.listing_cache.clear()
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache()
+    assert my_data_connector.get_data_reference_list_count() == 3
+
+
+@mock_s3
+def test_listing_cache_lists_stale_listing_incrementally():
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+    _put_s3_objects(
+        client=client,
+        bucket=bucket,
+        keys=["events/A-20210101.csv", "events/A-20210102.csv"],
+    )
+
+    my_data_connector: InferredAssetS3DataConnector = (
+        _build_s3_data_connector_with_listing_cache(
+            bucket=bucket,
+            listing_cache_options={"ttl_seconds": 0, "incremental": True},
+        )
+    )
+
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache()
+    assert my_data_connector.get_data_reference_list_count() == 2
+
+    _put_s3_objects(client=client, bucket=bucket, keys=["events/A-20210103.csv"])
+    with mock.patch.object(
+        my_data_connector._s3,
+        "list_objects_v2",
+        wraps=my_data_connector._s3.list_objects_v2,
+    ) as mock_list_objects_v2:
+        # noinspection PyProtectedMember
+        my_data_connector._refresh_data_references_cache()
+
+    assert mock_list_objects_v2.call_count == 1
+    assert mock_list_objects_v2.call_args.kwargs["StartAfter"] == (
+        "events/A-20210102.csv"
+    )
+    assert "Delimiter" not in mock_list_objects_v2.call_args.kwargs
+    assert my_data_connector.get_data_reference_list_count() == 3
+    assert my_data_connector.get_unmatched_data_references() == []
+
+
+@mock_s3
+def test_listing_cache_persists_listings(tmp_path):
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+    _put_s3_objects(
+        client=client, bucket=bucket, keys=["path/A-100.csv", "directory/B-1.csv"]
+    )
+
+    listing_cache_options: dict = {
+        "ttl_seconds": 3600,
+        "cache_file_path": str(tmp_path / "listings" / "my_data_connector.json"),
+    }
+    my_data_connector: InferredAssetS3DataConnector = (
+        _build_s3_data_connector_with_listing_cache(
+            bucket=bucket, listing_cache_options=listing_cache_options
+        )
+    )
+    # noinspection PyProtectedMember
+    my_data_connector._refresh_data_references_cache()
+
+    # A new data connector (e.g., in another process) uses the persisted listing.
+    my_data_connector = _build_s3_data_connector_with_listing_cache(
+        bucket=bucket, listing_cache_options=listing_cache_options
+    )
+    with mock.patch.object(
+        my_data_connector._s3,
+        "list_objects_v2",
+        side_effect=AssertionError("persisted listings must not be listed again"),
+    ):
+        # noinspection PyProtectedMember
+        my_data_connector._refresh_data_references_cache()
+
+    assert my_data_connector.get_data_reference_list_count() == 2
+    assert sorted(my_data_connector.get_available_data_asset_names()) == [
+        "directory",
+        "path",
+    ]
+
+
+@mock_s3
+def test_listing_cache_lists_prefixes_concurrently():
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client = boto3.client("s3", region_name=region_name)
+    keys: List[str] = [
+        f"{directory}/{letter}-{number}.csv"
+        for directory in ["alpha", "beta", "gamma/nested", "delta"]
+        for letter in ["A", "B"]
+        for number in range(3)
+    ]
+    _put_s3_objects(client=client, bucket=bucket, keys=keys)
+
+    sequential_data_connector: InferredAssetS3DataConnector = (
+        _build_s3_data_connector_with_listing_cache(
+            bucket=bucket, listing_cache_options={"max_workers": 1}
+        )
+    )
+    concurrent_data_connector: InferredAssetS3DataConnector = (
+        _build_s3_data_connector_with_listing_cache(
+            bucket=bucket, listing_cache_options={"max_workers": 4}
+        )
+    )
+
+    # noinspection PyProtectedMember
+    sequential_data_references: List[
+        str
+    ] = sequential_data_connector._get_data_reference_list()
+    # noinspection PyProtectedMember
+    concurrent_data_references: List[
+        str
+    ] = concurrent_data_connector._get_data_reference_list()
+
+    assert sorted(concurrent_data_references) == sorted(keys)
+    assert sorted(sequential_data_references) == sorted(keys)
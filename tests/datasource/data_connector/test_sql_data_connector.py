@@ -1,5 +1,8 @@
 import json
+import os
 import random
+import threading
+from unittest import mock
 
 import pytest
 from packaging.version import parse as parse_version
@@ -7,8 +10,16 @@ from ruamel.yaml import YAML
 
 from great_expectations.core.batch import Batch, BatchRequest
 from great_expectations.core.batch_spec import SqlAlchemyDatasourceBatchSpec
-from great_expectations.data_context.util import instantiate_class_from_config
-from great_expectations.datasource.data_connector import ConfiguredAssetSqlDataConnector
+from great_expectations.data_context.util import (
+    file_relative_path,
+    instantiate_class_from_config,
+)
+from great_expectations.datasource.data_connector import (
+    ConfiguredAssetSqlDataConnector,
+    InferredAssetSqlDataConnector,
+)
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.self_check.util import get_sqlite_connection_url
 
 try:
     sqlalchemy = pytest.importorskip("sqlalchemy")
@@ -1106,3 +1117,321 @@ def test_ConfiguredAssetSqlDataConnector_with_sorting(
     test_cases_for_sql_data_connector_sqlite_execution_engine,
 ):
     pass
+
+
+def _build_date_split_inferred_asset_sql_data_connector(
+    execution_engine, **kwargs
+) -> InferredAssetSqlDataConnector:
+    return InferredAssetSqlDataConnector(
+        name="split_on_date",
+        datasource_name="my_test_datasource",
+        execution_engine=execution_engine,
+        splitter_method="_split_on_column_value",
+        splitter_kwargs={"column_name": "date"},
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def pooled_sql_data_connector_sqlite_execution_engine(sa):
+    db_file_path: str = file_relative_path(
+        __file__,
+        os.path.join("..", "..", "test_sets", "test_cases_for_sql_data_connector.db"),
+    )
+    engine: sqlalchemy.engine.Engine = sa.create_engine(
+        get_sqlite_connection_url(db_file_path)
+    )
+    execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
+        name="test_sql_execution_engine", engine=engine
+    )
+    # Keep the pooled engine, as the execution engine does for dialects without temporary tables bound to a connection
+    # (e.g., postgresql), rather than the single connection it holds for sqlite.
+    execution_engine.engine.close()
+    execution_engine.engine = engine
+    execution_engine._engine_backup = None
+    return execution_engine
+
+
+def test_InferredAssetSqlDataConnector_discovers_partitions_concurrently(
+    pooled_sql_data_connector_sqlite_execution_engine,
+):
+    sequential_data_connector: InferredAssetSqlDataConnector = (
+        _build_date_split_inferred_asset_sql_data_connector(
+            execution_engine=pooled_sql_data_connector_sqlite_execution_engine
+        )
+    )
+
+    thread_idents: set = set()
+    get_batch_identifiers_list = (
+        InferredAssetSqlDataConnector._get_batch_identifiers_list_from_data_asset_config
+    )
+
+    def record_thread(self, data_asset_name, data_asset_config, engine=None):
+        thread_idents.add(threading.get_ident())
+        return get_batch_identifiers_list(
+            self, data_asset_name, data_asset_config, engine=engine
+        )
+
+    with mock.patch.object(
+        InferredAssetSqlDataConnector,
+        "_get_batch_identifiers_list_from_data_asset_config",
+        autospec=True,
+        side_effect=record_thread,
+    ):
+        concurrent_data_connector: InferredAssetSqlDataConnector = (
+            _build_date_split_inferred_asset_sql_data_connector(
+                execution_engine=pooled_sql_data_connector_sqlite_execution_engine,
+                partition_discovery_max_workers=4,
+            )
+        )
+        # noinspection PyProtectedMember
+        concurrent_data_connector._refresh_data_references_cache()
+
+    assert len(thread_idents) > 1
+    assert concurrent_data_connector.get_available_data_asset_names() == (
+        sequential_data_connector.get_available_data_asset_names()
+    )
+    assert "table_partitioned_by_date_column__A" in (
+        concurrent_data_connector.get_available_data_asset_names()
+    )
+    assert "table_partitioned_by_timestamp_column__B" not in (
+        concurrent_data_connector.get_available_data_asset_names()
+    )
+    # noinspection PyProtectedMember
+    sequential_data_connector._refresh_data_references_cache()
+    # noinspection PyProtectedMember
+    assert (
+        concurrent_data_connector._data_references_cache
+        == sequential_data_connector._data_references_cache
+    )
+
+
+def test_InferredAssetSqlDataConnector_does_not_share_a_connection_across_threads(
+    test_cases_for_sql_data_connector_sqlite_execution_engine, sa
+):
+    my_data_connector: InferredAssetSqlDataConnector = (
+        _build_date_split_inferred_asset_sql_data_connector(
+            execution_engine=test_cases_for_sql_data_connector_sqlite_execution_engine,
+            partition_discovery_max_workers=4,
+        )
+    )
+    # noinspection PyProtectedMember
+    assert my_data_connector._get_partition_discovery_max_workers() == 1
+
+    my_data_connector = _build_date_split_inferred_asset_sql_data_connector(
+        execution_engine=SqlAlchemyExecutionEngine(
+            name="test_sql_execution_engine",
+            engine=sa.create_engine("sqlite://"),
+        ),
+        partition_discovery_max_workers=4,
+    )
+    # noinspection PyProtectedMember
+    assert my_data_connector._get_partition_discovery_max_workers() == 1
+
+
+def test_InferredAssetSqlDataConnector_discovers_partitions_on_connection_of_execution_engine(
+    sa,
+):
+    db_file_path: str = file_relative_path(
+        __file__,
+        os.path.join("..", "..", "test_sets", "test_cases_for_sql_data_connector.db"),
+    )
+    execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
+        name="test_sql_execution_engine",
+        engine=sa.create_engine(get_sqlite_connection_url(db_file_path)),
+    )
+    # For sqlite, the execution engine replaces its engine by a single connection, which holds its temporary tables.
+    assert not isinstance(execution_engine.engine, sqlalchemy.engine.Engine)
+
+    my_data_connector: InferredAssetSqlDataConnector = (
+        _build_date_split_inferred_asset_sql_data_connector(
+            execution_engine=execution_engine,
+            partition_discovery_max_workers=4,
+        )
+    )
+    # noinspection PyProtectedMember
+    assert my_data_connector._get_partition_discovery_max_workers() == 1
+
+    with mock.patch.object(
+        my_data_connector,
+        "_get_batch_identifiers_list_from_data_asset_config",
+        wraps=my_data_connector._get_batch_identifiers_list_from_data_asset_config,
+    ) as mock_get_batch_identifiers_list:
+        # noinspection PyProtectedMember
+        my_data_connector._refresh_data_references_cache()
+    assert mock_get_batch_identifiers_list.call_count > 1
+    # No engine is passed, so partitions are discovered on the connection of the execution engine.
+    assert all(
+        call.kwargs["engine"] is None
+        for call in mock_get_batch_identifiers_list.call_args_list
+    )
+
+
+def test_InferredAssetSqlDataConnector_discovers_partitions_lazily(
+    test_cases_for_sql_data_connector_sqlite_execution_engine,
+):
+    with mock.patch.object(
+        InferredAssetSqlDataConnector,
+        "_get_batch_identifiers_list_from_data_asset_config",
+        autospec=True,
+        side_effect=InferredAssetSqlDataConnector._get_batch_identifiers_list_from_data_asset_config,
+    ) as mock_get_batch_identifiers_list:
+        my_data_connector: InferredAssetSqlDataConnector = _build_date_split_inferred_asset_sql_data_connector(
+            execution_engine=test_cases_for_sql_data_connector_sqlite_execution_engine,
+            lazy_partition_discovery=True,
+        )
+        assert mock_get_batch_identifiers_list.call_count == 0
+        # Tables are not probed, so inapplicable tables are not skipped.
+        assert len(my_data_connector.get_available_data_asset_names()) == 21
+
+        batch_definition_list = (
+            my_data_connector.get_batch_definition_list_from_batch_request(
+                BatchRequest(
+                    datasource_name="my_test_datasource",
+                    data_connector_name="split_on_date",
+                    data_asset_name="table_partitioned_by_date_column__A",
+                )
+            )
+        )
+        assert len(batch_definition_list) == 30
+        assert mock_get_batch_identifiers_list.call_count == 1
+
+        my_data_connector.get_batch_definition_list_from_batch_request(
+            BatchRequest(
+                datasource_name="my_test_datasource",
+                data_connector_name="split_on_date",
+                data_asset_name="table_partitioned_by_date_column__A",
+                data_connector_query={
+                    "batch_filter_parameters": {"date": "2020-01-01"}
+                },
+            )
+        )
+        assert mock_get_batch_identifiers_list.call_count == 1
+
+
+def test_InferredAssetSqlDataConnector_introspects_database_in_bulk(
+    test_cases_for_sql_data_connector_sqlite_execution_engine,
+):
+    inspector_data_connector: InferredAssetSqlDataConnector = (
+        InferredAssetSqlDataConnector(
+            name="whole_table",
+            datasource_name="my_test_datasource",
+            execution_engine=test_cases_for_sql_data_connector_sqlite_execution_engine,
+        )
+    )
+
+    with mock.patch.dict(
+        "great_expectations.datasource.data_connector.inferred_asset_sql_data_connector.BULK_INTROSPECTION_QUERIES",
+        {
+            "sqlite": """
+                SELECT 'main' AS schema_name, name AS table_name, type
+                FROM sqlite_master WHERE type IN ('table', 'view')
+                ORDER BY schema_name, type, table_name
+            """
+        },
+    ), mock.patch(
+        "great_expectations.datasource.data_connector.inferred_asset_sql_data_connector.sa.inspect",
+        side_effect=AssertionError("the database must be introspected in bulk"),
+    ):
+        bulk_data_connector: InferredAssetSqlDataConnector = InferredAssetSqlDataConnector(
+            name="whole_table",
+            datasource_name="my_test_datasource",
+            execution_engine=test_cases_for_sql_data_connector_sqlite_execution_engine,
+        )
+
+    assert bulk_data_connector.get_available_data_asset_names() == (
+        inspector_data_connector.get_available_data_asset_names()
+    )
+    assert len(bulk_data_connector.get_available_data_asset_names()) == 21
+
+
+def test_ConfiguredAssetSqlDataConnector_discovers_partitions_of_requested_asset_only(
+    test_cases_for_sql_data_connector_sqlite_execution_engine,
+):
+    my_data_connector: ConfiguredAssetSqlDataConnector = (
+        ConfiguredAssetSqlDataConnector(
+            name="my_sql_data_connector",
+            datasource_name="my_test_datasource",
+            execution_engine=test_cases_for_sql_data_connector_sqlite_execution_engine,
+            assets={
+                "table_partitioned_by_date_column__A": {
+                    "splitter_method": "_split_on_column_value",
+                    "splitter_kwargs": {"column_name": "date"},
+                },
+                "table_partitioned_by_timestamp_column__B": {
+                    "splitter_method": "_split_on_converted_datetime",
+                    "splitter_kwargs": {"column_name": "timestamp"},
+                },
+            },
+        )
+    )
+
+    with mock.patch.object(
+        my_data_connector,
+        "_get_batch_identifiers_list_from_data_asset_config",
+        wraps=my_data_connector._get_batch_identifiers_list_from_data_asset_config,
+    ) as mock_get_batch_identifiers_list:
+        batch_definition_list = (
+            my_data_connector.get_batch_definition_list_from_batch_request(
+                BatchRequest(
+                    datasource_name="my_test_datasource",
+                    data_connector_name="my_sql_data_connector",
+                    data_asset_name="table_partitioned_by_date_column__A",
+                )
+            )
+        )
+
+    assert len(batch_definition_list) == 30
+    mock_get_batch_identifiers_list.assert_called_once()
+    assert mock_get_batch_identifiers_list.call_args.args[0] == (
+        "table_partitioned_by_date_column__A"
+    )
+
+    report_object = my_data_connector.self_check(pretty_print=False)
+    assert (
+        report_object["data_assets"]["table_partitioned_by_timestamp_column__B"][
+            "batch_definition_count"
+        ]
+        == 30
+    )
+
+
+def test_ConfiguredAssetSqlDataConnector_self_check_discovers_partitions_of_reported_assets_only(
+    test_cases_for_sql_data_connector_sqlite_execution_engine,
+):
+    my_data_connector: ConfiguredAssetSqlDataConnector = (
+        ConfiguredAssetSqlDataConnector(
+            name="my_sql_data_connector",
+            datasource_name="my_test_datasource",
+            execution_engine=test_cases_for_sql_data_connector_sqlite_execution_engine,
+            assets={
+                "table_partitioned_by_date_column__A": {
+                    "splitter_method": "_split_on_column_value",
+                    "splitter_kwargs": {"column_name": "date"},
+                },
+                "table_partitioned_by_timestamp_column__B": {
+                    "splitter_method": "_split_on_converted_datetime",
+                    "splitter_kwargs": {"column_name": "timestamp"},
+                },
+            },
+        )
+    )
+
+    with mock.patch.object(
+        my_data_connector,
+        "_get_batch_identifiers_list_from_data_asset_config",
+        wraps=my_data_connector._get_batch_identifiers_list_from_data_asset_config,
+    ) as mock_get_batch_identifiers_list:
+        report_object = my_data_connector.self_check(pretty_print=False, max_examples=1)
+
+    assert report_object["data_asset_count"] == 2
+    assert report_object["data_assets"] == {
+        "table_partitioned_by_date_column__A": {
+            "batch_definition_count": 30,
+            "example_data_references": [{"date": "2020-01-01"}],
+        }
+    }
+    mock_get_batch_identifiers_list.assert_called_once()
+    assert mock_get_batch_identifiers_list.call_args.args[0] == (
+        "table_partitioned_by_date_column__A"
+    )
@@ -0,0 +1,133 @@
+import threading
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.execution_engine.metric_cache import (
+    InMemoryMetricCache,
+    SqliteMetricCache,
+    build_metric_cache,
+)
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+)
+from great_expectations.validator.validator import Validator
+
+
+def test_in_memory_metric_cache_evicts_least_recently_used_entries():
+    metric_cache = InMemoryMetricCache(max_size=2)
+    metric_cache.set(key=("a",), value=1)
+    metric_cache.set(key=("b",), value=2)
+    assert metric_cache.get(key=("a",)) == 1
+
+    metric_cache.set(key=("c",), value=3)
+    assert len(metric_cache) == 2
+    assert metric_cache.get(key=("b",)) is None
+    assert metric_cache.get_many(keys={"a": ("a",), "b": ("b",), "c": ("c",)}) == {
+        "a": 1,
+        "c": 3,
+    }
+
+    metric_cache.clear()
+    assert len(metric_cache) == 0
+
+
+def test_sqlite_metric_cache_persists_entries(tmp_path):
+    filepath = str(tmp_path / "metric_cache" / "metrics.db")
+    metric_cache = SqliteMetricCache(filepath=filepath, max_size=2)
+    metric_cache.set_many(items={("a", "x"): [1, 2], ("b", "y"): {"value": 2}})
+
+    other_metric_cache = SqliteMetricCache(filepath=filepath, max_size=2)
+    assert other_metric_cache.get(key=("a", "x")) == [1, 2]
+    assert other_metric_cache.get(key=("b", "y")) == {"value": 2}
+
+    # Values that cannot be pickled are not cached.
+    other_metric_cache.set(key=("c", "z"), value=threading.Lock())
+    assert other_metric_cache.get(key=("c", "z"), default="missing") == "missing"
+    assert len(other_metric_cache) == 2
+
+    other_metric_cache.set(key=("c", "z"), value=3)
+    assert len(metric_cache) == 2
+    assert metric_cache.get(key=("c", "z")) == 3
+
+
+def test_build_metric_cache():
+    assert build_metric_cache(metric_cache_config=None) is None
+
+    metric_cache = InMemoryMetricCache()
+    assert build_metric_cache(metric_cache_config=metric_cache) is metric_cache
+
+    metric_cache = build_metric_cache(
+        metric_cache_config={"class_name": "InMemoryMetricCache", "max_size": 10}
+    )
+    assert isinstance(metric_cache, InMemoryMetricCache)
+    assert metric_cache.max_size == 10
+
+    with pytest.raises(ge_exceptions.InvalidConfigError):
+        build_metric_cache(metric_cache_config={"max_size": 0})
+
+
+def _validate(execution_engine, df, batch_id):
+    validator = Validator(execution_engine=execution_engine, batches=[Batch(data=df)])
+    # Batches of the same data loaded by different runs generally have different ids.
+    validator.execution_engine.load_batch_data(batch_id, df)
+    validator.execution_engine.active_batch_data_id = batch_id
+    return validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 10},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "b"},
+            ),
+        ]
+    )
+
+
+def test_metric_cache_serves_repeat_runs_on_unchanged_data(tmp_path):
+    metric_cache_config = {
+        "class_name": "SqliteMetricCache",
+        "filepath": str(tmp_path / "metrics.db"),
+    }
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+
+    results = _validate(
+        execution_engine=PandasExecutionEngine(metric_cache=metric_cache_config),
+        df=df,
+        batch_id="run_1",
+    )
+    assert [result.success for result in results] == [False, False]
+
+    execution_engine = PandasExecutionEngine(metric_cache=metric_cache_config)
+    assert execution_engine.config["metric_cache"] == metric_cache_config
+    with mock.patch.object(
+        execution_engine,
+        "get_domain_records",
+        wraps=execution_engine.get_domain_records,
+    ) as mock_get_domain_records:
+        cached_results = _validate(
+            execution_engine=execution_engine, df=df.copy(), batch_id="run_2"
+        )
+    assert mock_get_domain_records.call_count == 0
+    assert cached_results == results
+
+    # Changed data is not served from the cache.
+    execution_engine = PandasExecutionEngine(metric_cache=metric_cache_config)
+    with mock.patch.object(
+        execution_engine,
+        "get_domain_records",
+        wraps=execution_engine.get_domain_records,
+    ) as mock_get_domain_records:
+        results = _validate(
+            execution_engine=execution_engine,
+            df=pd.DataFrame({"a": [1, 5, 2, 3, 5, 10], "b": [1, 2, 3, 4, 5, 6]}),
+            batch_id="run_3",
+        )
+    assert mock_get_domain_records.call_count > 0
+    assert [result.success for result in results] == [True, True]
@@ -18,7 +18,7 @@ except:
 
 
 import great_expectations.exceptions as ge_exceptions
-from great_expectations.core.batch import BatchDefinition
+from great_expectations.core.batch import Batch, BatchDefinition
 from great_expectations.core.batch_spec import (
     AzureBatchSpec,
     GCSBatchSpec,
@@ -26,13 +26,16 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.id_dict import IDDict
 from great_expectations.datasource.data_connector import ConfiguredAssetS3DataConnector
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.pandas_batch_data import ChunkedPandasBatchData
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
 )
 from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -561,7 +564,206 @@ def test_resolve_metric_bundle():
     )
 
 
+def test_resolve_metric_bundle_computes_domain_records_once_per_domain():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, 7]})
+
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metrics = []
+    for column in ["a", "b"]:
+        for metric_name in ["column.mean", "column.min", "column.max", "column.sum"]:
+            desired_metrics.append(
+                MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs={"column": column},
+                    metric_value_kwargs=None,
+                    metric_dependencies={
+                        "table.columns": table_columns_metric,
+                    },
+                )
+            )
+
+    with mock.patch.object(
+        engine, "get_domain_records", wraps=engine.get_domain_records
+    ) as mock_get_domain_records:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+
+    assert mock_get_domain_records.call_count == 1
+    assert results[("column.mean", "column=a", ())] == 2.0
+    assert results[("column.min", "column=a", ())] == 1.0
+    assert results[("column.max", "column=a", ())] == 3.0
+    assert results[("column.sum", "column=a", ())] == 6.0
+    assert results[("column.mean", "column=b", ())] == 5.5
+    assert results[("column.min", "column=b", ())] == 4
+    assert results[("column.max", "column=b", ())] == 7
+    assert results[("column.sum", "column=b", ())] == 22
+
+
+def test_resolve_metric_bundle_with_row_condition():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, 7]})
+
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    unfiltered_mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    filtered_mean = MetricConfiguration(
+        metric_name="column.mean",
+        metric_domain_kwargs={
+            "column": "b",
+            "row_condition": "b>4",
+            "condition_parser": "pandas",
+        },
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    filtered_max = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={
+            "column": "a",
+            "row_condition": "b>4",
+            "condition_parser": "pandas",
+        },
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unfiltered_mean, filtered_mean, filtered_max),
+        metrics=metrics,
+    )
+
+    assert results[unfiltered_mean.id] == 5.5
+    assert results[filtered_mean.id] == 6.0
+    assert results[filtered_max.id] == 3.0
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error
+def _build_column_aggregate_bundle(engine, metrics, metric_configurations):
+    from great_expectations.expectations.registry import get_metric_provider
+
+    metric_fn_bundle = []
+    for metric_configuration in metric_configurations:
+        metric_class, metric_fn = get_metric_provider(
+            metric_name=metric_configuration.metric_name, execution_engine=engine
+        )
+        metric_provider_kwargs = {
+            "cls": metric_class,
+            "execution_engine": engine,
+            "metric_domain_kwargs": metric_configuration.metric_domain_kwargs,
+            "metric_value_kwargs": metric_configuration.metric_value_kwargs,
+            "metrics": metrics,
+            "runtime_configuration": None,
+        }
+        metric_fn_bundle.append(
+            (
+                metric_configuration,
+                *metric_fn.metric_partial_fn(**metric_provider_kwargs),
+                metric_provider_kwargs,
+            )
+        )
+
+    return metric_fn_bundle
+
+
+def _failing_aggregate(metric_value_fn):
+    def metric_aggregate(column):
+        raise ge_exceptions.MetricComputationError("Aggregate failed.")
+
+    metric_aggregate.metric_value_fn = metric_value_fn
+    return metric_aggregate
+
+
+def test_resolve_metric_bundle_resolves_failed_aggregate_on_its_own():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+    table_columns_metric, metrics = get_table_columns_metric(engine=engine)
+
+    column_min = MetricConfiguration(
+        metric_name="column.min", metric_domain_kwargs={"column": "a"}
+    )
+    column_max = MetricConfiguration(
+        metric_name="column.max", metric_domain_kwargs={"column": "a"}
+    )
+    metric_fn_bundle = _build_column_aggregate_bundle(
+        engine=engine,
+        metrics={"table.columns": metrics[table_columns_metric.id]},
+        metric_configurations=[column_min, column_max],
+    )
+    metric_configuration, metric_aggregate, *rest = metric_fn_bundle[0]
+    metric_fn_bundle[0] = (
+        metric_configuration,
+        _failing_aggregate(metric_aggregate.metric_value_fn),
+        *rest,
+    )
+
+    results = engine.resolve_metric_bundle(metric_fn_bundle)
+
+    assert results == {column_min.id: 1.0, column_max.id: 3.0}
+
+
+def test_resolve_metric_bundle_reports_only_the_failed_metric():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+    table_columns_metric, metrics = get_table_columns_metric(engine=engine)
+
+    column_min = MetricConfiguration(
+        metric_name="column.min", metric_domain_kwargs={"column": "a"}
+    )
+    column_max = MetricConfiguration(
+        metric_name="column.max", metric_domain_kwargs={"column": "a"}
+    )
+    metric_fn_bundle = _build_column_aggregate_bundle(
+        engine=engine,
+        metrics={"table.columns": metrics[table_columns_metric.id]},
+        metric_configurations=[column_min, column_max],
+    )
+
+    def failing_metric_value_fn(**kwargs):
+        raise ge_exceptions.MetricComputationError("Metric failed.")
+
+    metric_configuration, _, *rest = metric_fn_bundle[0]
+    metric_fn_bundle[0] = (
+        metric_configuration,
+        _failing_aggregate(failing_metric_value_fn),
+        *rest,
+    )
+
+    with pytest.raises(ge_exceptions.MetricResolutionError) as e:
+        engine.resolve_metric_bundle(metric_fn_bundle)
+
+    assert [
+        metric_configuration.id for metric_configuration in e.value.failed_metrics
+    ] == [column_min.id]
+    assert "Metric failed." in e.value.message
+
+
 def test_resolve_metric_bundle_with_nonexistent_metric():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
 
@@ -640,6 +842,24 @@ def test_get_batch_with_split_on_whole_table_s3(
     assert df.dataframe.shape == test_df_small.shape
 
 
+def test_s3_client_is_created_lazily_and_shared_by_engines(
+    batch_with_split_on_whole_table_s3, test_df_small
+):
+    boto3_options = {"region_name": "us-east-1"}
+    with mock.patch(
+        "great_expectations.execution_engine.pandas_execution_engine.boto3.client",
+        wraps=boto3.client,
+    ) as mock_boto3_client:
+        engine = PandasExecutionEngine(boto3_options=boto3_options)
+        other_engine = PandasExecutionEngine(boto3_options=dict(boto3_options))
+        mock_boto3_client.assert_not_called()
+
+        df = engine.get_batch_data(batch_spec=batch_with_split_on_whole_table_s3)
+        assert df.dataframe.shape == test_df_small.shape
+        assert other_engine._s3 is engine._s3
+        assert mock_boto3_client.call_count == 1
+
+
 def test_get_batch_with_no_s3_configured(batch_with_split_on_whole_table_s3):
     # if S3 was not configured
     execution_engine_no_s3 = PandasExecutionEngine()
@@ -1065,3 +1285,131 @@ def test_get_batch_with_no_gcs_configured(gcs_batch_spec):
     # Raises error due the connection object not being set
     with pytest.raises(ge_exceptions.ExecutionEngineError):
         execution_engine_no_gcs.get_batch_data(batch_spec=gcs_batch_spec)
+
+
+@pytest.fixture
+def chunked_csv_path(tmp_path) -> str:
+    df = pd.DataFrame(
+        {
+            "a": [1, 5, 22, 3, 5, 10, None, 4],
+            "b": ["x", "y", "z", "x", None, "w", "v", "y"],
+        }
+    )
+    path = str(tmp_path / "chunked.csv")
+    df.to_csv(path, index=False)
+    return path
+
+
+def _validate_batch_data(batch_data, result_format="SUMMARY"):
+    validator = Validator(
+        execution_engine=batch_data.execution_engine,
+        batches=[Batch(data=batch_data)],
+    )
+    return validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type=expectation_type,
+                kwargs={**kwargs, "result_format": result_format},
+            )
+            for expectation_type, kwargs in [
+                ("expect_table_row_count_to_equal", {"value": 8}),
+                ("expect_column_max_to_be_between", {"column": "a", "max_value": 20}),
+                ("expect_column_min_to_be_between", {"column": "a", "min_value": 1}),
+                ("expect_column_mean_to_be_between", {"column": "a", "min_value": 7}),
+                ("expect_column_stdev_to_be_between", {"column": "a", "min_value": 1}),
+                (
+                    "expect_column_unique_value_count_to_be_between",
+                    {"column": "b", "min_value": 1, "max_value": 4},
+                ),
+                (
+                    "expect_column_proportion_of_unique_values_to_be_between",
+                    {"column": "b", "min_value": 0.5, "allow_relative_error": True},
+                ),
+                ("expect_column_values_to_not_be_null", {"column": "b"}),
+                (
+                    "expect_column_values_to_be_in_set",
+                    {"column": "b", "value_set": ["x"]},
+                ),
+            ]
+        ]
+    )
+
+
+def test_chunked_batch_metrics_match_unchunked_batch_metrics(chunked_csv_path):
+    batch_spec = PathBatchSpec(path=chunked_csv_path, reader_method="read_csv")
+    chunked_batch_spec = PathBatchSpec(
+        path=chunked_csv_path,
+        reader_method="read_csv",
+        reader_options={"chunksize": 3},
+    )
+
+    batch_data = PandasExecutionEngine().get_batch_data(batch_spec=batch_spec)
+    chunked_batch_data = PandasExecutionEngine().get_batch_data(
+        batch_spec=chunked_batch_spec
+    )
+    assert isinstance(chunked_batch_data, ChunkedPandasBatchData)
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        chunked_batch_data.dataframe
+
+    for result_format in ["SUMMARY", "COMPLETE"]:
+        results = _validate_batch_data(batch_data, result_format=result_format)
+        chunked_results = _validate_batch_data(
+            chunked_batch_data, result_format=result_format
+        )
+        assert [result.success for result in chunked_results] == [
+            result.success for result in results
+        ]
+        for chunked_result, result in zip(chunked_results, results):
+            assert chunked_result.result.keys() == result.result.keys()
+            for key, value in result.result.items():
+                if isinstance(value, float):
+                    assert chunked_result.result[key] == pytest.approx(value)
+                else:
+                    assert chunked_result.result[key] == value
+
+
+def test_chunked_batch_stops_reading_once_unexpected_values_are_sampled(
+    chunked_csv_path,
+):
+    execution_engine = PandasExecutionEngine()
+    chunked_batch_data = execution_engine.get_batch_data(
+        batch_spec=PathBatchSpec(
+            path=chunked_csv_path,
+            reader_method="read_csv",
+            reader_options={"chunksize": 2},
+        )
+    )
+    validator = Validator(
+        execution_engine=execution_engine, batches=[Batch(data=chunked_batch_data)]
+    )
+    unexpected_values = MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_values",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={
+            "value_set": ["x"],
+            "parse_strings_as_datetimes": False,
+            "result_format": {
+                "result_format": "BASIC",
+                "partial_unexpected_count": 2,
+            },
+        },
+    )
+    with mock.patch.object(
+        chunked_batch_data,
+        "_chunk_fn",
+        wraps=chunked_batch_data._chunk_fn,
+    ) as mock_chunk_fn:
+        assert validator.get_metric(metric=unexpected_values) == ["y", "z"]
+    # Only the first two (out of four) chunks are read to sample the unexpected values.
+    read_rows = {
+        row for call in mock_chunk_fn.call_args_list for row in call[0][0].index
+    }
+    assert read_rows == {0, 1, 2, 3}
+
+    with pytest.raises(ge_exceptions.MetricResolutionError):
+        validator.get_metric(
+            metric=MetricConfiguration(
+                metric_name="column.median",
+                metric_domain_kwargs={"column": "a"},
+            )
+        )
@@ -488,6 +488,48 @@ def test_get_domain_records_with_multicolumn_domain(
     ), "Data does not match after getting full access compute domain"
 
 
+def test_get_domain_records_persists_filtered_domain_shared_by_consumers(
+    spark_session, basic_spark_df_execution_engine
+):
+    pd_df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, 5]})
+    df = spark_session.createDataFrame(pd_df)
+    engine = basic_spark_df_execution_engine
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+
+    domain_kwargs = {
+        "column": "a",
+        "row_condition": 'col("a")>1',
+        "condition_parser": "great_expectations__experimental__",
+    }
+    column_max = MetricConfiguration(
+        metric_name="column.max", metric_domain_kwargs=domain_kwargs
+    )
+    column_min = MetricConfiguration(
+        metric_name="column.min", metric_domain_kwargs=domain_kwargs
+    )
+    engine.add_domain_records_consumers(metric_configurations=[column_max, column_min])
+
+    data = engine.get_domain_records(domain_kwargs=domain_kwargs)
+    assert data.is_cached
+    assert data.count() == 3
+    # The same filtered records are shared by domains that differ only in their column.
+    assert (
+        engine.get_domain_records(domain_kwargs={**domain_kwargs, "column": "b"})
+        is data
+    )
+
+    # Unfiltered records are the batch itself, and are not persisted.
+    table_data = engine.get_domain_records(domain_kwargs={})
+    assert table_data is engine.get_domain_records(domain_kwargs={})
+    assert not table_data.is_cached
+
+    engine.remove_domain_records_consumers(metric_configurations=[column_max])
+    assert data.is_cached
+
+    engine.remove_domain_records_consumers(metric_configurations=[column_min])
+    assert not data.is_cached
+
+
 def test_get_compute_domain_with_no_domain_kwargs(
     spark_session, basic_spark_df_execution_engine
 ):
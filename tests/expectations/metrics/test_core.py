@@ -757,6 +757,65 @@ def test_map_unique_column_does_not_exist_sa(sa):
     )
 
 
+def test_map_unexpected_values_partial_sample_spark(
+    spark_session, basic_spark_df_execution_engine
+):
+    # The domain spans several partitions, from which the first unexpected values are sampled in order.
+    df = spark_session.createDataFrame(
+        spark_session.sparkContext.parallelize([(i,) for i in range(20)], 4), ["a"]
+    )
+    engine = basic_spark_df_execution_engine
+    engine.load_batch_data(batch_id="my_id", batch_data=df)
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    condition_metric = MetricConfiguration(
+        metric_name="column_values.in_set.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": list(range(0, 20, 2))},
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(condition_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
+    for result_format, expected_unexpected_values in [
+        (
+            {"result_format": "SUMMARY", "partial_unexpected_count": 3},
+            [1, 3, 5],
+        ),
+        (
+            {"result_format": "COMPLETE", "partial_unexpected_count": 3},
+            list(range(1, 20, 2)),
+        ),
+    ]:
+        desired_metric = MetricConfiguration(
+            metric_name="column_values.in_set.unexpected_values",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={
+                "value_set": list(range(0, 20, 2)),
+                "result_format": result_format,
+            },
+            metric_dependencies={
+                "unexpected_condition": condition_metric,
+                "table.columns": table_columns_metric,
+            },
+        )
+        results = engine.resolve_metrics(
+            metrics_to_resolve=(desired_metric,), metrics=metrics
+        )
+        assert results[desired_metric.id] == expected_unexpected_values
+
+
 def test_map_unique_column_exists_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
         spark=spark_session,
@@ -2405,6 +2464,99 @@ def test_distinct_metric_pd():
     assert results == {desired_metric.id: {1, 2, 3}}
 
 
+def test_sketch_metrics_pd():
+    engine = build_pandas_engine(pd.DataFrame({"a": [1, 2, 1, 2, 3, 3, 4, 5, 6, None]}))
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    quantile_sketch = MetricConfiguration(
+        metric_name="column.quantile_sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"relative_error": 0.05},
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    distinct_values_sketch = MetricConfiguration(
+        metric_name="column.distinct_values.sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"relative_error": 0.05},
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(quantile_sketch, distinct_values_sketch), metrics=metrics
+    )
+    metrics.update(results)
+    assert results[quantile_sketch.id].count == 9
+    assert results[quantile_sketch.id].quantiles([0.0, 0.5, 1.0]) == [1, 3, 6]
+    assert results[distinct_values_sketch.id].count() == 6
+
+    # With a relative error, pandas quantiles are answered from the sketch.
+    desired_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": [0.0, 0.5, 1.0],
+            "allow_relative_error": 0.05,
+        },
+    )
+    dependencies = get_metric_provider("column.quantile_values", engine)[
+        0
+    ].get_evaluation_dependencies(metric=desired_metric, execution_engine=engine)
+    assert dependencies["column.quantile_sketch"].id == quantile_sketch.id
+    desired_metric.metric_dependencies = dependencies
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results == {desired_metric.id: [1, 3, 6]}
+
+
+def test_unique_proportion_metric_id_unchanged_without_relative_error_pd():
+    from great_expectations.core import ExpectationConfiguration
+    from great_expectations.expectations.registry import get_expectation_impl
+
+    engine = build_pandas_engine(pd.DataFrame({"a": [1, 2, 2, 3, None]}))
+    expectation_type = "expect_column_proportion_of_unique_values_to_be_between"
+    expectation = get_expectation_impl(expectation_type)()
+
+    configuration = ExpectationConfiguration(
+        expectation_type=expectation_type,
+        kwargs={"column": "a", "min_value": 0, "max_value": 1},
+    )
+    unique_proportion = expectation.get_validation_dependencies(
+        configuration=configuration, execution_engine=engine
+    )["metrics"]["column.unique_proportion"]
+    assert unique_proportion.metric_value_kwargs_id == ()
+
+    configuration = ExpectationConfiguration(
+        expectation_type=expectation_type,
+        kwargs={
+            "column": "a",
+            "min_value": 0,
+            "max_value": 1,
+            "allow_relative_error": 0.05,
+        },
+    )
+    unique_proportion = expectation.get_validation_dependencies(
+        configuration=configuration, execution_engine=engine
+    )["metrics"]["column.unique_proportion"]
+    assert unique_proportion.metric_value_kwargs == {"allow_relative_error": 0.05}
+    dependencies = get_metric_provider("column.unique_proportion", engine)[
+        0
+    ].get_evaluation_dependencies(metric=unique_proportion, execution_engine=engine)
+    assert "column.distinct_values.sketch" in dependencies
+    assert "column.distinct_values.count" not in dependencies
+
+
 def test_batch_aggregate_metrics_sa(caplog, sa):
     import datetime
 
@@ -1,12 +1,23 @@
+from unittest import mock
+
+import pandas as pd
+
+from great_expectations.core.batch import Batch
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
-from great_expectations.expectations.metrics import ColumnMax, ColumnValuesNonNull
+from great_expectations.expectations.metrics import (
+    ColumnMax,
+    ColumnValuesInSet,
+    ColumnValuesNonNull,
+)
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
 )
+from great_expectations.self_check.util import build_sa_engine
 from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
 
 
 def test_get_table_metric_provider_metric_dependencies(empty_sqlite_db):
@@ -85,3 +96,173 @@ def test_get_map_metric_dependencies():
     metric = MetricConfiguration("foo.unexpected_index_list", {}, {})
     dependencies = mp.get_evaluation_dependencies(metric)
     assert dependencies["unexpected_condition"].id[0] == "foo.condition"
+
+
+def test_get_map_metric_unexpected_records_dependencies():
+    mp = ColumnValuesInSet()
+    metric_value_kwargs = {
+        "value_set": [1, 2],
+        "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 20},
+    }
+    for metric_suffix in [
+        ".unexpected_values",
+        ".unexpected_index_list",
+        ".unexpected_rows",
+    ]:
+        metric = MetricConfiguration(
+            "column_values.in_set" + metric_suffix,
+            {"column": "a"},
+            metric_value_kwargs,
+        )
+        dependencies = mp.get_evaluation_dependencies(
+            metric, execution_engine=PandasExecutionEngine()
+        )
+        # The records are shared by the metrics reporting them with the same result format.
+        assert (
+            dependencies["unexpected_records"].id
+            == MetricConfiguration(
+                "column_values.in_set.unexpected_records",
+                {"column": "a"},
+                metric_value_kwargs,
+            ).id
+        )
+
+    # Value counts are computed over all of the unexpected values, rather than the reported ones.
+    metric = MetricConfiguration(
+        "column_values.in_set.unexpected_value_counts",
+        {"column": "a"},
+        metric_value_kwargs,
+    )
+    dependencies = mp.get_evaluation_dependencies(
+        metric, execution_engine=PandasExecutionEngine()
+    )
+    assert "unexpected_records" not in dependencies
+
+    metric = MetricConfiguration(
+        "column_values.in_set.unexpected_records", {"column": "a"}, {}
+    )
+    dependencies = mp.get_evaluation_dependencies(
+        metric, execution_engine=PandasExecutionEngine()
+    )
+    assert (
+        dependencies["unexpected_condition"].id[0] == "column_values.in_set.condition"
+    )
+
+
+def test_pandas_unexpected_records_are_shared_by_unexpected_metrics():
+    df = pd.DataFrame(
+        {"a": [1, None, 3, 2, None, 4, 3], "b": ["u", "v", "w", "x", "y", "z", "t"]},
+        index=[10, 11, 12, 13, 14, 15, 16],
+    )
+    engine = PandasExecutionEngine()
+    validator = Validator(execution_engine=engine, batches=[Batch(data=df)])
+    result_format = {"result_format": "COMPLETE"}
+    metric_domain_kwargs = {"column": "a"}
+    metric_value_kwargs = {"value_set": [1, 2], "result_format": result_format}
+
+    with mock.patch.object(
+        engine, "get_domain_records", wraps=engine.get_domain_records
+    ) as mock_get_domain_records:
+        metrics = validator.get_metrics(
+            {
+                metric_suffix: MetricConfiguration(
+                    "column_values.in_set" + metric_suffix,
+                    metric_domain_kwargs,
+                    metric_value_kwargs,
+                )
+                for metric_suffix in [
+                    ".unexpected_values",
+                    ".unexpected_index_list",
+                    ".unexpected_rows",
+                ]
+            }
+        )
+
+    # Nulls are not unexpected, and positions after them refer to the original records.
+    assert metrics[".unexpected_values"] == [3.0, 4.0, 3.0]
+    assert metrics[".unexpected_index_list"] == [12, 15, 16]
+    assert list(metrics[".unexpected_rows"]["b"]) == ["w", "z", "t"]
+
+    # The domain records are obtained once for the table columns, once for the condition, and once for all of the
+    # unexpected metrics (rather than once for each of them).
+    assert mock_get_domain_records.call_count == 3
+
+
+def test_pandas_unexpected_records_retain_only_reported_records():
+    df = pd.DataFrame(
+        {"a": [1, None, 3, 2, None, 4, 3], "b": ["u", "v", "w", "x", "y", "z", "t"]},
+        index=[10, 11, 12, 13, 14, 15, 16],
+    )
+    engine = PandasExecutionEngine()
+    validator = Validator(execution_engine=engine, batches=[Batch(data=df)])
+    metric_value_kwargs = {
+        "value_set": [1, 2],
+        "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 2},
+    }
+
+    metrics = validator.get_metrics(
+        {
+            "unexpected_records": MetricConfiguration(
+                "column_values.in_set.unexpected_records",
+                {"column": "a"},
+                metric_value_kwargs,
+            ),
+        }
+    )
+
+    # Rather than all of the records of the domain, only the reported unexpected records are retained.
+    assert list(metrics["unexpected_records"].index) == [12, 15]
+
+
+def test_sqlalchemy_unexpected_records_are_shared_by_unexpected_metrics(sa):
+    df = pd.DataFrame(
+        {"a": [1, None, 3, 2, None, 4, 3], "b": ["u", "v", "w", "x", "y", "z", "t"]}
+    )
+    engine = build_sa_engine(df, sa)
+    validator = Validator(execution_engine=engine)
+    metric_domain_kwargs = {"column": "a"}
+    metric_value_kwargs = {
+        "value_set": [1, 2],
+        "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 2},
+    }
+
+    with mock.patch.object(
+        engine, "get_domain_records", wraps=engine.get_domain_records
+    ) as mock_get_domain_records:
+        metrics = validator.get_metrics(
+            {
+                metric_suffix: MetricConfiguration(
+                    "column_values.in_set" + metric_suffix,
+                    metric_domain_kwargs,
+                    metric_value_kwargs,
+                )
+                for metric_suffix in [
+                    ".unexpected_records",
+                    ".unexpected_values",
+                    ".unexpected_rows",
+                ]
+            }
+        )
+
+    # Only the reported unexpected records are selected, and only with the (labelled) domain columns.
+    assert [list(row.keys()) for row in metrics[".unexpected_records"]] == [
+        ["a"],
+        ["a"],
+    ]
+    assert metrics[".unexpected_values"] == [3.0, 4.0]
+    # Unexpected rows hold all of the columns, so they are selected on their own.
+    assert [row["b"] for row in metrics[".unexpected_rows"]] == ["w", "z"]
+
+    # The domain records are obtained once for the condition, once for the unexpected records shared with the values,
+    # and once for the rows.
+    assert mock_get_domain_records.call_count == 3
+
+    dependencies = ColumnValuesInSet().get_evaluation_dependencies(
+        MetricConfiguration(
+            "column_values.in_set.unexpected_rows",
+            metric_domain_kwargs,
+            metric_value_kwargs,
+        ),
+        execution_engine=engine,
+    )
+    assert "unexpected_records" not in dependencies
@@ -1,8 +1,24 @@
+import subprocess
+import sys
+
+import pytest
+
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.core.expect_column_values_to_be_in_set import (
     ExpectColumnValuesToBeInSet,
 )
-from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.expectations.registry import (
+    build_registry_manifest,
+    get_expectation_impl,
+    get_metric_provider,
+    list_registered_expectation_implementations,
+)
+from great_expectations.expectations.registry_manifest import (
+    EXPECTATION_MODULES,
+    METRIC_MODULES,
+    RENDERER_MODULES,
+)
 
 
 def test_registry_basics():
@@ -16,3 +32,128 @@ def test_registry_from_configuration():
         kwargs={"column": "PClass", "value_set": [1, 2, 3]},
     )
     assert configuration._get_expectation_impl() == ExpectColumnValuesToBeInSet
+
+
+def test_registry_imports_expectation_modules_lazily():
+    # A fresh interpreter is used, since the modules are already imported by the other tests.
+    code = """
+import sys
+import great_expectations.validator.validator
+assert not [
+    module_name
+    for module_name in sys.modules
+    if module_name.startswith("great_expectations.expectations.core.")
+]
+from great_expectations.expectations.registry import get_expectation_impl
+get_expectation_impl("expect_column_values_to_be_in_set")
+assert "great_expectations.expectations.core.expect_column_values_to_be_in_set" in sys.modules
+assert "great_expectations.expectations.core.expect_column_values_to_be_unique" not in sys.modules
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_registry_keeps_core_metric_providers_overridden_for_one_engine():
+    # A fresh interpreter is used, so that the core "column.max" module is not imported before the override.
+    code = """
+import great_expectations.validator.validator
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.metrics import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_value,
+)
+from great_expectations.expectations.registry import _registered_metrics
+
+class PluginColumnMax(ColumnAggregateMetricProvider):
+    metric_name = "column.max"
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, **kwargs):
+        return 42
+
+providers = _registered_metrics["column.max"]["providers"]
+assert providers["PandasExecutionEngine"][0] is PluginColumnMax
+assert providers["SparkDFExecutionEngine"][0].__name__ == "ColumnMax"
+assert providers["SqlAlchemyExecutionEngine"][0].__name__ == "ColumnMax"
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_registry_imports_metric_modules_lazily_from_concurrent_threads():
+    # Threads must not see a metric unregistered, while another thread is still importing the module registering it.
+    code = """
+import importlib.machinery
+import sys
+import threading
+import time
+import great_expectations.validator.validator
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.registry import get_metric_provider
+from great_expectations.expectations.registry_manifest import METRIC_MODULES
+
+class SlowMetricModuleFinder(importlib.machinery.PathFinder):
+    # Delays executing the module registering "column.max", after the import has put it in "sys.modules".
+    @classmethod
+    def find_spec(cls, fullname, path=None, target=None):
+        if fullname != METRIC_MODULES["column.max"]:
+            return None
+        spec = super().find_spec(fullname, path, target)
+        exec_module = spec.loader.exec_module
+
+        def slow_exec_module(module):
+            time.sleep(0.5)
+            exec_module(module)
+
+        spec.loader.exec_module = slow_exec_module
+        return spec
+
+sys.meta_path.insert(0, SlowMetricModuleFinder)
+errors = []
+
+def get_provider():
+    try:
+        get_metric_provider("column.max", PandasExecutionEngine())
+    except Exception as e:
+        errors.append(e)
+
+threads = [threading.Thread(target=get_provider) for _ in range(2)]
+for thread in threads:
+    thread.start()
+    time.sleep(0.1)
+for thread in threads:
+    thread.join()
+assert not errors, errors
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_registry_imports_metric_modules_lazily():
+    metric_provider, metric_fn = get_metric_provider(
+        "column_values.in_set.condition", PandasExecutionEngine()
+    )
+    assert (
+        metric_provider.__module__ == METRIC_MODULES["column_values.in_set.condition"]
+    )
+    assert callable(metric_fn)
+
+
+def test_list_registered_expectation_implementations_includes_all_core_expectations():
+    expectation_types = list_registered_expectation_implementations()
+    assert set(EXPECTATION_MODULES).issubset(expectation_types)
+
+
+def test_lazy_package_attributes():
+    from great_expectations.expectations import core
+
+    assert "ExpectColumnValuesToBeInSet" in dir(core)
+    assert "ExpectColumnValuesToBeInSet" in core.__all__
+    assert core.ExpectColumnValuesToBeInSet == ExpectColumnValuesToBeInSet
+    with pytest.raises(AttributeError):
+        core.ExpectNothingToHappen
+
+
+def test_registry_manifest_is_up_to_date():
+    assert build_registry_manifest() == {
+        "EXPECTATION_MODULES": EXPECTATION_MODULES,
+        "METRIC_MODULES": METRIC_MODULES,
+        "RENDERER_MODULES": RENDERER_MODULES,
+    }, "The registry manifest is out of date; please run scripts/generate_registry_manifest.py."
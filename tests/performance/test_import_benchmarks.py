@@ -0,0 +1,39 @@
+"""
+Test the time it takes to import the validator (e.g., at the start of a "great_expectations checkpoint run").
+"""
+
+import subprocess
+import sys
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+# Core Expectations and Metrics are registered lazily, so importing the validator must not import their modules.
+IMPORT_VALIDATOR_CODE: str = """
+import sys
+import great_expectations.validator.validator
+assert not [
+    module_name
+    for module_name in sys.modules
+    if module_name.startswith("great_expectations.expectations.core.")
+    or module_name.startswith("great_expectations.expectations.metrics.column_")
+]
+"""
+
+
+def test_import_validator_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+):
+    """Benchmark importing the validator in a fresh interpreter (the modules of the test session are already imported)."""
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires the --performance-tests flag to run.")
+
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", IMPORT_VALIDATOR_CODE],),
+        kwargs={"check": True},
+        iterations=1,
+        rounds=5,
+    )
@@ -1,6 +1,9 @@
+import copy
 import os
+import re
 import shutil
 from typing import Dict
+from unittest import mock
 
 import pytest
 from freezegun import freeze_time
@@ -494,6 +497,217 @@ def test_configuration_driven_site_builder_skip_and_clean_missing(
     assert validations_set == validation_html_pages
 
 
+@freeze_time("09/26/2019 13:42:41")
+def test_configuration_driven_site_builder_incremental(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    # an incremental build renders only new or changed resources, patches the index from the manifest of the
+    # site, and removes the pages of deleted resources
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        incremental=True,
+        **local_site_config
+    )
+    _, index_links_dict = site_builder.build()
+
+    expectation_suite_set = set(context.stores["expectations_store"].list_keys())
+    validations_set = set(context.stores["validations_store"].list_keys())
+    manifest = site_builder.target_store.get_manifest()
+    assert {
+        ExpectationSuiteIdentifier.from_tuple(tuple(entry["key"]))
+        for entry in manifest["sections"]["expectations"]["resources"]
+    } == expectation_suite_set
+    assert {
+        ValidationResultIdentifier.from_tuple(tuple(entry["key"]))
+        for entry in manifest["sections"]["profiling"]["resources"]
+    } == validations_set
+
+    # the index is the same as the one of a full build
+    full_site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    _, full_index_links_dict = full_site_builder.build()
+    assert index_links_dict == full_index_links_dict
+    # only incremental builds keep a manifest
+    assert "manifest" in site_builder.target_store.store_backends
+    assert "manifest" not in full_site_builder.target_store.store_backends
+
+    section_renderers = {
+        site_section_name: mock.patch.object(
+            site_section_builder.renderer_class,
+            "render",
+            wraps=site_section_builder.renderer_class.render,
+        )
+        for (
+            site_section_name,
+            site_section_builder,
+        ) in site_builder.site_section_builders.items()
+    }
+
+    # nothing changed: no page is rendered and no resource is read, neither to detect changes nor for the index
+    mocked_renders = {
+        site_section_name: section_renderer.start()
+        for site_section_name, section_renderer in section_renderers.items()
+    }
+    source_store_backends = [
+        context.stores["expectations_store"].store_backend,
+        context.stores["validations_store"].store_backend,
+    ]
+    with mock.patch.object(
+        context, "get_validation_result", wraps=context.get_validation_result
+    ) as mock_get_validation_result, mock.patch.object(
+        source_store_backends[0], "_get", wraps=source_store_backends[0]._get
+    ) as mock_get_expectation_suite, mock.patch.object(
+        source_store_backends[1], "_get", wraps=source_store_backends[1]._get
+    ) as mock_get_validation:
+        _, index_links_dict = site_builder.build()
+    assert all(mock_render.call_count == 0 for mock_render in mocked_renders.values())
+    assert mock_get_validation_result.call_count == 0
+    assert mock_get_expectation_suite.call_count == 0
+    assert mock_get_validation.call_count == 0
+    assert index_links_dict == full_index_links_dict
+
+    # only the changed expectation suite is rendered again
+    changed_suite_identifier = sorted(
+        expectation_suite_set, key=lambda key: key.expectation_suite_name
+    )[0]
+    suite = context.get_expectation_suite(
+        changed_suite_identifier.expectation_suite_name
+    )
+    suite.meta["notes"] = "changed"
+    context.save_expectation_suite(suite)
+    site_builder.build()
+    assert mocked_renders["expectations"].call_count == 1
+    assert mocked_renders["profiling"].call_count == 0
+
+    # pages of removed resources are removed along with their manifest entries
+    removed_validation_identifier = sorted(validations_set, key=str)[0]
+    context.stores["validations_store"].store_backend.remove_key(
+        removed_validation_identifier.to_tuple()
+    )
+    _, index_links_dict = site_builder.build()
+    for section_renderer in section_renderers.values():
+        section_renderer.stop()
+
+    validation_html_pages = {
+        ValidationResultIdentifier.from_tuple(result_tuple)
+        for result_tuple in site_builder.target_store.store_backends[
+            ValidationResultIdentifier
+        ].list_keys()
+    }
+    assert validation_html_pages == validations_set - {removed_validation_identifier}
+    manifest = site_builder.target_store.get_manifest()
+    assert removed_validation_identifier.to_tuple() not in {
+        tuple(entry["key"]) for entry in manifest["sections"]["profiling"]["resources"]
+    }
+    assert len(index_links_dict["profiling_links"]) == len(validations_set) - 1
+
+
+@freeze_time("09/26/2019 13:42:41")
+def test_configuration_driven_site_builder_incremental_without_manifest_builds_all_resources(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    # an incremental build for a few resources (as requested by UpdateDataDocsAction) renders every resource of a
+    # section that has no valid manifest yet, since its index is built from the manifest alone
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    full_site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    _, full_index_links_dict = full_site_builder.build()
+
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        incremental=True,
+        **local_site_config
+    )
+    assert site_builder.target_store.get_manifest() == {}
+    validations_set = set(context.stores["validations_store"].list_keys())
+    _, index_links_dict = site_builder.build(
+        resource_identifiers=[sorted(validations_set, key=str)[0]]
+    )
+    assert index_links_dict == full_index_links_dict
+    manifest = site_builder.target_store.get_manifest()
+    assert {
+        ValidationResultIdentifier.from_tuple(tuple(entry["key"]))
+        for entry in manifest["sections"]["profiling"]["resources"]
+    } == validations_set
+
+    # pages rendered with another view configuration must all be rendered again
+    profiling_section_builder = site_builder.site_section_builders["profiling"]
+    fingerprint = profiling_section_builder._get_rendering_fingerprint()
+    profiling_section_builder._view_config["config"] = {
+        "module_name": "great_expectations.render.view",
+        "class_name": "DefaultMarkdownPageView",
+    }
+    assert profiling_section_builder._get_rendering_fingerprint() != fingerprint
+
+
+def test_configuration_driven_site_builder_renders_pages_in_worker_processes(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    # pages rendered by worker processes are the same as the pages of a sequential build
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+
+    local_site_config = copy.deepcopy(
+        context._project_config.data_docs_sites["local_site"]
+    )
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config
+    )
+    _, index_links_dict = site_builder.build()
+
+    local_site_config["store_backend"]["base_directory"] = os.path.join(
+        "uncommitted", "data_docs", "concurrent_site"
+    )
+    concurrent_site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        max_workers=2,
+        **local_site_config
+    )
+    assert all(
+        site_section_builder.max_workers == 2
+        for site_section_builder in (
+            concurrent_site_builder.site_section_builders.values()
+        )
+    )
+    _, concurrent_index_links_dict = concurrent_site_builder.build()
+    assert concurrent_index_links_dict == index_links_dict
+
+    # pages embed the time they were rendered at, and random ids of collapsible elements
+    volatile_pattern = (
+        r"\?d=\d{8}T\d{6}\.\d{6}Z" r"|[0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12}"
+    )
+    for key_type in [ExpectationSuiteIdentifier, ValidationResultIdentifier]:
+        store_backend = site_builder.target_store.store_backends[key_type]
+        concurrent_store_backend = concurrent_site_builder.target_store.store_backends[
+            key_type
+        ]
+        page_keys = store_backend.list_keys()
+        assert len(page_keys) > 0
+        assert sorted(concurrent_store_backend.list_keys()) == sorted(page_keys)
+        for page_key in page_keys:
+            assert re.sub(
+                volatile_pattern, "", concurrent_store_backend.get(page_key)
+            ) == re.sub(volatile_pattern, "", store_backend.get(page_key))
+
+
 @pytest.mark.rendered_output
 def test_configuration_driven_site_builder_without_how_to_buttons(
     site_builder_data_context_with_html_store_titanic_random,
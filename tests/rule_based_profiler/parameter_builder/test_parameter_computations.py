@@ -1,3 +1,4 @@
+import tracemalloc
 from typing import Dict, Optional, Union
 
 import numpy as np
@@ -53,3 +54,70 @@ def test_custom_bootstrap_efficacy():
             <= actual_false_positive_rates[column]
             <= false_positive_rate + 0.01
         )
+
+
+def test_bootstrap_quantiles_are_reproducible_and_independent_of_workers():
+    metric_values: np.ndarray = _generate_distribution_samples(size=364)[
+        "normal"
+    ].to_numpy()
+    false_positive_rate: np.float64 = np.float64(0.05)
+
+    # A budget of 8 resamples of 364 values per block yields many blocks.
+    memory_budget_bytes: int = 8 * 3 * 8 * metric_values.size
+
+    sequential_estimate: tuple = compute_bootstrap_quantiles(
+        metric_values=metric_values,
+        false_positive_rate=false_positive_rate,
+        n_resamples=100,
+        random_seed=7,
+        memory_budget_bytes=memory_budget_bytes,
+    )
+    assert sequential_estimate == compute_bootstrap_quantiles(
+        metric_values=metric_values,
+        false_positive_rate=false_positive_rate,
+        n_resamples=100,
+        random_seed=7,
+        memory_budget_bytes=memory_budget_bytes,
+    )
+    assert sequential_estimate == compute_bootstrap_quantiles(
+        metric_values=metric_values,
+        false_positive_rate=false_positive_rate,
+        n_resamples=100,
+        random_seed=7,
+        memory_budget_bytes=memory_budget_bytes,
+        max_workers=2,
+    )
+
+    lower_quantile, upper_quantile = sequential_estimate
+    assert metric_values.min() <= lower_quantile < upper_quantile
+    assert upper_quantile <= metric_values.max()
+
+
+def test_bootstrap_quantiles_within_memory_budget():
+    metric_values: np.ndarray = _generate_distribution_samples(size=1000)[
+        "uniform"
+    ].to_numpy()
+    false_positive_rate: np.float64 = np.float64(0.05)
+    memory_budget_bytes: int = 1024 * 1024
+
+    tracemalloc.start()
+    try:
+        lower_quantile, upper_quantile = compute_bootstrap_quantiles(
+            metric_values=metric_values,
+            false_positive_rate=false_positive_rate,
+            n_resamples=DEFAULT_BOOTSTRAP_NUM_RESAMPLES,
+            random_seed=0,
+            memory_budget_bytes=memory_budget_bytes,
+        )
+        _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Drawing all resamples at once would take up about 240 MB.
+    assert peak_memory_bytes < 2 * memory_budget_bytes
+
+    expected_lower_quantile, expected_upper_quantile = np.quantile(
+        metric_values, q=[false_positive_rate / 2, 1.0 - false_positive_rate / 2]
+    )
+    assert np.isclose(lower_quantile, expected_lower_quantile, rtol=1.0e-2)
+    assert np.isclose(upper_quantile, expected_upper_quantile, rtol=1.0e-2)
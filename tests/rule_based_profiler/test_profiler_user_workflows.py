@@ -1,5 +1,6 @@
 import datetime
 from typing import Any, Dict, List, cast
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -210,6 +211,95 @@ def test_bobby_profiler_user_workflow_multi_batch_row_count_range_rule_and_colum
     )
 
 
+@freeze_time("09/26/2019 13:42:41")
+def test_bobby_profiler_user_workflow_resolves_metrics_of_all_rules_together(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+    bobby_columnar_table_multi_batch,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    yaml_config: str = bobby_columnar_table_multi_batch["profiler_config"]
+
+    profiler_config: dict = yaml.load(yaml_config)
+
+    profiler: Profiler = Profiler(
+        profiler_config=profiler_config,
+        data_context=data_context,
+    )
+
+    with mock.patch.object(
+        Validator, "get_metrics", autospec=True, side_effect=Validator.get_metrics
+    ) as mock_get_metrics:
+        expectation_suite: ExpectationSuite = profiler.profile(
+            expectation_suite_name=bobby_columnar_table_multi_batch[
+                "test_configuration_oneshot_sampling_method"
+            ]["expectation_suite_name"],
+            include_citation=True,
+        )
+
+    assert (
+        expectation_suite
+        == bobby_columnar_table_multi_batch[
+            "test_configuration_oneshot_sampling_method"
+        ]["expected_expectation_suite"]
+    )
+
+    # The metrics of all parameter builders, domains, and batches are resolved in one call (the other calls are made
+    # by the domain builders, which determine the columns to profile).
+    num_metrics_per_call: List[int] = [
+        len(call.kwargs["metrics"] if "metrics" in call.kwargs else call.args[1])
+        for call in mock_get_metrics.call_args_list
+    ]
+    assert num_metrics_per_call.count(1) == len(num_metrics_per_call) - 1
+    assert max(num_metrics_per_call) > 1
+
+
+@freeze_time("09/26/2019 13:42:41")
+def test_bobby_profiler_user_workflow_loads_batches_of_each_batch_request_once(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+    bobby_columnar_table_multi_batch,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    yaml_config: str = bobby_columnar_table_multi_batch["profiler_config"]
+
+    profiler_config: dict = yaml.load(yaml_config)
+
+    profiler: Profiler = Profiler(
+        profiler_config=profiler_config,
+        data_context=data_context,
+    )
+
+    with mock.patch.object(
+        data_context, "get_batch_list", wraps=data_context.get_batch_list
+    ) as mock_get_batch_list:
+        expectation_suite: ExpectationSuite = profiler.profile(
+            expectation_suite_name=bobby_columnar_table_multi_batch[
+                "test_configuration_oneshot_sampling_method"
+            ]["expectation_suite_name"],
+            include_citation=True,
+        )
+
+    assert (
+        expectation_suite
+        == bobby_columnar_table_multi_batch[
+            "test_configuration_oneshot_sampling_method"
+        ]["expected_expectation_suite"]
+    )
+
+    # The profiler configuration uses two distinct batch requests (one by the domain builders, one by the parameter
+    # builders of all rules).
+    batch_request_ids: List[str] = [
+        call.kwargs["batch_request"].id for call in mock_get_batch_list.call_args_list
+    ]
+    assert len(batch_request_ids) == 2
+    assert len(set(batch_request_ids)) == 2
+
+
 @pytest.mark.skipif(
     version.parse(np.version.version) < version.parse("1.21.0"),
     reason="requires numpy version 1.21.0 or newer",
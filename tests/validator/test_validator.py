@@ -1,4 +1,5 @@
 from typing import Any, Dict, List, Set, Union
+from unittest import mock
 
 import pandas as pd
 import pytest
@@ -18,6 +19,7 @@ from great_expectations.core.expectation_configuration import ExpectationConfigu
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.datasource.data_connector.batch_filter import (
     BatchFilter,
     build_batch_filter,
@@ -29,6 +31,7 @@ from great_expectations.expectations.core.expect_column_value_z_scores_to_be_les
 from great_expectations.expectations.registry import get_expectation_impl
 from great_expectations.validator.validation_graph import (
     MetricConfiguration,
+    MetricEdge,
     ValidationGraph,
 )
 from great_expectations.validator.validator import Validator
@@ -66,10 +69,12 @@ def test_parse_validation_graph():
                 metric_configuration=metric_configuration,
                 configuration=configuration,
             )
-    ready_metrics, needed_metrics = Validator(engine)._parse_validation_graph(
-        validation_graph=graph, metrics=dict()
-    )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    metrics: dict = {}
+    ready_metrics = next(graph.get_ready_metric_sets(metrics=metrics))
+    needed_metric_ids = graph.get_unresolved_metric_ids(metrics=metrics) - {
+        metric_configuration.id for metric_configuration in ready_metrics
+    }
+    assert len(ready_metrics) == 2 and len(needed_metric_ids) == 10
 
 
 # Should be passing tests even if given incorrect MetricProvider data
@@ -105,10 +110,12 @@ def test_parse_validation_graph_with_bad_metrics_args():
                 metric_configuration=metric_configuration,
                 configuration=configuration,
             )
-    ready_metrics, needed_metrics = validator._parse_validation_graph(
-        validation_graph=graph, metrics=("nonexistent", "NONE")
-    )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    metrics: dict = {("nonexistent", "NONE", "NONE"): None}
+    ready_metrics = next(graph.get_ready_metric_sets(metrics=metrics))
+    needed_metric_ids = graph.get_unresolved_metric_ids(metrics=metrics) - {
+        metric_configuration.id for metric_configuration in ready_metrics
+    }
+    assert len(ready_metrics) == 2 and len(needed_metric_ids) == 10
 
 
 def test_populate_dependencies():
@@ -146,7 +153,87 @@ def test_populate_dependencies():
                 metric_configuration=metric_configuration,
                 configuration=configuration,
             )
-    assert len(graph.edges) == 17
+    assert len(graph.edges) == 20
+
+
+def test_validation_graph_get_ready_metric_sets():
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_value_z_scores_to_be_less_than",
+        kwargs={
+            "column": "a",
+            "mostly": 0.9,
+            "threshold": 4,
+            "double_sided": True,
+        },
+    )
+    graph = ValidationGraph()
+    engine = PandasExecutionEngine()
+    validator = Validator(execution_engine=engine)
+    expectation_impl = get_expectation_impl(
+        "expect_column_value_z_scores_to_be_less_than"
+    )
+    validation_dependencies = expectation_impl(
+        expectation_configuration
+    ).get_validation_dependencies(
+        expectation_configuration,
+        engine,
+    )
+    for metric_configuration in validation_dependencies["metrics"].values():
+        validator.build_metric_dependency_graph(
+            graph=graph,
+            execution_engine=engine,
+            metric_configuration=metric_configuration,
+            configuration=expectation_configuration,
+        )
+
+    # The edges are returned as a copy, so that mutating them does not alter the graph.
+    edges = graph.edges
+    edges.clear()
+    assert len(graph.edges) == 20
+
+    metrics: dict = {}
+    ready_metric_sets = []
+    for ready_metrics in graph.get_ready_metric_sets(metrics=metrics):
+        ready_metric_sets.append(ready_metrics)
+        for metric_configuration in ready_metrics:
+            # Every dependency of a ready metric must already have been "resolved".
+            assert graph.get_dependency_ids(metric_configuration.id).issubset(
+                metrics.keys()
+            )
+        metrics.update(
+            {metric_configuration.id: None for metric_configuration in ready_metrics}
+        )
+
+    # The first set consists of the metrics without dependencies.
+    assert len(ready_metric_sets[0]) == 2
+    assert sum([len(ready_metrics) for ready_metrics in ready_metric_sets]) == 12
+    assert set(metrics.keys()) == set(graph.metric_configurations.keys())
+
+
+def test_validation_graph_get_ready_metric_sets_with_unresolvable_metrics():
+    metric_a = MetricConfiguration("metric_a", {})
+    metric_b = MetricConfiguration("metric_b", {})
+    metric_c = MetricConfiguration("metric_c", {})
+    graph = ValidationGraph(
+        edges=[
+            MetricEdge(left=metric_a),
+            MetricEdge(left=metric_b, right=metric_c),
+            MetricEdge(left=metric_c, right=metric_b),
+        ]
+    )
+
+    metrics: dict = {}
+    with pytest.raises(ge_exceptions.MetricResolutionError) as e:
+        for ready_metrics in graph.get_ready_metric_sets(metrics=metrics):
+            assert [
+                metric_configuration.id for metric_configuration in ready_metrics
+            ] == [metric_a.id]
+            metrics[metric_a.id] = 1
+
+    assert {metric.id for metric in e.value.failed_metrics} == {
+        metric_b.id,
+        metric_c.id,
+    }
 
 
 def test_populate_dependencies_with_incorrect_metric_name():
@@ -244,6 +331,172 @@ def test_graph_validate(basic_datasource):
     ]
 
 
+def test_resolve_validation_graph_registers_domain_records_consumers(
+    basic_datasource,
+):
+    batch = basic_datasource.get_single_batch_from_batch_request(
+        RuntimeBatchRequest(
+            **{
+                "datasource_name": "my_datasource",
+                "data_connector_name": "test_runtime_data_connector",
+                "data_asset_name": "IN_MEMORY_DATA_ASSET",
+                "runtime_parameters": {
+                    "batch_data": pd.DataFrame({"a": [1, 2, None]}),
+                },
+                "batch_identifiers": {
+                    "pipeline_stage_name": 0,
+                    "airflow_run_id": 0,
+                    "custom_key_0": 0,
+                },
+            }
+        )
+    )
+    execution_engine = PandasExecutionEngine()
+    validator = Validator(execution_engine=execution_engine, batches=[batch])
+
+    with mock.patch.object(
+        execution_engine, "add_domain_records_consumers"
+    ) as mock_add, mock.patch.object(
+        execution_engine, "remove_domain_records_consumers"
+    ) as mock_remove:
+        validator.graph_validate(
+            configurations=[
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_not_be_null",
+                    kwargs={"column": "a"},
+                )
+            ]
+        )
+
+    registered_metric_ids: Set = {
+        metric_configuration.id
+        for metric_configuration in mock_add.call_args[1]["metric_configurations"]
+    }
+    assert registered_metric_ids
+    removed_metric_ids: Set = {
+        metric_configuration.id
+        for call in mock_remove.call_args_list
+        for metric_configuration in call[1]["metric_configurations"]
+    }
+    # Every registered consumer is removed once the graph has been resolved.
+    assert removed_metric_ids == registered_metric_ids
+
+
+def test_graph_validate_with_concurrency_enabled(basic_datasource):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+
+    batch = basic_datasource.get_single_batch_from_batch_request(
+        RuntimeBatchRequest(
+            **{
+                "datasource_name": "my_datasource",
+                "data_connector_name": "test_runtime_data_connector",
+                "data_asset_name": "IN_MEMORY_DATA_ASSET",
+                "runtime_parameters": {
+                    "batch_data": df,
+                },
+                "batch_identifiers": {
+                    "pipeline_stage_name": 0,
+                    "airflow_run_id": 0,
+                    "custom_key_0": 0,
+                },
+            }
+        )
+    )
+
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_value_z_scores_to_be_less_than",
+            kwargs={
+                "column": column,
+                "mostly": 0.9,
+                "threshold": 4,
+                "double_sided": True,
+            },
+        )
+        for column in ["a", "b"]
+    ] + [
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": column, "min_value": 0, "max_value": 10},
+        )
+        for column in ["a", "b"]
+    ]
+
+    serial_results = Validator(
+        execution_engine=PandasExecutionEngine(), batches=[batch]
+    ).graph_validate(configurations=expectation_configurations)
+
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[batch],
+        concurrency=ConcurrencyConfig(enabled=True, max_workers=4),
+    )
+    assert validator.concurrency.enabled
+    concurrent_results = validator.graph_validate(
+        configurations=expectation_configurations
+    )
+
+    assert [result.success for result in concurrent_results] == [
+        True,
+        True,
+        False,
+        True,
+    ]
+    assert concurrent_results == serial_results
+
+
+def test_group_ready_metrics_keeps_bundled_metrics_together():
+    engine = PandasExecutionEngine()
+    validator = Validator(
+        execution_engine=engine, concurrency=ConcurrencyConfig(enabled=True)
+    )
+    metrics_to_resolve = [
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+        ),
+        MetricConfiguration(
+            metric_name="column.min",
+            metric_domain_kwargs={"column": "b"},
+            metric_value_kwargs=None,
+        ),
+        MetricConfiguration(
+            metric_name="column.min",
+            metric_domain_kwargs={
+                "column": "b",
+                "row_condition": "a>1",
+                "condition_parser": "pandas",
+            },
+            metric_value_kwargs=None,
+        ),
+        MetricConfiguration(
+            metric_name="table.row_count",
+            metric_domain_kwargs={},
+            metric_value_kwargs=None,
+        ),
+        MetricConfiguration(
+            metric_name="column_values.nonnull.unexpected_count",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+        ),
+    ]
+
+    metric_groups = validator._group_ready_metrics(
+        metrics_to_resolve=metrics_to_resolve
+    )
+
+    assert [
+        [metric_configuration.metric_name for metric_configuration in metric_group]
+        for metric_group in metric_groups
+    ] == [
+        ["column.max", "column.min"],
+        ["column.min"],
+        ["table.row_count"],
+        ["column_values.nonnull.unexpected_count"],
+    ]
+
+
 def test_graph_validate_with_exception(basic_datasource):
     def mock_error(*args, **kwargs):
         raise Exception("Mock Error")
@@ -813,3 +1066,36 @@ def test_instantiate_validator_with_a_list_of_batch_requests(
     assert ve.value.args == (
         "Only one of batch_request or batch_request_list may be specified",
     )
+
+
+def test_instantiate_validator_with_a_loaded_batch_list(
+    yellow_trip_pandas_data_context,
+):
+    context: DataContext = yellow_trip_pandas_data_context
+    suite: ExpectationSuite = context.create_expectation_suite("validating_taxi_data")
+
+    jan_batch_request: BatchRequest = BatchRequest(
+        datasource_name="taxi_pandas",
+        data_connector_name="monthly",
+        data_asset_name="my_reports",
+        data_connector_query={"batch_filter_parameters": {"month": "01"}},
+    )
+    batch_list: List[Batch] = context.get_batch_list(batch_request=jan_batch_request)
+
+    with mock.patch.object(context, "get_batch_list") as mock_get_batch_list:
+        validator: Validator = context.get_validator(
+            batch_list=batch_list,
+            expectation_suite=suite,
+        )
+
+    # The batches are not loaded again.
+    assert mock_get_batch_list.call_count == 0
+    assert list(validator.batches.keys()) == [batch_list[0].id]
+
+    with pytest.raises(ValueError):
+        # noinspection PyUnusedLocal
+        validator: Validator = context.get_validator(
+            batch_request=jan_batch_request,
+            batch_list=batch_list,
+            expectation_suite=suite,
+        )